@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import datetime as dt
 import json
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict, Union, cast
+import logging
+import threading
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypedDict, Union, cast
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations._docs_decorators import public_api
@@ -23,6 +26,7 @@ from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
+from great_expectations.datasource.fluent.interfaces import Datasource
 from great_expectations.render.renderer.renderer import Renderer
 
 if TYPE_CHECKING:
@@ -30,6 +34,8 @@ if TYPE_CHECKING:
         ValidationDefinitionStore,
     )
 
+logger = logging.getLogger(__name__)
+
 
 @public_api
 class Checkpoint(BaseModel):
@@ -144,7 +150,25 @@ class Checkpoint(BaseModel):
         batch_parameters: Dict[str, Any] | None = None,
         expectation_parameters: Dict[str, Any] | None = None,
         run_id: RunIdentifier | None = None,
+        max_workers: int | None = None,
     ) -> CheckpointResult:
+        """Runs the validation definitions of this Checkpoint and then its actions.
+
+        Args:
+            batch_parameters: Parameters used to retrieve the batch of each validation definition.
+            expectation_parameters: Suite parameters passed to each validation definition.
+            run_id: An optional identifier of this run (current time is used by default).
+            max_workers: Opt-in maximum number of validation definitions to run concurrently (on a
+                thread pool).  Validation definitions run sequentially by default.
+
+        Returns:
+            CheckpointResult, whose run results are ordered as the validation definitions are.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise gx_exceptions.CheckpointError(  # noqa: TRY003
+                f"max_workers must be a positive integer; {max_workers} was provided."
+            )
+
         if not self.id:
             self._add_to_store()
 
@@ -154,6 +178,7 @@ class Checkpoint(BaseModel):
             expectation_parameters=expectation_parameters,
             result_format=self.result_format,
             run_id=run_id,
+            max_workers=max_workers,
         )
 
         checkpoint_result = self._construct_result(run_id=run_id, run_results=run_results)
@@ -161,21 +186,40 @@ class Checkpoint(BaseModel):
 
         return checkpoint_result
 
-    def _run_validation_definitions(
+    def _run_validation_definitions(  # noqa: PLR0913
         self,
         batch_parameters: Dict[str, Any] | None,
         expectation_parameters: Dict[str, Any] | None,
         result_format: ResultFormat | dict,
         run_id: RunIdentifier,
+        max_workers: int | None = None,
     ) -> Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult]:
-        run_results: Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult] = {}
-        for validation_definition in self.validation_definitions:
-            validation_result = validation_definition.run(
+        def run_validation_definition(
+            validation_definition: ValidationDefinition,
+        ) -> ExpectationSuiteValidationResult:
+            return validation_definition.run(
                 batch_parameters=batch_parameters,
                 suite_parameters=expectation_parameters,
                 result_format=result_format,
                 run_id=run_id,
             )
+
+        validation_results: List[ExpectationSuiteValidationResult]
+        if max_workers is None or max_workers == 1 or len(self.validation_definitions) == 1:
+            validation_results = [
+                run_validation_definition(validation_definition)
+                for validation_definition in self.validation_definitions
+            ]
+        else:
+            validation_results = self._run_validation_definitions_concurrently(
+                run_validation_definition=run_validation_definition,
+                max_workers=max_workers,
+            )
+
+        run_results: Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult] = {}
+        for validation_definition, validation_result in zip(
+            self.validation_definitions, validation_results
+        ):
             key = self._build_result_key(
                 validation_definition=validation_definition,
                 run_id=run_id,
@@ -185,6 +229,77 @@ class Checkpoint(BaseModel):
 
         return run_results
 
+    def _run_validation_definitions_concurrently(
+        self,
+        run_validation_definition: Callable[
+            [ValidationDefinition], ExpectationSuiteValidationResult
+        ],
+        max_workers: int,
+    ) -> List[ExpectationSuiteValidationResult]:
+        """Runs validation definitions on a thread pool; results are returned in order of validation definitions.
+
+        Every worker thread uses its own copies of Datasources (hence, its own ExecutionEngine objects), because
+        ExecutionEngine keeps state (loaded batches and resolved metrics) of the validation it runs.  As in sequential
+        execution, validation definitions, which have not started yet, are not run after one of them fails; the error of
+        the first failed validation definition (in order of validation definitions) is raised.
+        """  # noqa: E501
+        # Persisted up front, so that stores are not written to concurrently on their behalf.
+        for validation_definition in self.validation_definitions:
+            if not validation_definition.id:
+                validation_definition._add_to_store()
+
+        isolated_datasources = threading.local()
+        datasource_copies_of_all_threads: List[Dict[int, Datasource]] = []
+
+        def run_isolated_validation_definition(
+            validation_definition: ValidationDefinition,
+        ) -> ExpectationSuiteValidationResult:
+            if not hasattr(isolated_datasources, "copies"):
+                isolated_datasources.copies = {}
+                datasource_copies_of_all_threads.append(isolated_datasources.copies)
+
+            return run_validation_definition(
+                _isolate_validation_definition(
+                    validation_definition=validation_definition,
+                    datasource_copies=isolated_datasources.copies,
+                )
+            )
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="gx-checkpoint"
+            ) as executor:
+                futures: List[Future[ExpectationSuiteValidationResult]] = [
+                    executor.submit(run_isolated_validation_definition, validation_definition)
+                    for validation_definition in self.validation_definitions
+                ]
+                # Once any validation definition fails, those which have not started yet are skipped.  # noqa: E501
+                wait(futures, return_when=FIRST_EXCEPTION)
+                for future in futures:
+                    future.cancel()
+        finally:
+            # All workers have finished; their ExecutionEngine objects (e.g., SQL connection pools) are released.  # noqa: E501
+            _close_execution_engines(
+                datasources=[
+                    datasource_copy
+                    for datasource_copies in datasource_copies_of_all_threads
+                    for datasource_copy in datasource_copies.values()
+                ]
+            )
+
+        errors: List[BaseException] = [
+            error
+            for error in (future.exception() for future in futures if not future.cancelled())
+            if error is not None
+        ]
+        for error in errors[1:]:
+            logger.error(f"Validation definition failed during Checkpoint run: {error!r}")
+
+        if errors:
+            raise errors[0]
+
+        return [future.result() for future in futures]
+
     def _build_result_key(
         self,
         validation_definition: ValidationDefinition,
@@ -312,6 +427,54 @@ class CheckpointResult(BaseModel):
         return json.dumps(self.describe_dict(), indent=4)
 
 
+def _close_execution_engines(datasources: List[Datasource]) -> None:
+    """Closes ExecutionEngine objects of "datasources" (those which were created), releasing their connections."""  # noqa: E501
+    for datasource in datasources:
+        execution_engine = datasource._execution_engine
+        if execution_engine is None:
+            continue
+
+        datasource._execution_engine = None
+        close: Optional[Callable[[], None]] = getattr(execution_engine, "close", None)
+        if close is None:
+            continue
+
+        try:
+            close()
+        except Exception as e:
+            logger.warning(
+                f"Failed to close ExecutionEngine of Datasource {datasource.name}: {e!r}"
+            )
+
+
+def _isolate_validation_definition(
+    validation_definition: ValidationDefinition,
+    datasource_copies: Dict[int, Datasource],
+) -> ValidationDefinition:
+    """Copy of "validation_definition", whose batch is retrieved via copy of its Datasource from "datasource_copies".
+
+    Copies of Datasources are created (and added to "datasource_copies") on demand, without their ExecutionEngine.
+    """  # noqa: E501
+    batch_definition = validation_definition.batch_definition
+    data_asset = batch_definition.data_asset
+    datasource = data_asset.datasource
+    if not isinstance(datasource, Datasource):
+        return validation_definition
+
+    datasource_copy: Optional[Datasource] = datasource_copies.get(id(datasource))
+    if datasource_copy is None:
+        datasource_copy = datasource.copy()
+        datasource_copy._execution_engine = None
+        datasource_copy._cached_execution_engine_kwargs = {}
+        datasource_copies[id(datasource)] = datasource_copy
+
+    data_asset_copy = data_asset.copy()
+    data_asset_copy._datasource = datasource_copy
+    batch_definition_copy = batch_definition.copy()
+    batch_definition_copy.set_data_asset(data_asset_copy)
+    return validation_definition.copy(update={"data": batch_definition_copy})
+
+
 # Necessary due to cyclic dependencies between Checkpoint and CheckpointResult
 CheckpointResult.update_forward_refs()
 
@@ -37,6 +37,21 @@ try:
 except (ImportError, AttributeError):
     sqlite = SQLALCHEMY_NOT_IMPORTED
 
+try:
+    from sqlalchemy.dialects.mysql import insert as mysql_insert
+except (ImportError, AttributeError):
+    mysql_insert = SQLALCHEMY_NOT_IMPORTED
+
+try:
+    from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+except (ImportError, AttributeError):
+    postgresql_insert = SQLALCHEMY_NOT_IMPORTED
+
+try:
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+except (ImportError, AttributeError):
+    sqlite_insert = SQLALCHEMY_NOT_IMPORTED
+
 try:
     from sqlalchemy.dialects import registry
 except (ImportError, AttributeError):
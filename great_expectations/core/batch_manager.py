@@ -165,5 +165,35 @@ class BatchManager:
         """
         Updates the data for the specified Batch in the cache
         """
+        cached_batch_data: Optional[BatchDataUnion] = self._batch_data_cache.get(batch_id)
+        if cached_batch_data is not None and cached_batch_data is not batch_data:
+            # Batch is replaced with new data, which invalidates everything computed on its former data.  # noqa: E501
+            self.remove_batch(batch_id=batch_id)
+
+        if self.active_batch_data_id != batch_id:
+            # noinspection PyProtectedMember
+            self._execution_engine._invalidate_batch_data_caches(batch_id=None)
+
         self._batch_data_cache[batch_id] = batch_data
         self._active_batch_data_id = batch_id
+
+    def remove_batch(self, batch_id: str) -> None:
+        """
+        Evicts the specified Batch (and its data) from the cache, discarding state computed on it by the ExecutionEngine
+        """  # noqa: E501
+        is_active_batch_data: bool = self.active_batch_data_id == batch_id
+
+        self._batch_cache.pop(batch_id, None)
+        self._batch_data_cache.pop(batch_id, None)
+
+        if self._active_batch_id == batch_id:
+            self._active_batch_id = None
+
+        if self._active_batch_data_id == batch_id:
+            self._active_batch_data_id = None
+
+        # noinspection PyProtectedMember
+        self._execution_engine._invalidate_batch_data_caches(batch_id=batch_id)
+        if is_active_batch_data:
+            # noinspection PyProtectedMember
+            self._execution_engine._invalidate_batch_data_caches(batch_id=None)
@@ -9,15 +9,39 @@ from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 
 T = TypeVar("T")
 
+# Sentinel for "id" that has not been computed (or was discarded, because dictionary has been mutated).  # noqa: E501
+_NO_ID = object()
+
 
 class IDDict(dict):
+    """Dictionary, whose "id" is a digest of its (JSON-serializable) contents.
+
+    The default "id" (computed with "to_id()" and used by "__hash__()") is memoized and discarded whenever the
+    dictionary is mutated through any of its own methods.  Nested values must not be mutated in place after "id" has
+    been computed (replace them by assigning a new value to the key instead).
+    """  # noqa: E501
+
     _id_ignore_keys: Set[str] = set()
 
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is None and id_ignore_keys is None:
+            cached_id = self.__dict__.get("_cached_id", _NO_ID)
+            if cached_id is _NO_ID:
+                cached_id = self._compute_id(
+                    id_keys=self.keys(), id_ignore_keys=self._id_ignore_keys
+                )
+                self.__dict__["_cached_id"] = cached_id
+
+            return cached_id
+
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
             id_ignore_keys = self._id_ignore_keys
+
+        return self._compute_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+    def _compute_id(self, id_keys, id_ignore_keys):
         id_keys = set(id_keys) - set(id_ignore_keys)
         if len(id_keys) == 0:
             return tuple()
@@ -28,6 +52,49 @@ class IDDict(dict):
         _id_dict = convert_to_json_serializable(data={k: self[k] for k in id_keys})
         return hashlib.md5(json.dumps(_id_dict, sort_keys=True).encode("utf-8")).hexdigest()
 
+    def _invalidate_id(self) -> None:
+        self.__dict__.pop("_cached_id", None)
+
+    @override
+    def __setitem__(self, key, value) -> None:
+        self._invalidate_id()
+        super().__setitem__(key, value)
+
+    @override
+    def __delitem__(self, key) -> None:
+        self._invalidate_id()
+        super().__delitem__(key)
+
+    @override
+    def __ior__(self, other):  # type: ignore[override,misc]
+        self._invalidate_id()
+        return super().__ior__(other)
+
+    @override
+    def update(self, *args, **kwargs) -> None:
+        self._invalidate_id()
+        super().update(*args, **kwargs)
+
+    @override
+    def setdefault(self, key, default=None):
+        self._invalidate_id()
+        return super().setdefault(key, default)
+
+    @override
+    def pop(self, *args):
+        self._invalidate_id()
+        return super().pop(*args)
+
+    @override
+    def popitem(self):
+        self._invalidate_id()
+        return super().popitem()
+
+    @override
+    def clear(self) -> None:
+        self._invalidate_id()
+        super().clear()
+
     @override
     def __hash__(self) -> int:  # type: ignore[override]
         """Overrides the default implementation"""
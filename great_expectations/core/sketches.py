@@ -0,0 +1,491 @@
+"""Mergeable sketches, summarizing column values in bounded memory.
+
+Sketches are computed per batch (see "column.*_sketch" metrics), stored (e.g., by MetricStore), and merged across
+batches without reading their data again.  Every sketch exposes explicit bound of its error.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import base64
+import datetime
+import decimal
+import numbers
+from abc import abstractmethod
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Type
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+from great_expectations.compatibility.typing_extensions import override
+from great_expectations.types import SerializableDictDot
+from great_expectations.util import convert_to_json_serializable  # noqa: TID251
+
+SKETCH_TYPE_KEY = "sketch_type"
+
+
+class Sketch(SerializableDictDot):
+    """Sketch summarizes values it is updated with; sketches of the same type and configuration can be merged."""  # noqa: E501
+
+    sketch_type: ClassVar[str]
+
+    @abstractmethod
+    def update(self, values: Sequence, counts: Optional[Sequence[int]] = None) -> None:
+        """Adds (non-null) values, each occurring given number of times (once, if counts are omitted)."""  # noqa: E501
+        raise NotImplementedError
+
+    @abstractmethod
+    def merge(self, other: Sketch) -> None:
+        """Adds values, summarized by other sketch, to this sketch."""
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def from_json_dict(cls, data: dict) -> Sketch:
+        raise NotImplementedError
+
+    @classmethod
+    def from_value_counts(cls, value_counts: pd.Series, **kwargs) -> Sketch:
+        """Builds sketch from counts of distinct values (e.g., "column.value_counts" metric)."""
+        sketch = cls(**kwargs)
+        sketch.update(values=value_counts.index, counts=value_counts.to_numpy())
+        return sketch
+
+    def _check_mergeable(self, other: Sketch, **config) -> None:
+        if type(other) is not type(self):
+            raise TypeError(  # noqa: TRY003
+                f"{type(self).__name__} cannot be merged with {type(other).__name__}."
+            )
+
+        for name, value in config.items():
+            if getattr(other, name) != value:
+                raise ValueError(  # noqa: TRY003
+                    f'Sketches with different "{name}" ({value} and {getattr(other, name)}) cannot be merged.'  # noqa: E501
+                )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sketch):
+            return NotImplemented
+
+        return self.to_json_dict() == other.to_json_dict()
+
+
+def _as_counts(values: Sequence, counts: Optional[Sequence[int]]) -> np.ndarray:
+    if counts is None:
+        return np.ones(len(values), dtype=np.int64)
+
+    return np.asarray(counts, dtype=np.int64)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Number of bits, needed to represent each (unsigned 64-bit) value; computed exactly, without float conversion."""  # noqa: E501
+    values = values.astype(np.uint64)
+    lengths = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = values >= np.uint64(1 << shift)
+        lengths[mask] += shift
+        values = np.where(mask, values >> np.uint64(shift), values)
+
+    return lengths + (values > 0)
+
+
+class QuantilesSketch(Sketch):
+    """Compactor-based quantiles sketch (KLL family, with equal capacity "k" of all levels) of numeric values.
+
+    Values are kept in levels; every value at level h represents 2**h original values.  Whenever level holds more than
+    "k" values, they are sorted and every other one is promoted to next level.  Each such compaction at level h shifts
+    rank of any value by at most 2**h, and no more than n / (k * 2**h) compactions happen at level h; hence, rank of
+    quantiles deviates from exact rank by at most "rank_error" * n, where "rank_error" is (number of levels - 1) / k.
+    """  # noqa: E501
+
+    sketch_type = "quantiles"
+
+    DEFAULT_K: ClassVar[int] = 200
+
+    def __init__(self, k: int = DEFAULT_K) -> None:
+        if k < 2:  # noqa: PLR2004
+            raise ValueError(f"k must be at least 2; {k} was given.")  # noqa: TRY003
+
+        self.k = k
+        self.n = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        # Number of compactions per level; its parity alternates kept half of (sorted) values.
+        self._compactions: List[int] = [0]
+
+    @property
+    def rank_error(self) -> float:
+        """Bound of (normalized) rank error of quantiles; 0.0 while all values are kept."""
+        return min(1.0, (len(self._levels) - 1) / self.k)
+
+    @override
+    def update(self, values: Sequence, counts: Optional[Sequence[int]] = None) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+
+        counts = _as_counts(values, counts)
+        self.n += int(counts.sum())
+        self._update_min_max(minimum=float(values.min()), maximum=float(values.max()))
+
+        # Value occurring c times is kept at every level h, for which bit h of c is set.
+        for level in range(int(_bit_length(counts).max())):
+            level_values = values[(counts >> level) & 1 == 1]
+            if len(level_values) > 0:
+                self._add_to_level(level=level, values=level_values)
+
+        self._compress()
+
+    @override
+    def merge(self, other: Sketch) -> None:
+        self._check_mergeable(other, k=self.k)
+        assert isinstance(other, QuantilesSketch)
+        if other.n == 0:
+            return
+
+        self.n += other.n
+        self._update_min_max(minimum=other.min, maximum=other.max)
+        for level, level_values in enumerate(other._levels):
+            self._add_to_level(level=level, values=level_values)
+            self._compactions[level] += other._compactions[level]
+
+        self._compress()
+
+    def quantiles(self, quantiles: Sequence[float]) -> List[Optional[float]]:
+        """Returns (approximate, within "rank_error") values at given quantiles (None for empty sketch)."""  # noqa: E501
+        if self.n == 0:
+            return [None] * len(quantiles)
+
+        values = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level_values), 2**level)
+                for level, level_values in enumerate(self._levels)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        cumulative_weights = np.cumsum(weights[order])
+        indices = np.searchsorted(
+            cumulative_weights, np.asarray(quantiles, dtype=np.float64) * cumulative_weights[-1]
+        )
+        results: List[Optional[float]] = values[np.minimum(indices, len(values) - 1)].tolist()
+        # Extremes are tracked exactly.
+        return [
+            self.min if quantile <= 0.0 else self.max if quantile >= 1.0 else result
+            for quantile, result in zip(quantiles, results)
+        ]
+
+    @override
+    def to_json_dict(self) -> Dict[str, Any]:
+        return {
+            SKETCH_TYPE_KEY: self.sketch_type,
+            "k": self.k,
+            "n": self.n,
+            "min": self.min,
+            "max": self.max,
+            "levels": [level_values.tolist() for level_values in self._levels],
+            "compactions": list(self._compactions),
+        }
+
+    @classmethod
+    @override
+    def from_json_dict(cls, data: dict) -> QuantilesSketch:
+        sketch = cls(k=data["k"])
+        sketch.n = data["n"]
+        sketch.min = data["min"]
+        sketch.max = data["max"]
+        sketch._levels = [
+            np.asarray(level_values, dtype=np.float64) for level_values in data["levels"]
+        ]
+        sketch._compactions = list(data["compactions"])
+        return sketch
+
+    def _update_min_max(self, minimum: Optional[float], maximum: Optional[float]) -> None:
+        if minimum is not None:
+            self.min = minimum if self.min is None else min(self.min, minimum)
+
+        if maximum is not None:
+            self.max = maximum if self.max is None else max(self.max, maximum)
+
+    def _add_to_level(self, level: int, values: np.ndarray) -> None:
+        while len(self._levels) <= level:
+            self._levels.append(np.empty(0, dtype=np.float64))
+            self._compactions.append(0)
+
+        self._levels[level] = np.concatenate([self._levels[level], values])
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self._levels):
+            level_values = self._levels[level]
+            if len(level_values) > self.k:
+                level_values = np.sort(level_values, kind="stable")
+                # Odd value out (if any) stays at its level.
+                kept_count = len(level_values) % 2
+                offset = self._compactions[level] % 2
+                promoted = level_values[kept_count:][offset::2]
+                self._levels[level] = level_values[:kept_count]
+                self._compactions[level] += 1
+                self._add_to_level(level=level + 1, values=promoted)
+
+            level += 1
+
+
+class DistinctCountSketch(Sketch):
+    """HyperLogLog sketch, estimating number of distinct values with 2**precision (one byte) registers.
+
+    Relative standard error of estimate is about 1.04 / sqrt(2**precision) (e.g., 1.6% for default precision 12).  Values
+    are hashed by value, rather than by type: numbers (including booleans and decimals) as 64-bit floats, anything else
+    as its string representation; hence, sketches of the same column, computed by different execution engines (e.g., of
+    "NUMERIC" column, which SQL drivers return as decimals), can be merged.
+    """  # noqa: E501
+
+    sketch_type = "distinct_count"
+
+    DEFAULT_PRECISION: ClassVar[int] = 12
+    MIN_PRECISION: ClassVar[int] = 4
+    MAX_PRECISION: ClassVar[int] = 18
+
+    def __init__(self, precision: int = DEFAULT_PRECISION) -> None:
+        if not self.MIN_PRECISION <= precision <= self.MAX_PRECISION:
+            raise ValueError(  # noqa: TRY003
+                f"precision must be between {self.MIN_PRECISION} and {self.MAX_PRECISION}; {precision} was given."  # noqa: E501
+            )
+
+        self.precision = precision
+        self._registers = np.zeros(2**precision, dtype=np.uint8)
+
+    @property
+    def relative_standard_error(self) -> float:
+        return 1.04 / np.sqrt(len(self._registers))
+
+    @override
+    def update(self, values: Sequence, counts: Optional[Sequence[int]] = None) -> None:
+        # Number of occurrences does not affect number of distinct values.
+        if len(values) == 0:
+            return
+
+        hashes: np.ndarray = _hash_values(values)
+        suffix_bits = 64 - self.precision
+        register_indices = (hashes >> np.uint64(suffix_bits)).astype(np.int64)
+        suffixes = hashes & np.uint64((1 << suffix_bits) - 1)
+        # Position of leftmost 1-bit of (suffix_bits long) suffix.
+        ranks = (suffix_bits - _bit_length(suffixes) + 1).astype(np.uint8)
+        np.maximum.at(self._registers, register_indices, ranks)
+
+    @override
+    def merge(self, other: Sketch) -> None:
+        self._check_mergeable(other, precision=self.precision)
+        assert isinstance(other, DistinctCountSketch)
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def estimate(self) -> int:
+        """Estimated number of distinct values."""
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw_estimate = alpha * m * m / np.sum(np.power(2.0, -self._registers.astype(np.float64)))
+        empty_registers = int(np.count_nonzero(self._registers == 0))
+        if raw_estimate <= 2.5 * m and empty_registers > 0:
+            # Linear counting is more accurate for small cardinalities.
+            return int(round(m * np.log(m / empty_registers)))
+
+        return int(round(raw_estimate))
+
+    @override
+    def to_json_dict(self) -> Dict[str, Any]:
+        return {
+            SKETCH_TYPE_KEY: self.sketch_type,
+            "precision": self.precision,
+            "registers": base64.b64encode(self._registers.tobytes()).decode("ascii"),
+        }
+
+    @classmethod
+    @override
+    def from_json_dict(cls, data: dict) -> DistinctCountSketch:
+        sketch = cls(precision=data["precision"])
+        sketch._registers = np.frombuffer(
+            base64.b64decode(data["registers"]), dtype=np.uint8
+        ).copy()
+        return sketch
+
+
+def _hash_values(values: Sequence) -> np.ndarray:
+    array = pd.Index(values)
+    if is_numeric_dtype(array.dtype) or is_bool_dtype(array.dtype):
+        return pd.util.hash_array(array.to_numpy(dtype=np.float64))
+
+    objects: np.ndarray = array.to_numpy(dtype=object)
+    # Numbers of object columns (e.g., decimals) are hashed as floats, so as numeric columns are.
+    is_number = np.fromiter(
+        (isinstance(value, (numbers.Real, decimal.Decimal)) for value in objects),
+        dtype=bool,
+        count=len(objects),
+    )
+    hashes = np.empty(len(objects), dtype=np.uint64)
+    hashes[is_number] = pd.util.hash_array(objects[is_number].astype(np.float64))
+    hashes[~is_number] = pd.util.hash_array(objects[~is_number].astype(str).astype(object))
+    return hashes
+
+
+class FrequentValuesSketch(Sketch):
+    """Misra-Gries summary, keeping (at most) "capacity" most frequent values with their (under-estimated) counts.
+
+    Whenever more than "capacity" values are tracked, count of (capacity + 1)-th most frequent value is subtracted from
+    all counts, and values without positive count are dropped.  Hence, count of any value is under-estimated by at most
+    "count_error", which never exceeds n / (capacity + 1); every value, occurring more often than that, is tracked.
+
+    Values keep their types through JSON serialization for JSON-native types, timestamps, dates, and decimals; values of
+    other types are restored in their JSON-serializable form (see "convert_to_json_serializable").
+    """  # noqa: E501
+
+    sketch_type = "frequent_values"
+
+    DEFAULT_CAPACITY: ClassVar[int] = 100
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive; {capacity} was given.")  # noqa: TRY003
+
+        self.capacity = capacity
+        self.n = 0
+        self.count_error = 0
+        self._counts: Dict[Any, int] = {}
+
+    @override
+    def update(self, values: Sequence, counts: Optional[Sequence[int]] = None) -> None:
+        if len(values) == 0:
+            return
+
+        value_counts = pd.Series(_as_counts(values, counts), index=pd.Index(values))
+        value_counts = value_counts.groupby(level=0, sort=False).sum()
+        self._add_counts(value_counts=value_counts, count_error=0)
+
+    @override
+    def merge(self, other: Sketch) -> None:
+        self._check_mergeable(other, capacity=self.capacity)
+        assert isinstance(other, FrequentValuesSketch)
+        self._add_counts(
+            value_counts=pd.Series(other._counts, dtype=np.int64),
+            count_error=other.count_error,
+            n=other.n,
+        )
+
+    def most_frequent(self, count: Optional[int] = None) -> List[tuple]:
+        """Returns (value, estimated count) pairs of most frequent values, in descending order of counts."""  # noqa: E501
+        return sorted(self._counts.items(), key=lambda item: item[1], reverse=True)[:count]
+
+    def estimate(self, value: Any) -> int:
+        """Estimated count of value; true count is between estimate and estimate + "count_error"."""
+        return self._counts.get(value, 0)
+
+    @override
+    def to_json_dict(self) -> Dict[str, Any]:
+        most_frequent = self.most_frequent()
+        return {
+            SKETCH_TYPE_KEY: self.sketch_type,
+            "capacity": self.capacity,
+            "n": self.n,
+            "count_error": self.count_error,
+            "values": [_serialize_value(value) for value, _ in most_frequent],
+            "value_types": [_VALUE_TYPES.get(type(value)) for value, _ in most_frequent],
+            "counts": [count for _, count in most_frequent],
+        }
+
+    @classmethod
+    @override
+    def from_json_dict(cls, data: dict) -> FrequentValuesSketch:
+        sketch = cls(capacity=data["capacity"])
+        sketch.n = data["n"]
+        sketch.count_error = data["count_error"]
+        # Sketches, serialized before value types were recorded, have all values of JSON types.
+        value_types: List[Optional[str]] = data.get("value_types") or [None] * len(data["values"])
+        sketch._counts = {
+            _deserialize_value(value=value, value_type=value_type): count
+            for value, value_type, count in zip(data["values"], value_types, data["counts"])
+        }
+        return sketch
+
+    def _add_counts(
+        self, value_counts: pd.Series, count_error: int, n: Optional[int] = None
+    ) -> None:
+        self.n += int(value_counts.sum()) if n is None else n
+        self.count_error += count_error
+        if self._counts:
+            value_counts = value_counts.add(pd.Series(self._counts, dtype=np.int64), fill_value=0)
+
+        value_counts = value_counts.astype(np.int64)
+        if len(value_counts) > self.capacity:
+            threshold = int(value_counts.nlargest(self.capacity + 1).iloc[-1])
+            value_counts = value_counts[value_counts > threshold] - threshold
+            self.count_error += threshold
+
+        self._counts = {
+            value.item() if isinstance(value, np.generic) else value: int(count)
+            for value, count in value_counts.items()
+        }
+
+
+# Types of values, which are restored from their JSON representation (by "_deserialize_value").
+_VALUE_TYPES: Dict[type, str] = {
+    pd.Timestamp: "timestamp",
+    datetime.datetime: "timestamp",
+    datetime.date: "date",
+    decimal.Decimal: "decimal",
+}
+
+
+def _serialize_value(value: Any) -> Any:
+    value_type: Optional[str] = _VALUE_TYPES.get(type(value))
+    if value_type in ("timestamp", "date"):
+        return value.isoformat()
+
+    if value_type == "decimal":
+        return str(value)
+
+    return convert_to_json_serializable(value)
+
+
+def _deserialize_value(value: Any, value_type: Optional[str]) -> Any:
+    if value_type == "timestamp":
+        return pd.Timestamp(value)
+
+    if value_type == "date":
+        return datetime.date.fromisoformat(value)
+
+    if value_type == "decimal":
+        return decimal.Decimal(value)
+
+    return value
+
+
+_SKETCH_CLASSES: Dict[str, Type[Sketch]] = {
+    sketch_class.sketch_type: sketch_class
+    for sketch_class in (QuantilesSketch, DistinctCountSketch, FrequentValuesSketch)
+}
+
+
+def is_serialized_sketch(data: Any) -> bool:
+    return isinstance(data, dict) and data.get(SKETCH_TYPE_KEY) in _SKETCH_CLASSES
+
+
+def sketch_from_json_dict(data: dict) -> Sketch:
+    """Restores sketch of any type from its JSON-serializable dictionary (see "Sketch.to_json_dict()")."""  # noqa: E501
+    sketch_class: Optional[Type[Sketch]] = _SKETCH_CLASSES.get(data.get(SKETCH_TYPE_KEY))  # type: ignore[arg-type]
+    if sketch_class is None:
+        raise ValueError(f'Unknown sketch type "{data.get(SKETCH_TYPE_KEY)}".')  # noqa: TRY003
+
+    return sketch_class.from_json_dict(data)
+
+
+def merge_sketches(sketches: Sequence[Sketch]) -> Sketch:
+    """Merges sketches (e.g., of multiple batches) into new sketch; given sketches are not modified."""  # noqa: E501
+    if not sketches:
+        raise ValueError("At least one sketch must be given.")  # noqa: TRY003
+
+    merged: Sketch = sketch_from_json_dict(sketches[0].to_json_dict())
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+
+    return merged
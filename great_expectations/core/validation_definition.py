@@ -190,13 +190,14 @@ class ValidationDefinition(BaseModel):
         return batch_definition
 
     @public_api
-    def run(
+    def run(  # noqa: PLR0913
         self,
         *,
         batch_parameters: Optional[BatchParameters] = None,
         suite_parameters: Optional[dict[str, Any]] = None,
         result_format: ResultFormat | dict = ResultFormat.SUMMARY,
         run_id: RunIdentifier | None = None,
+        project_columns: bool = False,
     ) -> ExpectationSuiteValidationResult:
         if not self.id:
             self._add_to_store()
@@ -205,6 +206,7 @@ class ValidationDefinition(BaseModel):
             batch_definition=self.batch_definition,
             batch_parameters=batch_parameters,
             result_format=result_format,
+            project_columns=project_columns,
         )
         results = validator.validate_expectation_suite(self.suite, suite_parameters)
         results.meta["validation_id"] = self.id
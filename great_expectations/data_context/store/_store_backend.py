@@ -4,7 +4,7 @@ import logging
 import urllib
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Any, List, Optional, Union
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
 
 import pyparsing as pp
 
@@ -120,6 +120,16 @@ class StoreBackend(metaclass=ABCMeta):
     def get_all(self):
         return self._get_all()
 
+    def get_many(self, keys: Iterable[tuple], **kwargs) -> list[Any]:
+        """
+        Returns values of given keys (in the same order); backends may fetch them in a single batch.
+        """
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+
+        return self._get_many(keys, **kwargs)
+
     def set(self, key, value, **kwargs):
         self._validate_key(key)
         self._validate_value(value)
@@ -130,6 +140,21 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")  # noqa: TRY003
 
+    def set_many(self, items: Iterable[Tuple[tuple, Any]], **kwargs) -> None:
+        """
+        Sets values of given (key, value) pairs; backends may write them in a single batch (e.g., transaction).
+        """  # noqa: E501
+        items = list(items)
+        for key, value in items:
+            self._validate_key(key)
+            self._validate_value(value)
+
+        try:
+            self._set_many(items, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError("ValueError while calling _set_many on store backend.")  # noqa: TRY003
+
     def add(self, key, value, **kwargs):
         """
         Essentially `set` but validates that a given key-value pair does not already exist.
@@ -215,10 +240,17 @@ class StoreBackend(metaclass=ABCMeta):
     def _get_all(self) -> list[Any]:
         raise NotImplementedError
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> list[Any]:
+        return [self._get(key, **kwargs) for key in keys]
+
     @abstractmethod
     def _set(self, key, value, **kwargs) -> None:
         raise NotImplementedError
 
+    def _set_many(self, items: List[Tuple[tuple, Any]], **kwargs) -> None:
+        for key, value in items:
+            self._set(key, value, **kwargs)
+
     @abstractmethod
     def _move(self, source_key, dest_key, **kwargs) -> None:
         raise NotImplementedError
@@ -227,6 +259,10 @@ class StoreBackend(metaclass=ABCMeta):
     def list_keys(self, prefix=()) -> Union[List[str], List[tuple]]:
         raise NotImplementedError
 
+    def iter_keys(self, prefix=()) -> Iterator[Union[str, tuple]]:
+        """Iterates over keys (backends listing keys page by page yield them before listing is complete)."""  # noqa: E501
+        yield from self.list_keys(prefix=prefix)
+
     @abstractmethod
     def remove_key(self, key) -> None:
         raise NotImplementedError
@@ -67,11 +67,10 @@ class CheckpointStore(Store):
     def serialize(self, value):
         # In order to enable the custom json_encoders in Checkpoint, we need to set `models_as_dict` off  # noqa: E501
         # Ref: https://docs.pydantic.dev/1.10/usage/exporting_models/#serialising-self-reference-or-other-models
-        data = value.json(models_as_dict=False, indent=2, sort_keys=True)
         if self.cloud_mode:
-            return json.loads(data)
+            return json.loads(value.json(models_as_dict=False, indent=2, sort_keys=True))
 
-        return data
+        return self._json_codec.dumps_model(value)
 
     @override
     def deserialize(self, value):
@@ -80,7 +79,7 @@ class CheckpointStore(Store):
         if self.cloud_mode:
             return Checkpoint.parse_obj(value)
 
-        return Checkpoint.parse_raw(value)
+        return self._json_codec.loads_model(Checkpoint, value)
 
     @override
     def _add(self, key: DataContextKey, value: Checkpoint, **kwargs):
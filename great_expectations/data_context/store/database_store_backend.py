@@ -3,10 +3,15 @@ from __future__ import annotations
 import logging
 import uuid
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import sqlalchemy
+from great_expectations.compatibility.sqlalchemy import (
+    mysql_insert,
+    postgresql_insert,
+    sqlite_insert,
+)
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
@@ -25,6 +30,12 @@ if sa:
 
 logger = logging.getLogger(__name__)
 
+# Keys are fetched in chunks, so that number of bound parameters in each query stays within limits of all dialects.  # noqa: E501
+_MAX_BOUND_PARAMETERS_PER_QUERY = 900
+
+# "INSERT ... ON CONFLICT DO UPDATE" is supported by SQLite 3.24 and newer.
+_MIN_SQLITE_VERSION_WITH_UPSERT = (3, 24)
+
 
 class DatabaseStoreBackend(StoreBackend):
     def __init__(  # noqa: C901, PLR0912, PLR0913
@@ -228,18 +239,28 @@ class DatabaseStoreBackend(StoreBackend):
             create_engine_kwargs,
         )
 
+    def _build_key_condition(self, key):
+        return sa.and_(
+            *(
+                getattr(self._table.columns, key_col) == val
+                for key_col, val in zip(self.key_columns, key)
+            )
+        )
+
+    def _build_prefix_condition(self, prefix):
+        return sa.and_(
+            True,
+            *(
+                getattr(self._table.columns, key_col) == val
+                for key_col, val in zip(self.key_columns[: len(prefix)], prefix)
+            ),
+        )
+
     def _get(self, key):
         sel = (
             sa.select(sa.column("value"))
             .select_from(self._table)
-            .where(
-                sa.and_(
-                    *(
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns, key)
-                    )
-                )
-            )
+            .where(self._build_key_condition(key))
         )
         try:
             with self.engine.begin() as connection:
@@ -250,29 +271,123 @@ class DatabaseStoreBackend(StoreBackend):
             raise gx_exceptions.StoreError(f"Unable to fetch value for key: {key!s}")  # noqa: TRY003
 
     @override
-    def _get_all(self) -> list[Any]:
-        raise NotImplementedError
+    def _get_many(self, keys: List[tuple], **kwargs) -> list[Any]:
+        key_columns = [getattr(self._table.columns, key_col) for key_col in self.key_columns]
+        chunk_size = max(1, _MAX_BOUND_PARAMETERS_PER_QUERY // len(self.key_columns))
+        values_by_key: Dict[tuple, Any] = {}
+        try:
+            with self.engine.begin() as connection:
+                for start in range(0, len(keys), chunk_size):
+                    sel = (
+                        sa.select(*key_columns, self._table.columns.value)
+                        .select_from(self._table)
+                        .where(
+                            sa.or_(
+                                *(
+                                    self._build_key_condition(key)
+                                    for key in keys[start : start + chunk_size]
+                                )
+                            )
+                        )
+                    )
+                    for row in connection.execute(sel).fetchall():
+                        values_by_key[tuple(row[:-1])] = row[-1]
+        except SQLAlchemyError as e:
+            logger.debug(f"Error fetching values: {e!s}")
+            raise gx_exceptions.StoreError(f"Unable to fetch values for keys: {keys!s}")  # noqa: TRY003
+
+        try:
+            return [values_by_key[tuple(key)] for key in keys]
+        except KeyError as e:
+            raise gx_exceptions.StoreError(f"Unable to fetch value for key: {e.args[0]!s}")  # noqa: TRY003
 
     @override
-    def _set(self, key, value, allow_update=True, **kwargs) -> None:
-        cols = {k: v for (k, v) in zip(self.key_columns, key)}
-        cols["value"] = value
+    def get_all(self, prefix: Tuple = ()) -> list[Any]:
+        """Returns values of all keys (optionally, only those starting with given prefix) using single query."""  # noqa: E501
+        return self._get_all(prefix=prefix)
+
+    @override
+    def _get_all(self, prefix: Tuple = ()) -> list[Any]:
+        sel = (
+            sa.select(self._table.columns.value)
+            .select_from(self._table)
+            .where(self._build_prefix_condition(prefix))
+        )
+        try:
+            with self.engine.begin() as connection:
+                return [row[0] for row in connection.execute(sel).fetchall()]
+        except SQLAlchemyError as e:
+            logger.debug(f"Error fetching values: {e!s}")
+            raise gx_exceptions.StoreError(f"Unable to fetch values for prefix: {prefix!s}")  # noqa: TRY003
+
+    @property
+    def _upsert_dialect(self) -> str | None:
+        """Name of dialect, whose native "upsert" statement can be used for this table (None if not available)."""  # noqa: E501
+        # Conflicts are detected on primary key, which therefore must consist of key columns.
+        if {str(col.name).lower() for col in self._table.primary_key.columns} != set(
+            self.key_columns
+        ):
+            return None
+
+        dialect_name: str = self.engine.dialect.name
+        if dialect_name == "postgresql" and postgresql_insert:
+            return dialect_name
 
-        if allow_update:
-            if self.has_key(key):
-                ins = (
+        if dialect_name in ("mysql", "mariadb") and mysql_insert:
+            return "mysql"
+
+        if dialect_name == "sqlite" and sqlite_insert:
+            server_version_info = self.engine.dialect.server_version_info
+            if server_version_info and server_version_info >= _MIN_SQLITE_VERSION_WITH_UPSERT:
+                return dialect_name
+
+        return None
+
+    def _upsert(self, connection, rows: List[dict]) -> None:
+        """Inserts given rows, replacing values of existing keys, within transaction of given connection.
+
+        Native "upsert" statements (PostgreSQL and SQLite "INSERT ... ON CONFLICT", MySQL "INSERT ... ON DUPLICATE KEY")
+        write all rows in single (executemany) round trip; otherwise, every row is updated and, if absent, inserted.
+        """  # noqa: E501
+        upsert_dialect = self._upsert_dialect
+        if upsert_dialect in ("postgresql", "sqlite"):
+            insert = postgresql_insert if upsert_dialect == "postgresql" else sqlite_insert
+            stmt = insert(self._table)
+            connection.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=self.key_columns, set_={"value": stmt.excluded.value}
+                ),
+                rows,
+            )
+        elif upsert_dialect == "mysql":
+            stmt = mysql_insert(self._table)
+            connection.execute(stmt.on_duplicate_key_update(value=stmt.inserted.value), rows)
+        else:
+            for row in rows:
+                key = tuple(row[key_col] for key_col in self.key_columns)
+                result = connection.execute(
                     self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
-                    .values(**cols)
+                    .where(self._build_key_condition(key))
+                    .values(value=row["value"])
                 )
-            else:
-                ins = self._table.insert().values(**cols)
-        else:
-            ins = self._table.insert().values(**cols)
+                if result.rowcount == 0:
+                    connection.execute(self._table.insert().values(**row))
+
+    def _build_row(self, key, value) -> dict:
+        row = {k: v for (k, v) in zip(self.key_columns, key)}
+        row["value"] = value
+        return row
+
+    @override
+    def _set(self, key, value, allow_update=True, **kwargs) -> None:
+        row = self._build_row(key, value)
 
         try:
             with self.engine.begin() as connection:
-                connection.execute(ins)
+                if allow_update:
+                    self._upsert(connection, [row])
+                else:
+                    connection.execute(self._table.insert().values(**row))
         except sqlalchemy.IntegrityError as e:
             if self._get(key) == value:
                 logger.info(f"Key {key!s} already exists with the same value.")
@@ -281,6 +396,25 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Integrity error {e!s} while trying to store key"
                 )
 
+    @override
+    def _set_many(self, items: List[Tuple[tuple, Any]], allow_update=True, **kwargs) -> None:
+        if not items:
+            return
+
+        rows = [self._build_row(key, value) for key, value in items]
+        try:
+            with self.engine.begin() as connection:
+                if allow_update:
+                    self._upsert(connection, rows)
+                else:
+                    connection.execute(self._table.insert(), rows)
+        except sqlalchemy.IntegrityError as e:
+            logger.warning(
+                f"Batched write of {len(items)} items failed ({e!s}); storing them one by one instead."  # noqa: E501
+            )
+            # Transaction was rolled back; store items one by one to tolerate keys already holding same values.  # noqa: E501
+            super()._set_many(items, allow_update=allow_update, **kwargs)
+
     @override
     def _move(self) -> None:  # type: ignore[override]
         raise NotImplementedError
@@ -307,14 +441,7 @@ class DatabaseStoreBackend(StoreBackend):
         sel = (
             sa.select(sa.func.count(sa.column("value")))
             .select_from(self._table)
-            .where(
-                sa.and_(
-                    *(
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns, key)
-                    )
-                )
-            )
+            .where(self._build_key_condition(key))
         )
         try:
             with self.engine.begin() as connection:
@@ -326,31 +453,14 @@ class DatabaseStoreBackend(StoreBackend):
     def list_keys(self, prefix=()):
         columns = [sa.column(col) for col in self.key_columns]
         sel = (
-            sa.select(*columns)
-            .select_from(self._table)
-            .where(
-                sa.and_(
-                    True,
-                    *(
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns[: len(prefix)], prefix)
-                    ),
-                )
-            )
+            sa.select(*columns).select_from(self._table).where(self._build_prefix_condition(prefix))
         )
         with self.engine.begin() as connection:
             row_list: list[sqlalchemy.Row] = connection.execute(sel).fetchall()
         return [tuple(row) for row in row_list]
 
     def remove_key(self, key):
-        delete_statement = self._table.delete().where(
-            sa.and_(
-                *(
-                    getattr(self._table.columns, key_col) == val
-                    for key_col, val in zip(self.key_columns, key)
-                )
-            )
-        )
+        delete_statement = self._table.delete().where(self._build_key_condition(key))
         try:
             with self.engine.begin() as connection:
                 return connection.execute(delete_statement)
@@ -63,12 +63,13 @@ class ExpectationsStore(Store):
 
     _key_class = ExpectationSuiteIdentifier
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         store_backend=None,
         runtime_environment=None,
         store_name=None,
         data_context=None,
+        json_codec=None,
     ) -> None:
         self._expectationSuiteSchema = ExpectationSuiteSchema()
         self._data_context = data_context
@@ -97,6 +98,7 @@ class ExpectationsStore(Store):
             store_backend=store_backend,
             runtime_environment=runtime_environment,
             store_name=store_name,
+            json_codec=json_codec,
         )
 
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter  # noqa: E501
@@ -105,6 +107,7 @@ class ExpectationsStore(Store):
             "store_backend": store_backend,
             "runtime_environment": runtime_environment,
             "store_name": store_name,
+            "json_codec": json_codec,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -331,13 +334,13 @@ class ExpectationsStore(Store):
             # GXCloudStoreBackend expects a json str
             val = self._expectationSuiteSchema.dump(value)
             return val
-        return self._expectationSuiteSchema.dumps(value, indent=2, sort_keys=True)
+        return self._json_codec.dumps(self._expectationSuiteSchema.dump(value))
 
     def deserialize(self, value):
         if isinstance(value, dict):
             return self._expectationSuiteSchema.load(value)
-        elif isinstance(value, str):
-            return self._expectationSuiteSchema.loads(value)
+        elif isinstance(value, (str, bytes)):
+            return self._expectationSuiteSchema.load(self._json_codec.loads(value))
         else:
             raise TypeError(f"Cannot deserialize value of unknown type: {type(value)}")  # noqa: TRY003
 
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Type, TypeVar, Union
+
+from great_expectations.exceptions import StoreConfigurationError
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility import pydantic
+
+    ModelT = TypeVar("ModelT", bound=pydantic.BaseModel)
+
+logger = logging.getLogger(__name__)
+
+
+class JsonCodec(ABC):
+    """JsonCodec encodes values, held by Store objects, as JSON strings and decodes them back.
+
+    Every codec reads JSON written by any other codec (e.g., pretty-printed files written by default "json" codec), so
+    that codec of existing Store can be changed without migrating its contents.
+    """  # noqa: E501
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def dumps(self, data: Any) -> str:
+        """Encodes JSON-serializable data (dictionaries, lists, strings, numbers, booleans, and None)."""  # noqa: E501
+        raise NotImplementedError
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps_model(self, model: pydantic.BaseModel) -> str:
+        """Encodes pydantic model, applying its custom JSON encoders (which "models_as_dict=False" enables)."""  # noqa: E501
+        return self.dumps(json.loads(model.json(models_as_dict=False)))
+
+    def loads_model(self, model_class: Type[ModelT], data: Union[str, bytes]) -> ModelT:
+        """Decodes pydantic model of given class."""
+        return model_class.parse_raw(data)
+
+
+class PrettyJsonCodec(JsonCodec):
+    """Standard library "json" with indentation and sorted keys (default; human-readable and diff-friendly)."""  # noqa: E501
+
+    name = "json"
+
+    def dumps(self, data: Any) -> str:
+        return json.dumps(data, indent=2, sort_keys=True)
+
+    def dumps_model(self, model: pydantic.BaseModel) -> str:
+        return model.json(models_as_dict=False, indent=2, sort_keys=True)
+
+
+class CompactJsonCodec(JsonCodec):
+    """Standard library "json" with sorted keys, but without any whitespace between tokens."""
+
+    name = "compact"
+
+    _SEPARATORS = (",", ":")
+
+    def dumps(self, data: Any) -> str:
+        return json.dumps(data, separators=self._SEPARATORS, sort_keys=True)
+
+    def dumps_model(self, model: pydantic.BaseModel) -> str:
+        return model.json(models_as_dict=False, separators=self._SEPARATORS, sort_keys=True)
+
+
+class OrjsonCodec(JsonCodec):
+    """Compact JSON with sorted keys, encoded and decoded by "orjson" library (must be installed separately).
+
+    Unlike standard library "json", "orjson" writes non-finite floats (NaN and infinity) as null.  Documents holding
+    such values (written by other codecs) are decoded by standard library "json".
+    """  # noqa: E501
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as e:
+            raise StoreConfigurationError(  # noqa: TRY003
+                'JSON codec "orjson" requires "orjson" package; install it with "pip install orjson".'  # noqa: E501
+            ) from e
+
+        self._orjson = orjson
+        self._options: int = (
+            orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+    def dumps(self, data: Any) -> str:
+        # "orjson.dumps()" returns bytes; Store backends expect strings.
+        return self._orjson.dumps(data, option=self._options).decode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            # Standard library "json" also accepts "NaN" and "Infinity" literals.
+            return json.loads(data)
+
+    def loads_model(self, model_class: Type[ModelT], data: Union[str, bytes]) -> ModelT:
+        return model_class.parse_obj(self.loads(data))
+
+
+_JSON_CODECS: Dict[str, Type[JsonCodec]] = {
+    codec_class.name: codec_class
+    for codec_class in (PrettyJsonCodec, CompactJsonCodec, OrjsonCodec)
+}
+
+DEFAULT_JSON_CODEC_NAME = PrettyJsonCodec.name
+
+
+def get_json_codec(name: Optional[str] = None) -> JsonCodec:
+    """Instantiates JsonCodec, registered under given name ("json", "compact", or "orjson"; default is "json")."""  # noqa: E501
+    codec_name: str = name or DEFAULT_JSON_CODEC_NAME
+    codec_class: Optional[Type[JsonCodec]] = _JSON_CODECS.get(codec_name.lower())
+    if codec_class is None:
+        raise StoreConfigurationError(  # noqa: TRY003
+            f'Unknown JSON codec "{codec_name}"; available codecs are: {", ".join(_JSON_CODECS)}.'
+        )
+
+    return codec_class()
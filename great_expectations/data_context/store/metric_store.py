@@ -4,6 +4,7 @@ import json
 from typing import ClassVar, Type
 
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.sketches import is_serialized_sketch, sketch_from_json_dict
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
@@ -12,6 +13,7 @@ from great_expectations.data_context.types.resource_identifiers import (
     ValidationMetricIdentifier,
 )
 from great_expectations.util import (
+    convert_to_json_serializable,  # noqa: TID251
     filter_properties_dict,
     load_class,
     verify_dynamic_loading_support,
@@ -54,11 +56,16 @@ class MetricStore(Store):
         super().__init__(store_backend=store_backend, store_name=store_name)
 
     def serialize(self, value):
-        return json.dumps({"value": value})
+        # Sketches (and other serializable metric values) are stored as their JSON dictionaries.
+        return json.dumps({"value": convert_to_json_serializable(value)})
 
     def deserialize(self, value):
         if value:
-            return json.loads(value)["value"]
+            value = json.loads(value)["value"]
+            if is_serialized_sketch(value):
+                return sketch_from_json_dict(value)
+
+            return value
 
 
 class SuiteParameterStore(MetricStore):
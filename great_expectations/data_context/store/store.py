@@ -7,6 +7,7 @@ from typing import (
     Any,
     ClassVar,
     Dict,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -20,6 +21,7 @@ from great_expectations.core.data_context_key import DataContextKey
 from great_expectations.data_context.store.gx_cloud_store_backend import (
     GXCloudStoreBackend,
 )
+from great_expectations.data_context.store.json_codec import JsonCodec, get_json_codec
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.data_context.types.resource_identifiers import (
     ConfigurationIdentifier,
@@ -72,6 +74,7 @@ class Store:
         store_backend: Optional[dict] = None,
         runtime_environment: Optional[dict] = None,
         store_name: str = "no_store_name",
+        json_codec: Optional[str] = None,
     ) -> None:
         """
         Runtime environment may be necessary to instantiate store backend elements.
@@ -79,10 +82,12 @@ class Store:
             store_backend:
             runtime_environment:
             store_name: store name given in the DataContextConfig (via either in-code or yaml configuration)
+            json_codec: name of JSON codec ("json", "compact", or "orjson") used by stores that serialize values to JSON strings (default is "json")
         """  # noqa: E501
         if store_backend is None:
             store_backend = {"class_name": "InMemoryStoreBackend"}
         self._store_name = store_name
+        self._json_codec: JsonCodec = get_json_codec(name=json_codec)
         logger.debug("Building store_backend.")
         module_name = "great_expectations.data_context.store"
         self._store_backend = instantiate_class_from_config(
@@ -158,6 +163,10 @@ class Store:
     def store_name(self) -> str:
         return self._store_name
 
+    @property
+    def json_codec(self) -> JsonCodec:
+        return self._json_codec
+
     @property
     def store_backend_id(self) -> str:
         """
@@ -282,6 +291,12 @@ class Store:
         ]
         return [self.tuple_to_key(key) for key in keys_without_store_backend_id]
 
+    def iter_keys(self) -> Iterator[DataContextKey]:
+        """Same as "list_keys()", but yields keys while store backend is still listing them."""
+        for key in self._store_backend.iter_keys():
+            if key != StoreBackend.STORE_BACKEND_ID_KEY:
+                yield self.tuple_to_key(key)
+
     def has_key(self, key: DataContextKey) -> bool:
         if key == StoreBackend.STORE_BACKEND_ID_KEY:
             return self._store_backend.has_key(key)
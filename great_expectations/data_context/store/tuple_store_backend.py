@@ -9,7 +9,8 @@ import random
 import re
 import shutil
 from abc import ABCMeta
-from typing import Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 from great_expectations.compatibility import aws
 from great_expectations.compatibility.typing_extensions import override
@@ -19,6 +20,37 @@ from great_expectations.util import filter_properties_dict
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Number of objects, downloaded concurrently by "get_all()" of cloud storage backends, unless configured otherwise.  # noqa: E501
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+def _resolve_max_concurrency(max_concurrency: Optional[int]) -> int:
+    if max_concurrency is None:
+        return DEFAULT_MAX_CONCURRENCY
+
+    if not isinstance(max_concurrency, int) or max_concurrency < 1:
+        raise StoreBackendError(  # noqa: TRY003
+            f"max_concurrency must be a positive integer; {max_concurrency!r} was given."
+        )
+
+    return max_concurrency
+
+
+def _map_concurrently(func: Callable[[T], R], items: Iterable[T], max_concurrency: int) -> List[R]:
+    """Applies "func" to every item using pool of (at most) "max_concurrency" threads; results follow order of items.
+
+    Items are submitted to pool as soon as they are produced, so that (I/O bound) calls of "func" can start before
+    (lazily paginated) listing of items is exhausted.
+    """  # noqa: E501
+    if max_concurrency == 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        return list(executor.map(func, items))
+
 
 class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     r"""
@@ -467,6 +499,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -496,6 +529,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
             s3_put_options = {}
         self.s3_put_options = s3_put_options
         self.endpoint_url = endpoint_url
+        self._max_concurrency = _resolve_max_concurrency(max_concurrency)
+        self._client = None
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -518,6 +553,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             "base_public_path = None": base_public_path,
             "endpoint_url": endpoint_url,
             "store_name": store_name,
+            "max_concurrency": max_concurrency,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -539,22 +575,27 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return s3_object_key
 
     def _get(self, key):
-        client = self._create_client()
         s3_object_key = self._build_s3_object_key(key)
-        return self._get_by_s3_object_key(client, s3_object_key)
+        return self._get_by_s3_object_key(self._s3_client, s3_object_key)
 
     @override
     def _get_all(self) -> list[Any]:
         """Get all objects from the store.
-        NOTE: This is non-performant because we download each object separately.
+        NOTE: S3 has no batch download; objects are downloaded separately, but (up to "max_concurrency") concurrently.
         See https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/bucket/objects.html#objects
         for the docs.
-        """
-        client = self._create_client()
-        keys = self.list_keys()
-        keys = [k for k in keys if k != StoreBackend.STORE_BACKEND_ID_KEY]
-        s3_object_keys = [self._build_s3_object_key(key) for key in keys]
-        return [self._get_by_s3_object_key(client, key) for key in s3_object_keys]
+        """  # noqa: E501
+        get_by_s3_object_key = functools.partial(self._get_by_s3_object_key, self._s3_client)
+        s3_object_keys = (
+            self._build_s3_object_key(key)
+            for key in self.iter_keys()
+            if key != StoreBackend.STORE_BACKEND_ID_KEY
+        )
+        return _map_concurrently(
+            func=get_by_s3_object_key,
+            items=s3_object_keys,
+            max_concurrency=self._max_concurrency,
+        )
 
     def _get_by_s3_object_key(self, s3_client, s3_object_key):
         try:
@@ -615,11 +656,15 @@ class TupleS3StoreBackend(TupleStoreBackend):
         s3.Object(self.bucket, source_filepath).delete()
 
     @override
-    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:  # noqa: C901 - too complex
+    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
         # Note that the prefix arg is only included to maintain consistency with the parent class signature  # noqa: E501
+        return list(self.iter_keys(prefix=prefix))
+
+    @override
+    def iter_keys(self, prefix: Tuple = ()) -> Iterator[Tuple]:  # noqa: C901 - too complex
+        """Yields keys while objects are being listed (page by page), rather than after listing is complete."""  # noqa: E501
         s3r = self._create_resource()
         bucket = s3r.Bucket(self.bucket)
-        key_list = []
         if self.prefix:
             objects_list = bucket.objects.filter(Prefix=self.prefix)
         else:
@@ -644,8 +689,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
                 continue
             key = self._convert_filepath_to_key(s3_object_key)
             if key:
-                key_list.append(key)
-        return key_list
+                yield key
 
     def get_url_for_key(self, key, protocol=None):
         location = None
@@ -654,9 +698,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         else:
             # build s3 endpoint when no endpoint_url is configured
 
-            location = self._create_client().get_bucket_location(Bucket=self.bucket)[
-                "LocationConstraint"
-            ]
+            location = self._s3_client.get_bucket_location(Bucket=self.bucket)["LocationConstraint"]
 
             if location is None:
                 location = "https://s3.amazonaws.com"
@@ -732,6 +774,14 @@ class TupleS3StoreBackend(TupleStoreBackend):
     def _create_client(self):
         return aws.boto3.client("s3", **self.boto3_options)
 
+    @property
+    def _s3_client(self):
+        # Clients (unlike resources) of boto3 are thread-safe; one is created lazily and shared by all requests.  # noqa: E501
+        if self._client is None:
+            self._client = self._create_client()
+
+        return self._client
+
     def _create_resource(self):
         return aws.boto3.resource("s3", **self.boto3_options)
 
@@ -767,6 +817,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         public_urls=True,
         base_public_path=None,
         store_name=None,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -784,6 +835,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         self.prefix = prefix
         self.project = project
         self._public_urls = public_urls
+        self._max_concurrency = _resolve_max_concurrency(max_concurrency)
+        self._client = None
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -805,11 +858,22 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             "public_urls": public_urls,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "max_concurrency": max_concurrency,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
+    @property
+    def _gcs_client(self):
+        # Client is created lazily and shared by all requests (including concurrent downloads of "get_all()").  # noqa: E501
+        if self._client is None:
+            from great_expectations.compatibility import google
+
+            self._client = google.storage.Client(project=self.project)
+
+        return self._client
+
     def _build_gcs_object_key(self, key):
         if self.platform_specific_separator:
             if self.prefix:
@@ -826,23 +890,20 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return gcs_object_key
 
     def _get(self, key):
-        from great_expectations.compatibility import google
-
-        gcs = google.storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
+        bucket = self._gcs_client.bucket(self.bucket)
         return self._get_by_gcs_object_key(bucket, key)
 
     @override
     def _get_all(self) -> list[Any]:
-        from great_expectations.compatibility import google
-
-        gcs = google.storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
-
-        keys = self.list_keys()
-        keys = [k for k in keys if k != StoreBackend.STORE_BACKEND_ID_KEY]
-
-        return [self._get_by_gcs_object_key(bucket, key) for key in keys]
+        bucket = self._gcs_client.bucket(self.bucket)
+
+        get_by_gcs_object_key = functools.partial(self._get_by_gcs_object_key, bucket)
+        keys = (key for key in self.iter_keys() if key != StoreBackend.STORE_BACKEND_ID_KEY)
+        return _map_concurrently(
+            func=get_by_gcs_object_key,
+            items=keys,
+            max_concurrency=self._max_concurrency,
+        )
 
     def _get_by_gcs_object_key(self, bucket, key):
         gcs_object_key = self._build_gcs_object_key(key)
@@ -864,10 +925,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     ):
         gcs_object_key = self._build_gcs_object_key(key)
 
-        from great_expectations.compatibility import google
-
-        gcs = google.storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
+        bucket = self._gcs_client.bucket(self.bucket)
         blob = bucket.blob(gcs_object_key)
 
         if isinstance(value, str):
@@ -879,10 +937,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
 
     @override
     def _move(self, source_key, dest_key, **kwargs) -> None:
-        from great_expectations.compatibility import google
-
-        gcs = google.storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
+        bucket = self._gcs_client.bucket(self.bucket)
 
         source_filepath = self._convert_key_to_filepath(source_key)
         if not source_filepath.startswith(self.prefix):
@@ -897,13 +952,12 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
         # Note that the prefix arg is only included to maintain consistency with the parent class signature  # noqa: E501
-        key_list = []
-
-        from great_expectations.compatibility import google
-
-        gcs = google.storage.Client(self.project)
+        return list(self.iter_keys(prefix=prefix))
 
-        for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
+    @override
+    def iter_keys(self, prefix: Tuple = ()) -> Iterator[Tuple]:
+        """Yields keys while blobs are being listed (page by page), rather than after listing is complete."""  # noqa: E501
+        for blob in self._gcs_client.list_blobs(self.bucket, prefix=self.prefix):
             gcs_object_name = blob.name
             gcs_object_key = os.path.relpath(
                 gcs_object_name,
@@ -917,8 +971,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
                 continue
             key = self._convert_filepath_to_key(gcs_object_key)
             if key:
-                key_list.append(key)
-        return key_list
+                yield key
 
     def get_url_for_key(self, key, protocol=None):
         path = self._convert_key_to_filepath(key)
@@ -960,8 +1013,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     def remove_key(self, key):
         from great_expectations.compatibility import google
 
-        gcs = google.storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
+        bucket = self._gcs_client.bucket(self.bucket)
         try:
             bucket.delete_blobs(blobs=list(bucket.list_blobs(prefix=self.prefix)))
         except google.NotFound:
@@ -1002,6 +1054,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
         store_name=None,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -1025,6 +1078,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         self.account_url = account_url or os.environ.get(  # noqa: TID251
             "AZURE_STORAGE_ACCOUNT_URL"
         )
+        self._max_concurrency = _resolve_max_concurrency(max_concurrency)
 
     @property
     @functools.lru_cache  # noqa: B019 # lru_cache on method
@@ -1071,8 +1125,12 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
 
     @override
     def _get_all(self) -> list[Any]:
-        keys = self.list_keys()
-        return [self._get(key) for key in keys]
+        # Container client (shared by all requests) is thread-safe.
+        return _map_concurrently(
+            func=self._get,
+            items=self.iter_keys(),
+            max_concurrency=self._max_concurrency,
+        )
 
     def _set(self, key, value, content_encoding="utf-8", **kwargs):
         from great_expectations.compatibility.azure import ContentSettings
@@ -1105,8 +1163,11 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
         # Note that the prefix arg is only included to maintain consistency with the parent class signature  # noqa: E501
-        key_list = []
+        return list(self.iter_keys(prefix=prefix))
 
+    @override
+    def iter_keys(self, prefix: Tuple = ()) -> Iterator[Tuple]:
+        """Yields keys while blobs are being listed (page by page), rather than after listing is complete."""  # noqa: E501
         for obj in self._container_client.list_blobs(name_starts_with=self.prefix):
             az_blob_key = os.path.relpath(obj.name)
             if az_blob_key.startswith(f"{self.prefix}{os.path.sep}"):
@@ -1120,8 +1181,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
                 continue
             key = self._convert_filepath_to_key(az_blob_key)
 
-            key_list.append(key)
-        return key_list
+            yield key
 
     def get_url_for_key(self, key, protocol=None):
         az_blob_key = self._convert_key_to_filepath(key)
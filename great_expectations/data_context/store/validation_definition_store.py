@@ -60,13 +60,13 @@ class ValidationDefinitionStore(Store):
 
         # In order to enable the custom json_encoders in ValidationDefinition, we need to set `models_as_dict` off  # noqa: E501
         # Ref: https://docs.pydantic.dev/1.10/usage/exporting_models/#serialising-self-reference-or-other-models
-        return value.json(models_as_dict=False, indent=2, sort_keys=True)
+        return self._json_codec.dumps_model(value)
 
     @override
     def deserialize(self, value):
         from great_expectations.core.validation_definition import ValidationDefinition
 
-        return ValidationDefinition.parse_raw(value)
+        return self._json_codec.loads_model(ValidationDefinition, value)
 
     @override
     def _add(self, key: DataContextKey, value: ValidationDefinition, **kwargs):
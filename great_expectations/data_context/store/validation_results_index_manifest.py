@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import logging
+import os
+import pathlib
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from great_expectations.util import convert_to_json_serializable  # noqa: TID251
+
+if TYPE_CHECKING:
+    from great_expectations.core.expectation_validation_result import (
+        ExpectationSuiteValidationResult,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+VALIDATION_RESULTS_INDEX_MANIFEST_FILE_NAME = ".validation_results_index_manifest.jsonl"
+
+_IndexManifestKey = Tuple[str, ...]
+
+
+class ValidationResultsIndexManifest:
+    """Compact index of stored Validation Results, holding only what Data Docs index page needs to render.
+
+    Every entry maps key tuple of "ValidationResultIdentifier" to "success", "batch_kwargs", and "batch_spec" of
+    corresponding Validation Result, so that index page can be built without deserializing every Validation Result.
+
+    When "filepath" is given, manifest is persisted as JSON lines file, to which entries (and removals) are appended;
+    later lines take precedence over earlier ones, and only newly appended lines are read on subsequent access.
+    Otherwise, manifest is kept in memory for lifetime of this object (and has to be filled in again in new process).
+
+    Existing stores are backfilled with "ValidationResultsStore.rebuild_index_manifest()", also available as command:
+
+        python -m great_expectations.data_context.store.validation_results_index_manifest --context-root-dir <dir>
+
+    Args:
+        filepath: optional location of JSON lines file backing this manifest.
+    """  # noqa: E501
+
+    def __init__(self, filepath: Optional[str] = None) -> None:
+        self._filepath = filepath
+        self._entries: Dict[_IndexManifestKey, dict] = {}
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        cls = self.__class__
+        result = cls.__new__(cls)
+
+        memo[id(self)] = result
+
+        with self._lock:
+            result._filepath = self._filepath
+            result._entries = copy.deepcopy(self._entries, memo)
+            result._offset = self._offset
+
+        result._lock = threading.Lock()
+
+        return result
+
+    @property
+    def filepath(self) -> Optional[str]:
+        return self._filepath
+
+    @staticmethod
+    def build_entry(validation_result: ExpectationSuiteValidationResult) -> dict:
+        """Extracts fields, rendered on Data Docs index page, from given Validation Result."""
+        meta: dict = validation_result.meta or {}
+        return {
+            "success": validation_result.success,
+            "batch_kwargs": convert_to_json_serializable(meta.get("batch_kwargs", {})),
+            "batch_spec": convert_to_json_serializable(meta.get("batch_spec", {})),
+        }
+
+    def get(self, key: _IndexManifestKey) -> Optional[dict]:
+        return self.entries().get(tuple(key))
+
+    def entries(self) -> Dict[_IndexManifestKey, dict]:
+        """Returns all current entries (reading only lines appended since last access)."""
+        with self._lock:
+            self._refresh()
+            return dict(self._entries)
+
+    def add(self, key: _IndexManifestKey, entry: dict) -> None:
+        key = tuple(key)
+        with self._lock:
+            self._append(record={"key": list(key), **entry})
+            self._entries[key] = entry
+
+    def remove(self, key: _IndexManifestKey) -> None:
+        key = tuple(key)
+        with self._lock:
+            self._append(record={"key": list(key), "removed": True})
+            self._entries.pop(key, None)
+
+    def rewrite(self, entries: Iterable[Tuple[_IndexManifestKey, dict]]) -> int:
+        """Replaces contents of manifest with given "(key, entry)" pairs; returns number of entries written."""  # noqa: E501
+        new_entries: Dict[_IndexManifestKey, dict] = {tuple(key): entry for key, entry in entries}
+        with self._lock:
+            if self._filepath:
+                os.makedirs(os.path.dirname(self._filepath), exist_ok=True)  # noqa: PTH103, PTH120
+                temp_filepath = f"{self._filepath}.tmp"
+                with open(temp_filepath, "w") as outfile:
+                    for key, entry in new_entries.items():
+                        outfile.write(self._dumps(record={"key": list(key), **entry}))
+
+                os.replace(temp_filepath, self._filepath)  # noqa: PTH105
+                self._offset = os.path.getsize(self._filepath)  # noqa: PTH202
+
+            self._entries = new_entries
+
+        return len(new_entries)
+
+    def _append(self, record: dict) -> None:
+        if not self._filepath:
+            return
+
+        # Pick up lines appended by other writers first, so that local state stays in order.
+        self._refresh()
+        os.makedirs(os.path.dirname(self._filepath), exist_ok=True)  # noqa: PTH103, PTH120
+        with open(self._filepath, "a") as outfile:
+            outfile.write(self._dumps(record=record))
+
+        self._offset = os.path.getsize(self._filepath)  # noqa: PTH202
+
+    def _refresh(self) -> None:
+        if not self._filepath:
+            return
+
+        try:
+            size: int = os.path.getsize(self._filepath)  # noqa: PTH202
+        except FileNotFoundError:
+            self._entries = {}
+            self._offset = 0
+            return
+
+        if size < self._offset:
+            # File was rewritten; read it anew.
+            self._entries = {}
+            self._offset = 0
+
+        if size == self._offset:
+            return
+
+        with open(self._filepath, "rb") as infile:
+            infile.seek(self._offset)
+            content: bytes = infile.read()
+
+        # Only consume complete lines; partially written trailing line is read on next access.
+        consumed: int = content.rfind(b"\n") + 1
+        line: bytes
+        for line in content[:consumed].splitlines():
+            self._load_record(line=line)
+
+        self._offset += consumed
+
+    def _load_record(self, line: bytes) -> None:
+        if not line.strip():
+            return
+
+        try:
+            record: Any = json.loads(line)
+            key: _IndexManifestKey = tuple(record.pop("key"))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            logger.warning(f"Skipping malformed line in {self._filepath}.")
+            return
+
+        if record.get("removed"):
+            self._entries.pop(key, None)
+        else:
+            self._entries[key] = record
+
+    @staticmethod
+    def _dumps(record: dict) -> str:
+        return json.dumps(record, sort_keys=True) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Backfills index manifest of Validation Results store of File Data Context (one-time operation)."""  # noqa: E501
+    parser = argparse.ArgumentParser(
+        prog="python -m great_expectations.data_context.store.validation_results_index_manifest",
+        description="Rebuild Validation Results index manifest from all stored Validation Results.",
+    )
+    parser.add_argument(
+        "--context-root-dir",
+        required=True,
+        help='Directory containing "great_expectations.yml" of File Data Context.',
+    )
+    args = parser.parse_args(argv)
+
+    from great_expectations.data_context.data_context.context_factory import get_context
+    from great_expectations.data_context.data_context.file_data_context import (
+        FileDataContext,
+    )
+
+    context_root_dir = pathlib.Path(args.context_root_dir)
+    if not (context_root_dir / FileDataContext.GX_YML).is_file():
+        print(f'No "{FileDataContext.GX_YML}" found in {context_root_dir}.', file=sys.stderr)
+        return 1
+
+    context = get_context(context_root_dir=context_root_dir)
+    count: int = context.validation_results_store.rebuild_index_manifest()
+    print(f"Recorded {count} Validation Results in index manifest.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
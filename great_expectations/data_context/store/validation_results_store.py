@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, Dict, Optional, Type
+import logging
+import os
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple, Type
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.expectation_validation_result import (
@@ -11,7 +13,14 @@ from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
 from great_expectations.data_context.store.store import Store
-from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
+from great_expectations.data_context.store.tuple_store_backend import (
+    TupleFilesystemStoreBackend,
+    TupleStoreBackend,
+)
+from great_expectations.data_context.store.validation_results_index_manifest import (
+    VALIDATION_RESULTS_INDEX_MANIFEST_FILE_NAME,
+    ValidationResultsIndexManifest,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     GXCloudIdentifier,
@@ -26,6 +35,8 @@ from great_expectations.util import (
 if TYPE_CHECKING:
     from great_expectations.data_context.types.refs import GXCloudResourceRef
 
+logger = logging.getLogger(__name__)
+
 
 class ValidationResultsStore(Store):
     """
@@ -98,7 +109,13 @@ class ValidationResultsStore(Store):
 
     _key_class: ClassVar[Type] = ValidationResultIdentifier
 
-    def __init__(self, store_backend=None, runtime_environment=None, store_name=None) -> None:
+    def __init__(
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        store_name=None,
+        json_codec=None,
+    ) -> None:
         self._expectationSuiteValidationResultSchema = ExpectationSuiteValidationResultSchema()
 
         if store_backend is not None:
@@ -131,6 +148,7 @@ class ValidationResultsStore(Store):
             store_backend=store_backend,
             runtime_environment=runtime_environment,
             store_name=store_name,
+            json_codec=json_codec,
         )
 
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter  # noqa: E501
@@ -139,11 +157,24 @@ class ValidationResultsStore(Store):
             "store_backend": store_backend,
             "runtime_environment": runtime_environment,
             "store_name": store_name,
+            "json_codec": json_codec,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
+        self._index_manifest = self._build_index_manifest()
+
+    @property
+    def index_manifest(self) -> ValidationResultsIndexManifest:
+        """Compact index of stored Validation Results, used for building Data Docs index pages.
+
+        Note: Manifest is persisted only by "TupleFilesystemStoreBackend" (as file next to Validation Results).  With
+        other backends (S3, GCS, Azure, database, in-memory), it is kept in memory and starts out empty in every new
+        process, so Data Docs index builder loads Validation Results missing from it (once per process).
+        """  # noqa: E501
+        return self._index_manifest
+
     @override
     @staticmethod
     def gx_cloud_response_json_to_object_dict(response_json: Dict) -> Dict:
@@ -160,21 +191,123 @@ class ValidationResultsStore(Store):
     def serialize(self, value):
         if self.cloud_mode:
             return value.to_json_dict()
-        return self._expectationSuiteValidationResultSchema.dumps(
-            value.to_json_dict(), indent=2, sort_keys=True
+        return self._json_codec.dumps(
+            self._expectationSuiteValidationResultSchema.dump(value.to_json_dict())
         )
 
     def deserialize(self, value):
         if isinstance(value, dict):
             return self._expectationSuiteValidationResultSchema.load(value)
         else:
-            return self._expectationSuiteValidationResultSchema.loads(value)
+            return self._expectationSuiteValidationResultSchema.load(self._json_codec.loads(value))
 
     @property
     @override
     def config(self) -> dict:
         return self._config
 
+    @override
+    def set(self, key, value, **kwargs):
+        result = super().set(key=key, value=value, **kwargs)
+        self._record_in_index_manifest(key=key, value=value)
+        return result
+
+    @override
+    def _add(self, key, value, **kwargs):
+        result = super()._add(key=key, value=value, **kwargs)
+        self._record_in_index_manifest(key=key, value=value)
+        return result
+
+    @override
+    def _update(self, key, value, **kwargs):
+        result = super()._update(key=key, value=value, **kwargs)
+        self._record_in_index_manifest(key=key, value=value)
+        return result
+
+    @override
+    def _add_or_update(self, key, value, **kwargs):
+        result = super()._add_or_update(key=key, value=value, **kwargs)
+        self._record_in_index_manifest(key=key, value=value)
+        return result
+
+    @override
+    def remove_key(self, key):
+        result = super().remove_key(key)
+        if not self.cloud_mode:
+            key_tuple: Tuple[str, ...] = key if isinstance(key, tuple) else key.to_tuple()
+            try:
+                self._index_manifest.remove(key=key_tuple)
+            except OSError as e:
+                logger.warning(f"Unable to update Validation Results index manifest: {e}")
+
+        return result
+
+    def add_to_index_manifest(
+        self,
+        key: ValidationResultIdentifier,
+        validation_result: ExpectationSuiteValidationResult,
+    ) -> None:
+        """Records index page fields of given Validation Result in index manifest of this store.
+
+        Failure to update manifest never fails storing Validation Result (index page falls back to loading it).
+        """  # noqa: E501
+        try:
+            self._index_manifest.add(
+                key=key.to_tuple(),
+                entry=ValidationResultsIndexManifest.build_entry(
+                    validation_result=validation_result
+                ),
+            )
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Unable to update Validation Results index manifest: {e}")
+
+    def _record_in_index_manifest(self, key, value) -> None:
+        # Every write of Validation Result (re)places its entry, so that overwritten results do not leave stale entries.  # noqa: E501
+        if isinstance(key, ValidationResultIdentifier) and not self.cloud_mode:
+            self.add_to_index_manifest(key=key, validation_result=value)
+
+    def rebuild_index_manifest(self) -> int:
+        """Backfills index manifest from all Validation Results currently in this store.
+
+        This is a one-time operation for stores, populated before index manifest was maintained (or modified outside
+        of this store); afterwards, manifest is kept up to date as Validation Results are written and removed.
+
+        Returns:
+            Number of Validation Results recorded in index manifest.
+        """  # noqa: E501
+        entries: List[Tuple[Tuple[str, ...], dict]] = []
+        key: ValidationResultIdentifier
+        for key in self.iter_keys():
+            validation_result: Any = self.get(key=key)
+            if validation_result is None:
+                continue
+
+            entries.append(
+                (
+                    key.to_tuple(),
+                    ValidationResultsIndexManifest.build_entry(validation_result=validation_result),
+                )
+            )
+
+        return self._index_manifest.rewrite(entries=entries)
+
+    def _build_index_manifest(self) -> ValidationResultsIndexManifest:
+        # Only locally-mounted filesystem supports appending to manifest file; other backends keep it in memory.  # noqa: E501
+        if not isinstance(self._store_backend, TupleFilesystemStoreBackend):
+            return ValidationResultsIndexManifest()
+
+        # Manifest file is kept next to Validation Results, but must not be listed as one of them.
+        self._store_backend.IGNORED_FILES = [
+            *self._store_backend.IGNORED_FILES,
+            VALIDATION_RESULTS_INDEX_MANIFEST_FILE_NAME,
+        ]
+        return ValidationResultsIndexManifest(
+            filepath=os.path.join(  # noqa: PTH118
+                self._store_backend.full_base_directory,
+                VALIDATION_RESULTS_INDEX_MANIFEST_FILE_NAME,
+            )
+        )
+
     def store_validation_results(
         self,
         suite_validation_result: ExpectationSuiteValidationResult,
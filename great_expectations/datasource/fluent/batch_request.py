@@ -7,6 +7,7 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    List,
     Mapping,
     Optional,
     Union,
@@ -59,6 +60,8 @@ class BatchRequest(pydantic.GenericModel, Generic[PartitionerT]):
             calling DataAsset.get_batch_parameters_keys(...).
         batch_slice: A python slice that can be used to filter the sorted batches by index.
             e.g. `batch_slice = "[-5:]"` will request only the last 5 batches after the options filter is applied.
+        columns: An optional list of column names; if provided, only these columns are loaded into Batch data
+            (where supported by the Data Asset), while schema metadata (e.g., "table.columns") is left intact.
 
     Returns:
         BatchRequest
@@ -86,13 +89,19 @@ class BatchRequest(pydantic.GenericModel, Generic[PartitionerT]):
     _batch_slice_input: Optional[BatchSlice] = pydantic.PrivateAttr(
         default=None,
     )
+    # Column projection is a directive for loading Batch data; it is not part of the request identity.  # noqa: E501
+    _columns: Optional[List[str]] = pydantic.PrivateAttr(
+        default=None,
+    )
 
     def __init__(self, **kwargs) -> None:
         _batch_slice_input: Optional[BatchSlice] = None
         if "batch_slice" in kwargs:
             _batch_slice_input = kwargs.pop("batch_slice")
+        _columns: Optional[List[str]] = kwargs.pop("columns", None)
         super().__init__(**kwargs)
         self._batch_slice_input = _batch_slice_input
+        self.update_columns(_columns)
 
     @property
     def batch_slice(self) -> slice:
@@ -114,9 +123,29 @@ class BatchRequest(pydantic.GenericModel, Generic[PartitionerT]):
             raise ValueError(f"Failed to parse BatchSlice to slice: {e}")  # noqa: TRY003
         self._batch_slice_input = value
 
+    @property
+    def columns(self) -> Optional[List[str]]:
+        """Names of the only columns to load into Batch data (None means all columns)."""
+        return self._columns
+
+    def update_columns(self, value: Optional[List[str]] = None) -> None:
+        """Updates the columns on this BatchRequest.
+
+        Args:
+            value: The new list of column names to load into Batch data (None means all columns).
+
+        Returns:
+            None
+        """
+        if value is not None and (
+            isinstance(value, str) or not all(isinstance(column, str) for column in value)
+        ):
+            raise TypeError("columns must be a list of column names.")  # noqa: TRY003
+        self._columns = None if value is None else list(value)
+
     class Config:
         extra = pydantic.Extra.forbid
-        property_set_methods = {"batch_slice": "update_batch_slice"}
+        property_set_methods = {"batch_slice": "update_batch_slice", "columns": "update_columns"}
         validate_assignment = True
 
     def __setattr__(self, key, val):
@@ -12,6 +12,7 @@ from typing import (
     Mapping,
     Optional,
     Set,
+    cast,
 )
 
 import great_expectations.exceptions as gx_exceptions
@@ -29,16 +30,16 @@ from great_expectations.datasource.fluent.interfaces import (
     DataAsset,
     DatasourceT,
     PartitionerSortingProtocol,
+    PendingBatch,
     TestConnectionError,
 )
+from great_expectations.execution_engine import PandasExecutionEngine
 
 if TYPE_CHECKING:
     from great_expectations.alias_types import PathStr
     from great_expectations.core.batch import LegacyBatchDefinition
-    from great_expectations.execution_engine import (
-        PandasExecutionEngine,
-        SparkDFExecutionEngine,
-    )
+    from great_expectations.core.batch_spec import BatchSpec
+    from great_expectations.execution_engine import SparkDFExecutionEngine
 
 logger = logging.getLogger(__name__)
 
@@ -132,38 +133,72 @@ class PathDataAsset(DataAsset, Generic[DatasourceT, PartitionerT], ABC):
             self.datasource.get_execution_engine()
         )
 
-        batch_definition_list = self._get_batch_definition_list(batch_request)
-
-        batch_list: List[Batch] = []
+        # The data connector would apply "batch_slice" before batches are sorted; instead, sorting
+        # and slicing are applied to batch identifiers first, so that data is only loaded for the
+        # batches that are actually returned.
+        unsliced_batch_request = copy.deepcopy(batch_request)
+        unsliced_batch_request.update_batch_slice(None)
+        batch_definition_list = self._get_batch_definition_list(unsliced_batch_request)
 
+        pending_batches: List[PendingBatch] = []
         for batch_definition in batch_definition_list:
+            fully_specified_batch_request = copy.deepcopy(batch_request)
+            fully_specified_batch_request.options.update(batch_definition.batch_identifiers)
+            batch_metadata = self._get_batch_metadata_from_batch_request(
+                batch_request=fully_specified_batch_request
+            )
+            pending_batches.append(
+                PendingBatch(
+                    batch_request=fully_specified_batch_request,
+                    metadata=batch_metadata,
+                    batch_definition=batch_definition,
+                )
+            )
+
+        if sortable_partitioner := self._get_sortable_partitioner(batch_request.partitioner):
+            self.sort_batches(pending_batches, sortable_partitioner)
+
+        sliced_pending_batches: List[PendingBatch] = pending_batches[batch_request.batch_slice]
+        batch_specs: List[BatchSpec] = []
+        pending_batch: PendingBatch
+        for pending_batch in sliced_pending_batches:
+            batch_definition = cast("LegacyBatchDefinition", pending_batch.batch_definition)
             batch_spec = self._data_connector.build_batch_spec(batch_definition=batch_definition)
             batch_spec_options = self._batch_spec_options_from_batch_request(batch_request)
             batch_spec.update(batch_spec_options)
+            if batch_request.columns is not None:
+                batch_spec["columns"] = batch_request.columns
 
-            data, markers = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
+            batch_specs.append(batch_spec)
 
-            fully_specified_batch_request = copy.deepcopy(batch_request)
-            fully_specified_batch_request.options.update(batch_definition.batch_identifiers)
-            batch_metadata = self._get_batch_metadata_from_batch_request(
-                batch_request=fully_specified_batch_request
+        batch_data_and_markers: List[tuple]
+        if isinstance(execution_engine, PandasExecutionEngine):
+            # Batches, partitioned from the same file, are sliced from a single read of it.
+            batch_data_and_markers = execution_engine.get_batch_data_and_markers_list(
+                batch_specs=batch_specs
             )
+        else:
+            batch_data_and_markers = [
+                execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
+                for batch_spec in batch_specs
+            ]
 
+        batch_list: List[Batch] = []
+        for pending_batch, batch_spec, (data, markers) in zip(
+            sliced_pending_batches, batch_specs, batch_data_and_markers
+        ):
             batch = Batch(
                 datasource=self.datasource,
                 data_asset=self,
-                batch_request=fully_specified_batch_request,
+                batch_request=pending_batch.batch_request,
                 data=data,
-                metadata=batch_metadata,
+                metadata=pending_batch.metadata,
                 batch_markers=markers,
                 batch_spec=batch_spec,
-                batch_definition=batch_definition,
+                batch_definition=cast("LegacyBatchDefinition", pending_batch.batch_definition),
             )
             batch_list.append(batch)
 
-        if sortable_partitioner := self._get_sortable_partitioner(batch_request.partitioner):
-            self.sort_batches(batch_list, sortable_partitioner)
-
         return batch_list
 
     def _get_batch_definition_list(
@@ -233,42 +233,42 @@ def list_s3_keys(  # noqa: C901 - too complex
     if iterator_dict is None:
         iterator_dict = {}
 
-    if "continuation_token" in iterator_dict:
-        query_options.update({"ContinuationToken": iterator_dict["continuation_token"]})
-
-    logger.debug(f"Fetching objects from S3 with query options: {query_options}")
-
-    s3_objects_info: dict = s3.list_objects_v2(**query_options)
-
-    if not any(key in s3_objects_info for key in ["Contents", "CommonPrefixes"]):
-        raise ValueError("S3 query may not have been configured correctly.")  # noqa: TRY003
-
-    if "Contents" in s3_objects_info:
-        keys: List[str] = [item["Key"] for item in s3_objects_info["Contents"] if item["Size"] > 0]
-        yield from keys
+    # Pages (continuation tokens) are fetched iteratively, so that listing is not bounded by recursion limit.  # noqa: E501
+    while True:
+        if "continuation_token" in iterator_dict:
+            query_options.update({"ContinuationToken": iterator_dict["continuation_token"]})
+
+        logger.debug(f"Fetching objects from S3 with query options: {query_options}")
+
+        s3_objects_info: dict = s3.list_objects_v2(**query_options)
+
+        if not any(key in s3_objects_info for key in ["Contents", "CommonPrefixes"]):
+            raise ValueError("S3 query may not have been configured correctly.")  # noqa: TRY003
+
+        if "Contents" in s3_objects_info:
+            keys: List[str] = [
+                item["Key"] for item in s3_objects_info["Contents"] if item["Size"] > 0
+            ]
+            yield from keys
+
+        if recursive and "CommonPrefixes" in s3_objects_info:
+            common_prefixes: List[Dict[str, Any]] = s3_objects_info["CommonPrefixes"]
+            for prefix_info in common_prefixes:
+                query_options_tmp: dict = copy.deepcopy(query_options)
+                query_options_tmp.pop("ContinuationToken", None)
+                query_options_tmp.update({"Prefix": prefix_info["Prefix"]})
+                # Recursively fetch from updated prefix
+                yield from list_s3_keys(
+                    s3=s3,
+                    query_options=query_options_tmp,
+                    iterator_dict={},
+                    recursive=recursive,
+                )
+
+        if not s3_objects_info["IsTruncated"]:
+            break
 
-    if recursive and "CommonPrefixes" in s3_objects_info:
-        common_prefixes: List[Dict[str, Any]] = s3_objects_info["CommonPrefixes"]
-        for prefix_info in common_prefixes:
-            query_options_tmp: dict = copy.deepcopy(query_options)
-            query_options_tmp.update({"Prefix": prefix_info["Prefix"]})
-            # Recursively fetch from updated prefix
-            yield from list_s3_keys(
-                s3=s3,
-                query_options=query_options_tmp,
-                iterator_dict={},
-                recursive=recursive,
-            )
-
-    if s3_objects_info["IsTruncated"]:
         iterator_dict["continuation_token"] = s3_objects_info["NextContinuationToken"]
-        # Recursively fetch more
-        yield from list_s3_keys(
-            s3=s3,
-            query_options=query_options,
-            iterator_dict=iterator_dict,
-            recursive=recursive,
-        )
 
     if "continuation_token" in iterator_dict:
         # Make sure we clear the token once we've gotten fully through
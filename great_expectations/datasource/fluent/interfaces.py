@@ -196,6 +196,19 @@ class GxSerializationWarning(GxDatasourceWarning):
 BatchMetadata: TypeAlias = Dict[str, Any]
 
 
+@dataclasses.dataclass(frozen=True)
+class PendingBatch:
+    """Identifies a Batch (fully specified BatchRequest and metadata) before its data is loaded.
+
+    DataAssets sort and slice PendingBatch objects, so that data is only loaded for the Batch
+    objects that are actually returned.
+    """
+
+    batch_request: BatchRequest
+    metadata: BatchMetadata
+    batch_definition: Optional[LegacyBatchDefinition] = None
+
+
 @pydantic_dc.dataclass(frozen=True)
 class Sorter:
     key: str
@@ -457,11 +470,13 @@ class DataAsset(GenericBaseModel, Generic[DatasourceT, PartitionerT]):
         return Datasource.parse_order_by_sorters(order_by=order_by)
 
     def sort_batches(
-        self, batch_list: List[Batch], partitioner: PartitionerSortingProtocol
+        self,
+        batch_list: Union[List[Batch], List[PendingBatch]],
+        partitioner: PartitionerSortingProtocol,
     ) -> None:
         """Sorts batch_list in place in the order configured in this DataAsset.
         Args:
-            batch_list: The list of batches to sort in place.
+            batch_list: The list of batches (or pending batches) to sort in place.
             partitioner: Configuration used to determine sort.
         """
         reverse = not partitioner.sort_ascending
@@ -480,8 +495,8 @@ class DataAsset(GenericBaseModel, Generic[DatasourceT, PartitionerT]):
 
 def _sort_batches_with_none_metadata_values(
     key: str,
-) -> Callable[[Batch, Batch], int]:
-    def _compare_function(a: Batch, b: Batch) -> int:
+) -> Callable[[Union[Batch, PendingBatch], Union[Batch, PendingBatch]], int]:
+    def _compare_function(a: Union[Batch, PendingBatch], b: Union[Batch, PendingBatch]) -> int:
         if a.metadata[key] is not None and b.metadata[key] is not None:
             if a.metadata[key] < b.metadata[key]:
                 return -1
@@ -30,6 +30,7 @@ if TYPE_CHECKING:
     from great_expectations.datasource.fluent.interfaces import (
         Batch,
         PartitionerSortingProtocol,
+        PendingBatch,
     )
 
 # Controls which methods should raise an error when called on an InvalidDatasource
@@ -97,7 +98,9 @@ class InvalidAsset(DataAsset):
 
     @override
     def sort_batches(
-        self, batch_list: List[Batch], partitioner: PartitionerSortingProtocol
+        self,
+        batch_list: Union[List[Batch], List[PendingBatch]],
+        partitioner: PartitionerSortingProtocol,
     ) -> None:
         self._raise_type_error()
 
@@ -463,6 +463,9 @@ class SnowflakeDatasource(SQLDatasource):
             connection_string=connection_string,
             engine=self.get_engine(),
             create_temp_table=self.create_temp_table,
+            max_concurrent_queries=self.max_concurrent_queries,
+            schema_cache_ttl=self.schema_cache_ttl,
+            schema_cache_path=self.schema_cache_path,
             data_context=self._data_context,
         )
         self._execution_engine = gx_exec_engine
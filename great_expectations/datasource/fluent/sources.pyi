@@ -267,6 +267,9 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, str] = ...,
         create_temp_table: bool = True,
+        max_concurrent_queries: Optional[int] = None,
+        schema_cache_ttl: Optional[float] = None,
+        schema_cache_path: Optional[str] = None,
     ) -> SQLDatasource: ...
     def update_sql(  # noqa: PLR0913
         self,
@@ -276,6 +279,9 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, str] = ...,
         create_temp_table: bool = True,
+        max_concurrent_queries: Optional[int] = None,
+        schema_cache_ttl: Optional[float] = None,
+        schema_cache_path: Optional[str] = None,
     ) -> SQLDatasource: ...
     def add_or_update_sql(  # noqa: PLR0913
         self,
@@ -285,6 +291,9 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, str] = ...,
         create_temp_table: bool = True,
+        max_concurrent_queries: Optional[int] = None,
+        schema_cache_ttl: Optional[float] = None,
+        schema_cache_path: Optional[str] = None,
     ) -> SQLDatasource: ...
     def delete_sql(
         self,
@@ -298,6 +307,9 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, pydantic.networks.PostgresDsn, str] = ...,
         create_temp_table: bool = True,
+        max_concurrent_queries: Optional[int] = None,
+        schema_cache_ttl: Optional[float] = None,
+        schema_cache_path: Optional[str] = None,
     ) -> PostgresDatasource: ...
     def update_postgres(  # noqa: PLR0913
         self,
@@ -307,6 +319,9 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, pydantic.networks.PostgresDsn, str] = ...,
         create_temp_table: bool = True,
+        max_concurrent_queries: Optional[int] = None,
+        schema_cache_ttl: Optional[float] = None,
+        schema_cache_path: Optional[str] = None,
     ) -> PostgresDatasource: ...
     def add_or_update_postgres(  # noqa: PLR0913
         self,
@@ -316,6 +331,9 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, pydantic.networks.PostgresDsn, str] = ...,
         create_temp_table: bool = True,
+        max_concurrent_queries: Optional[int] = None,
+        schema_cache_ttl: Optional[float] = None,
+        schema_cache_path: Optional[str] = None,
     ) -> PostgresDatasource: ...
     def delete_postgres(
         self,
@@ -554,6 +572,9 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, SqliteDsn, str] = ...,
         create_temp_table: bool = True,
+        max_concurrent_queries: Optional[int] = None,
+        schema_cache_ttl: Optional[float] = None,
+        schema_cache_path: Optional[str] = None,
     ) -> SqliteDatasource: ...
     def update_sqlite(  # noqa: PLR0913
         self,
@@ -563,6 +584,9 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, SqliteDsn, str] = ...,
         create_temp_table: bool = True,
+        max_concurrent_queries: Optional[int] = None,
+        schema_cache_ttl: Optional[float] = None,
+        schema_cache_path: Optional[str] = None,
     ) -> SqliteDatasource: ...
     def add_or_update_sqlite(  # noqa: PLR0913
         self,
@@ -572,6 +596,9 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, SqliteDsn, str] = ...,
         create_temp_table: bool = True,
+        max_concurrent_queries: Optional[int] = None,
+        schema_cache_ttl: Optional[float] = None,
+        schema_cache_path: Optional[str] = None,
     ) -> SqliteDatasource: ...
     def delete_sqlite(
         self,
@@ -588,6 +615,9 @@ class _SourceFactories:
             ConfigStr, SnowflakeDsn, str, SnowflakeConnectionDetails, dict[str, str]
         ] = ...,
         create_temp_table: bool = ...,
+        max_concurrent_queries: Optional[int] = ...,
+        schema_cache_ttl: Optional[float] = ...,
+        schema_cache_path: Optional[str] = ...,
         account: None = ...,
         user: None = ...,
         password: None = ...,
@@ -606,6 +636,9 @@ class _SourceFactories:
         *,
         connection_string: None = ...,
         create_temp_table: bool = ...,
+        max_concurrent_queries: Optional[int] = ...,
+        schema_cache_ttl: Optional[float] = ...,
+        schema_cache_path: Optional[str] = ...,
         account: str = ...,
         user: str = ...,
         password: Union[ConfigStr, str] = ...,
@@ -626,6 +659,9 @@ class _SourceFactories:
             ConfigStr, SnowflakeDsn, str, SnowflakeConnectionDetails, dict[str, str]
         ] = ...,
         create_temp_table: bool = ...,
+        max_concurrent_queries: Optional[int] = ...,
+        schema_cache_ttl: Optional[float] = ...,
+        schema_cache_path: Optional[str] = ...,
         account: None = ...,
         user: None = ...,
         password: None = ...,
@@ -644,6 +680,9 @@ class _SourceFactories:
         *,
         connection_string: None = ...,
         create_temp_table: bool = ...,
+        max_concurrent_queries: Optional[int] = ...,
+        schema_cache_ttl: Optional[float] = ...,
+        schema_cache_path: Optional[str] = ...,
         account: str = ...,
         user: str = ...,
         password: Union[ConfigStr, str] = ...,
@@ -664,6 +703,9 @@ class _SourceFactories:
             ConfigStr, SnowflakeDsn, str, SnowflakeConnectionDetails, dict[str, str]
         ] = ...,
         create_temp_table: bool = ...,
+        max_concurrent_queries: Optional[int] = ...,
+        schema_cache_ttl: Optional[float] = ...,
+        schema_cache_path: Optional[str] = ...,
         account: None = ...,
         user: None = ...,
         password: None = ...,
@@ -682,6 +724,9 @@ class _SourceFactories:
         *,
         connection_string: None = ...,
         create_temp_table: bool = ...,
+        max_concurrent_queries: Optional[int] = ...,
+        schema_cache_ttl: Optional[float] = ...,
+        schema_cache_path: Optional[str] = ...,
         account: str = ...,
         user: str = ...,
         password: Union[ConfigStr, str] = ...,
@@ -703,6 +748,9 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, DatabricksDsn, str] = ...,
         create_temp_table: bool = True,
+        max_concurrent_queries: Optional[int] = None,
+        schema_cache_ttl: Optional[float] = None,
+        schema_cache_path: Optional[str] = None,
     ) -> DatabricksSQLDatasource: ...
     def update_databricks_sql(  # noqa: PLR0913
         self,
@@ -712,6 +760,9 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, DatabricksDsn, str] = ...,
         create_temp_table: bool = True,
+        max_concurrent_queries: Optional[int] = None,
+        schema_cache_ttl: Optional[float] = None,
+        schema_cache_path: Optional[str] = None,
     ) -> DatabricksSQLDatasource: ...
     def add_or_update_databricks_sql(  # noqa: PLR0913
         self,
@@ -721,6 +772,9 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, DatabricksDsn, str] = ...,
         create_temp_table: bool = True,
+        max_concurrent_queries: Optional[int] = None,
+        schema_cache_ttl: Optional[float] = None,
+        schema_cache_path: Optional[str] = None,
     ) -> DatabricksSQLDatasource: ...
     def delete_databricks_sql(
         self,
@@ -63,6 +63,7 @@ from great_expectations.datasource.fluent.interfaces import (
     DatasourceT,
     GxDatasourceWarning,
     PartitionerProtocol,
+    PendingBatch,
     Sorter,
     SortersDefinition,
     TestConnectionError,
@@ -534,64 +535,81 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
         """
         self._validate_batch_request(batch_request)
 
-        batch_list: List[Batch] = []
         if batch_request.partitioner:
             sql_partitioner = self.get_partitioner_implementation(batch_request.partitioner)
         else:
             sql_partitioner = None
-        batch_spec_kwargs: dict[str, str | dict | None]
-        for request in self._fully_specified_batch_requests(batch_request):
-            batch_metadata: BatchMetadata = self._get_batch_metadata_from_batch_request(
-                batch_request=request
-            )
-            batch_spec_kwargs = self._create_batch_spec_kwargs()
-            if sql_partitioner:
-                batch_spec_kwargs["partitioner_method"] = sql_partitioner.method_name
-                batch_spec_kwargs["partitioner_kwargs"] = (
-                    sql_partitioner.partitioner_method_kwargs()
-                )
-                # mypy infers that batch_spec_kwargs["batch_identifiers"] is a collection, but
-                # it is hardcoded to a dict above, so we cast it here.
-                cast(Dict, batch_spec_kwargs["batch_identifiers"]).update(
-                    sql_partitioner.batch_parameters_to_batch_spec_kwarg_identifiers(
-                        request.options
-                    )
-                )
-            # Creating the batch_spec is our hook into the execution engine.
-            batch_spec = self._create_batch_spec(batch_spec_kwargs)
-            execution_engine: SqlAlchemyExecutionEngine = self.datasource.get_execution_engine()
-            data, markers = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
-
-            # batch_definition (along with batch_spec and markers) is only here to satisfy a
-            # legacy constraint when computing usage statistics in a validator. We hope to remove
-            # it in the future.
-            # imports are done inline to prevent a circular dependency with core/batch.py
-            from great_expectations.core import IDDict
-            from great_expectations.core.batch import LegacyBatchDefinition
-
-            batch_definition = LegacyBatchDefinition(
-                datasource_name=self.datasource.name,
-                data_connector_name=_DATA_CONNECTOR_NAME,
-                data_asset_name=self.name,
-                batch_identifiers=IDDict(batch_spec["batch_identifiers"]),
-                batch_spec_passthrough=None,
+
+        # Sorting and slicing are applied to batch identifiers first, so that batch data (and temp
+        # tables) are only created for the batches that are actually returned.
+        pending_batches: List[PendingBatch] = [
+            PendingBatch(
+                batch_request=request,
+                metadata=self._get_batch_metadata_from_batch_request(batch_request=request),
             )
+            for request in self._fully_specified_batch_requests(batch_request)
+        ]
+        if sql_partitioner:
+            self.sort_batches(pending_batches, sql_partitioner)
 
-            batch_list.append(
-                Batch(
-                    datasource=self.datasource,
-                    data_asset=self,
-                    batch_request=request,
-                    data=data,
-                    metadata=batch_metadata,
-                    batch_markers=markers,
-                    batch_spec=batch_spec,
-                    batch_definition=batch_definition,
-                )
+        return [
+            self._materialize_batch(
+                pending_batch=pending_batch,
+                sql_partitioner=sql_partitioner,
+                columns=batch_request.columns,
             )
+            for pending_batch in pending_batches[batch_request.batch_slice]
+        ]
+
+    def _materialize_batch(
+        self,
+        pending_batch: PendingBatch,
+        sql_partitioner: Optional[SqlPartitioner],
+        columns: Optional[List[str]] = None,
+    ) -> Batch:
+        """Loads batch data for a fully specified batch request and builds its Batch."""
+        request: BatchRequest = pending_batch.batch_request
+        batch_spec_kwargs: dict[str, str | dict | list | None] = self._create_batch_spec_kwargs()
+        if columns is not None:
+            batch_spec_kwargs["columns"] = columns
         if sql_partitioner:
-            self.sort_batches(batch_list, sql_partitioner)
-        return batch_list[batch_request.batch_slice]
+            batch_spec_kwargs["partitioner_method"] = sql_partitioner.method_name
+            batch_spec_kwargs["partitioner_kwargs"] = sql_partitioner.partitioner_method_kwargs()
+            # mypy infers that batch_spec_kwargs["batch_identifiers"] is a collection, but
+            # it is hardcoded to a dict above, so we cast it here.
+            cast(Dict, batch_spec_kwargs["batch_identifiers"]).update(
+                sql_partitioner.batch_parameters_to_batch_spec_kwarg_identifiers(request.options)
+            )
+        # Creating the batch_spec is our hook into the execution engine.
+        batch_spec = self._create_batch_spec(batch_spec_kwargs)
+        execution_engine: SqlAlchemyExecutionEngine = self.datasource.get_execution_engine()
+        data, markers = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
+
+        # batch_definition (along with batch_spec and markers) is only here to satisfy a
+        # legacy constraint when computing usage statistics in a validator. We hope to remove
+        # it in the future.
+        # imports are done inline to prevent a circular dependency with core/batch.py
+        from great_expectations.core import IDDict
+        from great_expectations.core.batch import LegacyBatchDefinition
+
+        batch_definition = LegacyBatchDefinition(
+            datasource_name=self.datasource.name,
+            data_connector_name=_DATA_CONNECTOR_NAME,
+            data_asset_name=self.name,
+            batch_identifiers=IDDict(batch_spec["batch_identifiers"]),
+            batch_spec_passthrough=None,
+        )
+
+        return Batch(
+            datasource=self.datasource,
+            data_asset=self,
+            batch_request=request,
+            data=data,
+            metadata=pending_batch.metadata,
+            batch_markers=markers,
+            batch_spec=batch_spec,
+            batch_definition=batch_definition,
+        )
 
     @override
     def build_batch_request(
@@ -915,6 +933,13 @@ class SQLDatasource(Datasource):
         connection_string: The SQLAlchemy connection string used to connect to the database.
             For example: "postgresql+psycopg2://postgres:@localhost/test_database"
         create_temp_table: Whether to leverage temporary tables during metric computation.
+        max_concurrent_queries: Opt-in maximum number of per-domain metric queries to run
+            concurrently. Queries run serially by default, and always for dialects needing a single
+            persisted connection.
+        schema_cache_ttl: Opt-in time-to-live (in seconds) of reflected table columns, which are
+            cached by connection, schema, and table. Columns are reflected anew by default.
+        schema_cache_path: Local file, to which cached reflected table columns are persisted, so
+            that they are reused by later processes. Requires schema_cache_ttl.
         kwargs: Extra SQLAlchemy keyword arguments to pass to `create_engine()`. Note, only python
             primitive types will be serializable to config.
         assets: An optional dictionary whose keys are SQL DataAsset names and whose values
@@ -929,6 +954,9 @@ class SQLDatasource(Datasource):
     type: Literal["sql"] = "sql"
     connection_string: Union[ConfigStr, str]
     create_temp_table: bool = False
+    max_concurrent_queries: Optional[pydantic.PositiveInt] = None
+    schema_cache_ttl: Optional[pydantic.NonNegativeFloat] = None
+    schema_cache_path: Optional[str] = None
     kwargs: Dict[str, Union[ConfigStr, Any]] = pydantic.Field(
         default={},
         description="Optional dictionary of `kwargs` will be passed to the SQLAlchemy Engine"
@@ -131,6 +131,12 @@ class SqliteDatasource(SQLDatasource):
         connection_string: The SQLAlchemy connection string used to connect to the sqlite database.
             For example: "sqlite:///path/to/file.db"
         create_temp_table: Whether to leverage temporary tables during metric computation.
+        max_concurrent_queries: Accepted for consistency with other SQL datasources; sqlite always
+            runs metric queries serially on its single persisted connection.
+        schema_cache_ttl: Opt-in time-to-live (in seconds) of reflected table columns, which are
+            cached by connection, schema, and table. Columns are reflected anew by default.
+        schema_cache_path: Local file, to which cached reflected table columns are persisted, so
+            that they are reused by later processes. Requires schema_cache_ttl.
         assets: An optional dictionary whose keys are TableAsset names and whose values
             are TableAsset objects.
     """
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import itertools
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
@@ -22,6 +23,13 @@ from great_expectations._docs_decorators import public_api
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch_manager import BatchManager
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine.metric_cache import (
+    DEFAULT_METRIC_CACHE_MAX_BYTES,
+    LRUMetricCache,
+    MetricCache,
+    MetricCacheStatistics,
+    NoOpMetricCache,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -53,18 +61,6 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class NoOpDict:
-    def __getitem__(self, item):
-        return None
-
-    def __setitem__(self, key, value):
-        return None
-
-    # noinspection PyMethodMayBeStatic,PyUnusedLocal
-    def update(self, value):
-        return None
-
-
 @dataclass(frozen=True)
 class MetricComputationConfiguration(DictDot):
     """
@@ -138,6 +134,10 @@ class ExecutionEngine(ABC):
         batch_spec_defaults: dictionary of BatchSpec overrides (useful for amending configuration at runtime).
         batch_data_dict: dictionary of Batch objects with corresponding IDs as keys supplied at initialization time
         validator: Validator object (optional) -- not utilized in V3 and later versions
+        metric_cache_max_bytes: approximate memory budget (in bytes) of metric cache, beyond which least-recently-used
+            metrics are evicted (defaults to 512 MiB).
+        metric_cache: MetricCache object (optional) to use instead of default LRUMetricCache (takes precedence over
+            "metric_cache_max_bytes").
     """  # noqa: E501
 
     recognized_batch_spec_defaults: Set[str] = set()
@@ -149,18 +149,27 @@ class ExecutionEngine(ABC):
         batch_spec_defaults: Optional[dict] = None,
         batch_data_dict: Optional[dict] = None,
         validator: Optional[Validator] = None,
+        metric_cache_max_bytes: Optional[int] = None,
+        metric_cache: Optional[MetricCache] = None,
     ) -> None:
         self.name = name
         self._validator = validator
 
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store  # noqa: E501
-        # (e.g. self.spark_df) over the lifetime of the dataset instance
+        # (e.g. self.spark_df) over the lifetime of the dataset instance; metrics computed on Batch are discarded  # noqa: E501
+        # when that Batch is reloaded or removed from BatchManager.
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
-        if self._caching:
-            self._metric_cache: Union[Dict, NoOpDict] = {}
+        self._metric_cache: MetricCache
+        if not self._caching:
+            self._metric_cache = NoOpMetricCache()
+        elif metric_cache is not None:
+            self._metric_cache = metric_cache
         else:
-            self._metric_cache = NoOpDict()
+            self._metric_cache = LRUMetricCache(
+                max_bytes=DEFAULT_METRIC_CACHE_MAX_BYTES
+                if metric_cache_max_bytes is None
+                else metric_cache_max_bytes
+            )
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -194,6 +203,7 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "metric_cache_max_bytes": metric_cache_max_bytes,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -218,6 +228,16 @@ class ExecutionEngine(ABC):
         """Getter for batch_manager"""
         return self._batch_manager
 
+    @property
+    def metric_cache(self) -> MetricCache:
+        """Getter for metric_cache (resolved metrics, reused across metric resolutions)"""
+        return self._metric_cache
+
+    @property
+    def metric_cache_statistics(self) -> MetricCacheStatistics:
+        """Snapshot of metric cache hit, miss, eviction, and invalidation counters and size"""
+        return self._metric_cache.statistics
+
     def _load_batch_data_from_dict(self, batch_data_dict: Dict[str, BatchDataType]) -> None:
         """
         Loads all data in batch_data_dict using cache_batch_data
@@ -230,6 +250,14 @@ class ExecutionEngine(ABC):
     def load_batch_data(self, batch_id: str, batch_data: BatchDataUnion) -> None:
         self._batch_manager.save_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    def _invalidate_batch_data_caches(self, batch_id: Optional[str]) -> None:
+        """Discards any state memoized for the given Batch (called whenever its BatchData is replaced or removed).
+
+        A "batch_id" of None refers to state computed on Domains, which do not specify "batch_id" (hence, on active
+        Batch); it is discarded whenever another Batch becomes active (or active Batch is replaced or removed).
+        """  # noqa: E501
+        self._metric_cache.invalidate_batch(batch_id=batch_id)
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -285,6 +313,26 @@ class ExecutionEngine(ABC):
             metric_fn_bundle_configurations=metric_fn_bundle_configurations,
         )
 
+    def materialize_deferred_metrics(
+        self,
+        metrics_to_materialize: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes actual values of metrics, which "resolve_metrics()" deferred to metrics consuming them.
+
+        Called for resolved metrics, which no other metric consumes (hence, whose values are returned to caller).
+
+        Args:
+            metrics_to_materialize: resolved metrics, whose values must not be deferred
+            metrics: already-computed metrics currently available to the engine
+            runtime_configuration: runtime configuration information
+
+        Returns:
+            Dictionary with actual values of metrics, whose values were deferred (none, unless overridden).
+        """  # noqa: E501
+        return {}
+
     def resolve_metric_bundle(self, metric_fn_bundle) -> Dict[Tuple[str, str, str], MetricValue]:
         """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""  # noqa: E501
         raise NotImplementedError
@@ -497,16 +545,23 @@ class ExecutionEngine(ABC):
 
         metric_name: str
         metric_configuration: MetricConfiguration
+        is_cached: bool
+        cached_value: Optional[MetricValue]
         for (
             metric_name,
             metric_configuration,
         ) in metric_to_resolve.metric_dependencies.items():
             if metric_configuration.id in metrics:
                 metric_dependencies_by_metric_name[metric_name] = metrics[metric_configuration.id]
-            elif self._caching and metric_configuration.id in self._metric_cache:  # type: ignore[operator] # TODO: update NoOpDict
-                metric_dependencies_by_metric_name[metric_name] = self._metric_cache[
-                    metric_configuration.id
-                ]
+                continue
+
+            is_cached, cached_value = (
+                self._metric_cache.lookup(metric_configuration.id)
+                if self._caching
+                else (False, None)
+            )
+            if is_cached:
+                metric_dependencies_by_metric_name[metric_name] = cached_value
             else:
                 raise gx_exceptions.MetricError(
                     message=f'Missing metric dependency: "{metric_name}" for metric "{metric_to_resolve.metric_name}".'  # noqa: E501
@@ -529,11 +584,18 @@ class ExecutionEngine(ABC):
         Returns:
             resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
         """  # noqa: E501
-        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = (
+            self._resolve_direct_metric_bundles(
+                metric_fn_direct_configurations=metric_fn_direct_configurations
+            )
+        )
 
         metric_computation_configuration: MetricComputationConfiguration
 
         for metric_computation_configuration in metric_fn_direct_configurations:
+            if metric_computation_configuration.metric_configuration.id in resolved_metrics:
+                continue
+
             try:
                 resolved_metrics[metric_computation_configuration.metric_configuration.id] = (
                     metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
@@ -552,6 +614,9 @@ class ExecutionEngine(ABC):
                 self.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle_configurations)
             )
             resolved_metrics.update(resolved_metric_bundle)
+        except gx_exceptions.MetricResolutionError:
+            # Engine has already attributed failure to specific metrics (e.g., to those of one Domain).  # noqa: E501
+            raise
         except Exception as e:
             raise gx_exceptions.MetricResolutionError(
                 message=str(e),
@@ -562,10 +627,34 @@ class ExecutionEngine(ABC):
             ) from e
 
         if self._caching:
-            self._metric_cache.update(resolved_metrics)
+            self._metric_cache.update(
+                metrics=resolved_metrics,
+                batch_ids={
+                    metric_computation_configuration.metric_configuration.id: metric_computation_configuration.metric_configuration.metric_domain_kwargs.get(  # noqa: E501
+                        "batch_id"
+                    )
+                    for metric_computation_configuration in itertools.chain(
+                        metric_fn_direct_configurations, metric_fn_bundle_configurations
+                    )
+                },
+            )
 
         return resolved_metrics
 
+    def _resolve_direct_metric_bundles(
+        self,
+        metric_fn_direct_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes directly-computable metrics, which ExecutionEngine is able to compute together (none, unless overridden).
+
+        Args:
+            metric_fn_direct_configurations: directly-computable "MetricComputationConfiguration" objects
+
+        Returns:
+            Dictionary with values of those metrics, which were computed together; others are computed one by one.
+        """  # noqa: E501
+        return {}
+
     def _partition_domain_kwargs(
         self,
         domain_kwargs: Dict[str, Any],
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.types import DictDot
+
+if TYPE_CHECKING:
+    from great_expectations.validator.computed_metric import MetricValue
+
+logger = logging.getLogger(__name__)
+
+
+# Default memory budget (in bytes) of metric cache shared by all Batch objects loaded into ExecutionEngine.  # noqa: E501
+DEFAULT_METRIC_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Number of elements inspected when estimating size of large containers (remaining elements are extrapolated).  # noqa: E501
+_SIZE_ESTIMATE_SAMPLE_SIZE = 64
+_SIZE_ESTIMATE_MAX_DEPTH = 4
+
+_MetricKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class MetricCacheStatistics(DictDot):
+    """
+    MetricCacheStatistics is a "dataclass" object, which holds snapshot of "MetricCache" counters and memory usage.
+    """  # noqa: E501
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    current_bytes: int
+    max_bytes: Optional[int]
+
+    @property
+    def hit_rate(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict:
+        """Returns: this MetricCacheStatistics as a dictionary"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": self.entries,
+            "current_bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": self.hit_rate,
+        }
+
+    def to_json_dict(self) -> dict:
+        """Returns: this MetricCacheStatistics as a JSON dictionary"""
+        return self.to_dict()
+
+
+class MetricCache(ABC):
+    """MetricCache defines interface of storage for resolved metrics, used by ExecutionEngine across metric resolutions.
+
+    Every cached metric value is associated with the "batch_id" of Batch, on which it was computed (or None, if its
+    Domain did not specify "batch_id" and, hence, refers to the active Batch), so that values can be discarded when
+    corresponding Batch is reloaded or evicted from BatchManager.
+    """  # noqa: E501
+
+    @abstractmethod
+    def __contains__(self, key: _MetricKey) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def lookup(self, key: _MetricKey) -> Tuple[bool, Optional[MetricValue]]:
+        """Returns "(True, value)" for cached metric (recording hit) and "(False, None)" otherwise (recording miss)."""  # noqa: E501
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: _MetricKey, value: MetricValue, batch_id: Optional[str] = None) -> None:
+        raise NotImplementedError
+
+    def update(
+        self,
+        metrics: Mapping[_MetricKey, MetricValue],
+        batch_ids: Optional[Mapping[_MetricKey, Optional[str]]] = None,
+    ) -> None:
+        batch_ids = batch_ids or {}
+        key: _MetricKey
+        value: MetricValue
+        for key, value in metrics.items():
+            self.put(key=key, value=value, batch_id=batch_ids.get(key))
+
+    @abstractmethod
+    def invalidate_batch(self, batch_id: Optional[str]) -> None:
+        """Discards all metric values associated with given "batch_id"."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def statistics(self) -> MetricCacheStatistics:
+        raise NotImplementedError
+
+    @abstractmethod
+    def reset_statistics(self) -> None:
+        raise NotImplementedError
+
+
+class NoOpMetricCache(MetricCache):
+    """MetricCache that stores nothing (used when ExecutionEngine caching is disabled)."""
+
+    def __init__(self) -> None:
+        self._misses = 0
+
+    def __contains__(self, key: _MetricKey) -> bool:
+        return False
+
+    def __len__(self) -> int:
+        return 0
+
+    def lookup(self, key: _MetricKey) -> Tuple[bool, Optional[MetricValue]]:
+        self._misses += 1
+        return False, None
+
+    def put(self, key: _MetricKey, value: MetricValue, batch_id: Optional[str] = None) -> None:
+        pass
+
+    def invalidate_batch(self, batch_id: Optional[str]) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    @property
+    def statistics(self) -> MetricCacheStatistics:
+        return MetricCacheStatistics(
+            hits=0,
+            misses=self._misses,
+            evictions=0,
+            invalidations=0,
+            entries=0,
+            current_bytes=0,
+            max_bytes=0,
+        )
+
+    def reset_statistics(self) -> None:
+        self._misses = 0
+
+
+class LRUMetricCache(MetricCache):
+    """MetricCache, which evicts least-recently-used metric values once their approximate total size exceeds budget.
+
+    Args:
+        max_bytes: approximate memory budget in bytes (None means unbounded; 0 disables caching).
+        max_entries: optional maximum number of cached metric values.
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = DEFAULT_METRIC_CACHE_MAX_BYTES,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes must be a non-negative integer or None.")  # noqa: TRY003
+
+        if max_entries is not None and max_entries < 0:
+            raise ValueError("max_entries must be a non-negative integer or None.")  # noqa: TRY003
+
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+
+        # Each entry holds "(value, approximate_size_in_bytes, batch_id)" tuple.
+        self._entries: OrderedDict[_MetricKey, Tuple[MetricValue, int, Optional[str]]] = (
+            OrderedDict()
+        )
+        self._keys_by_batch_id: Dict[Optional[str], Set[_MetricKey]] = {}
+        self._current_bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+        self._lock = threading.RLock()
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    @property
+    def current_bytes(self) -> int:
+        return self._current_bytes
+
+    def __contains__(self, key: _MetricKey) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: _MetricKey) -> Tuple[bool, Optional[MetricValue]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, entry[0]
+
+    def put(self, key: _MetricKey, value: MetricValue, batch_id: Optional[str] = None) -> None:
+        size: int = get_approximate_size(value)
+        if (self._max_bytes is not None and size > self._max_bytes) or self._max_entries == 0:
+            with self._lock:
+                self._discard(key=key)
+
+            return
+
+        with self._lock:
+            self._discard(key=key)
+            self._entries[key] = (value, size, batch_id)
+            self._keys_by_batch_id.setdefault(batch_id, set()).add(key)
+            self._current_bytes += size
+            self._evict()
+
+    def invalidate_batch(self, batch_id: Optional[str]) -> None:
+        with self._lock:
+            key: _MetricKey
+            for key in list(self._keys_by_batch_id.get(batch_id, ())):
+                self._discard(key=key)
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_batch_id.clear()
+            self._current_bytes = 0
+
+    @property
+    def statistics(self) -> MetricCacheStatistics:
+        with self._lock:
+            return MetricCacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def reset_statistics(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._invalidations = 0
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self._max_bytes is not None and self._current_bytes > self._max_bytes)
+            or (self._max_entries is not None and len(self._entries) > self._max_entries)
+        ):
+            key: _MetricKey = next(iter(self._entries))
+            self._discard(key=key)
+            self._evictions += 1
+
+    def _discard(self, key: _MetricKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        _, size, batch_id = entry
+        self._current_bytes -= size
+        keys: Optional[Set[_MetricKey]] = self._keys_by_batch_id.get(batch_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_batch_id[batch_id]
+
+
+def get_approximate_size(value: Any, depth: int = 0) -> int:  # noqa: C901, PLR0911
+    """Estimates memory footprint of metric value in bytes.
+
+    Pandas and NumPy objects report their buffer sizes; large containers are sized from sample of their elements, so
+    that estimating size of long "unexpected_index_list" values remains cheap.
+    """  # noqa: E501
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+
+    if isinstance(value, (pd.Series, pd.Index)):
+        size = int(value.memory_usage(deep=False))
+        if value.dtype == object:
+            # Buffer of "object" Series holds only references; account for referenced Python objects.  # noqa: E501
+            size += len(value) * _sample_average_size(values=value.to_numpy(), depth=depth)
+
+        return size
+
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=False).sum())
+
+    if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        return sys.getsizeof(value)
+
+    if depth >= _SIZE_ESTIMATE_MAX_DEPTH:
+        return sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        if not value:
+            return sys.getsizeof(value)
+
+        sample = list(value.items())[:_SIZE_ESTIMATE_SAMPLE_SIZE]
+        average = sum(
+            get_approximate_size(key, depth + 1) + get_approximate_size(item, depth + 1)
+            for key, item in sample
+        ) / len(sample)
+        return sys.getsizeof(value) + int(average * len(value))
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        if not value:
+            return sys.getsizeof(value)
+
+        return sys.getsizeof(value) + len(value) * _sample_average_size(values=value, depth=depth)
+
+    return sys.getsizeof(value)
+
+
+def _sample_average_size(values: Any, depth: int) -> int:
+    sample: list = []
+    for element in values:
+        sample.append(element)
+        if len(sample) >= _SIZE_ESTIMATE_SAMPLE_SIZE:
+            break
+
+    if not sample:
+        return 0
+
+    return int(sum(get_approximate_size(element, depth + 1) for element in sample) / len(sample))
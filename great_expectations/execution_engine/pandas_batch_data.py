@@ -1,18 +1,93 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import logging
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
 
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch import BatchData
 
 if TYPE_CHECKING:
-    import pandas as pd
+    from typing_extensions import TypeAlias
+
+logger = logging.getLogger(__name__)
+
+ChunkReaderFn: TypeAlias = Callable[[], Iterator[pd.DataFrame]]
 
 
 class PandasBatchData(BatchData):
-    def __init__(self, execution_engine, dataframe: pd.DataFrame) -> None:
+    def __init__(
+        self,
+        execution_engine,
+        dataframe: pd.DataFrame,
+        source_columns: Optional[List[str]] = None,
+    ) -> None:
         super().__init__(execution_engine=execution_engine)
         self._dataframe = dataframe
+        self._source_columns = source_columns
 
     @property
     def dataframe(self):
         return self._dataframe
+
+    @property
+    def source_columns(self) -> Optional[List[str]]:
+        """Names of all source data columns, if only some of them were loaded (None otherwise)."""
+        return self._source_columns
+
+
+class ChunkedPandasBatchData(PandasBatchData):
+    """PandasBatchData, whose source is streamed in chunks (rather than held in memory as one DataFrame).
+
+    While "iter_chunks()" is being iterated, "dataframe" is the current chunk, so that metric implementations compute
+    partial aggregates of that chunk.  Outside of iteration, accessing "dataframe" loads the entire batch (and keeps it
+    until "release_dataframe()" is called), unless "allow_full_load" is False, in which case an error is raised.
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        execution_engine,
+        read_chunks: ChunkReaderFn,
+        source_columns: Optional[List[str]] = None,
+        allow_full_load: bool = True,
+    ) -> None:
+        super().__init__(
+            execution_engine=execution_engine,
+            dataframe=None,  # type: ignore[arg-type] # loaded on demand
+            source_columns=source_columns,
+        )
+        self._read_chunks = read_chunks
+        self._allow_full_load = allow_full_load
+        self._chunk: Optional[pd.DataFrame] = None
+
+    @property
+    @override
+    def dataframe(self) -> pd.DataFrame:
+        if self._chunk is not None:
+            return self._chunk
+
+        if self._dataframe is None:
+            if not self._allow_full_load:
+                raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                    "Metric cannot be computed from chunks of streamed batch, and loading entire batch is not allowed."  # noqa: E501
+                )
+
+            logger.warning("Loading entire streamed batch into memory to compute metric.")
+            self._dataframe = pd.concat(list(self._read_chunks()))
+
+        return self._dataframe
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Reads source data in chunks, making each chunk the "dataframe" of this batch in turn."""
+        try:
+            for chunk in self._read_chunks():
+                self._chunk = chunk
+                yield chunk
+        finally:
+            self._chunk = None
+
+    def release_dataframe(self) -> None:
+        """Drops entire batch loaded by accessing "dataframe" outside of chunk iteration."""
+        self._dataframe = None
@@ -0,0 +1,323 @@
+"""Partial aggregates of metrics, computed over chunks of "ChunkedPandasBatchData" and merged into metric values.
+
+A metric is decomposable, if its value on entire batch can be obtained from values ("partials") computed on every
+chunk of that batch (e.g., counts are summed, extrema are reduced, and means are weighted by counts).  Metrics, whose
+"PandasExecutionEngine" implementations return row-aligned series (e.g., map conditions), are evaluated on the same
+chunk as the metric that consumes them.  Only map metrics, known to be row-local (see "is_row_local_map_metric()"), are
+evaluated on chunks; metrics of all other map conditions (e.g., uniqueness or monotonicity, which compare rows with one
+another) are computed on entire batch instead.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import ast
+import math
+import re
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypes,
+    SummarizationMetricNameSuffixes,
+)
+from great_expectations.expectations.registry import get_metric_provider
+from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.pandas_execution_engine import (
+        PandasExecutionEngine,
+    )
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+# Metric function types, whose values are aligned with rows of the data they are computed on.
+CHUNK_LOCAL_METRIC_FUNCTION_TYPES = {
+    MetricPartialFunctionTypes.MAP_FN,
+    MetricPartialFunctionTypes.MAP_SERIES,
+    MetricPartialFunctionTypes.MAP_CONDITION_SERIES,
+}
+
+_PANDAS_UNEXPECTED_INDEX_QUERY_PATTERN = re.compile(r"^df\.filter\(items=(.*), axis=0\)$")
+
+
+class ChunkLocalMetricValue:
+    """Placeholder value of metric, whose actual value is computed on the data its consumer is computed on.
+
+    Placeholders never leave metric resolution: values of metrics, which no other metric consumes (e.g., map conditions
+    requested directly), are computed on entire batch (see "PandasExecutionEngine.materialize_deferred_metrics()").
+    """  # noqa: E501
+
+    def __init__(self, metric_configuration: MetricConfiguration) -> None:
+        self._metric_configuration = metric_configuration
+
+    @property
+    def metric_configuration(self) -> MetricConfiguration:
+        return self._metric_configuration
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._metric_configuration.id})"
+
+
+class ChunkAggregator(ABC):
+    """Computes partial aggregate of metric on every chunk and merges partial aggregates into metric value."""  # noqa: E501
+
+    # If True, then metric value is determined by first chunk alone.
+    first_chunk_only: ClassVar[bool] = False
+
+    def partial(
+        self,
+        compute_metric_value: Callable[[], Any],
+        execution_engine: PandasExecutionEngine,
+        metric_configuration: MetricConfiguration,
+    ) -> Any:
+        """Partial aggregate of current chunk ("compute_metric_value" evaluates metric on current chunk)."""  # noqa: E501
+        return compute_metric_value()
+
+    @abstractmethod
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> Any:
+        """Metric value of entire batch, merged from partial aggregates of all its chunks (in order)."""  # noqa: E501
+        raise NotImplementedError
+
+
+class _FirstChunkAggregator(ChunkAggregator):
+    first_chunk_only = True
+
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> Any:
+        return partials[0]
+
+
+class _SumAggregator(ChunkAggregator):
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> Any:
+        return sum(partials[1:], partials[0])
+
+
+class _ExtremumAggregator(ChunkAggregator):
+    def __init__(self, reduce_fn: Callable[[List[Any]], Any]) -> None:
+        self._reduce_fn = reduce_fn
+
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> Any:
+        # Chunks without values of column contribute missing extrema.
+        values: List[Any] = [partial for partial in partials if not pd.isna(partial)]
+        if not values:
+            return partials[0]
+
+        return self._reduce_fn(values)
+
+
+class _HistogramAggregator(ChunkAggregator):
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> Any:
+        return list(np.sum(partials, axis=0))
+
+
+class _MeanAggregator(ChunkAggregator):
+    def partial(
+        self,
+        compute_metric_value: Callable[[], Any],
+        execution_engine: PandasExecutionEngine,
+        metric_configuration: MetricConfiguration,
+    ) -> Tuple[Any, int]:
+        count: int = int(
+            _get_column_values(
+                execution_engine=execution_engine, metric_configuration=metric_configuration
+            ).size
+        )
+        return compute_metric_value(), count
+
+    def merge(
+        self, partials: List[Tuple[Any, int]], metric_configuration: MetricConfiguration
+    ) -> Any:
+        weighted: List[Tuple[Any, int]] = [(mean, count) for mean, count in partials if count > 0]
+        total_count: int = sum(count for _, count in weighted)
+        if total_count == 0:
+            return np.nan
+
+        return sum(mean * (count / total_count) for mean, count in weighted)
+
+
+class _StandardDeviationAggregator(ChunkAggregator):
+    """Merges counts, means, and sums of squared deviations of chunks (Chan et al. parallel algorithm)."""  # noqa: E501
+
+    def partial(
+        self,
+        compute_metric_value: Callable[[], Any],
+        execution_engine: PandasExecutionEngine,
+        metric_configuration: MetricConfiguration,
+    ) -> Tuple[int, float, float]:
+        values: pd.Series = _get_column_values(
+            execution_engine=execution_engine, metric_configuration=metric_configuration
+        )
+        convert_pandas_series_decimal_to_float_dtype(data=values, inplace=True)
+        if values.size == 0:
+            return 0, 0.0, 0.0
+
+        mean = float(values.mean())
+        return int(values.size), mean, float(((values - mean) ** 2).sum())
+
+    def merge(
+        self, partials: List[Tuple[int, float, float]], metric_configuration: MetricConfiguration
+    ) -> float:
+        count: int = 0
+        mean: float = 0.0
+        m2: float = 0.0
+        for partial_count, partial_mean, partial_m2 in partials:
+            if partial_count == 0:
+                continue
+
+            delta: float = partial_mean - mean
+            total_count: int = count + partial_count
+            mean += delta * partial_count / total_count
+            m2 += partial_m2 + delta**2 * count * partial_count / total_count
+            count = total_count
+
+        # Sample standard deviation (as computed by "pandas.Series.std()").
+        if count < 2:  # noqa: PLR2004
+            return np.nan
+
+        return math.sqrt(m2 / (count - 1))
+
+
+class _ValueCountsAggregator(ChunkAggregator):
+    def merge(self, partials: List[pd.Series], metric_configuration: MetricConfiguration) -> Any:
+        non_empty_partials: List[pd.Series] = [partial for partial in partials if not partial.empty]
+        if not non_empty_partials:
+            return partials[0]
+
+        counts: pd.Series = (
+            pd.concat(non_empty_partials).groupby(level=0, sort=False, dropna=False).sum()
+        )
+        # Same default and orders as "column.value_counts" metric of entire batch.
+        sort: str = metric_configuration.metric_value_kwargs.get("sort") or "value"
+        if sort == "value":
+            try:
+                counts = counts.sort_index()
+            except TypeError:
+                # Values of multiple types (e.g., strings and floats) are sorted as strings.
+                counts.index = counts.index.astype(str)
+                counts = counts.sort_index()
+        elif sort == "count":
+            counts = counts.sort_values(ascending=False, kind="stable")
+
+        counts.name = "count"
+        counts.index.name = "value"
+        return counts
+
+
+class _UnexpectedListAggregator(ChunkAggregator):
+    def merge(self, partials: List[list], metric_configuration: MetricConfiguration) -> list:
+        merged: list = [element for partial in partials for element in partial]
+        return merged[: _get_unexpected_records_limit(metric_configuration=metric_configuration)]
+
+
+class _UnexpectedRowsAggregator(ChunkAggregator):
+    def merge(self, partials: List[pd.DataFrame], metric_configuration: MetricConfiguration) -> Any:
+        merged: pd.DataFrame = pd.concat(partials)
+        limit: Optional[int] = _get_unexpected_records_limit(
+            metric_configuration=metric_configuration
+        )
+        return merged if limit is None else merged.iloc[:limit]
+
+
+class _UnexpectedIndexQueryAggregator(ChunkAggregator):
+    """Merges index lists of Pandas unexpected index queries (of form "df.filter(items=[...], axis=0)")."""  # noqa: E501
+
+    def merge(
+        self, partials: List[Optional[str]], metric_configuration: MetricConfiguration
+    ) -> Optional[str]:
+        if any(partial is None for partial in partials):
+            return None
+
+        index_list: list = []
+        for partial in partials:
+            match: Optional[re.Match] = _PANDAS_UNEXPECTED_INDEX_QUERY_PATTERN.match(
+                partial  # type: ignore[arg-type] # None is handled above
+            )
+            if match is None:
+                raise ValueError(f'Unrecognized unexpected index query "{partial}".')  # noqa: TRY003
+
+            index_list.extend(ast.literal_eval(match.group(1)))
+
+        return f"df.filter(items={index_list}, axis=0)"
+
+
+_CHUNK_AGGREGATORS_BY_METRIC_NAME: Dict[str, ChunkAggregator] = {
+    "table.row_count": _SumAggregator(),
+    "table.column_types": _FirstChunkAggregator(),
+    "column.min": _ExtremumAggregator(reduce_fn=min),
+    "column.max": _ExtremumAggregator(reduce_fn=max),
+    "column.sum": _SumAggregator(),
+    "column.mean": _MeanAggregator(),
+    "column.standard_deviation": _StandardDeviationAggregator(),
+    "column.value_counts": _ValueCountsAggregator(),
+    "column.histogram": _HistogramAggregator(),
+}
+
+_CHUNK_AGGREGATORS_BY_MAP_METRIC_SUFFIX: Dict[str, ChunkAggregator] = {
+    SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value: _SumAggregator(),
+    SummarizationMetricNameSuffixes.FILTERED_ROW_COUNT.value: _SumAggregator(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value: _UnexpectedListAggregator(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST.value: _UnexpectedListAggregator(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value: _UnexpectedRowsAggregator(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_QUERY.value: _UnexpectedIndexQueryAggregator(),
+}
+
+
+def get_chunk_aggregator(
+    metric_name: str, execution_engine: PandasExecutionEngine
+) -> Optional[ChunkAggregator]:
+    """Returns ChunkAggregator of metric named "metric_name" (None, if metric is not decomposable into chunks)."""  # noqa: E501
+    if metric_name in _CHUNK_AGGREGATORS_BY_METRIC_NAME:
+        return _CHUNK_AGGREGATORS_BY_METRIC_NAME[metric_name]
+
+    _, _, suffix = metric_name.rpartition(".")
+    aggregator: Optional[ChunkAggregator] = _CHUNK_AGGREGATORS_BY_MAP_METRIC_SUFFIX.get(suffix)
+    if aggregator is None or not is_row_local_map_metric(
+        metric_name=metric_name, execution_engine=execution_engine
+    ):
+        return None
+
+    return aggregator
+
+
+def is_row_local_map_metric(metric_name: str, execution_engine: PandasExecutionEngine) -> bool:
+    """Whether value of every row of map metric (or of its summaries) depends on that row alone.
+
+    Map metric providers declare it by "row_local" attribute; if undeclared, only map metrics of Great Expectations itself
+    are known to be row-local (custom ones are not, hence they are computed on entire batch rather than on chunks).
+    """  # noqa: E501
+    try:
+        metric_class, _ = get_metric_provider(
+            metric_name=metric_name, execution_engine=execution_engine
+        )
+    except gx_exceptions.MetricProviderError:
+        return False
+
+    row_local: Optional[bool] = getattr(metric_class, "row_local", None)
+    if row_local is None:
+        return metric_class.__module__.startswith("great_expectations.")
+
+    return row_local
+
+
+def _get_column_values(
+    execution_engine: PandasExecutionEngine, metric_configuration: MetricConfiguration
+) -> pd.Series:
+    df: pd.DataFrame
+    accessor_domain_kwargs: dict
+    df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+        domain_kwargs=metric_configuration.metric_domain_kwargs,
+        domain_type=MetricDomainTypes.COLUMN,
+    )
+    column: pd.Series = df[accessor_domain_kwargs["column"]]
+    return column[column.notnull()]
+
+
+def _get_unexpected_records_limit(metric_configuration: MetricConfiguration) -> Optional[int]:
+    result_format: dict = metric_configuration.metric_value_kwargs["result_format"]
+    if result_format["result_format"] == "COMPLETE":
+        return None
+
+    return result_format["partial_unexpected_count"]
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import datetime
 import hashlib
+import json
 import logging
 import pickle
+import threading
+from collections import OrderedDict
 from functools import partial
 from io import BytesIO
 from typing import (
@@ -12,6 +15,8 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
+    List,
     Optional,
     Tuple,
     Union,
@@ -19,11 +24,13 @@ from typing import (
     overload,
 )
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations._docs_decorators import public_api
 from great_expectations.compatibility import aws, azure, google
+from great_expectations.compatibility.pyarrow import parquet as pyarrow_parquet
 from great_expectations.compatibility.sqlalchemy_and_pandas import (
     execute_pandas_reader_fn,
 )
@@ -48,13 +55,35 @@ from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.execution_engine import (
     PartitionDomainKwargs,  # noqa: TCH001
 )
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.pandas_batch_data import (
+    ChunkedPandasBatchData,
+    PandasBatchData,
+)
+from great_expectations.execution_engine.pandas_chunk_aggregators import (
+    CHUNK_LOCAL_METRIC_FUNCTION_TYPES,
+    ChunkAggregator,
+    ChunkLocalMetricValue,
+    get_chunk_aggregator,
+    is_row_local_map_metric,
+)
+from great_expectations.execution_engine.partition_and_sample.data_partitioner import (
+    PartitionerMethod,
+)
 from great_expectations.execution_engine.partition_and_sample.pandas_data_partitioner import (
     PandasDataPartitioner,
 )
 from great_expectations.execution_engine.partition_and_sample.pandas_data_sampler import (
     PandasDataSampler,
 )
+from great_expectations.expectations.registry import (
+    get_metric_function_type,
+    get_metric_provider,
+)
+from great_expectations.util import convert_to_json_serializable  # noqa: TID251
+from great_expectations.validator.computed_metric import MetricValue  # noqa: TCH001
+from great_expectations.validator.metric_configuration import (
+    MetricConfiguration,  # noqa: TCH001
+)
 
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
@@ -66,6 +95,149 @@ HASH_THRESHOLD = 1e9
 
 DataFrameFactoryFn: TypeAlias = Callable[..., pd.DataFrame]
 
+# Default memory budget (in bytes) for memoized "get_domain_records()" row filtering masks (one byte per row).  # noqa: E501
+DEFAULT_DOMAIN_RECORDS_MASK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_DomainRecordsMaskKey: TypeAlias = Tuple[
+    str, Optional[str], Optional[str], Optional[str], Optional[Tuple[Any, ...]]
+]
+
+
+class _DomainRecordsMaskCache:
+    """Size bounded LRU memo of boolean row masks computed by "PandasExecutionEngine.get_domain_records()".
+
+    Masks are keyed by "(batch_id, row_condition, condition_parser, ignore_row_if, column subset)" and are evicted in
+    least-recently-used order once their combined size exceeds "max_bytes".  A "max_bytes" of 0 disables memoization.
+    """  # noqa: E501
+
+    def __init__(self, max_bytes: int = DEFAULT_DOMAIN_RECORDS_MASK_CACHE_MAX_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._masks: OrderedDict[_DomainRecordsMaskKey, np.ndarray] = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def current_bytes(self) -> int:
+        return self._current_bytes
+
+    def __len__(self) -> int:
+        return len(self._masks)
+
+    def get(self, key: _DomainRecordsMaskKey) -> Optional[np.ndarray]:
+        with self._lock:
+            mask = self._masks.get(key)
+            if mask is not None:
+                self._masks.move_to_end(key)
+
+            return mask
+
+    def put(self, key: _DomainRecordsMaskKey, mask: np.ndarray) -> None:
+        if mask.nbytes > self._max_bytes:
+            return
+
+        with self._lock:
+            previous = self._masks.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous.nbytes
+
+            self._masks[key] = mask
+            self._current_bytes += mask.nbytes
+            while self._current_bytes > self._max_bytes:
+                _, evicted = self._masks.popitem(last=False)
+                self._current_bytes -= evicted.nbytes
+
+    def invalidate(self, batch_id: Optional[str]) -> None:
+        with self._lock:
+            keys: List[_DomainRecordsMaskKey] = [key for key in self._masks if key[0] == batch_id]
+            for key in keys:
+                self._current_bytes -= self._masks.pop(key).nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._masks.clear()
+            self._current_bytes = 0
+
+
+# Reader methods, which can load only a subset of columns (via "usecols" or "columns" options).
+_USECOLS_READER_METHODS = {"read_csv", "read_table", "read_fwf", "read_excel"}
+_COLUMNS_READER_METHODS = {"read_parquet"}
+_COLUMN_PROJECTING_READER_METHODS = _USECOLS_READER_METHODS | _COLUMNS_READER_METHODS
+
+# Reader methods, which can read local files in chunks of rows (via "chunksize" option).
+_CHUNKED_READER_METHODS = {"read_csv", "read_table", "read_fwf"}
+_CHUNKING_READER_OPTIONS = {"chunksize", "iterator"}
+
+
+class _ColumnProjectingReaderFn:
+    """Pandas reader function, which loads only "columns" (and records names of all source columns).
+
+    Columns are selected with a "usecols" callable (CSV-like and Excel readers) or, for Parquet, with "columns" after
+    reading the file schema (requires "pyarrow").  At least one source column is always loaded, so that row counts stay
+    intact.  If the reader options already select columns, or the schema cannot be read, then all columns are loaded
+    and "source_columns" remains None.
+    """  # noqa: E501
+
+    def __init__(
+        self, reader_fn: DataFrameFactoryFn, reader_method: str, columns: List[str]
+    ) -> None:
+        self._reader_fn = reader_fn
+        self._reader_method = reader_method
+        self._columns = set(columns)
+        self.source_columns: Optional[List[str]] = None
+
+    def __call__(self, *args, **reader_options) -> pd.DataFrame:
+        if self._reader_method in _USECOLS_READER_METHODS and "usecols" not in reader_options:
+            return self._read_using_usecols(*args, **reader_options)
+
+        if self._reader_method in _COLUMNS_READER_METHODS and "columns" not in reader_options:
+            source_columns: Optional[List[str]] = self._read_parquet_column_names(
+                *args, **reader_options
+            )
+            if source_columns:
+                self.source_columns = source_columns
+                return self._reader_fn(
+                    *args,
+                    columns=[column for column in source_columns if column in self._columns]
+                    or source_columns[:1],
+                    **reader_options,
+                )
+
+        return self._reader_fn(*args, **reader_options)
+
+    def _read_using_usecols(self, *args, **reader_options) -> pd.DataFrame:
+        # Dictionary keys are used as insertion-ordered set of source columns seen by "usecols".
+        source_columns: Dict[str, None] = {}
+
+        def usecols(column: str) -> bool:
+            # Readers may call "usecols" repeatedly for the same column.
+            source_columns.setdefault(column, None)
+            return column == next(iter(source_columns)) or column in self._columns
+
+        df: pd.DataFrame = self._reader_fn(*args, usecols=usecols, **reader_options)
+        self.source_columns = list(source_columns)
+        return df
+
+    @staticmethod
+    def _read_parquet_column_names(*args, **reader_options) -> Optional[List[str]]:
+        source = args[0] if args else reader_options.get("path")
+        if source is None or not pyarrow_parquet:
+            return None
+
+        try:
+            names: List[str] = pyarrow_parquet.read_schema(source).names
+        except Exception as e:
+            logger.debug(f"Unable to read Parquet schema; loading all columns: {e}")
+            return None
+        finally:
+            if hasattr(source, "seek"):
+                source.seek(0)
+
+        return names
+
 
 @public_api
 class PandasExecutionEngine(ExecutionEngine):
@@ -82,6 +254,11 @@ class PandasExecutionEngine(ExecutionEngine):
         execution_engine: ExecutionEngine = PandasExecutionEngine(batch_data_dict={batch.id: batch.data})
     ```
 
+    Passing "chunk_size" (number of rows) enables streaming mode: local CSV and Parquet files are read in chunks of
+    "chunk_size" rows, rather than loaded entirely, and decomposable metrics are computed chunk by chunk.  Metrics, which
+    cannot be computed from chunks, load entire batch (with a warning), unless "allow_full_batch_load" is False, in which
+    case they fail.
+
     --ge-feature-maturity-info--
 
         id: validation_engine_pandas
@@ -115,6 +292,26 @@ class PandasExecutionEngine(ExecutionEngine):
         boto3_options: Dict[str, dict] = kwargs.pop("boto3_options", {})
         azure_options: Dict[str, dict] = kwargs.pop("azure_options", {})
         gcs_options: Dict[str, dict] = kwargs.pop("gcs_options", {})
+        domain_records_cache_max_bytes: int = kwargs.pop(
+            "domain_records_cache_max_bytes", DEFAULT_DOMAIN_RECORDS_MASK_CACHE_MAX_BYTES
+        )
+        if domain_records_cache_max_bytes < 0:
+            raise gx_exceptions.InvalidConfigError(  # noqa: TRY003
+                "domain_records_cache_max_bytes must be a non-negative integer."
+            )
+
+        self._domain_records_mask_cache = _DomainRecordsMaskCache(
+            max_bytes=domain_records_cache_max_bytes
+        )
+
+        chunk_size: Optional[int] = kwargs.pop("chunk_size", None)
+        if chunk_size is not None and chunk_size <= 0:
+            raise gx_exceptions.InvalidConfigError(  # noqa: TRY003
+                "chunk_size must be a positive integer."
+            )
+
+        self._chunk_size = chunk_size
+        self._allow_full_batch_load: bool = kwargs.pop("allow_full_batch_load", True)
 
         # Instantiate cloud provider clients as None at first.
         # They will be instantiated if/when passed cloud-specific in BatchSpec is passed in
@@ -130,6 +327,9 @@ class PandasExecutionEngine(ExecutionEngine):
                 "boto3_options": boto3_options,
                 "azure_options": azure_options,
                 "gcs_options": gcs_options,
+                "domain_records_cache_max_bytes": domain_records_cache_max_bytes,
+                "chunk_size": chunk_size,
+                "allow_full_batch_load": self._allow_full_batch_load,
             }
         )
 
@@ -203,7 +403,7 @@ class PandasExecutionEngine(ExecutionEngine):
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
     @override
-    def get_batch_data_and_markers(  # noqa: C901, PLR0912, PLR0915
+    def get_batch_data_and_markers(
         self, batch_spec: BatchSpec | PandasBatchSpecProtocol
     ) -> Tuple[PandasBatchData, BatchMarkers]:  # batch_data
         # We need to build a batch_markers to be used in the dataframe
@@ -215,6 +415,282 @@ class PandasExecutionEngine(ExecutionEngine):
             }
         )
 
+        if self._chunk_size is not None:
+            chunked_batch_data: Optional[ChunkedPandasBatchData] = self._get_chunked_batch_data(
+                batch_spec=batch_spec
+            )
+            if chunked_batch_data is not None:
+                return chunked_batch_data, batch_markers
+
+        df: pd.DataFrame
+        source_columns: Optional[List[str]]
+        df, source_columns = self._get_dataframe_from_batch_spec(batch_spec=batch_spec)
+
+        df = self._apply_partitioning_and_sampling_methods(batch_spec, df)  # type: ignore[arg-type]
+        if df.memory_usage().sum() < HASH_THRESHOLD:
+            batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+
+        typed_batch_data = PandasBatchData(
+            execution_engine=self, dataframe=df, source_columns=source_columns
+        )
+
+        return typed_batch_data, batch_markers
+
+    def _get_chunked_batch_data(
+        self, batch_spec: BatchSpec | PandasBatchSpecProtocol
+    ) -> Optional[ChunkedPandasBatchData]:
+        """Streamed batch data of "batch_spec" (None, if its source cannot be read in chunks).
+
+        Only local files are streamed: CSV-like files in chunks of "chunk_size" rows, and Parquet files in record batches
+        of "chunk_size" rows (requires "pyarrow").  Partitioned and sampled batches are loaded entirely.
+        """  # noqa: E501
+        if (
+            not isinstance(batch_spec, PathBatchSpec)
+            or isinstance(batch_spec, (S3BatchSpec, AzureBatchSpec, GCSBatchSpec))
+            or batch_spec.get("partitioner_method")
+            not in (None, PartitionerMethod.PARTITION_ON_WHOLE_TABLE.value)
+            or batch_spec.get("sampling_method")
+        ):
+            return None
+
+        path: str = batch_spec.path
+        reader_method: str = (
+            batch_spec.reader_method or self.guess_reader_method_from_path(path)["reader_method"]
+        )
+        reader_options: dict = batch_spec.reader_options
+        columns: Optional[List[str]] = batch_spec.get("columns")
+        if reader_method in _CHUNKED_READER_METHODS and not (
+            _CHUNKING_READER_OPTIONS & reader_options.keys()
+        ):
+            return self._get_chunked_text_file_batch_data(
+                reader_fn=self._get_reader_fn(batch_spec.reader_method, path),
+                path=path,
+                reader_options=reader_options,
+                columns=columns,
+            )
+
+        if reader_method == "read_parquet" and pyarrow_parquet and not reader_options:
+            return self._get_chunked_parquet_batch_data(path=path, columns=columns)
+
+        return None
+
+    def _get_chunked_text_file_batch_data(
+        self,
+        reader_fn: DataFrameFactoryFn,
+        path: str,
+        reader_options: dict,
+        columns: Optional[List[str]],
+    ) -> ChunkedPandasBatchData:
+        source_columns: List[str] = list(reader_fn(path, **{**reader_options, "nrows": 0}).columns)
+        usecols: Optional[List[str]] = None
+        if columns is not None and "usecols" not in reader_options:
+            # First column is always loaded, so that row counts stay intact.
+            usecols = [column for column in source_columns if column in set(columns)] or (
+                source_columns[:1]
+            )
+
+        def read_chunks() -> Iterator[pd.DataFrame]:
+            options: dict = {**reader_options, "chunksize": self._chunk_size}
+            if usecols is not None:
+                options["usecols"] = usecols
+
+            with reader_fn(path, **options) as reader:
+                yield from reader
+
+        return ChunkedPandasBatchData(
+            execution_engine=self,
+            read_chunks=read_chunks,
+            source_columns=source_columns if usecols is not None else None,
+            allow_full_load=self._allow_full_batch_load,
+        )
+
+    def _get_chunked_parquet_batch_data(
+        self, path: str, columns: Optional[List[str]]
+    ) -> Optional[ChunkedPandasBatchData]:
+        try:
+            source_columns: List[str] = pyarrow_parquet.ParquetFile(path).schema_arrow.names
+        except Exception as e:
+            logger.debug(f"Unable to stream Parquet file {path}; loading it entirely: {e}")
+            return None
+
+        selected_columns: Optional[List[str]] = None
+        if columns is not None:
+            selected_columns = [column for column in source_columns if column in set(columns)] or (
+                source_columns[:1]
+            )
+
+        def read_chunks() -> Iterator[pd.DataFrame]:
+            parquet_file = pyarrow_parquet.ParquetFile(path)
+            # Record batches are indexed consecutively (as rows of entire file would be).
+            row_offset: int = 0
+            for record_batch in parquet_file.iter_batches(
+                batch_size=self._chunk_size, columns=selected_columns
+            ):
+                chunk: pd.DataFrame = record_batch.to_pandas()
+                chunk.index = pd.RangeIndex(row_offset, row_offset + len(chunk))
+                row_offset += len(chunk)
+                yield chunk
+
+            if row_offset == 0:
+                yield (
+                    parquet_file.schema_arrow.empty_table()
+                    .select(selected_columns or source_columns)
+                    .to_pandas()
+                )
+
+        return ChunkedPandasBatchData(
+            execution_engine=self,
+            read_chunks=read_chunks,
+            source_columns=source_columns if selected_columns is not None else None,
+            allow_full_load=self._allow_full_batch_load,
+        )
+
+    def get_partitioned_batch_data_and_markers(
+        self, batch_spec: BatchSpec
+    ) -> Iterator[Tuple[dict, PandasBatchData, BatchMarkers]]:
+        """Load source data of "batch_spec" once and yield batch data of every one of its partitions.
+
+        Unlike "get_batch_data_and_markers()", which reads and filters the whole source for a single batch, all
+        partitions of "partitioner_method" are enumerated in one group-by pass over the loaded data (the
+        "batch_identifiers" in "partitioner_kwargs" are ignored).  Sampling, if configured, is applied to every partition.
+
+        Args:
+            batch_spec: BatchSpec specifying source data as well as partitioner (and sampling) directives.
+
+        Yields:
+            Tuples of batch identifiers, batch data, and batch markers of every partition.
+        """  # noqa: E501
+        df: pd.DataFrame
+        source_columns: Optional[List[str]]
+        df, source_columns = self._get_dataframe_from_batch_spec(batch_spec=batch_spec)
+        yield from self._get_partitions_batch_data_and_markers(
+            batch_spec=batch_spec, df=df, source_columns=source_columns
+        )
+
+    def get_batch_data_and_markers_list(
+        self, batch_specs: List[BatchSpec]
+    ) -> List[Tuple[PandasBatchData, BatchMarkers]]:
+        """Load batch data of every one of "batch_specs", reading every source only once.
+
+        Batch specs, which differ only in "batch_identifiers" of their partitioner (e.g., days of one file), share their
+        source: it is loaded once, its partitions are enumerated in one group-by pass (as by
+        "get_partitioned_batch_data_and_markers()"), and every batch is looked up among them.  Other batch specs are
+        loaded by "get_batch_data_and_markers()".
+
+        Args:
+            batch_specs: BatchSpecs specifying source data as well as partitioner (and sampling) directives.
+
+        Returns:
+            Batch data and batch markers of every batch spec, in order of "batch_specs".
+        """  # noqa: E501
+        results: List[Optional[Tuple[PandasBatchData, BatchMarkers]]] = [None] * len(batch_specs)
+        indices_by_source: Dict[str, List[int]] = {}
+        for index, batch_spec in enumerate(batch_specs):
+            source_id: Optional[str] = _get_partitioned_source_id(batch_spec)
+            if source_id is None:
+                results[index] = self.get_batch_data_and_markers(batch_spec=batch_spec)
+            else:
+                indices_by_source.setdefault(source_id, []).append(index)
+
+        indices: List[int]
+        for indices in indices_by_source.values():
+            if len(indices) == 1:
+                results[indices[0]] = self.get_batch_data_and_markers(
+                    batch_spec=batch_specs[indices[0]]
+                )
+                continue
+
+            df: pd.DataFrame
+            source_columns: Optional[List[str]]
+            df, source_columns = self._get_dataframe_from_batch_spec(
+                batch_spec=batch_specs[indices[0]]
+            )
+            partitions: Dict[str, Tuple[PandasBatchData, BatchMarkers]] = {
+                _get_batch_identifiers_id(batch_identifiers): (batch_data, batch_markers)
+                for batch_identifiers, batch_data, batch_markers in (
+                    self._get_partitions_batch_data_and_markers(
+                        batch_spec=batch_specs[indices[0]], df=df, source_columns=source_columns
+                    )
+                )
+            }
+            for index in indices:
+                batch_identifiers = batch_specs[index]["partitioner_kwargs"].get(
+                    "batch_identifiers"
+                )
+                partition = partitions.get(_get_batch_identifiers_id(batch_identifiers or {}))
+                if partition is None:
+                    # No rows of this batch (or its identifiers are not of enumerated form); filter loaded data.  # noqa: E501
+                    partition = self._get_batch_data_and_markers_from_dataframe(
+                        batch_spec=batch_specs[index],
+                        df=self._apply_partitioning_and_sampling_methods(
+                            batch_specs[index],  # type: ignore[arg-type]
+                            df,
+                        ),
+                        source_columns=source_columns,
+                    )
+
+                results[index] = partition
+
+        return cast(List[Tuple[PandasBatchData, BatchMarkers]], results)
+
+    def _get_partitions_batch_data_and_markers(
+        self, batch_spec: BatchSpec, df: pd.DataFrame, source_columns: Optional[List[str]]
+    ) -> Iterator[Tuple[dict, PandasBatchData, BatchMarkers]]:
+        partitioner_method_name: str = (
+            batch_spec.get("partitioner_method") or PartitionerMethod.PARTITION_ON_WHOLE_TABLE.value
+        )
+        partitioner_kwargs: dict = batch_spec.get("partitioner_kwargs") or {}
+
+        batch_identifiers: dict
+        partition_df: pd.DataFrame
+        for batch_identifiers, partition_df in self._data_partitioner.get_partitions(
+            df=df,
+            partitioner_method_name=partitioner_method_name,
+            partitioner_kwargs=partitioner_kwargs,
+        ):
+            yield (
+                batch_identifiers,
+                *self._get_batch_data_and_markers_from_dataframe(
+                    batch_spec=batch_spec,
+                    df=self._apply_sampling_method(batch_spec, partition_df),
+                    source_columns=source_columns,
+                ),
+            )
+
+    def _get_batch_data_and_markers_from_dataframe(
+        self, batch_spec: BatchSpec, df: pd.DataFrame, source_columns: Optional[List[str]]
+    ) -> Tuple[PandasBatchData, BatchMarkers]:
+        batch_markers = BatchMarkers(
+            {
+                "ge_load_time": datetime.datetime.now(datetime.timezone.utc).strftime(
+                    "%Y%m%dT%H%M%S.%fZ"
+                )
+            }
+        )
+        if df.memory_usage().sum() < HASH_THRESHOLD:
+            batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+
+        return (
+            PandasBatchData(execution_engine=self, dataframe=df, source_columns=source_columns),
+            batch_markers,
+        )
+
+    def _get_dataframe_from_batch_spec(  # noqa: C901, PLR0912, PLR0915
+        self, batch_spec: BatchSpec | PandasBatchSpecProtocol
+    ) -> Tuple[pd.DataFrame, Optional[List[str]]]:
+        """Load source data of "batch_spec".
+
+        If "batch_spec" contains "columns" (and the reader method supports it), then only these columns are loaded.
+
+        Returns:
+            Loaded dataframe and names of all source columns (None, unless columns were projected).
+        """  # noqa: E501
+        # column projection not supported for FabricBatchSpec
+        columns: Optional[List[str]] = (
+            batch_spec.get("columns") if isinstance(batch_spec, BatchSpec) else None
+        )
+
+        reader_fn: Optional[DataFrameFactoryFn] = None
         batch_data: Any
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
@@ -259,7 +735,7 @@ class PandasExecutionEngine(ExecutionEngine):
                     f"""PandasExecutionEngine encountered the following error while trying to read data from S3 Bucket: {error}"""  # noqa: E501
                 )
             logger.debug(f"Fetching s3 object. Bucket: {s3_url.bucket} Key: {s3_url.key}")
-            reader_fn: DataFrameFactoryFn = self._get_reader_fn(reader_method, s3_url.key)
+            reader_fn = self._get_column_projecting_reader_fn(reader_method, s3_url.key, columns)
             buf = BytesIO(s3_object["Body"].read())
             buf.seek(0)
             df = reader_fn(buf, **reader_options)
@@ -285,7 +761,9 @@ class PandasExecutionEngine(ExecutionEngine):
             logger.debug(
                 f"Fetching Azure blob. Container: {azure_url.container} Blob: {azure_url.blob}"
             )
-            reader_fn = self._get_reader_fn(reader_method, azure_url.blob)
+            reader_fn = self._get_column_projecting_reader_fn(
+                reader_method, azure_url.blob, columns
+            )
             buf = BytesIO(azure_object.readall())
             buf.seek(0)
             df = reader_fn(buf, **reader_options)
@@ -312,7 +790,7 @@ class PandasExecutionEngine(ExecutionEngine):
                     f"""PandasExecutionEngine encountered the following error while trying to read data from GCS \
 Bucket: {error}"""  # noqa: E501
                 )
-            reader_fn = self._get_reader_fn(reader_method, gcs_url.blob)
+            reader_fn = self._get_column_projecting_reader_fn(reader_method, gcs_url.blob, columns)
             buf = BytesIO(gcs_blob.download_as_bytes())
             buf.seek(0)
             df = reader_fn(buf, **reader_options)
@@ -322,13 +800,13 @@ Bucket: {error}"""  # noqa: E501
             reader_method = batch_spec.reader_method
             reader_options = batch_spec.reader_options
             path = batch_spec.path
-            reader_fn = self._get_reader_fn(reader_method, path)
+            reader_fn = self._get_column_projecting_reader_fn(reader_method, path, columns)
             df = reader_fn(path, **reader_options)
 
         elif isinstance(batch_spec, PandasBatchSpec):
             reader_method = batch_spec.reader_method
             reader_options = batch_spec.reader_options
-            reader_fn = self._get_reader_fn(reader_method)
+            reader_fn = self._get_column_projecting_reader_fn(reader_method, columns=columns)
             reader_fn_result: pd.DataFrame | list[pd.DataFrame] = execute_pandas_reader_fn(
                 reader_fn, reader_options
             )
@@ -353,13 +831,10 @@ Bucket: {error}"""  # noqa: E501
 not {batch_spec.__class__.__name__}"""  # noqa: E501
             )
 
-        df = self._apply_partitioning_and_sampling_methods(batch_spec, df)  # type: ignore[arg-type]
-        if df.memory_usage().sum() < HASH_THRESHOLD:
-            batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
-
-        typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
+        if isinstance(reader_fn, _ColumnProjectingReaderFn):
+            return df, reader_fn.source_columns
 
-        return typed_batch_data, batch_markers
+        return df, None
 
     def _apply_partitioning_and_sampling_methods(
         self,
@@ -376,6 +851,17 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
                 partitioner_kwargs: dict = batch_spec.get("partitioner_kwargs") or {}
                 batch_data = partitioner_fn(batch_data, **partitioner_kwargs)
 
+            batch_data = self._apply_sampling_method(batch_spec, batch_data)
+
+        return batch_data
+
+    def _apply_sampling_method(
+        self,
+        batch_spec: BatchSpec | PandasBatchSpecProtocol,
+        batch_data: pd.DataFrame,
+    ) -> pd.DataFrame:
+        # sampling not supported for FabricBatchSpec
+        if isinstance(batch_spec, BatchSpec):
             sampler_method_name: Optional[str] = batch_spec.get("sampling_method")
             if sampler_method_name:
                 sampling_fn: Callable = self._data_sampler.get_sampler_method(sampler_method_name)
@@ -473,12 +959,332 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
             reader_fn = getattr(pd, reader_method)
             if reader_options:
                 reader_fn = partial(reader_fn, **reader_options)
-            return reader_fn
         except AttributeError:
             raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
                 f'Unable to find reader_method "{reader_method}" in pandas.'
             )
 
+        return reader_fn
+
+    def _get_column_projecting_reader_fn(
+        self,
+        reader_method: Optional[str],
+        path: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+    ) -> DataFrameFactoryFn:
+        """Reader function of "_get_reader_fn()", loading only "columns" (where reader method supports it)."""  # noqa: E501
+        reader_fn: DataFrameFactoryFn = (
+            self._get_reader_fn(reader_method)
+            if path is None
+            else self._get_reader_fn(reader_method, path)
+        )
+        if columns is None:
+            return reader_fn
+
+        if reader_method is None and path is not None:
+            reader_method = self.guess_reader_method_from_path(path)["reader_method"]
+
+        if reader_method in _COLUMN_PROJECTING_READER_METHODS:
+            return _ColumnProjectingReaderFn(
+                reader_fn=reader_fn, reader_method=reader_method, columns=columns
+            )
+
+        return reader_fn
+
+    @override
+    def resolve_metrics(  # noqa: C901
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Resolves metrics; metrics of streamed batches ("ChunkedPandasBatchData") are resolved chunk by chunk.
+
+        For streamed batches, row-aligned (e.g., map condition) metrics are not materialized; they are evaluated on the
+        data of metrics consuming them.  Decomposable metrics (see "pandas_chunk_aggregators") are computed in one pass
+        over chunks and merged; all other metrics are computed on entire batch (as explicit fallback).
+        """  # noqa: E501
+        if metrics is None:
+            metrics = {}
+
+        metrics_to_resolve = list(metrics_to_resolve)
+        chunked_metrics: List[MetricConfiguration] = [
+            metric
+            for metric in metrics_to_resolve
+            if self._get_streamed_batch_id(metric) is not None
+        ]
+        if not chunked_metrics:
+            return super().resolve_metrics(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        aggregated_metrics: List[MetricConfiguration] = []
+        fallback_metrics: List[MetricConfiguration] = [
+            metric for metric in metrics_to_resolve if metric not in chunked_metrics
+        ]
+        for metric in chunked_metrics:
+            if (
+                get_metric_function_type(metric_name=metric.metric_name, execution_engine=self)
+                in CHUNK_LOCAL_METRIC_FUNCTION_TYPES
+            ):
+                resolved_metrics[metric.id] = ChunkLocalMetricValue(metric_configuration=metric)
+            elif get_chunk_aggregator(
+                metric_name=metric.metric_name, execution_engine=self
+            ) is not None and not self._depends_on_cross_row_values(metric=metric, metrics=metrics):
+                aggregated_metrics.append(metric)
+            else:
+                fallback_metrics.append(metric)
+
+        if aggregated_metrics:
+            resolved_metrics.update(
+                self._resolve_metrics_over_chunks(
+                    metrics_to_resolve=aggregated_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        if fallback_metrics:
+            try:
+                resolved_metrics.update(
+                    super().resolve_metrics(
+                        metrics_to_resolve=fallback_metrics,
+                        metrics={
+                            **metrics,
+                            **self._resolve_chunk_local_dependencies(
+                                metrics_to_resolve=fallback_metrics,
+                                metrics=metrics,
+                                runtime_configuration=runtime_configuration,
+                            ),
+                        },
+                        runtime_configuration=runtime_configuration,
+                    )
+                )
+            finally:
+                for metric in fallback_metrics:
+                    self._release_streamed_batch_data(metric)
+
+        return resolved_metrics
+
+    @override
+    def materialize_deferred_metrics(
+        self,
+        metrics_to_materialize: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes chunk-local metrics (of streamed batches), which no other metric consumes, on entire batch."""  # noqa: E501
+        deferred_metrics: List[MetricConfiguration] = [
+            metric
+            for metric in metrics_to_materialize
+            if isinstance(metrics.get(metric.id), ChunkLocalMetricValue)
+        ]
+        computed_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        try:
+            for metric in deferred_metrics:
+                try:
+                    self._compute_metric_on_current_data(
+                        metric_configuration=metric,
+                        metrics=metrics,
+                        computed_metrics=computed_metrics,
+                        runtime_configuration=runtime_configuration,
+                    )
+                except Exception as e:
+                    raise gx_exceptions.MetricResolutionError(
+                        message=str(e), failed_metrics=(metric,)
+                    ) from e
+        finally:
+            for metric in deferred_metrics:
+                self._release_streamed_batch_data(metric)
+
+        return {metric.id: computed_metrics[metric.id] for metric in deferred_metrics}
+
+    def _depends_on_cross_row_values(
+        self,
+        metric: MetricConfiguration,
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> bool:
+        """Whether any chunk-local dependency of "metric" (however indirect) is not known to be row-local."""  # noqa: E501
+        for dependency in metric.metric_dependencies.values():
+            value: Optional[MetricValue] = metrics.get(dependency.id)
+            if isinstance(value, ChunkLocalMetricValue) and (
+                not is_row_local_map_metric(
+                    metric_name=dependency.metric_name, execution_engine=self
+                )
+                or self._depends_on_cross_row_values(
+                    metric=value.metric_configuration, metrics=metrics
+                )
+            ):
+                return True
+
+        return False
+
+    def _get_streamed_batch_id(self, metric: MetricConfiguration) -> Optional[str]:
+        batch_id: Optional[str] = (
+            metric.metric_domain_kwargs.get("batch_id") or self.batch_manager.active_batch_data_id
+        )
+        batch_data = self.batch_manager.batch_data_cache.get(batch_id)  # type: ignore[arg-type] # None is absent
+        return batch_id if isinstance(batch_data, ChunkedPandasBatchData) else None
+
+    def _release_streamed_batch_data(self, metric: MetricConfiguration) -> None:
+        batch_id: Optional[str] = self._get_streamed_batch_id(metric)
+        if batch_id is not None:
+            cast(
+                ChunkedPandasBatchData, self.batch_manager.batch_data_cache[batch_id]
+            ).release_dataframe()
+            self._domain_records_mask_cache.invalidate(batch_id=batch_id)
+
+    def _resolve_metrics_over_chunks(  # noqa: C901
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes partial aggregates of decomposable metrics in one pass over chunks of every batch and merges them."""  # noqa: E501
+        metrics_by_batch_id: Dict[str, List[MetricConfiguration]] = {}
+        for metric in metrics_to_resolve:
+            metrics_by_batch_id.setdefault(
+                metric.metric_domain_kwargs.get("batch_id")
+                or cast(str, self.batch_manager.active_batch_data_id),
+                [],
+            ).append(metric)
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        for batch_id, batch_metrics in metrics_by_batch_id.items():
+            batch_data = cast(ChunkedPandasBatchData, self.batch_manager.batch_data_cache[batch_id])
+            aggregators: Dict[Tuple[str, str, str], ChunkAggregator] = {
+                metric.id: cast(
+                    ChunkAggregator,
+                    get_chunk_aggregator(metric_name=metric.metric_name, execution_engine=self),
+                )
+                for metric in batch_metrics
+            }
+            partials: Dict[Tuple[str, str, str], list] = {metric.id: [] for metric in batch_metrics}
+            pending_metrics: List[MetricConfiguration] = batch_metrics
+            chunks: Iterator[pd.DataFrame] = batch_data.iter_chunks()
+            try:
+                for _ in chunks:
+                    # Row masks of previous chunk do not apply to current one.
+                    self._domain_records_mask_cache.invalidate(batch_id=batch_id)
+                    chunk_local_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+                    for metric in pending_metrics:
+                        try:
+                            partials[metric.id].append(
+                                aggregators[metric.id].partial(
+                                    compute_metric_value=partial(
+                                        self._compute_metric_on_current_data,
+                                        metric_configuration=metric,
+                                        metrics=metrics,
+                                        computed_metrics=chunk_local_metrics,
+                                        runtime_configuration=runtime_configuration,
+                                    ),
+                                    execution_engine=self,
+                                    metric_configuration=metric,
+                                )
+                            )
+                        except Exception as e:
+                            raise gx_exceptions.MetricResolutionError(
+                                message=str(e), failed_metrics=(metric,)
+                            ) from e
+
+                    pending_metrics = [
+                        metric
+                        for metric in pending_metrics
+                        if not aggregators[metric.id].first_chunk_only
+                    ]
+                    if not pending_metrics:
+                        break
+            finally:
+                chunks.close()  # type: ignore[attr-defined] # generator
+                self._domain_records_mask_cache.invalidate(batch_id=batch_id)
+
+            for metric in batch_metrics:
+                try:
+                    resolved_metrics[metric.id] = aggregators[metric.id].merge(
+                        partials[metric.id], metric_configuration=metric
+                    )
+                except Exception as e:
+                    raise gx_exceptions.MetricResolutionError(
+                        message=str(e), failed_metrics=(metric,)
+                    ) from e
+
+        if self._caching:
+            self._metric_cache.update(
+                metrics=resolved_metrics,
+                batch_ids={
+                    metric.id: metric.metric_domain_kwargs.get("batch_id")
+                    for metric in metrics_to_resolve
+                },
+            )
+
+        return resolved_metrics
+
+    def _resolve_chunk_local_dependencies(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes chunk-local dependencies of "metrics_to_resolve" on entire batch."""
+        computed_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        for metric in metrics_to_resolve:
+            for dependency in metric.metric_dependencies.values():
+                value: Optional[MetricValue] = metrics.get(dependency.id)
+                if isinstance(value, ChunkLocalMetricValue):
+                    self._compute_metric_on_current_data(
+                        metric_configuration=value.metric_configuration,
+                        metrics=metrics,
+                        computed_metrics=computed_metrics,
+                        runtime_configuration=runtime_configuration,
+                    )
+
+        return computed_metrics
+
+    def _compute_metric_on_current_data(
+        self,
+        metric_configuration: MetricConfiguration,
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        computed_metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> MetricValue:
+        """Computes metric on current data of its batch (chunk or entire batch), including chunk-local dependencies.
+
+        Chunk-local values are memoized in "computed_metrics", which must not outlive current data.
+        """  # noqa: E501
+        if metric_configuration.id in computed_metrics:
+            return computed_metrics[metric_configuration.id]
+
+        dependencies: Dict[str, Any] = (
+            self._get_computed_metric_evaluation_dependencies_by_metric_name(
+                metric_to_resolve=metric_configuration, metrics=metrics
+            )
+        )
+        for name, value in dependencies.items():
+            if isinstance(value, ChunkLocalMetricValue):
+                dependencies[name] = self._compute_metric_on_current_data(
+                    metric_configuration=value.metric_configuration,
+                    metrics=metrics,
+                    computed_metrics=computed_metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+
+        metric_class, metric_fn = get_metric_provider(
+            metric_name=metric_configuration.metric_name, execution_engine=self
+        )
+        value = metric_fn(
+            cls=metric_class,
+            execution_engine=self,
+            metric_domain_kwargs=metric_configuration.metric_domain_kwargs,
+            metric_value_kwargs=metric_configuration.metric_value_kwargs,
+            metrics=dependencies,
+            runtime_configuration=runtime_configuration,
+        )
+        computed_metrics[metric_configuration.id] = value
+        return value
+
     @override
     def resolve_metric_bundle(self, metric_fn_bundle) -> Dict[Tuple[str, str, str], Any]:
         """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""  # noqa: E501
@@ -525,74 +1331,134 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
 
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
+        condition_parser = domain_kwargs.get("condition_parser", None)
         if row_condition:
-            condition_parser = domain_kwargs.get("condition_parser", None)
-
             # Ensuring proper condition parser has been provided
             if condition_parser not in ["python", "pandas"]:
                 raise ValueError(  # noqa: TRY003
                     "condition_parser is required when setting a row_condition,"
                     " and must be 'python' or 'pandas'"
                 )
-            else:
-                # Querying row condition
+        else:
+            row_condition = None
+            condition_parser = None
+
+        ignore_row_if, how, subset = self._get_ignore_row_if_directive(domain_kwargs=domain_kwargs)
+
+        if row_condition is None and how is None:
+            return data
+
+        # Boolean row masks are memoized per Batch, so that metrics sharing a filter evaluate it only once.  # noqa: E501
+        key: _DomainRecordsMaskKey = (
+            batch_id or cast(str, self.batch_manager.active_batch_data_id),
+            row_condition,
+            condition_parser,
+            ignore_row_if if how else None,
+            tuple(subset) if how else None,
+        )
+        mask = self._domain_records_mask_cache.get(key)
+        if mask is None:
+            mask = self._compute_domain_records_mask(
+                data=data,
+                row_condition=row_condition,
+                condition_parser=condition_parser,
+                how=how,
+                subset=subset,
+            )
+            if mask is None:
+                # Row condition does not evaluate to a boolean mask; preserve "DataFrame.query()" semantics.  # noqa: E501
                 data = data.query(row_condition, parser=condition_parser)
+                if how:
+                    data = data.dropna(axis=0, how=how, subset=subset)
 
+                return data
+
+            self._domain_records_mask_cache.put(key=key, mask=mask)
+
+        return data.loc[mask]
+
+    @staticmethod
+    def _get_ignore_row_if_directive(  # noqa: C901, PLR0911
+        domain_kwargs: dict,
+    ) -> Tuple[Optional[str], Optional[str], Optional[List[str]]]:
+        """Translates "ignore_row_if" directive into "ignore_row_if" value, "dropna()" mode, and column subset.
+
+        Returns "(ignore_row_if, None, None)" when directive does not filter any rows.
+        """  # noqa: E501
         if "column" in domain_kwargs:
-            return data
+            return None, None, None
 
         if (
             "column_A" in domain_kwargs
             and "column_B" in domain_kwargs
             and "ignore_row_if" in domain_kwargs
         ):
-            # noinspection PyPep8Naming
-            column_A_name = domain_kwargs["column_A"]
-            # noinspection PyPep8Naming
-            column_B_name = domain_kwargs["column_B"]
-
             ignore_row_if = domain_kwargs["ignore_row_if"]
+            subset = [domain_kwargs["column_A"], domain_kwargs["column_B"]]
             if ignore_row_if == "both_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=[column_A_name, column_B_name],
-                )
-            elif ignore_row_if == "either_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=[column_A_name, column_B_name],
-                )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "neither":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+                return ignore_row_if, "all", subset
 
-            return data
+            if ignore_row_if == "either_value_is_missing":
+                return ignore_row_if, "any", subset
 
-        if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
-            column_list = domain_kwargs["column_list"]
+            if ignore_row_if != "neither":
+                raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+
+            return ignore_row_if, None, None
 
+        if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
             ignore_row_if = domain_kwargs["ignore_row_if"]
+            subset = list(domain_kwargs["column_list"])
             if ignore_row_if == "all_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=column_list,
-                )
-            elif ignore_row_if == "any_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=column_list,
-                )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "never":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+                return ignore_row_if, "all", subset
 
-            return data
+            if ignore_row_if == "any_value_is_missing":
+                return ignore_row_if, "any", subset
+
+            if ignore_row_if != "never":
+                raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+
+            return ignore_row_if, None, None
 
-        return data
+        return None, None, None
+
+    @staticmethod
+    def _compute_domain_records_mask(
+        data: pd.DataFrame,
+        row_condition: Optional[str],
+        condition_parser: Optional[str],
+        how: Optional[str],
+        subset: Optional[List[str]],
+    ) -> Optional[np.ndarray]:
+        """Computes positional boolean mask equivalent to "DataFrame.query(row_condition)" followed by "DataFrame.dropna(how, subset)".
+
+        Returns None if "row_condition" does not evaluate to a boolean Series aligned with "data".
+        """  # noqa: E501
+        mask = np.ones(len(data), dtype=bool)
+
+        if row_condition is not None:
+            condition = data.eval(row_condition, parser=condition_parser)
+            if not (
+                isinstance(condition, pd.Series)
+                and condition.dtype == np.bool_
+                and condition.index.equals(data.index)
+            ):
+                return None
+
+            mask &= condition.to_numpy()
+
+        if how is not None:
+            not_missing = data[subset].notna()
+            if how == "all":
+                mask &= not_missing.any(axis=1).to_numpy()
+            else:
+                mask &= not_missing.all(axis=1).to_numpy()
+
+        return mask
+
+    def _invalidate_batch_data_caches(self, batch_id: Optional[str]) -> None:
+        super()._invalidate_batch_data_caches(batch_id=batch_id)
+        self._domain_records_mask_cache.invalidate(batch_id=batch_id)
 
     @public_api
     @override
@@ -638,6 +1504,32 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
         return data, partition_domain_kwargs.compute, partition_domain_kwargs.accessor
 
 
+def _get_partitioned_source_id(batch_spec: BatchSpec | PandasBatchSpecProtocol) -> Optional[str]:
+    """Identifies source of partitioned "batch_spec" (None for in-memory or unpartitioned batch specs).
+
+    Batch specs, differing only in "batch_identifiers" of their partitioner, share the same source id.
+    """  # noqa: E501
+    if (
+        not isinstance(batch_spec, BatchSpec)
+        or isinstance(batch_spec, RuntimeDataBatchSpec)
+        or batch_spec.get("partitioner_method")
+        in (None, PartitionerMethod.PARTITION_ON_WHOLE_TABLE.value)
+    ):
+        return None
+
+    source: dict = dict(batch_spec)
+    source["partitioner_kwargs"] = {
+        key: value
+        for key, value in (batch_spec.get("partitioner_kwargs") or {}).items()
+        if key != "batch_identifiers"
+    }
+    return json.dumps(convert_to_json_serializable(source), sort_keys=True)
+
+
+def _get_batch_identifiers_id(batch_identifiers: dict) -> str:
+    return json.dumps(convert_to_json_serializable(batch_identifiers), sort_keys=True)
+
+
 def hash_pandas_dataframe(df):
     try:
         obj = pd.util.hash_pandas_object(df, index=True).values
@@ -1,16 +1,33 @@
 from __future__ import annotations
 
 import hashlib
-from typing import TYPE_CHECKING, List, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.execution_engine.partition_and_sample.data_partitioner import (
     DataPartitioner,
     DatePart,
+    PartitionerMethod,
 )
 
 if TYPE_CHECKING:
-    import pandas as pd
+    from great_expectations.compatibility.typing_extensions import TypeAlias
+
+PartitionKeys: TypeAlias = Dict[str, pd.Series]
 
 
 class PandasDataPartitioner(DataPartitioner):
@@ -20,6 +37,16 @@ class PandasDataPartitioner(DataPartitioner):
     date_part e.g. SparkDataPartitioner.date_part.MONTH
     """
 
+    DATE_PART_PARTITIONER_METHOD_TO_DATE_PARTS_MAPPING: ClassVar[Dict[str, List[DatePart]]] = {
+        PartitionerMethod.PARTITION_ON_YEAR.value: [DatePart.YEAR],
+        PartitionerMethod.PARTITION_ON_YEAR_AND_MONTH.value: [DatePart.YEAR, DatePart.MONTH],
+        PartitionerMethod.PARTITION_ON_YEAR_AND_MONTH_AND_DAY.value: [
+            DatePart.YEAR,
+            DatePart.MONTH,
+            DatePart.DAY,
+        ],
+    }
+
     def partition_on_year(
         self,
         df: pd.DataFrame,
@@ -175,7 +202,9 @@ class PandasDataPartitioner(DataPartitioner):
         date_format_string: str = "%Y-%m-%d",
     ) -> pd.DataFrame:
         """Convert the values in the named column to the given date_format, and partition on that"""
-        stringified_datetime_series = df[column_name].map(lambda x: x.strftime(date_format_string))
+        stringified_datetime_series = PandasDataPartitioner._convert_datetime(
+            series=df[column_name], date_format_string=date_format_string
+        )
         matching_string = batch_identifiers[column_name]
         return df[stringified_datetime_series == matching_string]
 
@@ -186,7 +215,10 @@ class PandasDataPartitioner(DataPartitioner):
         """Divide the values in the named column by `divisor`, and partition on that"""
 
         matching_divisor = batch_identifiers[column_name]
-        matching_rows = df[column_name].map(lambda x: int(x / divisor) == matching_divisor)
+        matching_rows = (
+            PandasDataPartitioner._divide_integer(series=df[column_name], divisor=divisor)
+            == matching_divisor
+        )
 
         return df[matching_rows]
 
@@ -197,7 +229,7 @@ class PandasDataPartitioner(DataPartitioner):
         """Divide the values in the named column by `divisor`, and partition on that"""
 
         matching_mod_value = batch_identifiers[column_name]
-        matching_rows = df[column_name].map(lambda x: x % mod == matching_mod_value)
+        matching_rows = df[column_name] % mod == matching_mod_value
 
         return df[matching_rows]
 
@@ -228,8 +260,156 @@ class PandasDataPartitioner(DataPartitioner):
         hash_function_name: str = "md5",
     ) -> pd.DataFrame:
         """Partition on the hashed value of the named column"""
+        hash_method: Callable = PandasDataPartitioner._get_hash_method(
+            hash_function_name=hash_function_name
+        )
+        matching_rows = (
+            PandasDataPartitioner._hash_values(
+                series=df[column_name], hash_method=hash_method, hash_digits=hash_digits
+            )
+            == batch_identifiers["hash_value"]
+        )
+        return df[matching_rows]
+
+    def get_partitions(
+        self,
+        df: pd.DataFrame,
+        partitioner_method_name: str,
+        partitioner_kwargs: dict,
+    ) -> Iterator[Tuple[dict, pd.DataFrame]]:
+        """Enumerate all partitions of the dataframe in one pass.
+
+        Rather than filtering the whole dataframe once per batch (as "partition_on_*" methods do), partition keys of all
+        rows are computed at once and the dataframe is grouped on them.  Rows whose partition key is null belong to no
+        partition.
+
+        Args:
+            df: dataframe from batch data.
+            partitioner_method_name: Desired partitioner method to use.
+            partitioner_kwargs: Dict of directives used by the partitioner method as keyword arguments of key=value
+                ("batch_identifiers", if present, are ignored).
+
+        Yields:
+            Tuples of batch_identifiers (of the form accepted by the partitioner method) and dataframe of partition,
+            in ascending order of partition keys.
+        """  # noqa: E501
+        partitioner_method_name = self._get_partitioner_method_name(partitioner_method_name)
+        if partitioner_method_name == PartitionerMethod.PARTITION_ON_WHOLE_TABLE.value:
+            yield {}, df
+            return
+
+        partition_keys: PartitionKeys
+        nesting_column_name: Optional[str]
+        partition_keys, nesting_column_name = self._get_partition_keys(
+            df=df,
+            partitioner_method_name=partitioner_method_name,
+            partitioner_kwargs=partitioner_kwargs,
+        )
+
+        keys: List[pd.Series] = list(partition_keys.values())
+        group_key: Any
+        partition_df: pd.DataFrame
+        for group_key, partition_df in df.groupby(
+            keys[0] if len(keys) == 1 else keys, sort=True, dropna=True
+        ):
+            key_values: tuple = (group_key,) if len(keys) == 1 else group_key
+            batch_identifiers: dict = {
+                name: value.item() if isinstance(value, np.generic) else value
+                for name, value in zip(partition_keys.keys(), key_values)
+            }
+            if nesting_column_name is not None:
+                batch_identifiers = {nesting_column_name: batch_identifiers}
+
+            yield batch_identifiers, partition_df
+
+    def _get_partition_keys(  # noqa: C901
+        self,
+        df: pd.DataFrame,
+        partitioner_method_name: str,
+        partitioner_kwargs: dict,
+    ) -> Tuple[PartitionKeys, Optional[str]]:
+        """Compute partition keys of all rows for the partitioner method.
+
+        Returns:
+            Partition keys of all rows (by batch identifier name) and column name, under which batch identifiers are
+            nested (only for date part partitioner methods; None otherwise).
+        """  # noqa: E501
+        if partitioner_method_name == PartitionerMethod.PARTITION_ON_MULTI_COLUMN_VALUES.value:
+            return {
+                column_name: df[column_name] for column_name in partitioner_kwargs["column_names"]
+            }, None
+
+        column_name: str = partitioner_kwargs["column_name"]
+        series: pd.Series = df[column_name]
+
+        date_parts: List[DatePart]
+        if partitioner_method_name in self.DATE_PART_PARTITIONER_METHOD_TO_DATE_PARTS_MAPPING:
+            date_parts = self.DATE_PART_PARTITIONER_METHOD_TO_DATE_PARTS_MAPPING[
+                partitioner_method_name
+            ]
+            return self._get_date_part_keys(series=series, date_parts=date_parts), column_name
+
+        if partitioner_method_name == PartitionerMethod.PARTITION_ON_DATE_PARTS.value:
+            self._validate_date_parts(partitioner_kwargs["date_parts"])
+            date_parts = self._convert_date_parts(partitioner_kwargs["date_parts"])
+            return self._get_date_part_keys(series=series, date_parts=date_parts), column_name
+
+        partition_keys: PartitionKeys
+        if partitioner_method_name == PartitionerMethod.PARTITION_ON_COLUMN_VALUE.value:
+            partition_keys = {column_name: series}
+        elif partitioner_method_name == PartitionerMethod.PARTITION_ON_CONVERTED_DATETIME.value:
+            partition_keys = {
+                column_name: self._convert_datetime(
+                    series=series,
+                    date_format_string=partitioner_kwargs.get("date_format_string", "%Y-%m-%d"),
+                )
+            }
+        elif partitioner_method_name == PartitionerMethod.PARTITION_ON_DIVIDED_INTEGER.value:
+            partition_keys = {
+                column_name: self._divide_integer(
+                    series=series, divisor=partitioner_kwargs["divisor"]
+                )
+            }
+        elif partitioner_method_name == PartitionerMethod.PARTITION_ON_MOD_INTEGER.value:
+            partition_keys = {column_name: series % partitioner_kwargs["mod"]}
+        elif partitioner_method_name == PartitionerMethod.PARTITION_ON_HASHED_COLUMN.value:
+            partition_keys = {
+                "hash_value": self._hash_values(
+                    series=series,
+                    hash_method=self._get_hash_method(
+                        hash_function_name=partitioner_kwargs.get("hash_function_name", "md5")
+                    ),
+                    hash_digits=partitioner_kwargs["hash_digits"],
+                )
+            }
+        else:
+            raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                f'Partitioner method "{partitioner_method_name}" does not support enumerating partitions.'  # noqa: E501
+            )
+
+        return partition_keys, None
+
+    @staticmethod
+    def _get_date_part_keys(series: pd.Series, date_parts: List[DatePart]) -> PartitionKeys:
+        return {date_part.value: getattr(series.dt, date_part.value) for date_part in date_parts}
+
+    @staticmethod
+    def _convert_datetime(series: pd.Series, date_format_string: str) -> pd.Series:
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series.dt.strftime(date_format_string)
+
+        # Values of "object" columns (e.g., "datetime.date") are converted one by one.
+        return series.map(lambda x: x.strftime(date_format_string))
+
+    @staticmethod
+    def _divide_integer(series: pd.Series, divisor: int) -> pd.Series:
+        # Truncation (rather than flooring) matches "int(x / divisor)" (and SQL integer division).
+        return np.trunc(series / divisor).astype("Int64")
+
+    @staticmethod
+    def _get_hash_method(hash_function_name: str) -> Callable:
         try:
-            hash_method = getattr(hashlib, hash_function_name)
+            return getattr(hashlib, hash_function_name)
         except (TypeError, AttributeError):
             raise (
                 gx_exceptions.ExecutionEngineError(  # noqa: TRY003
@@ -237,8 +417,21 @@ class PandasDataPartitioner(DataPartitioner):
                         Reference to {hash_function_name} cannot be found."""  # noqa: E501
                 )
             )
-        matching_rows = df[column_name].map(
-            lambda x: hash_method(str(x).encode()).hexdigest()[-1 * hash_digits :]
-            == batch_identifiers["hash_value"]
-        )
-        return df[matching_rows]
+
+    @staticmethod
+    def _hash_values(series: pd.Series, hash_method: Callable, hash_digits: int) -> pd.Series:
+        def hash_value(value: Any) -> str:
+            return hash_method(str(value).encode()).hexdigest()[-1 * hash_digits :]
+
+        # Each distinct value is hashed only once; hashes are then broadcast to rows by their codes.
+        # Raw values are factorized, so that "str()" of each value (e.g., "Timestamp") is hashed.
+        codes, uniques = pd.factorize(series)
+        hashes: np.ndarray = np.array([hash_value(value) for value in uniques] + [""], dtype=object)
+        hash_values = pd.Series(hashes[codes], index=series.index)
+
+        # Missing values (e.g., "None" and "NaN") share one code; their string forms differ, though.
+        is_missing: np.ndarray = codes == -1
+        if is_missing.any():
+            hash_values[is_missing] = series[is_missing].map(hash_value)
+
+        return hash_values
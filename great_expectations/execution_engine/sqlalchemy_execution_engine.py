@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import datetime
 import hashlib
+import itertools
 import logging
 import math
 import os
@@ -10,6 +11,7 @@ import random
 import re
 import string
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from typing import (
@@ -21,6 +23,7 @@ from typing import (
     List,
     MutableMapping,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
@@ -78,6 +81,11 @@ from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_schema_cache import (
+    SchemaReflectionCache,
+    get_connection_fingerprint,
+    get_schema_reflection_cache,
+)
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -142,6 +150,8 @@ except ImportError:
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine as SaEngine  # noqa: TID251
 
+    from great_expectations.execution_engine.metric_cache import MetricCache
+
 
 def _get_dialect_type_module(dialect):  # noqa: C901
     """Given a dialect, returns the dialect type, which is defines the engine/system that is used to communicates
@@ -274,6 +284,17 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url (string): If neither the engines, the credentials, nor the connection_string have been provided, a \
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
+        max_concurrent_queries (int): Opt-in maximum number of per-Domain metric queries that may be executed \
+            concurrently (each on its own connection from the engine's pool).  Defaults to serial execution. \
+            Ignored for dialects that require a single persisted connection (e.g. sqlite, mssql).
+        schema_cache_ttl (float): Opt-in time-to-live (in seconds) of reflected table columns, cached by connection, \
+            schema, and table, and shared by all engines of the process.  Defaults to no caching.
+        schema_cache_path (str): Local file, to which cached reflected table columns are persisted, so that they are \
+            shared between processes.  Requires schema_cache_ttl.
+        metric_cache_max_bytes (int): Approximate memory budget (in bytes) of metric cache, beyond which \
+            least-recently-used metrics are evicted (defaults to 512 MiB).
+        metric_cache (MetricCache): MetricCache object to use instead of default LRUMetricCache (takes precedence \
+            over metric_cache_max_bytes).
         kwargs (dict): These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
 
     For example:
@@ -293,16 +314,50 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
+        max_concurrent_queries: Optional[int] = None,
+        schema_cache_ttl: Optional[float] = None,
+        schema_cache_path: Optional[str] = None,
+        metric_cache_max_bytes: Optional[int] = None,
+        metric_cache: Optional[MetricCache] = None,
         # kwargs will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine  # noqa: E501
         **kwargs,
     ) -> None:
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            metric_cache_max_bytes=metric_cache_max_bytes,
+            metric_cache=metric_cache,
+        )
         self._name = name
 
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+
+        if max_concurrent_queries is not None and max_concurrent_queries < 1:
+            raise InvalidConfigError(  # noqa: TRY003
+                f"max_concurrent_queries must be a positive integer; {max_concurrent_queries} was provided."  # noqa: E501
+            )
+
+        self._max_concurrent_queries = max_concurrent_queries
+
+        if schema_cache_ttl is not None and schema_cache_ttl < 0:
+            raise InvalidConfigError(  # noqa: TRY003
+                f"schema_cache_ttl must be a non-negative number; {schema_cache_ttl} was provided."
+            )
+
+        if schema_cache_path is not None and schema_cache_ttl is None:
+            raise InvalidConfigError(  # noqa: TRY003
+                "schema_cache_path requires schema_cache_ttl to be provided."
+            )
+
+        self._schema_cache_ttl = schema_cache_ttl
+        self._schema_cache: Optional[SchemaReflectionCache] = (
+            None
+            if schema_cache_ttl is None
+            else get_schema_reflection_cache(persist_path=schema_cache_path)
+        )
         os.environ["SF_PARTNER"] = "great_expectations_oss"  # noqa: TID251
 
         # sqlite/mssql temp tables only persist within a connection, so we need to keep the connection alive by  # noqa: E501
@@ -426,6 +481,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "max_concurrent_queries": max_concurrent_queries,
+            "schema_cache_ttl": schema_cache_ttl,
+            "schema_cache_path": schema_cache_path,
+            "metric_cache_max_bytes": metric_cache_max_bytes,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -478,6 +537,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 "Credentials or an engine are required for a SqlAlchemyExecutionEngine."
             )
 
+    @property
+    def max_concurrent_queries(self) -> Optional[int]:
+        return self._max_concurrent_queries
+
     @property
     def credentials(self) -> Optional[dict]:
         return self._credentials
@@ -946,7 +1009,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         return PartitionDomainKwargs(compute_domain_kwargs, accessor_domain_kwargs)
 
     @override
-    def resolve_metric_bundle(  # noqa: C901 - too complex
+    def resolve_metric_bundle(  # noqa: C901, PLR0912 - too complex
         self,
         metric_fn_bundle: Iterable[MetricComputationConfiguration],
     ) -> Dict[Tuple[str, str, str], MetricValue]:
@@ -965,8 +1028,6 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """  # noqa: E501
         resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
-        res: List[sqlalchemy.Row]
-
         # We need a different query for each Domain (where clause).
         queries: Dict[Tuple[str, str, str], dict] = {}
 
@@ -989,6 +1050,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 queries[domain_id] = {
                     "select": [],
                     "metric_ids": [],
+                    "metric_configurations": [],
                     "domain_kwargs": compute_domain_kwargs,
                 }
 
@@ -1004,57 +1066,212 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 queries[domain_id]["select"].append(metric_fn.label(metric_to_resolve.metric_name))
 
             queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
+            queries[domain_id]["metric_configurations"].append(metric_to_resolve)
 
-        for query in queries.values():
-            domain_kwargs: dict = query["domain_kwargs"]
-            selectable: sqlalchemy.Selectable = self.get_domain_records(domain_kwargs=domain_kwargs)
+        # Queries are built serially (selectables depend on loaded "Batch" data); only their execution is concurrent.  # noqa: E501
+        sa_query_objects: Dict[Tuple[str, str, str], sqlalchemy.Select] = {}
+        for domain_id, query in queries.items():
+            try:
+                sa_query_objects[domain_id] = self._build_metric_bundle_query(query=query)
+            except Exception as e:
+                raise gx_exceptions.MetricResolutionError(
+                    message=str(e),
+                    failed_metrics=query["metric_configurations"],
+                ) from e
+
+        max_workers: int = min(self._max_concurrent_queries or 1, len(queries))
+        if max_workers > 1 and self._supports_concurrent_queries():
+            results: Dict[Tuple[str, str, str], sqlalchemy.Row] = (
+                self._execute_metric_bundle_queries_concurrently(
+                    queries=queries,
+                    sa_query_objects=sa_query_objects,
+                    max_workers=max_workers,
+                )
+            )
+        else:
+            results = {}
+            for domain_id, query in queries.items():
+                try:
+                    results[domain_id] = self._execute_metric_bundle_query(
+                        sa_query_object=sa_query_objects[domain_id],
+                        query=query,
+                    )
+                except Exception as e:
+                    raise gx_exceptions.MetricResolutionError(
+                        message=str(e),
+                        failed_metrics=query["metric_configurations"],
+                    ) from e
 
-            assert len(query["select"]) == len(query["metric_ids"])
+        # Results are merged in the order, in which Domains were first encountered in "metric_fn_bundle".  # noqa: E501
+        idx: int
+        metric_id: Tuple[str, str, str]
+        for domain_id, query in queries.items():
+            for idx, metric_id in enumerate(query["metric_ids"]):
+                # Converting SQL query execution results into JSON-serializable format produces simple data types,  # noqa: E501
+                # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.  # noqa: E501
+                resolved_metrics[metric_id] = convert_to_json_serializable(
+                    data=results[domain_id][idx]
+                )
+
+        return resolved_metrics
+
+    @override
+    def _resolve_direct_metric_bundles(
+        self,
+        metric_fn_direct_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Passes directly-computable metrics, whose MetricProvider implements "_sqlalchemy_bundle()", to it together.
+
+        MetricProvider (e.g., "column.histogram") then computes metrics, sharing one compute Domain, by single query;
+        metrics, which it leaves out of its result, are computed one by one.
+        """  # noqa: E501
+        metric_fn_direct_configurations_by_metric_class: Dict[
+            type, List[MetricComputationConfiguration]
+        ] = {}
+        metric_computation_configuration: MetricComputationConfiguration
+        for metric_computation_configuration in metric_fn_direct_configurations:
+            metric_class = metric_computation_configuration.metric_provider_kwargs["cls"]
+            if getattr(metric_class, "_sqlalchemy_bundle", None) is not None:
+                metric_fn_direct_configurations_by_metric_class.setdefault(metric_class, []).append(
+                    metric_computation_configuration
+                )
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        for (
+            metric_class,
+            metric_computation_configurations,
+        ) in metric_fn_direct_configurations_by_metric_class.items():
+            if len(metric_computation_configurations) < 2:  # noqa: PLR2004
+                continue
 
             try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.columns().subquery()
+                resolved_metrics.update(
+                    metric_class._sqlalchemy_bundle(
+                        execution_engine=self,
+                        metric_computation_configurations=metric_computation_configurations,
                     )
-                elif (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (
-                    sqlalchemy.TextualSelect and isinstance(selectable, sqlalchemy.TextualSelect)
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(selectable.subquery())
-                else:
-                    sa_query_object = sa.select(*query["select"]).select_from(selectable)
+                )
+            except Exception as e:
+                raise gx_exceptions.MetricResolutionError(
+                    message=str(e),
+                    failed_metrics=[
+                        metric_computation_configuration.metric_configuration
+                        for metric_computation_configuration in metric_computation_configurations
+                    ],
+                ) from e
+
+        return resolved_metrics
+
+    def _build_metric_bundle_query(self, query: dict) -> sqlalchemy.Select:
+        """Builds single aggregate "SELECT" statement for all bundled metrics, sharing one compute Domain."""  # noqa: E501
+        domain_kwargs: dict = query["domain_kwargs"]
+        selectable: sqlalchemy.Selectable = self.get_domain_records(domain_kwargs=domain_kwargs)
+
+        assert len(query["select"]) == len(query["metric_ids"])
+
+        """
+        If a custom query is passed, selectable will be TextClause and not formatted
+        as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+        to TextualSelect using sa.columns() before it can be converted to type Subquery
+        """
+        if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):
+            return sa.select(*query["select"]).select_from(selectable.columns().subquery())
+
+        if (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (
+            sqlalchemy.TextualSelect and isinstance(selectable, sqlalchemy.TextualSelect)
+        ):
+            return sa.select(*query["select"]).select_from(selectable.subquery())
 
-                logger.debug(f"Attempting query {sa_query_object!s}")
-                res = self.execute_query(sa_query_object).fetchall()
+        return sa.select(*query["select"]).select_from(selectable)
+
+    def _execute_metric_bundle_query(
+        self,
+        sa_query_object: sqlalchemy.Select,
+        query: dict,
+    ) -> sqlalchemy.Row:
+        """Executes aggregate "SELECT" statement for one compute Domain and returns its single result row."""  # noqa: E501
+        res: List[sqlalchemy.Row]
+        try:
+            logger.debug(f"Attempting query {sa_query_object!s}")
+            res = self.execute_query(sa_query_object).fetchall()
+
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
+{IDDict(query["domain_kwargs"]).to_id()}"""
+            )
+        except sqlalchemy.OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += (
+                f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)  # noqa: TRY400
+            raise ExecutionEngineError(message=exception_message)
 
-                logger.debug(
-                    f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
-{IDDict(domain_kwargs).to_id()}"""
+        assert len(res) == 1, "all bundle-computed metrics must be single-value statistics"
+        assert len(query["metric_ids"]) == len(res[0]), "unexpected number of metrics returned"
+
+        return res[0]
+
+    def _execute_metric_bundle_queries_concurrently(
+        self,
+        queries: Dict[Tuple[str, str, str], dict],
+        sa_query_objects: Dict[Tuple[str, str, str], sqlalchemy.Select],
+        max_workers: int,
+    ) -> Dict[Tuple[str, str, str], sqlalchemy.Row]:
+        """Executes per-Domain aggregate queries on bounded thread pool, each using its own pooled connection.
+
+        All queries are allowed to complete; "MetricResolutionError" is then raised for metrics of failed Domains only.
+        """  # noqa: E501
+        results: Dict[Tuple[str, str, str], sqlalchemy.Row] = {}
+        errors: Dict[Tuple[str, str, str], Exception] = {}
+
+        domain_id: Tuple[str, str, str]
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gx_sql_metric_bundle"
+        ) as executor:
+            futures: Dict[Tuple[str, str, str], Future] = {
+                domain_id: executor.submit(
+                    self._execute_metric_bundle_query,
+                    sa_query_object=sa_query_objects[domain_id],
+                    query=query,
                 )
-            except sqlalchemy.OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += (
-                    f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
+                for domain_id, query in queries.items()
+            }
+            for domain_id, future in futures.items():
+                try:
+                    results[domain_id] = future.result()
+                except Exception as e:
+                    errors[domain_id] = e
+
+        if errors:
+            failed_metrics: List[MetricConfiguration] = list(
+                itertools.chain.from_iterable(
+                    queries[domain_id]["metric_configurations"] for domain_id in errors
                 )
-                logger.error(exception_message)  # noqa: TRY400
-                raise ExecutionEngineError(message=exception_message)
+            )
+            first_error: Exception = next(iter(errors.values()))
+            raise gx_exceptions.MetricResolutionError(
+                message="; ".join(str(error) for error in errors.values()),
+                failed_metrics=failed_metrics,
+            ) from first_error
 
-            assert len(res) == 1, "all bundle-computed metrics must be single-value statistics"
-            assert len(query["metric_ids"]) == len(res[0]), "unexpected number of metrics returned"
+        return results
 
-            idx: int
-            metric_id: Tuple[str, str, str]
-            for idx, metric_id in enumerate(query["metric_ids"]):
-                # Converting SQL query execution results into JSON-serializable format produces simple data types,  # noqa: E501
-                # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.  # noqa: E501
-                resolved_metrics[metric_id] = convert_to_json_serializable(data=res[0][idx])
+    def _supports_concurrent_queries(self) -> bool:
+        """Determines whether per-Domain queries can safely run on separate connections from the engine's pool.
 
-        return resolved_metrics
+        Dialects that require persisted connection (see "_dialect_requires_persisted_connection()"), such as SQLite
+        (including in-memory databases), as well as engines, whose pool hands out single shared connection, are not
+        eligible, because their temporary tables and data are only visible to that single connection.
+        """  # noqa: E501
+        if self.dialect_name in _PERSISTED_CONNECTION_DIALECTS:
+            return False
+
+        pool = getattr(self.engine, "pool", None)
+        return pool is not None and not (
+            sqlalchemy.StaticPool and isinstance(pool, sqlalchemy.StaticPool)
+        )
 
     def close(self) -> None:
         """
@@ -1074,6 +1291,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
         """  # noqa: E501
+        if self._schema_cache is not None:
+            self._schema_cache.flush()
+
         if self._engine_backup:
             if self._connection:
                 self._connection.close()
@@ -1164,6 +1384,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 partition_clause = sa.true()
 
         selectable: sqlalchemy.Selectable = self._subselectable(batch_spec)
+        selected_columns: list = self._get_selected_columns(batch_spec=batch_spec)
         sampling_method: Optional[str] = batch_spec.get("sampling_method")
         if sampling_method is not None:
             if sampling_method in [
@@ -1181,7 +1402,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             else:
                 sampler_fn = self._data_sampler.get_sampler_method(sampling_method)
                 return (
-                    sa.select("*")
+                    sa.select(*selected_columns)
                     .select_from(selectable)
                     .where(
                         sa.and_(
@@ -1191,7 +1412,35 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     )
                 )
 
-        return sa.select("*").select_from(selectable).where(partition_clause)
+        return sa.select(*selected_columns).select_from(selectable).where(partition_clause)
+
+    def _get_selected_columns(self, batch_spec: BatchSpec) -> list:
+        """Columns to select into batch data ("*", unless "columns" of table batch are projected).
+
+        Projected columns, which do not exist in the table, are left out (so that they are reported as missing by
+        expectations, rather than failing the query); the source table keeps reporting full schema metadata.
+        """  # noqa: E501
+        columns: Optional[List[str]] = batch_spec.get("columns")
+        table_name: Optional[str] = batch_spec.get("table_name")
+        if not columns or not table_name:
+            return ["*"]
+
+        table_column_names: List[str] = [
+            column["name"]
+            for column in self.get_table_columns(
+                table_name=table_name, schema_name=batch_spec.get("schema_name", None)
+            )
+        ]
+        if not table_column_names:
+            return ["*"]
+
+        projected_column_names: Set[str] = set(columns)
+        selected_column_names: List[str] = [
+            column_name
+            for column_name in table_column_names
+            if column_name in projected_column_names
+        ] or table_column_names[:1]
+        return [sa.column(column_name) for column_name in selected_column_names]
 
     def _subselectable(self, batch_spec: BatchSpec) -> sqlalchemy.Selectable:
         table_name = batch_spec.get("table_name")
@@ -1281,6 +1530,55 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return self._inspector
 
+    def get_table_columns(
+        self, table_name: str, schema_name: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Reflected columns of table (as returned by "Inspector.get_columns()").
+
+        If "schema_cache_ttl" is configured, then non-empty reflection results are served from schema reflection cache,
+        shared by all engines connected to the same database, until they expire or are invalidated.
+        """  # noqa: E501
+        cache_key: Optional[Tuple[str, Optional[str], str]] = None
+        if self._schema_cache is not None:
+            connection_fingerprint: Optional[str] = self._get_connection_fingerprint()
+            if connection_fingerprint is not None:
+                cache_key = (connection_fingerprint, schema_name, table_name)
+                columns: Optional[List[Dict[str, Any]]] = self._schema_cache.get(
+                    key=cache_key, ttl=cast(float, self._schema_cache_ttl)
+                )
+                if columns is not None:
+                    return columns
+
+        columns = self.get_inspector().get_columns(table_name, schema=schema_name)
+        if cache_key is not None and columns:
+            cast(SchemaReflectionCache, self._schema_cache).set(key=cache_key, columns=columns)
+
+        return columns  # type: ignore[return-value] # reflected columns are never None
+
+    def invalidate_schema_cache(
+        self, table_name: Optional[str] = None, schema_name: Optional[str] = None
+    ) -> int:
+        """Drops cached reflected columns of tables of this engine's database (matching "table_name" and "schema_name", if given).
+
+        Also resets the engine's Inspector, which caches reflected metadata of its own.
+
+        Returns:
+            Number of dropped schema reflection cache entries.
+        """  # noqa: E501
+        self._inspector = None
+        connection_fingerprint: Optional[str] = self._get_connection_fingerprint()
+        if self._schema_cache is None or connection_fingerprint is None:
+            return 0
+
+        return self._schema_cache.invalidate(
+            connection_fingerprint=connection_fingerprint,
+            schema_name=schema_name,
+            table_name=table_name,
+        )
+
+    def _get_connection_fingerprint(self) -> Optional[str]:
+        return get_connection_fingerprint(url=getattr(self.engine, "engine", self.engine).url)
+
     @contextmanager
     def get_connection(self) -> sqlalchemy.Connection:
         """Get a connection for executing queries.
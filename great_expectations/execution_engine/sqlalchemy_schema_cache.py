@@ -0,0 +1,231 @@
+"""Cache of table schemas reflected by "SqlAlchemyExecutionEngine", shared by all engines of current process.
+
+Reflecting columns of a table (via "Inspector.get_columns()") queries information schema of the database, which takes
+seconds per table on some warehouses (e.g., Snowflake and Databricks).  Since "Inspector" caches reflected metadata only
+for the lifetime of its engine, and execution engines are rebuilt whenever Datasource configuration changes, reflected
+column metadata is cached here by "(connection fingerprint, schema name, table name)", so that it outlives engines (and,
+if "persist_path" is given, also the process).  Entries expire after the time-to-live requested by the engine looking
+them up, and can be invalidated explicitly.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import logging
+import pathlib
+import pickle
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+logger = logging.getLogger(__name__)
+
+SchemaReflectionCacheKey = Tuple[str, Optional[str], str]
+
+
+@dataclass(frozen=True)
+class _SchemaReflectionCacheEntry:
+    columns: List[Dict[str, Any]]
+    reflected_at: float
+
+
+class SchemaReflectionCache:
+    """Thread-safe cache of reflected table column metadata, optionally persisted to local file at "persist_path".
+
+    Persisted entries are loaded on first access; changes are written back (merged with entries written by other
+    processes in the meantime) by "flush()", which is also called on interpreter exit.  Column metadata, which cannot be
+    pickled (e.g., with custom dialect types), is cached in memory only.
+    """  # noqa: E501
+
+    def __init__(self, persist_path: Optional[pathlib.Path] = None) -> None:
+        self._persist_path = persist_path
+        self._entries: Dict[SchemaReflectionCacheKey, _SchemaReflectionCacheEntry] = {}
+        self._invalidated_keys: set = set()
+        self._loaded: bool = persist_path is None
+        self._dirty: bool = False
+        self._lock = threading.RLock()
+
+    @property
+    def persist_path(self) -> Optional[pathlib.Path]:
+        return self._persist_path
+
+    def get(self, key: SchemaReflectionCacheKey, ttl: float) -> Optional[List[Dict[str, Any]]]:
+        """Returns cached column metadata of "key", if reflected at most "ttl" seconds ago (None otherwise)."""  # noqa: E501
+        with self._lock:
+            self._load()
+            entry: Optional[_SchemaReflectionCacheEntry] = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if time.time() - entry.reflected_at > ttl:
+                del self._entries[key]
+                return None
+
+            return entry.columns
+
+    def set(self, key: SchemaReflectionCacheKey, columns: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._load()
+            self._entries[key] = _SchemaReflectionCacheEntry(
+                columns=columns, reflected_at=time.time()
+            )
+            self._invalidated_keys.discard(key)
+            self._dirty = True
+
+    def invalidate(
+        self,
+        connection_fingerprint: Optional[str] = None,
+        schema_name: Optional[str] = None,
+        table_name: Optional[str] = None,
+    ) -> int:
+        """Drops entries matching all given key parts (all entries, if none is given); returns number of dropped entries.
+
+        Note: "schema_name" of None matches entries of every schema.
+        """  # noqa: E501
+        with self._lock:
+            self._load()
+            keys: List[SchemaReflectionCacheKey] = [
+                key
+                for key in self._entries
+                if (connection_fingerprint is None or key[0] == connection_fingerprint)
+                and (schema_name is None or key[1] == schema_name)
+                and (table_name is None or key[2] == table_name)
+            ]
+            for key in keys:
+                del self._entries[key]
+
+            self._invalidated_keys.update(keys)
+            if keys:
+                self._dirty = True
+
+            return len(keys)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def flush(self) -> None:
+        """Writes cached entries to "persist_path" (no-op, if there is nothing to write)."""
+        with self._lock:
+            if self._persist_path is None or not self._dirty:
+                return
+
+            # Entries persisted by other processes since loading are kept, unless newer here or invalidated.  # noqa: E501
+            entries: Dict[SchemaReflectionCacheKey, _SchemaReflectionCacheEntry] = {
+                key: entry
+                for key, entry in self._read_persisted_entries().items()
+                if key not in self._invalidated_keys
+            }
+            for key, entry in self._entries.items():
+                if key not in entries or entries[key].reflected_at < entry.reflected_at:
+                    entries[key] = entry
+
+            payload: Dict[SchemaReflectionCacheKey, bytes] = {}
+            for key, entry in entries.items():
+                try:
+                    payload[key] = pickle.dumps(entry)
+                except Exception as e:
+                    logger.debug(f"Schema of {key} cannot be persisted: {e!r}")
+
+            try:
+                self._write_atomically(payload=pickle.dumps(payload))
+            except OSError as e:
+                logger.warning(
+                    f"Unable to persist schema reflection cache to {self._persist_path}: {e}"
+                )
+                return
+
+            self._invalidated_keys.clear()
+            self._dirty = False
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+
+        self._loaded = True
+        for key, entry in self._read_persisted_entries().items():
+            if key not in self._entries:
+                self._entries[key] = entry
+
+    def _read_persisted_entries(
+        self,
+    ) -> Dict[SchemaReflectionCacheKey, _SchemaReflectionCacheEntry]:
+        if self._persist_path is None or not self._persist_path.exists():
+            return {}
+
+        entries: Dict[SchemaReflectionCacheKey, _SchemaReflectionCacheEntry] = {}
+        try:
+            payload: Dict[SchemaReflectionCacheKey, bytes] = pickle.loads(
+                self._persist_path.read_bytes()
+            )
+
+            for key, pickled_entry in payload.items():
+                try:
+                    entries[key] = pickle.loads(pickled_entry)
+                except Exception as e:
+                    logger.debug(f"Persisted schema of {key} cannot be loaded: {e!r}")
+        except Exception as e:
+            logger.warning(
+                f"Ignoring unreadable schema reflection cache file {self._persist_path}: {e!r}"
+            )
+
+        return entries
+
+    def _write_atomically(self, payload: bytes) -> None:
+        # Readers in other processes never observe partially written file.
+        persist_path = cast(pathlib.Path, self._persist_path)
+        persist_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=persist_path.parent, suffix=".tmp", delete=False
+        ) as temp_file:
+            temp_file.write(payload)
+
+        temp_path = pathlib.Path(temp_file.name)
+        try:
+            temp_path.replace(persist_path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+
+_schema_reflection_caches: Dict[Optional[pathlib.Path], SchemaReflectionCache] = {}
+_schema_reflection_caches_lock = threading.Lock()
+
+
+def get_schema_reflection_cache(persist_path: Optional[str] = None) -> SchemaReflectionCache:
+    """Returns SchemaReflectionCache shared by all engines of current process, persisted at "persist_path" (if any)."""  # noqa: E501
+    path: Optional[pathlib.Path] = (
+        None if persist_path is None else pathlib.Path(persist_path).expanduser().resolve()
+    )
+    with _schema_reflection_caches_lock:
+        if path not in _schema_reflection_caches:
+            _schema_reflection_caches[path] = SchemaReflectionCache(persist_path=path)
+
+        return _schema_reflection_caches[path]
+
+
+def get_connection_fingerprint(url: Any) -> Optional[str]:
+    """Digest identifying database of SQLAlchemy "url" (None, for in-memory SQLite databases, which are never shared).
+
+    Digest (rather than URL itself) is used, so that credentials are not exposed in persisted cache.
+    """  # noqa: E501
+    if url is None or (
+        url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+    ):
+        return None
+
+    rendered_url: str = (
+        url.render_as_string(hide_password=False) if hasattr(url, "render_as_string") else str(url)
+    )
+    return hashlib.sha256(rendered_url.encode("utf-8")).hexdigest()
+
+
+@atexit.register
+def _flush_schema_reflection_caches() -> None:
+    for cache in list(_schema_reflection_caches.values()):
+        try:
+            cache.flush()
+        except Exception as e:
+            logger.debug(f"Unable to flush schema reflection cache: {e!r}")
@@ -46,6 +46,10 @@ STRICT_MIN_DESCRIPTION = (
 STRICT_MAX_DESCRIPTION = (
     "If True, the column median must be strictly smaller than max_value, default=False"
 )
+ALLOW_RELATIVE_ERROR_DESCRIPTION = (
+    "Whether to allow approximate median on backends that compute it by approximate "
+    "percentile function (e.g., Trino and BigQuery), default=False"
+)
 SUPPORTED_DATA_SOURCES = ["Snowflake", "PostgreSQL"]
 DATA_QUALITY_ISSUES = ["Numerical Data"]
 
@@ -71,6 +75,8 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
             {STRICT_MIN_DESCRIPTION}
         strict_max (boolean): \
             {STRICT_MAX_DESCRIPTION}
+        allow_relative_error (boolean): \
+            {ALLOW_RELATIVE_ERROR_DESCRIPTION}
 
     Other Parameters:
         result_format (str or None): \
@@ -167,6 +173,9 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
     )
     strict_min: bool = pydantic.Field(default=False, description=STRICT_MAX_DESCRIPTION)
     strict_max: bool = pydantic.Field(default=False, description=STRICT_MIN_DESCRIPTION)
+    allow_relative_error: bool = pydantic.Field(
+        default=False, description=ALLOW_RELATIVE_ERROR_DESCRIPTION
+    )
 
     library_metadata: ClassVar[Dict[str, Union[str, list, bool]]] = {
         "maturity": "production",
@@ -185,6 +194,7 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
         "strict_min",
         "max_value",
         "strict_max",
+        "allow_relative_error",
     )
 
     args_keys = (
@@ -193,6 +203,7 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
         "max_value",
         "strict_min",
         "strict_max",
+        "allow_relative_error",
     )
 
     class Config:
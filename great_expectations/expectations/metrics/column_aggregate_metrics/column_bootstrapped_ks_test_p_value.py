@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Final
+from concurrent.futures import ProcessPoolExecutor
+from typing import Final, List, Optional, Sequence
 
 from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
@@ -18,14 +19,103 @@ logger = logging.getLogger(__name__)
 import numpy as np
 from scipy import stats
 
-NP_RANDOM_GENERATOR: Final = np.random.default_rng()
+# Upper bound on number of values in single 2-D array of bootstrap samples (bounds memory use).
+MAX_BOOTSTRAP_VALUES_PER_CHUNK: Final[int] = 2**20
+
+
+def _get_bootstrap_chunk_sizes(bootstrap_samples: int, bootstrap_sample_size: int) -> List[int]:
+    samples_per_chunk: int = max(1, MAX_BOOTSTRAP_VALUES_PER_CHUNK // max(1, bootstrap_sample_size))
+    chunk_sizes: List[int] = [samples_per_chunk] * (bootstrap_samples // samples_per_chunk)
+    if bootstrap_samples % samples_per_chunk:
+        chunk_sizes.append(bootstrap_samples % samples_per_chunk)
+
+    return chunk_sizes
+
+
+def _get_bootstrapped_ks_test_p_values_chunk(  # noqa: PLR0913
+    column_values: np.ndarray,
+    bins: np.ndarray,
+    test_cdf: np.ndarray,
+    bootstrap_samples: int,
+    bootstrap_sample_size: int,
+    seed_sequence: np.random.SeedSequence,
+) -> np.ndarray:
+    """Draws "bootstrap_samples" resamples as one 2-D array and computes two-sided KS test p-values of all of them.
+
+    Each row is sorted once; KS statistic of row is largest distance between its empirical CDF (evaluated on both sides
+    of every step) and expected CDF, interpolated over partition bins (same as "scipy.stats.kstest" does per sample).
+    """  # noqa: E501
+    generator: np.random.Generator = np.random.default_rng(seed_sequence)
+    samples: np.ndarray = np.sort(
+        generator.choice(column_values, size=(bootstrap_samples, bootstrap_sample_size)),
+        axis=1,
+    )
+    cdf_values: np.ndarray = np.interp(samples, bins, test_cdf)
+
+    steps: np.ndarray = np.arange(bootstrap_sample_size + 1) / bootstrap_sample_size
+    d_plus: np.ndarray = np.max(steps[1:] - cdf_values, axis=1)
+    d_minus: np.ndarray = np.max(cdf_values - steps[:-1], axis=1)
+    statistics: np.ndarray = np.maximum(d_plus, d_minus)
+
+    return np.clip(stats.kstwo.sf(statistics, bootstrap_sample_size), 0.0, 1.0)
+
+
+def get_bootstrapped_ks_test_p_values(  # noqa: PLR0913
+    column_values: Sequence,
+    bins: Sequence[float],
+    test_cdf: Sequence[float],
+    bootstrap_samples: int,
+    bootstrap_sample_size: int,
+    random_seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> np.ndarray:
+    """Computes two-sided KS test p-values of "bootstrap_samples" resamples (with replacement) of "column_values".
+
+    Resamples are drawn and tested in chunks of at most "MAX_BOOTSTRAP_VALUES_PER_CHUNK" values; every chunk has its own
+    random generator, spawned from "random_seed", so that results only depend on "random_seed" (not on "max_workers").
+    If "max_workers" is greater than 1 and there is more than one chunk, chunks are processed by pool of processes.
+    """  # noqa: E501
+    column_values = np.asarray(column_values)
+    bins = np.asarray(bins, dtype=float)
+    test_cdf = np.asarray(test_cdf, dtype=float)
+
+    chunk_sizes: List[int] = _get_bootstrap_chunk_sizes(
+        bootstrap_samples=bootstrap_samples, bootstrap_sample_size=bootstrap_sample_size
+    )
+    seed_sequences: List[np.random.SeedSequence] = np.random.SeedSequence(random_seed).spawn(
+        len(chunk_sizes)
+    )
+    chunk_arguments: list = [
+        (column_values, bins, test_cdf, chunk_size, bootstrap_sample_size, seed_sequence)
+        for chunk_size, seed_sequence in zip(chunk_sizes, seed_sequences)
+    ]
+
+    p_values: List[np.ndarray]
+    if max_workers and max_workers > 1 and len(chunk_arguments) > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(chunk_arguments))) as executor:
+            p_values = list(
+                executor.map(_get_bootstrapped_ks_test_p_values_chunk, *zip(*chunk_arguments))
+            )
+    else:
+        p_values = [
+            _get_bootstrapped_ks_test_p_values_chunk(*arguments) for arguments in chunk_arguments
+        ]
+
+    return np.concatenate(p_values) if p_values else np.array([], dtype=float)
 
 
 class ColumnBootstrappedKSTestPValue(ColumnAggregateMetricProvider):
     """MetricProvider Class for Aggregate Standard Deviation metric"""
 
     metric_name = "column.bootstrapped_ks_test_p_value"
-    value_keys = ("partition_object", "p", "bootstrap_sample", "bootstrap_sample_size")
+    value_keys = (
+        "partition_object",
+        "p",
+        "bootstrap_samples",
+        "bootstrap_sample_size",
+        "random_seed",
+        "max_workers",
+    )
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(  # noqa: C901, PLR0913
@@ -35,6 +125,8 @@ class ColumnBootstrappedKSTestPValue(ColumnAggregateMetricProvider):
         p=0.05,
         bootstrap_samples=None,
         bootstrap_sample_size=None,
+        random_seed=None,
+        max_workers=None,
         **kwargs,
     ):
         if not is_valid_continuous_partition_object(partition_object):
@@ -49,9 +141,6 @@ class ColumnBootstrappedKSTestPValue(ColumnAggregateMetricProvider):
 
         test_cdf = np.append(np.array([0]), np.cumsum(partition_object["weights"]))
 
-        def estimated_cdf(x):
-            return np.interp(x, partition_object["bins"], test_cdf)
-
         if bootstrap_samples is None:
             bootstrap_samples = 1000
 
@@ -63,15 +152,17 @@ class ColumnBootstrappedKSTestPValue(ColumnAggregateMetricProvider):
             # for nonoverlapping ranges.
             bootstrap_sample_size = len(partition_object["weights"]) * 2
 
-        results = [
-            stats.kstest(
-                NP_RANDOM_GENERATOR.choice(column, size=bootstrap_sample_size),
-                estimated_cdf,
-            )[1]
-            for _ in range(bootstrap_samples)
-        ]
-
-        test_result = (1 + sum(x >= p for x in results)) / (bootstrap_samples + 1)
+        results = get_bootstrapped_ks_test_p_values(
+            column_values=column,
+            bins=partition_object["bins"],
+            test_cdf=test_cdf,
+            bootstrap_samples=bootstrap_samples,
+            bootstrap_sample_size=bootstrap_sample_size,
+            random_seed=random_seed,
+            max_workers=max_workers,
+        )
+
+        test_result = (1 + int(np.sum(results >= p))) / (bootstrap_samples + 1)
 
         hist, _bin_edges = np.histogram(column, partition_object["bins"])
         below_partition = len(np.where(column < partition_object["bins"][0])[0])
@@ -2,15 +2,16 @@ from __future__ import annotations
 
 import copy
 import logging
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
-from great_expectations.compatibility import pyspark
+from great_expectations.compatibility import pyspark, sqlalchemy
 from great_expectations.compatibility.pyspark import (
     functions as F,
 )
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.core import IDDict
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.util import get_sql_dialect_floating_point_infinity_value
 from great_expectations.execution_engine import (
@@ -18,6 +19,7 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
 )
@@ -27,8 +29,19 @@ from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 if TYPE_CHECKING:
     import pandas as pd
 
+    from great_expectations.execution_engine.execution_engine import (
+        MetricComputationConfiguration,
+    )
+
 logger = logging.getLogger(__name__)
 
+# PostgreSQL 9.5 introduced "width_bucket(operand, thresholds)" with (sorted) array of thresholds;
+# this also excludes Redshift (reporting version 8.0), when connected to using PostgreSQL driver.
+_MIN_POSTGRESQL_VERSION_WITH_WIDTH_BUCKET_THRESHOLDS = (9, 5)
+
+# SQL Server does not allow "CASE" expressions to be nested more than 10 levels deep.
+_MAX_CASE_NESTING_LEVELS: Dict[str, int] = {GXSqlDialect.MSSQL: 10}
+
 
 class ColumnHistogram(ColumnAggregateMetricProvider):
     metric_name = "column.histogram"
@@ -73,12 +86,15 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
             domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
         )
         column = accessor_domain_kwargs["column"]
-        bins = metric_value_kwargs["bins"]
-
-        if isinstance(bins, np.ndarray):
-            bins = bins.tolist()
-        else:
-            bins = list(bins)
+        bins = _get_bins(metric_value_kwargs=metric_value_kwargs)
+
+        if _is_computed_by_grouped_scan(bins=bins, execution_engine=execution_engine):
+            return _get_column_histogram_grouped(
+                column=sa.column(column),
+                bins=bins,
+                selectable=selectable,
+                execution_engine=execution_engine,
+            )
 
         case_conditions = []
         if len(bins) == 1 and not (
@@ -207,6 +223,54 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
         # Run the data through convert_to_json_serializable to ensure we do not have Decimal types
         return convert_to_json_serializable(list(execution_engine.execute_query(query).fetchone()))
 
+    @classmethod
+    def _sqlalchemy_bundle(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_computation_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], List[int]]:
+        """Computes histograms of all columns, sharing one compute Domain, by single statement (per compute Domain).
+
+        Histograms, which are not computed by grouped scan (or which are alone on their compute Domain), are left out.
+        """  # noqa: E501
+        selectables: Dict[Tuple[str, str, str], Any] = {}
+        histograms_by_domain_id: Dict[
+            Tuple[str, str, str], List[Tuple[Tuple[str, str, str], Any, List[float]]]
+        ] = {}
+        for metric_computation_configuration in metric_computation_configurations:
+            metric_configuration = metric_computation_configuration.metric_configuration
+            bins = _get_bins(metric_value_kwargs=metric_configuration.metric_value_kwargs)
+            if not _is_computed_by_grouped_scan(bins=bins, execution_engine=execution_engine):
+                continue
+
+            selectable, compute_domain_kwargs, accessor_domain_kwargs = (
+                execution_engine.get_compute_domain(
+                    domain_kwargs=metric_configuration.metric_domain_kwargs,
+                    domain_type=MetricDomainTypes.COLUMN,
+                )
+            )
+            domain_id = IDDict(compute_domain_kwargs).to_id()
+            selectables.setdefault(domain_id, selectable)
+            histograms_by_domain_id.setdefault(domain_id, []).append(
+                (metric_configuration.id, sa.column(accessor_domain_kwargs["column"]), bins)
+            )
+
+        resolved_metrics: Dict[Tuple[str, str, str], List[int]] = {}
+        for domain_id, histograms in histograms_by_domain_id.items():
+            if len(histograms) < 2:  # noqa: PLR2004
+                continue
+
+            hists = _get_column_histograms_grouped(
+                columns_and_bins=[(column, bins) for _, column, bins in histograms],
+                selectable=selectables[domain_id],
+                execution_engine=execution_engine,
+            )
+            resolved_metrics.update(
+                (metric_id, hist) for (metric_id, _, _), hist in zip(histograms, hists)
+            )
+
+        return resolved_metrics
+
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(  # noqa: C901, PLR0913
         cls,
@@ -279,3 +343,178 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
                 logger.warning("Discarding histogram values above highest bin.")
 
         return hist
+
+
+def _get_bins(metric_value_kwargs: dict) -> list:
+    bins = metric_value_kwargs["bins"]
+    if isinstance(bins, np.ndarray):
+        return bins.tolist()
+
+    return list(bins)
+
+
+def _is_computed_by_grouped_scan(bins: list, execution_engine: SqlAlchemyExecutionEngine) -> bool:
+    # Dialects, not known to support grouping by computed bin index, get one "sum(case(...))" per bin.  # noqa: E501
+    return len(bins) > 1 and GXSqlDialect(execution_engine.dialect_name) != GXSqlDialect.OTHER
+
+
+def _is_infinite(value: float, negative: bool) -> bool:
+    return value in (
+        get_sql_dialect_floating_point_infinity_value(schema="api_np", negative=negative),
+        get_sql_dialect_floating_point_infinity_value(schema="api_cast", negative=negative),
+    )
+
+
+def _get_bin_index_by_linear_search(column, thresholds: List[float], low: int, high: int):
+    """Builds flat "CASE" expression, equal to number of thresholds, not exceeding column value (between "low" and "high")."""  # noqa: E501
+    return sa.case(
+        *[(column < thresholds[index], sa.literal(index)) for index in range(low, high)],
+        else_=sa.literal(high),
+    )
+
+
+def _get_bin_index_by_binary_search(
+    column, thresholds: List[float], low: int, high: int, max_depth: Optional[int] = None
+):
+    """Builds nested "CASE" expression, equal to number of thresholds, not exceeding column value.
+
+    Bin index is known to be between "low" and "high"; each level of nesting halves this range, so that every value is
+    compared with (about) log2(number of bins) thresholds, rather than with all of them.  Once "max_depth" levels are
+    nested, remaining range is searched by flat "CASE" expression.
+    """  # noqa: E501
+    if low == high:
+        return sa.literal(low)
+
+    if max_depth is not None and max_depth <= 1:
+        return _get_bin_index_by_linear_search(
+            column=column, thresholds=thresholds, low=low, high=high
+        )
+
+    middle = (low + high) // 2
+    depth = None if max_depth is None else max_depth - 1
+    return sa.case(
+        (
+            column < thresholds[middle],
+            _get_bin_index_by_binary_search(
+                column=column, thresholds=thresholds, low=low, high=middle, max_depth=depth
+            ),
+        ),
+        else_=_get_bin_index_by_binary_search(
+            column=column, thresholds=thresholds, low=middle + 1, high=high, max_depth=depth
+        ),
+    )
+
+
+def _get_bin_index(column, thresholds: List[float], dialect):
+    """Builds expression, whose value is index of bin, holding column value (i.e., number of thresholds not exceeding it).
+
+    PostgreSQL (9.5+) and Trino compute it natively, by "width_bucket()" of (sorted) array of thresholds; elsewhere, it
+    is computed by binary search, expressed as nested "CASE" expression (no deeper than dialect allows).
+    """  # noqa: E501
+    if not thresholds:
+        return sa.literal(0)
+
+    dialect_name: str = dialect.name.lower()
+    server_version_info = getattr(dialect, "server_version_info", None)
+    # Literals in scientific notation are (exact) double precision values in Trino and numeric values in PostgreSQL.  # noqa: E501
+    thresholds_array = sa.literal_column(
+        f"ARRAY[{', '.join(f'{threshold:.17e}' for threshold in thresholds)}]"
+    )
+    if dialect_name == GXSqlDialect.TRINO:
+        return sa.func.width_bucket(sa.cast(column, sa.Float), thresholds_array)
+
+    if (
+        dialect_name == GXSqlDialect.POSTGRESQL
+        and server_version_info
+        and server_version_info >= _MIN_POSTGRESQL_VERSION_WITH_WIDTH_BUCKET_THRESHOLDS
+    ):
+        # PostgreSQL (before 13) does not resolve "width_bucket(double precision, numeric[])" implicitly.  # noqa: E501
+        return sa.func.width_bucket(
+            sa.cast(column, sa.Float), sa.cast(thresholds_array, sa.ARRAY(sa.Float))
+        )
+
+    return _get_bin_index_by_binary_search(
+        column=column,
+        thresholds=thresholds,
+        low=0,
+        high=len(thresholds),
+        max_depth=_MAX_CASE_NESTING_LEVELS.get(dialect_name),
+    )
+
+
+def _get_binned_values(column, bin_edges: List[float], selectable, dialect) -> sa.Select:
+    """Selects index of bin (labeled "bin_index") for every non-NULL column value, which falls into bins."""  # noqa: E501
+    conditions = [column != None]  # noqa: E711
+    if not _is_infinite(bin_edges[0], negative=True):
+        conditions.append(column >= bin_edges[0])
+
+    if not _is_infinite(bin_edges[-1], negative=False):
+        conditions.append(column <= bin_edges[-1])
+
+    # Value, which is greater than or equal to i interior bin edges, belongs to bin i.
+    bin_index = _get_bin_index(column=column, thresholds=bin_edges[1:-1], dialect=dialect).label(
+        "bin_index"
+    )
+    # Compute Domain with row condition is "SELECT" statement, which must be made subquery to select from.  # noqa: E501
+    if sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select):
+        selectable = selectable.subquery()
+
+    return sa.select(bin_index).select_from(selectable).where(sa.and_(*conditions))
+
+
+def _get_column_histogram_grouped(
+    column, bins: List[float], selectable, execution_engine: SqlAlchemyExecutionEngine
+) -> List[int]:
+    """Computes histogram by single scan, grouping values by index of their bin.
+
+    Bins are half-open ("lower edge <= value < upper edge"), except for last bin, which also holds values equal to its
+    upper edge; values outside of bins are not counted.  Unlike "sum(case(...))" per bin, size of query does not grow
+    with number of bins (apart from thresholds themselves), and each value is compared with few thresholds.
+    """  # noqa: E501
+    bin_edges: List[float] = [float(edge) for edge in bins]
+    # Grouping by (labeled) column of subquery keeps bound parameters of bin index out of "GROUP BY" clause.  # noqa: E501
+    binned = _get_binned_values(
+        column=column, bin_edges=bin_edges, selectable=selectable, dialect=execution_engine.dialect
+    ).subquery()
+    query = sa.select(binned.c.bin_index, sa.func.count()).group_by(binned.c.bin_index)
+
+    hist: List[int] = [0] * (len(bin_edges) - 1)
+    for index, count in execution_engine.execute_query(query).fetchall():
+        hist[int(index)] = int(count)
+
+    return hist
+
+
+def _get_column_histograms_grouped(
+    columns_and_bins: List[Tuple[Any, List[float]]],
+    selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+) -> List[List[int]]:
+    """Computes histograms of several columns of one compute Domain by single statement.
+
+    Bin indices of every column (as in "_get_column_histogram_grouped()") are combined by "UNION ALL", tagged with
+    position of their column, and grouped by both, so that number of round trips does not grow with number of columns.
+    """  # noqa: E501
+    binned_values: List[sa.Select] = []
+    hists: List[List[int]] = []
+    for column_index, (column, bins) in enumerate(columns_and_bins):
+        bin_edges: List[float] = [float(edge) for edge in bins]
+        binned_values.append(
+            _get_binned_values(
+                column=column,
+                bin_edges=bin_edges,
+                selectable=selectable,
+                dialect=execution_engine.dialect,
+            ).add_columns(sa.literal_column(str(column_index)).label("column_index"))
+        )
+        hists.append([0] * (len(bin_edges) - 1))
+
+    binned = sa.union_all(*binned_values).subquery()
+    query = sa.select(binned.c.column_index, binned.c.bin_index, sa.func.count()).group_by(
+        binned.c.column_index, binned.c.bin_index
+    )
+
+    for column_index, index, count in execution_engine.execute_query(query).fetchall():
+        hists[int(column_index)][int(index)] = int(count)
+
+    return hists
@@ -17,6 +17,11 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     ColumnAggregateMetricProvider,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values import (  # noqa: E501
+    COLUMN_QUANTILES_AGGREGATE_METRIC_NAME,
+    get_column_quantiles_aggregate_dependency,
+    parse_column_quantiles_aggregate_result,
+)
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
@@ -29,9 +34,16 @@ if TYPE_CHECKING:
 
 
 class ColumnMedian(ColumnAggregateMetricProvider):
-    """MetricProvider Class for Aggregate Mean MetricProvider"""
+    """MetricProvider Class for Aggregate Mean MetricProvider
+
+    For SQL dialects having percentile aggregate function (see "column_quantiles_aggregate_is_supported()"), median is
+    computed by the same (bundled) query as other aggregate metrics of column; otherwise, values are sorted by query of
+    its own.  Approximate median is only computed if "allow_relative_error" metric value kwarg is truthy.
+    """  # noqa: E501
 
     metric_name = "column.median"
+    value_keys = ("allow_relative_error",)
+    default_kwarg_values = {"allow_relative_error": False}
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
@@ -57,6 +69,13 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         column_name = accessor_domain_kwargs["column"]
         column = sa.column(column_name)
         """SqlAlchemy Median Implementation"""
+        if COLUMN_QUANTILES_AGGREGATE_METRIC_NAME in metrics:
+            return parse_column_quantiles_aggregate_result(
+                result=metrics[COLUMN_QUANTILES_AGGREGATE_METRIC_NAME],
+                quantiles=[0.5],
+                dialect_name=execution_engine.dialect_name,
+            )[0]
+
         nonnull_count = metrics.get("column_values.nonnull.count")
         if not nonnull_count:
             return None
@@ -143,7 +162,19 @@ class ColumnMedian(ColumnAggregateMetricProvider):
             runtime_configuration=runtime_configuration,
         )
 
-        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+        metric_value_kwargs = metric.metric_value_kwargs or {}
+        quantiles_aggregate: Optional[MetricConfiguration] = (
+            get_column_quantiles_aggregate_dependency(
+                metric=metric,
+                execution_engine=execution_engine,
+                quantiles=[0.5],
+                allow_relative_error=metric_value_kwargs.get("allow_relative_error", False),
+                continuous=True,
+            )
+        )
+        if quantiles_aggregate is not None:
+            dependencies[COLUMN_QUANTILES_AGGREGATE_METRIC_NAME] = quantiles_aggregate
+        elif isinstance(execution_engine, SqlAlchemyExecutionEngine):
             dependencies["column_values.nonnull.count"] = MetricConfiguration(
                 metric_name="column_values.nonnull.count",
                 metric_domain_kwargs=metric.metric_domain_kwargs,
@@ -5,7 +5,7 @@ import itertools
 import logging
 import traceback
 from collections.abc import Iterable
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
 
@@ -13,8 +13,10 @@ from great_expectations.compatibility import sqlalchemy, trino
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
@@ -23,13 +25,221 @@ from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.execution_engine.util import get_approximate_percentile_disc_sql
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
+    column_aggregate_partial,
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+if TYPE_CHECKING:
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
 
 logger = logging.getLogger(__name__)
 
+COLUMN_QUANTILES_AGGREGATE_METRIC_NAME = "column.aggregate_quantile_values"
+
+# Ordered-set aggregates ("percentile_disc() WITHIN GROUP") need PostgreSQL 9.4 or newer; this
+# also excludes Redshift (reporting version 8.0), when connected to using PostgreSQL driver.
+_MIN_POSTGRESQL_VERSION_WITH_PERCENTILE_AGGREGATES = (9, 4)
+
+# Quantiles, computed by BigQuery "APPROX_QUANTILES()", are picked from boundaries of this many equal-sized buckets.  # noqa: E501
+_BIGQUERY_APPROX_QUANTILES_BUCKETS = 1000
+
+
+def _get_column_quantiles_aggregate_function(  # noqa: C901, PLR0911
+    dialect, quantiles_count: int, allow_relative_error: Any, continuous: bool
+) -> Optional[str]:
+    dialect_name: str = dialect.name.lower()
+    if quantiles_count == 0:
+        return None
+
+    if dialect_name == GXSqlDialect.POSTGRESQL:
+        server_version_info = dialect.server_version_info
+        if (
+            server_version_info
+            and server_version_info >= _MIN_POSTGRESQL_VERSION_WITH_PERCENTILE_AGGREGATES
+        ):
+            return "percentile_cont" if continuous else "percentile_disc"
+
+        return None
+
+    if dialect_name == GXSqlDialect.SNOWFLAKE and quantiles_count == 1:
+        if allow_relative_error:
+            return "approx_percentile"
+
+        return "percentile_cont" if continuous else "percentile_disc"
+
+    if dialect_name == GXSqlDialect.CLICKHOUSE and not continuous:
+        return "quantilesExact"
+
+    if allow_relative_error:
+        if dialect_name == GXSqlDialect.TRINO:
+            return "approx_percentile"
+
+        if dialect_name == GXSqlDialect.BIGQUERY:
+            return "approx_quantiles"
+
+    return None
+
+
+def column_quantiles_aggregate_is_supported(
+    dialect,
+    quantiles: Iterable,
+    allow_relative_error: Any = False,
+    continuous: bool = False,
+) -> bool:
+    """Whether quantiles can be computed by single-pass aggregate function, bundled with other aggregate metrics.
+
+    Exact percentiles are computed by PostgreSQL 9.4+ ("percentile_disc" / "percentile_cont" of array of fractions),
+    Snowflake (single fraction only), and ClickHouse ("quantilesExact"; discrete only).  Approximate percentiles are
+    only used if "allow_relative_error" is truthy; these are computed by Trino ("approx_percentile"), BigQuery
+    ("APPROX_QUANTILES"), and Snowflake ("APPROX_PERCENTILE"; single fraction only), with accuracy defined by dialect.
+    Continuous percentiles interpolate between adjacent values (e.g., median of even number of values is average of
+    two center values); discrete percentiles are values of column.
+    """  # noqa: E501
+    return (
+        _get_column_quantiles_aggregate_function(
+            dialect=dialect,
+            quantiles_count=len(list(quantiles)),
+            allow_relative_error=allow_relative_error,
+            continuous=continuous,
+        )
+        is not None
+    )
+
+
+def get_column_quantiles_aggregate(
+    column,
+    quantiles: Iterable,
+    dialect,
+    allow_relative_error: Any = False,
+    continuous: bool = False,
+):
+    """Builds aggregate expression, which computes quantiles of column in single pass (see "column_quantiles_aggregate_is_supported()")."""  # noqa: E501
+    dialect_name: str = dialect.name.lower()
+    # Database drivers cannot handle numpy floats; rounding avoids representation errors of Snowflake "percentile_disc".  # noqa: E501
+    fractions: list[float] = [round(float(quantile), 10) for quantile in quantiles]
+    function_name: Optional[str] = _get_column_quantiles_aggregate_function(
+        dialect=dialect,
+        quantiles_count=len(fractions),
+        allow_relative_error=allow_relative_error,
+        continuous=continuous,
+    )
+    fractions_array = sa.literal_column(f"ARRAY[{', '.join(str(x) for x in fractions)}]")
+    if function_name in ("percentile_cont", "percentile_disc"):
+        percentile_function = getattr(sa.func, function_name)
+        if dialect_name == GXSqlDialect.SNOWFLAKE:
+            return percentile_function(fractions[0]).within_group(column.asc())
+
+        return percentile_function(fractions_array).within_group(column.asc())
+
+    if function_name == "approx_percentile":
+        if dialect_name == GXSqlDialect.SNOWFLAKE:
+            return sa.func.approx_percentile(column, fractions[0])
+
+        return sa.func.approx_percentile(column, fractions_array)
+
+    if function_name == "approx_quantiles":
+        return sa.func.approx_quantiles(column, _BIGQUERY_APPROX_QUANTILES_BUCKETS)
+
+    if function_name == "quantilesExact":
+        quoted_column_name: str = dialect.identifier_preparer.quote(column.name)
+        return sa.literal_column(
+            f"quantilesExact({', '.join(str(x) for x in fractions)})({quoted_column_name})"
+        )
+
+    raise ValueError(  # noqa: TRY003
+        f'Quantiles cannot be computed by aggregate function of "{dialect_name}" dialect with allow_relative_error={allow_relative_error!r}.'  # noqa: E501
+    )
+
+
+def parse_column_quantiles_aggregate_result(
+    result: Any, quantiles: Iterable, dialect_name: str
+) -> list:
+    """Converts raw value of "column.aggregate_quantile_values" metric into list of quantiles (one per fraction)."""  # noqa: E501
+    fractions: list = list(quantiles)
+    if result is None:
+        # Percentile aggregate functions yield NULL for column holding no (non-null) values.
+        return [None] * len(fractions)
+
+    if dialect_name == GXSqlDialect.BIGQUERY:
+        if len(result) == 0:
+            return [None] * len(fractions)
+
+        return [
+            result[round(fraction * _BIGQUERY_APPROX_QUANTILES_BUCKETS)] for fraction in fractions
+        ]
+
+    if not isinstance(result, (list, tuple)):
+        # Single fraction aggregate functions yield scalar.
+        return [result]
+
+    return list(result)
+
+
+def get_column_quantiles_aggregate_dependency(
+    metric: MetricConfiguration,
+    execution_engine: Optional[ExecutionEngine],
+    quantiles: Iterable,
+    allow_relative_error: Any = False,
+    continuous: bool = False,
+) -> Optional[MetricConfiguration]:
+    """Returns "column.aggregate_quantile_values" dependency for given metric, if execution engine can bundle it."""  # noqa: E501
+    if not (
+        isinstance(execution_engine, SqlAlchemyExecutionEngine)
+        and column_quantiles_aggregate_is_supported(
+            dialect=execution_engine.dialect,
+            quantiles=quantiles,
+            allow_relative_error=allow_relative_error,
+            continuous=continuous,
+        )
+    ):
+        return None
+
+    return MetricConfiguration(
+        metric_name=COLUMN_QUANTILES_AGGREGATE_METRIC_NAME,
+        metric_domain_kwargs=metric.metric_domain_kwargs,
+        metric_value_kwargs={
+            "quantiles": list(quantiles),
+            "allow_relative_error": allow_relative_error,
+            "continuous": continuous,
+        },
+    )
+
+
+class ColumnQuantileValuesAggregate(ColumnAggregateMetricProvider):
+    """Quantiles, computed by single-pass percentile aggregate function, native to SQL dialect.
+
+    Unlike "column.quantile_values", this metric is computed by the same (bundled) query as other aggregate metrics of
+    its domain, rather than by query of its own.  It is only requested (by "column.quantile_values" and
+    "column.median") for dialects and accuracy, for which "column_quantiles_aggregate_is_supported()" holds; its value
+    is result of aggregate function, as returned by database (see "parse_column_quantiles_aggregate_result()").
+    """  # noqa: E501
+
+    metric_name = COLUMN_QUANTILES_AGGREGATE_METRIC_NAME
+    value_keys = ("quantiles", "allow_relative_error", "continuous")
+
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        column,
+        quantiles,
+        _dialect,
+        allow_relative_error=False,
+        continuous=False,
+        **kwargs,
+    ):
+        return get_column_quantiles_aggregate(
+            column=column,
+            quantiles=quantiles,
+            dialect=_dialect,
+            allow_relative_error=allow_relative_error,
+            continuous=continuous,
+        )
+
 
 class ColumnQuantileValues(ColumnAggregateMetricProvider):
     metric_name = "column.quantile_values"
@@ -73,7 +283,13 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         quantiles = metric_value_kwargs["quantiles"]
         allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
         table_row_count = metrics.get("table.row_count")
-        if dialect_name == GXSqlDialect.MSSQL:
+        if COLUMN_QUANTILES_AGGREGATE_METRIC_NAME in metrics:
+            return parse_column_quantiles_aggregate_result(
+                result=metrics[COLUMN_QUANTILES_AGGREGATE_METRIC_NAME],
+                quantiles=quantiles,
+                dialect_name=dialect_name,
+            )
+        elif dialect_name == GXSqlDialect.MSSQL:
             return _get_column_quantiles_mssql(
                 column=column,
                 quantiles=quantiles,
@@ -182,6 +398,36 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
 
         return df.approxQuantile(column, list(quantiles), allow_relative_error)
 
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        metric_value_kwargs = metric.metric_value_kwargs or {}
+        quantiles_aggregate: Optional[MetricConfiguration] = (
+            get_column_quantiles_aggregate_dependency(
+                metric=metric,
+                execution_engine=execution_engine,
+                quantiles=metric_value_kwargs.get("quantiles") or [],
+                allow_relative_error=metric_value_kwargs.get("allow_relative_error", False),
+            )
+        )
+        if quantiles_aggregate is not None:
+            dependencies[COLUMN_QUANTILES_AGGREGATE_METRIC_NAME] = quantiles_aggregate
+
+        return dependencies
+
 
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, execution_engine: SqlAlchemyExecutionEngine
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING, ClassVar, Dict, Iterator, Optional, Type
+
+from great_expectations.compatibility.pyspark import functions as F
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.sketches import (
+    DistinctCountSketch,
+    FrequentValuesSketch,
+    QuantilesSketch,
+    Sketch,
+)
+from great_expectations.execution_engine import (
+    ExecutionEngine,
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+)
+from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility import pyspark, sqlalchemy
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+
+
+class ColumnSketchMetricProvider(ColumnAggregateMetricProvider):
+    """Base class for metrics, whose values are mergeable sketches (see "great_expectations.core.sketches").
+
+    Sketches are built from counts of distinct non-null values, which every execution engine aggregates natively (e.g.,
+    SQL "GROUP BY"); hence, only distinct values (rather than all rows) are fetched.  SQL and Spark counts are streamed
+    into sketch in chunks of "VALUE_COUNTS_CHUNK_SIZE" values, so that memory stays bounded however many distinct values
+    column has; Pandas sketches are built from "column.value_counts" metric of (already loaded) batch.  Sketches of
+    multiple batches are merged without reading their data again.
+    """  # noqa: E501
+
+    sketch_class: ClassVar[Type[Sketch]]
+
+    VALUE_COUNTS_CHUNK_SIZE: ClassVar[int] = 10_000
+
+    @classmethod
+    def _create_sketch(cls, metric_value_kwargs: dict) -> Sketch:
+        sketch_kwargs: dict = {
+            key: metric_value_kwargs[key]
+            for key in cls.value_keys
+            if metric_value_kwargs.get(key) is not None
+        }
+        return cls.sketch_class(**sketch_kwargs)
+
+    @classmethod
+    def _update_sketch(cls, sketch: Sketch, value_counts: Iterator[tuple]) -> Sketch:
+        """Updates sketch with (value, count) pairs, consumed "VALUE_COUNTS_CHUNK_SIZE" pairs at a time."""  # noqa: E501
+        while chunk := list(itertools.islice(value_counts, cls.VALUE_COUNTS_CHUNK_SIZE)):
+            values, counts = zip(*chunk)
+            sketch.update(values=list(values), counts=list(counts))
+
+        return sketch
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(cls, metrics, metric_value_kwargs, **kwargs):
+        sketch: Sketch = cls._create_sketch(metric_value_kwargs=metric_value_kwargs)
+        value_counts = metrics["column.value_counts"]
+        sketch.update(values=value_counts.index, counts=value_counts.to_numpy())
+        return sketch
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        **kwargs,
+    ):
+        selectable: sqlalchemy.Selectable
+        accessor_domain_kwargs: Dict[str, str]
+        selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            metric_domain_kwargs, MetricDomainTypes.COLUMN
+        )
+        column = sa.column(accessor_domain_kwargs["column"])
+        query: sqlalchemy.Select = (
+            sa.select(column.label("value"), sa.func.count(column).label("count"))
+            .where(column.isnot(None))
+            .group_by(column)
+            .select_from(selectable)
+        )
+
+        sketch: Sketch = cls._create_sketch(metric_value_kwargs=metric_value_kwargs)
+        with execution_engine.get_connection() as connection:
+            # Server-side cursor (where dialect supports it) keeps driver from buffering all rows.
+            result = connection.execution_options(stream_results=True).execute(query)
+            rows: Iterator[tuple] = iter(lambda: result.fetchmany(cls.VALUE_COUNTS_CHUNK_SIZE), [])
+            return cls._update_sketch(
+                sketch=sketch, value_counts=(tuple(row) for chunk in rows for row in chunk)
+            )
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        **kwargs,
+    ):
+        df: pyspark.DataFrame
+        accessor_domain_kwargs: Dict[str, str]
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            metric_domain_kwargs, MetricDomainTypes.COLUMN
+        )
+        column: str = accessor_domain_kwargs["column"]
+        value_counts_df: pyspark.DataFrame = (
+            df.select(column).where(F.col(column).isNotNull()).groupBy(column).count()
+        )
+
+        sketch: Sketch = cls._create_sketch(metric_value_kwargs=metric_value_kwargs)
+        # Rows are fetched partition by partition, rather than collected at once.
+        return cls._update_sketch(
+            sketch=sketch,
+            value_counts=(tuple(row) for row in value_counts_df.toLocalIterator()),
+        )
+
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        # SQL and Spark value counts are streamed into sketch by metric itself.
+        if isinstance(execution_engine, (SqlAlchemyExecutionEngine, SparkDFExecutionEngine)):
+            return dependencies
+
+        dependencies["column.value_counts"] = MetricConfiguration(
+            metric_name="column.value_counts",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs={
+                "sort": "none",
+                "collate": None,
+            },
+        )
+
+        return dependencies
+
+
+class ColumnQuantilesSketch(ColumnSketchMetricProvider):
+    """QuantilesSketch of numeric column; "k" (default 200) trades size for accuracy (see "rank_error")."""  # noqa: E501
+
+    metric_name = "column.quantiles_sketch"
+    value_keys = ("k",)
+    sketch_class = QuantilesSketch
+
+
+class ColumnDistinctCountSketch(ColumnSketchMetricProvider):
+    """HyperLogLog sketch of column; "precision" (default 12) trades size for accuracy."""
+
+    metric_name = "column.distinct_count_sketch"
+    value_keys = ("precision",)
+    sketch_class = DistinctCountSketch
+
+
+class ColumnFrequentValuesSketch(ColumnSketchMetricProvider):
+    """Misra-Gries summary of column; "capacity" (default 100) is number of tracked values."""
+
+    metric_name = "column.frequent_values_sketch"
+    value_keys = ("capacity",)
+    sketch_class = FrequentValuesSketch
@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime
 from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 from dateutil.parser import parse
 
@@ -47,7 +48,10 @@ class ColumnValuesBetween(ColumnMapMetricProvider):
             raise ValueError("min_value cannot be greater than max_value")  # noqa: TRY003
 
         # Use a vectorized approach for native numpy dtypes
-        if column.dtype in [int, float]:
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind in "iuf":
+            return cls._pandas_vectorized(temp_column, min_value, max_value, strict_min, strict_max)
+        elif cls._is_string_column_with_string_bounds(column, min_value, max_value):
+            # Strings compare element-wise without per-row Python callbacks (types already agree).
             return cls._pandas_vectorized(temp_column, min_value, max_value, strict_min, strict_max)
         elif isinstance(column.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_ns_dtype(
             column.dtype
@@ -120,6 +124,20 @@ class ColumnValuesBetween(ColumnMapMetricProvider):
 
         return temp_column.map(is_between)
 
+    @staticmethod
+    def _is_string_column_with_string_bounds(
+        column: pd.Series,
+        min_value: Optional[Union[int, float, str, datetime.datetime]],
+        max_value: Optional[Union[int, float, str, datetime.datetime]],
+    ) -> bool:
+        if column.dtype != object or len(column) == 0:
+            return False
+
+        if not all(isinstance(value, str) for value in (min_value, max_value) if value is not None):
+            return False
+
+        return pd.api.types.infer_dtype(column, skipna=False) == "string"
+
     @classmethod
     def _pandas_vectorized(  # noqa: C901, PLR0911, PLR0913
         cls,
@@ -7,6 +7,9 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    map_pandas_column_datetime_strings,
+)
 
 
 class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
@@ -27,4 +30,10 @@ class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
             except (ValueError, OverflowError):
                 return False
 
-        return column.map(is_parseable)
+        return map_pandas_column_datetime_strings(
+            column=column,
+            condition=is_parseable,
+            parse_format="ISO8601",
+            # ISO 8601 values, which do not start with "YYYY-MM" (e.g., "2020.5"), may not be parseable by dateutil.  # noqa: E501
+            verify_pattern=r"^(?!\d{4}-\d{2})",
+        )
@@ -20,6 +20,7 @@ from great_expectations.expectations.metrics.metric_provider import metric_parti
 class ColumnValuesDecreasing(ColumnMapMetricProvider):
     condition_metric_name = "column_values.decreasing"
     condition_value_keys = ("strictly",)
+    row_local = False
     default_kwarg_values = {
         "strictly": False,
     }
@@ -11,6 +11,9 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    get_pandas_column_values_instance_of_mask,
+)
 
 
 class ColumnValuesInTypeList(ColumnMapMetricProvider):
@@ -45,4 +48,4 @@ class ColumnValuesInTypeList(ColumnMapMetricProvider):
         if len(comp_types) < 1:
             raise ValueError(f"No recognized numpy/python type in list: {type_list}")  # noqa: TRY003
 
-        return column.map(lambda x: isinstance(x, tuple(comp_types)))
+        return get_pandas_column_values_instance_of_mask(column=column, types=tuple(comp_types))
@@ -12,6 +12,9 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    map_pandas_column_distinct_string_values,
+)
 
 
 class ColumnValuesJsonParseable(ColumnMapMetricProvider):
@@ -26,7 +29,7 @@ class ColumnValuesJsonParseable(ColumnMapMetricProvider):
             except Exception:
                 return False
 
-        return column.map(is_json)
+        return map_pandas_column_distinct_string_values(column=column, condition=is_json)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, **kwargs):
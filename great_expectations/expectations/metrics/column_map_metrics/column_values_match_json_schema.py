@@ -14,6 +14,9 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    map_pandas_column_distinct_string_values,
+)
 from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 
 
@@ -23,21 +26,24 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, json_schema, **kwargs):
+        # Schema is checked and its validator is built once (upon first value), rather than by "jsonschema.validate()" for every value.  # noqa: E501
+        validator = None
+
         def matches_json_schema(val):
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
+            nonlocal validator
+
+            val_json = json.loads(val)
+            if validator is None:
+                validator_class = jsonschema.validators.validator_for(json_schema)
+                # Raises "jsonschema.SchemaError" for invalid schema.
+                validator_class.check_schema(json_schema)
+                validator = validator_class(json_schema)
 
-        return column.map(matches_json_schema)
+            return validator.is_valid(val_json)
+
+        return map_pandas_column_distinct_string_values(
+            column=column, condition=matches_json_schema
+        )
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, json_schema, **kwargs):
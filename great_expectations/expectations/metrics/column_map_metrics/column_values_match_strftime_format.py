@@ -12,6 +12,10 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    map_pandas_column_datetime_strings,
+    map_pandas_column_distinct_string_values,
+)
 
 
 class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
@@ -31,7 +35,19 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
             except ValueError:
                 return False
 
-        return column.map(is_parseable_by_format)
+        # pandas matches time zone names beyond those "strptime" knows, and accepts offsets without minutes.  # noqa: E501
+        if "%z" in strftime_format or "%Z" in strftime_format:
+            return map_pandas_column_distinct_string_values(
+                column=column, condition=is_parseable_by_format
+            )
+
+        return map_pandas_column_datetime_strings(
+            column=column,
+            condition=is_parseable_by_format,
+            parse_format=strftime_format,
+            # pandas accepts up to nanoseconds for "%f", while "strptime" accepts up to microseconds.  # noqa: E501
+            verify_pattern=r"\d{7}" if "%f" in strftime_format else None,
+        )
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, strftime_format, **kwargs):
@@ -20,6 +20,7 @@ from great_expectations.util import generate_temporary_table_name
 
 class ColumnValuesUnique(ColumnMapMetricProvider):
     condition_metric_name = "column_values.unique"
+    row_local = False
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
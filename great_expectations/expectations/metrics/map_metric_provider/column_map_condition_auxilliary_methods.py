@@ -12,6 +12,8 @@ from typing import (
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.expectations.metrics.util import (
     get_dbms_compatible_metric_domain_kwargs,
+    get_pandas_unexpected_records,
+    get_unexpected_records_limit,
 )
 
 if TYPE_CHECKING:
@@ -79,16 +81,15 @@ def _pandas_column_map_condition_values(
 
     domain_values = df[column_name]
 
-    domain_values = domain_values[
-        boolean_mapped_unexpected_values == True  # noqa: E712
-    ]
-
     result_format = metric_value_kwargs["result_format"]
 
-    if result_format["result_format"] == "COMPLETE":
-        return list(domain_values)
+    domain_values = get_pandas_unexpected_records(
+        domain_records=domain_values,
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values == True,  # noqa: E712
+        limit=get_unexpected_records_limit(result_format=result_format),
+    )
 
-    return list(domain_values[: result_format["partial_unexpected_count"]])
+    return list(domain_values)
 
 
 # TODO: <Alex>11/15/2022: Please DO_NOT_DELETE this method (even though it is not currently utilized).  Thanks.</Alex>  # noqa: E501
@@ -420,5 +421,5 @@ def _spark_column_map_condition_value_counts(
     if result_format["result_format"] == "COMPLETE":
         rows = value_counts.collect()
     else:
-        rows = value_counts.collect()[: result_format["partial_unexpected_count"]]
+        rows = value_counts.limit(result_format["partial_unexpected_count"]).collect()
     return rows
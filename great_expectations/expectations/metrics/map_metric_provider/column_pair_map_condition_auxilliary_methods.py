@@ -16,6 +16,8 @@ from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_m
 )
 from great_expectations.expectations.metrics.util import (
     get_dbms_compatible_metric_domain_kwargs,
+    get_pandas_unexpected_records,
+    get_unexpected_records_limit,
 )
 from great_expectations.util import (
     get_sqlalchemy_selectable,
@@ -79,22 +81,21 @@ def _pandas_column_pair_map_condition_values(
 
     domain_values = df[column_names]
 
-    domain_values = domain_values[
-        boolean_mapped_unexpected_values == True  # noqa: E712
-    ]
-
     result_format = metric_value_kwargs["result_format"]
 
+    domain_values = get_pandas_unexpected_records(
+        domain_records=domain_values,
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values == True,  # noqa: E712
+        limit=get_unexpected_records_limit(result_format=result_format),
+    )
+
     unexpected_list = [
         value_pair
         for value_pair in zip(
             domain_values[column_A_name].values, domain_values[column_B_name].values
         )
     ]
-    if result_format["result_format"] == "COMPLETE":
-        return unexpected_list
-
-    return unexpected_list[: result_format["partial_unexpected_count"]]
+    return unexpected_list
 
 
 def _pandas_column_pair_map_condition_filtered_row_count(
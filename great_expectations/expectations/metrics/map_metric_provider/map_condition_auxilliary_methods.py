@@ -29,7 +29,9 @@ from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_m
 from great_expectations.expectations.metrics.util import (
     compute_unexpected_pandas_indices,
     get_dbms_compatible_metric_domain_kwargs,
+    get_pandas_unexpected_records,
     get_sqlalchemy_source_table_and_schema,
+    get_unexpected_records_limit,
     sql_statement_with_post_compile_to_string,
 )
 from great_expectations.util import (
@@ -121,7 +123,12 @@ def _pandas_map_condition_index(
         domain_column_name_list = column_list
 
     result_format = metric_value_kwargs["result_format"]
-    domain_records_df = domain_records_df[boolean_mapped_unexpected_values]
+    # Only records, reported for given "result_format", are materialized.
+    domain_records_df = get_pandas_unexpected_records(
+        domain_records=domain_records_df,
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+        limit=get_unexpected_records_limit(result_format=result_format),
+    )
 
     unexpected_index_list: Union[List[int], List[Dict[str, Any]]] = (
         compute_unexpected_pandas_indices(
@@ -238,12 +245,11 @@ def _pandas_map_condition_rows(
 
     result_format = metric_value_kwargs["result_format"]
 
-    df = df[boolean_mapped_unexpected_values]
-
-    if result_format["result_format"] == "COMPLETE":
-        return df
-
-    return df.iloc[: result_format["partial_unexpected_count"]]
+    return get_pandas_unexpected_records(
+        domain_records=df,
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+        limit=get_unexpected_records_limit(result_format=result_format),
+    )
 
 
 def _sqlalchemy_map_condition_unexpected_count_aggregate_fn(
@@ -3,7 +3,7 @@ from __future__ import annotations
 import inspect
 import logging
 import warnings
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.typing_extensions import override
@@ -101,6 +101,9 @@ class MapMetricProvider(MetricProvider):
     condition_value_keys: tuple[str, ...] = tuple()
     function_value_keys: tuple[str, ...] = tuple()
     filter_column_isnull = True
+    # Whether value of every row depends on that row alone (False for, e.g., uniqueness); if None, only built-in  # noqa: E501
+    # map metrics are treated as row-local (e.g., when evaluating them on chunks of streamed batches).  # noqa: E501
+    row_local: Optional[bool] = None
 
     @classmethod
     def _register_metric_functions(cls):  # noqa: C901, PLR0912, PLR0915
@@ -16,6 +16,8 @@ from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_m
 )
 from great_expectations.expectations.metrics.util import (
     get_dbms_compatible_metric_domain_kwargs,
+    get_pandas_unexpected_records,
+    get_unexpected_records_limit,
 )
 from great_expectations.util import (
     get_sqlalchemy_selectable,
@@ -71,16 +73,15 @@ def _pandas_multicolumn_map_condition_values(
 
     domain_values = df[column_list]
 
-    domain_values = domain_values[
-        boolean_mapped_unexpected_values == True  # noqa: E712
-    ]
-
     result_format = metric_value_kwargs["result_format"]
 
-    if result_format["result_format"] == "COMPLETE":
-        return domain_values.to_dict("records")
+    domain_values = get_pandas_unexpected_records(
+        domain_records=domain_values,
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values == True,  # noqa: E712
+        limit=get_unexpected_records_limit(result_format=result_format),
+    )
 
-    return domain_values[: result_format["partial_unexpected_count"]].to_dict("records")
+    return domain_values.to_dict("records")
 
 
 def _pandas_multicolumn_map_condition_filtered_row_count(
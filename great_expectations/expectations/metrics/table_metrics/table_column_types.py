@@ -10,6 +10,9 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_batch_data import (
+    PandasBatchData,  # noqa: TCH001
+)
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
@@ -37,6 +40,17 @@ class ColumnTypes(TableMetricProvider):
         df, _, _ = execution_engine.get_compute_domain(
             metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
         )
+        batch_data: Optional[PandasBatchData] = execution_engine.batch_manager.batch_data_cache.get(
+            metric_domain_kwargs.get("batch_id")
+            or execution_engine.batch_manager.active_batch_data_id
+        )
+        if batch_data is not None and batch_data.source_columns is not None:
+            # Only some columns were loaded; full schema is reported (without types of columns that were not loaded).  # noqa: E501
+            column_types: Dict[str, Any] = dict(zip(df.columns, df.dtypes))
+            return [
+                {"name": name, "type": column_types.get(name)} for name in batch_data.source_columns
+            ]
+
         return [{"name": name, "type": dtype} for (name, dtype) in zip(df.columns, df.dtypes)]
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import logging
 import re
+import warnings
 from collections import UserDict
 from typing import (
-    TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     List,
     Mapping,
@@ -16,6 +17,7 @@ from typing import (
 )
 
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 from packaging import version
 
@@ -68,9 +70,6 @@ _BIGQUERY_MODULE_NAME = "sqlalchemy_bigquery"
 from great_expectations.compatibility import bigquery as sqla_bigquery
 from great_expectations.compatibility.bigquery import bigquery_types_tuple
 
-if TYPE_CHECKING:
-    import pandas as pd
-
 try:
     import teradatasqlalchemy.dialect
     import teradatasqlalchemy.types as teradatatypes
@@ -78,6 +77,9 @@ except ImportError:
     teradatasqlalchemy = None
     teradatatypes = None
 
+# Number of mask elements, scanned at a time, when looking for first unexpected records (non-COMPLETE result formats).  # noqa: E501
+_UNEXPECTED_RECORDS_SCAN_CHUNK_SIZE = 65536
+
 
 def get_dialect_regex_expression(  # noqa: C901, PLR0911, PLR0912, PLR0915
     column, regex, dialect, positive=True
@@ -370,7 +372,6 @@ def get_sqlalchemy_column_metadata(
         columns: Sequence[Dict[str, Any]]
 
         engine = execution_engine.engine
-        inspector = execution_engine.get_inspector()
         try:
             # if a custom query was passed
             if sqlalchemy.TextClause and isinstance(table_selectable, sqlalchemy.TextClause):
@@ -386,9 +387,9 @@ def get_sqlalchemy_column_metadata(
                 table_name = str(table_selectable)
                 if execution_engine.dialect_name == GXSqlDialect.SNOWFLAKE:
                     table_name = table_name.lower()
-                columns = inspector.get_columns(
+                columns = execution_engine.get_table_columns(
                     table_name=table_name,
-                    schema=schema_name,
+                    schema_name=schema_name,
                 )
         except (
             KeyError,
@@ -1409,3 +1410,181 @@ def compute_unexpected_pandas_indices(  # noqa: C901
         unexpected_index_list = list(domain_records_df.index)
 
     return unexpected_index_list
+
+
+def get_unexpected_records_limit(result_format: Dict[str, Any]) -> Optional[int]:
+    """Returns number of unexpected records to materialize for given "result_format" (None means all of them).
+
+    Only "COMPLETE" result format reports every unexpected record; all others report at most "partial_unexpected_count".
+    """  # noqa: E501
+    if result_format["result_format"] == "COMPLETE":
+        return None
+
+    return result_format["partial_unexpected_count"]
+
+
+def get_pandas_unexpected_records(
+    domain_records: pd.DataFrame | pd.Series,
+    boolean_mapped_unexpected_values: Any,
+    limit: Optional[int] = None,
+) -> pd.DataFrame | pd.Series:
+    """Returns records flagged by "boolean_mapped_unexpected_values" mask, materializing at most "limit" of them.
+
+    The mask is scanned in chunks, so that only first "limit" unexpected records are copied, regardless of how many
+    records are unexpected.  Masks, which are not boolean or are not aligned with "domain_records", are applied using
+    regular Pandas indexing (and truncated afterwards).
+
+    Args:
+        domain_records: DataFrame or Series of records, to which mask applies.
+        boolean_mapped_unexpected_values: mask, flagging unexpected records.
+        limit: maximum number of unexpected records to return (None means all of them).
+
+    Returns:
+        unexpected records, in their original order.
+    """  # noqa: E501
+    if limit is None:
+        return domain_records[boolean_mapped_unexpected_values]
+
+    mask_index = getattr(boolean_mapped_unexpected_values, "index", None)
+    mask_values: np.ndarray = np.asarray(boolean_mapped_unexpected_values)
+    if (
+        mask_values.dtype != np.bool_
+        or mask_values.ndim != 1
+        or len(mask_values) != len(domain_records)
+        or (mask_index is not None and not mask_index.equals(domain_records.index))
+    ):
+        return domain_records[boolean_mapped_unexpected_values].iloc[:limit]
+
+    positions: List[np.ndarray] = []
+    remaining: int = limit
+    start: int
+    for start in range(0, len(mask_values), _UNEXPECTED_RECORDS_SCAN_CHUNK_SIZE):
+        if remaining <= 0:
+            break
+
+        chunk_positions: np.ndarray = (
+            np.flatnonzero(mask_values[start : start + _UNEXPECTED_RECORDS_SCAN_CHUNK_SIZE])[
+                :remaining
+            ]
+            + start
+        )
+        positions.append(chunk_positions)
+        remaining -= len(chunk_positions)
+
+    return domain_records.iloc[
+        np.concatenate(positions) if positions else np.empty(0, dtype=np.intp)
+    ]
+
+
+# Vectorized "type()" (applied to every element of "object" array in single C-level loop).
+_get_types_of_values = np.frompyfunc(type, 1, 1)
+
+
+def get_pandas_column_values_instance_of_mask(
+    column: pd.Series, types: Tuple[type, ...]
+) -> pd.Series:
+    """Flags values of "column", which are instances of any of "types"; same as "column.map(lambda x: isinstance(x, types))".
+
+    Values of columns having numeric or boolean NumPy dtype are all boxed to same Python type, so that single check
+    decides result for entire column.  For "object" columns, check is made once per distinct Python type of values.
+    Other columns (e.g., of datetime, categorical, or extension dtypes) are checked value by value.
+    """  # noqa: E501
+
+    def is_instance(value: Any) -> bool:
+        return isinstance(value, types)
+
+    if len(column) == 0:
+        return column.map(is_instance)
+
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biufc":
+        is_instance_of_types: bool = bool(column.iloc[:1].map(is_instance).iloc[0])
+        return pd.Series(
+            np.full(len(column), is_instance_of_types), index=column.index, name=column.name
+        )
+
+    if column.dtype == object:
+        value_types: np.ndarray = _get_types_of_values(column.to_numpy(dtype=object))
+        codes: np.ndarray
+        unique_types: np.ndarray
+        codes, unique_types = pd.factorize(value_types)
+        unique_type_matches: np.ndarray = np.fromiter(
+            (issubclass(value_type, types) for value_type in unique_types),
+            dtype=bool,
+            count=len(unique_types),
+        )
+        return pd.Series(unique_type_matches[codes], index=column.index, name=column.name)
+
+    return column.map(is_instance)
+
+
+def map_pandas_column_distinct_string_values(
+    column: pd.Series, condition: Callable[[str], bool]
+) -> pd.Series:
+    """Evaluates "condition" for every value of "column"; same as "column.map(condition)".
+
+    For "object" columns, holding only strings, "condition" is evaluated once per distinct value (in order of first
+    appearance, so that exceptions surface for same value as with "column.map(condition)"); all other columns are
+    evaluated value by value.  Hence, "condition" must be pure function of its argument.
+    """  # noqa: E501
+    if len(column) == 0 or column.dtype != object:
+        return column.map(condition)
+
+    codes: np.ndarray
+    unique_values: np.ndarray
+    try:
+        codes, unique_values = pd.factorize(column.to_numpy(dtype=object))
+    except TypeError:
+        # Unhashable values (e.g., lists or dictionaries) cannot be deduplicated.
+        return column.map(condition)
+
+    if (codes < 0).any() or not all(type(value) is str for value in unique_values):
+        return column.map(condition)
+
+    unique_value_results: np.ndarray = np.fromiter(
+        (condition(value) for value in unique_values), dtype=bool, count=len(unique_values)
+    )
+    return pd.Series(unique_value_results[codes], index=column.index, name=column.name)
+
+
+# Strings, which "pd.to_datetime()" converts to current date (or time) regardless of format.
+_PANDAS_SPECIAL_DATETIME_STRINGS = ("now", "today")
+
+
+def map_pandas_column_datetime_strings(
+    column: pd.Series,
+    condition: Callable[[str], bool],
+    parse_format: str,
+    verify_pattern: Optional[str] = None,
+) -> pd.Series:
+    """Evaluates "condition", which holds for every string "pd.to_datetime(..., format=parse_format)" parses, for "column".
+
+    Columns of strings are parsed by "pd.to_datetime()" in one vectorized pass; "condition" is evaluated only for values,
+    which fail to parse there, and for values, which match regular expression "verify_pattern" (i.e., which pandas may
+    parse more leniently than "condition" does).  Those remaining values (as well as columns holding other types) are
+    evaluated by "map_pandas_column_distinct_string_values()" (hence, once per distinct value).
+    """  # noqa: E501
+    if len(column) == 0 or pd.api.types.infer_dtype(column, skipna=False) != "string":
+        return map_pandas_column_distinct_string_values(column=column, condition=condition)
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            parsed: pd.Series = pd.to_datetime(
+                column, format=parse_format, errors="coerce", utc=True
+            )
+    except (ValueError, TypeError, OverflowError):
+        # Format is not supported by pandas.
+        return map_pandas_column_distinct_string_values(column=column, condition=condition)
+
+    is_parsed: np.ndarray = parsed.notna().to_numpy(dtype=bool)
+    is_parsed &= ~column.isin(_PANDAS_SPECIAL_DATETIME_STRINGS).to_numpy(dtype=bool)
+    if verify_pattern is not None:
+        is_parsed &= ~column.str.contains(verify_pattern, regex=True).to_numpy(dtype=bool)
+
+    results: np.ndarray = is_parsed.copy()
+    if not is_parsed.all():
+        results[~is_parsed] = map_pandas_column_distinct_string_values(
+            column=column[~is_parsed], condition=condition
+        ).to_numpy(dtype=bool)
+
+    return pd.Series(results, index=column.index, name=column.name)
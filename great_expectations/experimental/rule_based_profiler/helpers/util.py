@@ -19,6 +19,7 @@ from typing import (
     List,
     Optional,
     Protocol,
+    Sequence,
     Tuple,
     Union,
 )
@@ -96,6 +97,9 @@ RECOGNIZED_QUANTILE_STATISTIC_INTERPOLATION_METHODS: set = {
 
 NP_RANDOM_GENERATOR: Final = np.random.default_rng()
 
+# Upper bound on number of values in single chunk of bootstrap resamples (bounds memory use).
+MAX_BOOTSTRAP_VALUES_PER_CHUNK: Final[int] = 2**22
+
 
 def get_validator(  # noqa: PLR0913
     purpose: str,
@@ -742,10 +746,8 @@ def compute_bootstrap_quantiles_point_estimate(  # noqa: PLR0913
     Efron, B., & Tibshirani, R. J. (1993). Estimates of bias. An Introduction to the Bootstrap (pp. 124-130).
         Springer Science and Business Media Dordrecht. DOI 10.1007/978-1-4899-4541-9
 
-    This implementation is sub-par compared to the one available from the "SciPy" standard library
-    ("https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.bootstrap.html"), in that it does not handle
-    multi-dimensional statistics. "scipy.stats.bootstrap" is vectorized, thus having the ability to accept a
-    multi-dimensional statistic function and process all dimensions.
+    Both quantiles are estimated from the same resamples in one vectorized pass, and resamples are drawn in
+    memory-bounded chunks (see "compute_bootstrap_quantiles_bias_corrected_point_estimates").
 
     Unfortunately, as of March 4th, 2022, the SciPy implementation has two issues: 1) it only returns a confidence
     interval and not a point estimate for the population parameter of interest, which is what we require for our use
@@ -787,45 +789,19 @@ def compute_bootstrap_quantiles_point_estimate(  # noqa: PLR0913
     lower_quantile_pct: float = false_positive_rate / 2.0
     upper_quantile_pct: float = 1.0 - false_positive_rate / 2.0
 
-    sample_lower_quantile: np.ndarray = numpy.numpy_quantile(
-        a=metric_values,
-        q=lower_quantile_pct,
-        method=quantile_statistic_interpolation_method,
-    )
-    sample_upper_quantile: np.ndarray = numpy.numpy_quantile(
-        a=metric_values,
-        q=upper_quantile_pct,
-        method=quantile_statistic_interpolation_method,
-    )
-
-    bootstraps: np.ndarray
-    if random_seed:
-        random_state: np.random.Generator = np.random.Generator(np.random.PCG64(random_seed))
-        bootstraps = random_state.choice(metric_values, size=(n_resamples, metric_values.size))
-    else:
-        bootstraps = NP_RANDOM_GENERATOR.choice(
-            metric_values, size=(n_resamples, metric_values.size)
-        )
-
-    lower_quantile_bias_corrected_point_estimate: Union[np.float64, datetime.datetime] = (
-        _determine_quantile_bias_corrected_point_estimate(
-            bootstraps=bootstraps,
-            quantile_pct=lower_quantile_pct,
-            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
-            quantile_bias_correction=quantile_bias_correction,
-            quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
-            sample_quantile=sample_lower_quantile,
-        )
-    )
-    upper_quantile_bias_corrected_point_estimate: Union[np.float64, datetime.datetime] = (
-        _determine_quantile_bias_corrected_point_estimate(
-            bootstraps=bootstraps,
-            quantile_pct=upper_quantile_pct,
-            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
-            quantile_bias_correction=quantile_bias_correction,
-            quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
-            sample_quantile=sample_upper_quantile,
-        )
+    lower_quantile_bias_corrected_point_estimate: Union[np.float64, datetime.datetime]
+    upper_quantile_bias_corrected_point_estimate: Union[np.float64, datetime.datetime]
+    (
+        lower_quantile_bias_corrected_point_estimate,
+        upper_quantile_bias_corrected_point_estimate,
+    ) = compute_bootstrap_quantiles_bias_corrected_point_estimates(
+        metric_values=metric_values,
+        quantile_pcts=[lower_quantile_pct, upper_quantile_pct],
+        n_resamples=n_resamples,
+        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        quantile_bias_correction=quantile_bias_correction,
+        quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
+        random_seed=random_seed,
     )
 
     return build_numeric_range_estimation_result(
@@ -884,43 +860,101 @@ def build_numeric_range_estimation_result(
     )
 
 
-def _determine_quantile_bias_corrected_point_estimate(  # noqa: PLR0913
-    bootstraps: np.ndarray,
-    quantile_pct: float,
+def compute_bootstrap_quantiles_bias_corrected_point_estimates(  # noqa: PLR0913
+    metric_values: np.ndarray,
+    quantile_pcts: Sequence[float],
+    n_resamples: int,
     quantile_statistic_interpolation_method: str,
     quantile_bias_correction: bool,
     quantile_bias_std_error_ratio_threshold: float,
-    sample_quantile: np.ndarray,
-) -> np.float64:
-    bootstrap_quantiles: Union[np.ndarray, np.float64] = numpy.numpy_quantile(
-        bootstraps,
-        q=quantile_pct,
-        axis=1,
+    random_seed: Optional[int] = None,
+    max_values_per_chunk: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Computes bootstrapped (and bias corrected, as needed) point estimates of "quantile_pcts" quantiles of "metric_values".
+
+    All quantiles are computed in one "axis=1" pass over each chunk of resamples (resamples are drawn once for all
+    quantiles).  Chunks hold at most "max_values_per_chunk" (default: "MAX_BOOTSTRAP_VALUES_PER_CHUNK") values, which
+    bounds memory use for large "n_resamples"; chunks are drawn from the same random generator in succession, so that
+    results do not depend on chunk size.
+
+    Args:
+        metric_values: "numpy.ndarray" of values with elements corresponding to "Batch" data samples.
+        quantile_pcts: quantiles (between 0 and 1) to estimate.
+        n_resamples: number of bootstrap resamples.
+        quantile_statistic_interpolation_method: quantile interpolation method (see "numpy.quantile").
+        quantile_bias_correction: if True, bias correction is always applied.
+        quantile_bias_std_error_ratio_threshold: otherwise, bias correction is applied to quantiles, whose ratio of bias
+            to standard error exceeds this threshold.
+        random_seed: optional random seed (for reproducibility).
+        max_values_per_chunk: optional upper bound on number of values in single chunk of resamples.
+
+    Returns:
+        "numpy.ndarray" of point estimates, in order of "quantile_pcts".
+    """  # noqa: E501
+    quantile_pcts_array: np.ndarray = np.asarray(quantile_pcts, dtype=float)
+
+    sample_quantiles: np.ndarray = numpy.numpy_quantile(
+        a=metric_values,
+        q=quantile_pcts_array,
         method=quantile_statistic_interpolation_method,
     )
-    bootstrap_quantile_point_estimate: np.ndarray = np.mean(bootstrap_quantiles)
-    bootstrap_quantile_standard_error: np.ndarray = np.std(bootstrap_quantiles)
-    bootstrap_quantile_bias: float = bootstrap_quantile_point_estimate - sample_quantile
+
+    random_generator: np.random.Generator
+    if random_seed:
+        random_generator = np.random.Generator(np.random.PCG64(random_seed))
+    else:
+        random_generator = NP_RANDOM_GENERATOR
+
+    if max_values_per_chunk is None:
+        max_values_per_chunk = MAX_BOOTSTRAP_VALUES_PER_CHUNK
+
+    resamples_per_chunk: int = max(1, max_values_per_chunk // max(1, metric_values.size))
+
+    # Only resamples are held in chunks; bootstrapped quantiles (one row per quantile) are small.
+    bootstrap_quantiles_chunks: List[np.ndarray] = []
+    bootstraps: np.ndarray
+    chunk_start: int
+    for chunk_start in range(0, n_resamples, resamples_per_chunk):
+        bootstraps = random_generator.choice(
+            metric_values,
+            size=(min(resamples_per_chunk, n_resamples - chunk_start), metric_values.size),
+        )
+        bootstrap_quantiles_chunks.append(
+            numpy.numpy_quantile(
+                bootstraps,
+                q=quantile_pcts_array,
+                axis=1,
+                method=quantile_statistic_interpolation_method,
+            )
+        )
+
+    bootstrap_quantiles: np.ndarray = np.concatenate(bootstrap_quantiles_chunks, axis=1)
+
+    bootstrap_quantile_point_estimates: np.ndarray = np.mean(bootstrap_quantiles, axis=1)
+    bootstrap_quantile_standard_errors: np.ndarray = np.std(bootstrap_quantiles, axis=1)
+    bootstrap_quantile_biases: np.ndarray = bootstrap_quantile_point_estimates - sample_quantiles
 
     # Bias / Standard Error > 0.25 is a rule of thumb for when to apply bias correction.
     # See:
     # Efron, B., & Tibshirani, R. J. (1993). Estimates of bias. An Introduction to the Bootstrap (pp. 128).  # noqa: E501
     #         Springer Science and Business Media Dordrecht. DOI 10.1007/978-1-4899-4541-9
-    quantile_bias_corrected_point_estimate: np.float64
-
-    if (
-        not quantile_bias_correction
-        and bootstrap_quantile_standard_error > 0.0
-        and bootstrap_quantile_bias / bootstrap_quantile_standard_error
-        <= quantile_bias_std_error_ratio_threshold
-    ):
-        quantile_bias_corrected_point_estimate = bootstrap_quantile_point_estimate
-    else:
-        quantile_bias_corrected_point_estimate = (
-            bootstrap_quantile_point_estimate - bootstrap_quantile_bias
-        )
+    bias_std_error_ratios: np.ndarray = np.divide(
+        bootstrap_quantile_biases,
+        bootstrap_quantile_standard_errors,
+        out=np.full(bootstrap_quantile_biases.shape, np.inf),
+        where=bootstrap_quantile_standard_errors > 0.0,
+    )
+    skip_bias_correction: np.ndarray = np.logical_and(
+        not quantile_bias_correction,
+        bias_std_error_ratios <= quantile_bias_std_error_ratio_threshold,
+    )
 
-    return quantile_bias_corrected_point_estimate
+    return np.where(
+        skip_bias_correction,
+        bootstrap_quantile_point_estimates,
+        bootstrap_quantile_point_estimates - bootstrap_quantile_biases,
+    )
 
 
 def convert_metric_values_to_float_dtype_best_effort(
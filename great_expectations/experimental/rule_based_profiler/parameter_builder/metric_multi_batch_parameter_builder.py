@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import numpy as np
 
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.domain import Domain  # noqa: TCH001
 from great_expectations.experimental.rule_based_profiler.config import (
     ParameterBuilderConfig,  # noqa: TCH001
@@ -20,9 +21,13 @@ from great_expectations.experimental.rule_based_profiler.parameter_container imp
     FULLY_QUALIFIED_PARAMETER_NAME_ATTRIBUTED_VALUE_KEY,
     FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY,
     FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY,
+    PARAMETER_PREFIX,
     ParameterContainer,
 )
 from great_expectations.types.attributes import Attributes
+from great_expectations.validator.metric_configuration import (
+    MetricConfiguration,  # noqa: TCH001
+)
 
 if TYPE_CHECKING:
     from great_expectations.data_context.data_context.abstract_data_context import (
@@ -129,6 +134,55 @@ class MetricMultiBatchParameterBuilder(ParameterBuilder):
     def reduce_scalar_metric(self) -> Union[str, bool]:
         return self._reduce_scalar_metric
 
+    @override
+    def get_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Returns "MetricConfiguration" objects for "metric_name", unless its arguments reference outputs of other
+        "ParameterBuilder" objects (these are only available once parameters of "domain" are being built).
+        """  # noqa: E501
+        if not self.metric_name or _references_parameters(
+            value=[
+                self.metric_domain_kwargs,
+                self.metric_value_kwargs,
+                self.single_batch_mode,
+            ]
+        ):
+            return []
+
+        single_batch_mode: bool = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.single_batch_mode,
+            expected_return_type=bool,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        batch_ids: Optional[List[str]] = self.get_batch_ids(
+            limit=1 if single_batch_mode else None,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        if not batch_ids:
+            return []
+
+        metric_configurations: List[MetricConfiguration]
+        _, _, metric_configurations = self._build_metric_configurations(
+            metric_name=self.metric_name,
+            batch_ids=batch_ids,
+            metric_domain_kwargs=self.metric_domain_kwargs,
+            metric_value_kwargs=self.metric_value_kwargs,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        return metric_configurations
+
     def _build_parameters(
         self,
         domain: Domain,
@@ -226,3 +280,17 @@ class MetricMultiBatchParameterBuilder(ParameterBuilder):
                 FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY: details,
             }
         )
+
+
+def _references_parameters(value: Any) -> bool:
+    """Returns True if "value" (possibly nested) references outputs of "ParameterBuilder" objects ("$parameter...")."""  # noqa: E501
+    if isinstance(value, str):
+        return value.startswith(PARAMETER_PREFIX)
+
+    if isinstance(value, dict):
+        return any(_references_parameters(value=element) for element in value.values())
+
+    if isinstance(value, (list, set, tuple)):
+        return any(_references_parameters(value=element) for element in value)
+
+    return False
@@ -94,6 +94,7 @@ class ParameterBuilder(ABC, Builder):
 
     exclude_field_names: ClassVar[Set[str]] = Builder.exclude_field_names | {
         "suite_parameter_builders",
+        "resolved_metrics",
     }
 
     def __init__(
@@ -125,6 +126,8 @@ class ParameterBuilder(ABC, Builder):
             data_context=self._data_context,
         )
 
+        self._resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
     def build_parameters(  # noqa: PLR0913
         self,
         domain: Domain,
@@ -282,6 +285,18 @@ class ParameterBuilder(ABC, Builder):
     ) -> Optional[List[ParameterBuilderConfig]]:
         return self._suite_parameter_builder_configs
 
+    @property
+    def resolved_metrics(self) -> Dict[Tuple[str, str, str], MetricValue]:
+        """
+        Metrics resolved ahead of time (e.g., by "Rule" for all "Domain" objects together), keyed by metric ID, which
+        "get_metrics()" uses instead of resolving them again.
+        """  # noqa: E501
+        return self._resolved_metrics
+
+    @resolved_metrics.setter
+    def resolved_metrics(self, value: Dict[Tuple[str, str, str], MetricValue]) -> None:
+        self._resolved_metrics = value
+
     @property
     def raw_fully_qualified_parameter_name(self) -> str:
         """
@@ -378,108 +393,63 @@ specified (empty "metric_name" value detected)."""  # noqa: E501
                 message=f"Utilizing a {self.__class__.__name__} requires a non-empty list of Batch identifiers."  # noqa: E501
             )
 
-        """
-        Compute metrics, corresponding to multiple "MetricConfiguration" directives, together, rather than individually.
-
-        As a strategy, since "metric_domain_kwargs" changes depending on "batch_id", "metric_value_kwargs" serves as
-        identifying entity (through "AttributedResolvedMetrics") for accessing resolved metrics (computation results).
-
-        All "MetricConfiguration" directives are generated by combining each metric_value_kwargs" with
-        "metric_domain_kwargs" for all "batch_ids" (where every "metric_domain_kwargs" represents separate "batch_id").
-        Then, all "MetricConfiguration" objects, collected into list as container, are resolved simultaneously.
-        """  # noqa: E501
-
-        # Step-1: Gather "metric_domain_kwargs" (corresponding to "batch_ids").
-
-        domain_kwargs: dict = build_metric_domain_kwargs(
-            batch_id=None,
+        domain_kwargs: dict
+        metrics_to_resolve: List[MetricConfiguration]
+        (
+            domain_kwargs,
+            metric_value_kwargs,
+            metrics_to_resolve,
+        ) = self._build_metric_configurations(
+            metric_name=metric_name,
+            batch_ids=batch_ids,
             metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
             domain=domain,
             variables=variables,
             parameters=parameters,
         )
 
-        batch_id: str
-
-        metric_domain_kwargs = [
-            copy.deepcopy(
-                build_metric_domain_kwargs(
-                    batch_id=batch_id,
-                    metric_domain_kwargs=copy.deepcopy(domain_kwargs),
-                    domain=domain,
-                    variables=variables,
-                    parameters=parameters,
-                )
-            )
-            for batch_id in batch_ids
-        ]
-
-        # Step-2: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).  # noqa: E501
+        # Step-4: Resolve all metrics in one operation simultaneously.
 
-        if not isinstance(metric_value_kwargs, list):
-            metric_value_kwargs = [metric_value_kwargs]
+        # Metrics of all "Domain" objects may have been resolved together beforehand (by "Rule").
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {
+            metric_configuration.id: self.resolved_metrics[metric_configuration.id]
+            for metric_configuration in metrics_to_resolve
+            if metric_configuration.id in self.resolved_metrics
+        }
 
-        value_kwargs_cursor: dict
-        metric_value_kwargs = [
-            # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.  # noqa: E501
-            get_parameter_value_and_validate_return_type(
+        metrics_to_compute: List[MetricConfiguration] = [
+            metric_configuration
+            for metric_configuration in metrics_to_resolve
+            if metric_configuration.id not in resolved_metrics
+        ]
+        if metrics_to_compute:
+            # The Validator object used for metric calculation purposes.
+            validator: Validator = self.get_validator(
                 domain=domain,
-                parameter_reference=value_kwargs_cursor,
-                expected_return_type=None,
                 variables=variables,
                 parameters=parameters,
             )
-            for value_kwargs_cursor in metric_value_kwargs
-        ]
-
-        # Step-3: Generate "MetricConfiguration" directives for all "metric_domain_kwargs"/"metric_value_kwargs" pairs.  # noqa: E501
-
-        domain_kwargs_cursor: dict
-        kwargs_combinations: List[List[dict]] = [
-            [domain_kwargs_cursor, value_kwargs_cursor]
-            for value_kwargs_cursor in metric_value_kwargs
-            for domain_kwargs_cursor in metric_domain_kwargs
-        ]
 
-        metrics_to_resolve: List[MetricConfiguration]
-
-        kwargs_pair_cursor: List[dict, dict]
-        metrics_to_resolve = [
-            MetricConfiguration(
-                metric_name=metric_name,
-                metric_domain_kwargs=kwargs_pair_cursor[0],
-                metric_value_kwargs=kwargs_pair_cursor[1],
+            graph: ValidationGraph = validator.metrics_calculator.build_metric_dependency_graph(
+                metric_configurations=metrics_to_compute,
+                runtime_configuration=runtime_configuration,
             )
-            for kwargs_pair_cursor in kwargs_combinations
-        ]
-
-        # Step-4: Resolve all metrics in one operation simultaneously.
-
-        # The Validator object used for metric calculation purposes.
-        validator: Validator = self.get_validator(
-            domain=domain,
-            variables=variables,
-            parameters=parameters,
-        )
-
-        graph: ValidationGraph = validator.metrics_calculator.build_metric_dependency_graph(
-            metric_configurations=metrics_to_resolve,
-            runtime_configuration=runtime_configuration,
-        )
 
-        resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
-        aborted_metrics_info: Dict[
-            Tuple[str, str, str],
-            Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
-        ]
-        (
-            resolved_metrics,
-            _aborted_metrics_info,
-        ) = validator.metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
-            graph=graph,
-            runtime_configuration=runtime_configuration,
-            min_graph_edges_pbar_enable=0,
-        )
+            computed_metrics: Dict[Tuple[str, str, str], MetricValue]
+            aborted_metrics_info: Dict[
+                Tuple[str, str, str],
+                Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+            ]
+            (
+                computed_metrics,
+                _aborted_metrics_info,
+            ) = validator.metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(  # noqa: E501
+                graph=graph,
+                runtime_configuration=runtime_configuration,
+                min_graph_edges_pbar_enable=0,
+            )
+            resolved_metrics.update(computed_metrics)
 
         # Step-5: Map resolved metrics to their attributes for identification and recovery by receiver.  # noqa: E501
 
@@ -568,6 +538,107 @@ specified (empty "metric_name" value detected)."""  # noqa: E501
             details=details,
         )
 
+    def get_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Returns "MetricConfiguration" objects, which this "ParameterBuilder" resolves for "domain" (if they are known
+        before any "ParameterBuilder" outputs are computed); "Rule" resolves these for all "Domain" objects together.
+
+        Default implementation returns empty list (i.e., metrics are only resolved when parameters are built).
+        """  # noqa: E501
+        return []
+
+    def _build_metric_configurations(  # noqa: PLR0913
+        self,
+        metric_name: str,
+        batch_ids: List[str],
+        metric_domain_kwargs: Optional[Union[Union[str, dict], List[Union[str, dict]]]] = None,
+        metric_value_kwargs: Optional[Union[Union[str, dict], List[Union[str, dict]]]] = None,
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Tuple[dict, List[dict], List[MetricConfiguration]]:
+        """
+        Builds "MetricConfiguration" directives, so that corresponding metrics are computed together, rather than individually.
+
+        As a strategy, since "metric_domain_kwargs" changes depending on "batch_id", "metric_value_kwargs" serves as
+        identifying entity (through "AttributedResolvedMetrics") for accessing resolved metrics (computation results).
+
+        All "MetricConfiguration" directives are generated by combining each metric_value_kwargs" with
+        "metric_domain_kwargs" for all "batch_ids" (where every "metric_domain_kwargs" represents separate "batch_id").
+        Then, all "MetricConfiguration" objects, collected into list as container, are resolved simultaneously.
+        """  # noqa: E501
+
+        # Step-1: Gather "metric_domain_kwargs" (corresponding to "batch_ids").
+
+        domain_kwargs: dict = build_metric_domain_kwargs(
+            batch_id=None,
+            metric_domain_kwargs=metric_domain_kwargs,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        batch_id: str
+
+        metric_domain_kwargs = [
+            copy.deepcopy(
+                build_metric_domain_kwargs(
+                    batch_id=batch_id,
+                    metric_domain_kwargs=copy.deepcopy(domain_kwargs),
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                )
+            )
+            for batch_id in batch_ids
+        ]
+
+        # Step-2: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).  # noqa: E501
+
+        if not isinstance(metric_value_kwargs, list):
+            metric_value_kwargs = [metric_value_kwargs]
+
+        value_kwargs_cursor: dict
+        metric_value_kwargs = [
+            # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.  # noqa: E501
+            get_parameter_value_and_validate_return_type(
+                domain=domain,
+                parameter_reference=value_kwargs_cursor,
+                expected_return_type=None,
+                variables=variables,
+                parameters=parameters,
+            )
+            for value_kwargs_cursor in metric_value_kwargs
+        ]
+
+        # Step-3: Generate "MetricConfiguration" directives for all "metric_domain_kwargs"/"metric_value_kwargs" pairs.  # noqa: E501
+
+        domain_kwargs_cursor: dict
+        kwargs_combinations: List[List[dict]] = [
+            [domain_kwargs_cursor, value_kwargs_cursor]
+            for value_kwargs_cursor in metric_value_kwargs
+            for domain_kwargs_cursor in metric_domain_kwargs
+        ]
+
+        metrics_to_resolve: List[MetricConfiguration]
+
+        kwargs_pair_cursor: List[dict, dict]
+        metrics_to_resolve = [
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=kwargs_pair_cursor[0],
+                metric_value_kwargs=kwargs_pair_cursor[1],
+            )
+            for kwargs_pair_cursor in kwargs_combinations
+        ]
+
+        return domain_kwargs, metric_value_kwargs, metrics_to_resolve
+
     @staticmethod
     def _sanitize_metric_computation(  # noqa: PLR0913
         parameter_builder: ParameterBuilder,
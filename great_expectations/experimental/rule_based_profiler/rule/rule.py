@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import copy
 import json
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.util import (
@@ -45,6 +46,11 @@ if TYPE_CHECKING:
     from great_expectations.experimental.rule_based_profiler.parameter_builder import (
         ParameterBuilder,
     )
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+    from great_expectations.validator.validator import Validator
+
+logger = logging.getLogger(__name__)
 
 
 class Rule(SerializableDictDot):
@@ -141,47 +147,65 @@ class Rule(SerializableDictDot):
 
         rule_state.reset_parameter_containers()
 
-        pbar_method: Callable = determine_progress_bar_method_by_environment()
-
-        domain: Domain
-        for domain in pbar_method(
-            domains,
-            desc="Profiling Dataset:",
-            position=1,
-            leave=False,
-            bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
-        ):
-            rule_state.initialize_parameter_container_for_domain(domain=domain)
-
-            parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
-            parameter_builder: ParameterBuilder
-            for parameter_builder in parameter_builders:
-                parameter_builder.build_parameters(
-                    domain=domain,
+        # resolve_metrics_across_domains: If "True" (default), metrics, which "ParameterBuilder" objects need for all  # noqa: E501
+        # "Domain" objects, are first resolved together (so that they can be bundled into fewer queries per "Batch").  # noqa: E501
+        parameter_builders_with_resolved_metrics: List[ParameterBuilder] = []
+        try:
+            if (runtime_configuration or {}).get("resolve_metrics_across_domains", True):
+                parameter_builders_with_resolved_metrics = self._resolve_metrics_across_domains(
+                    domains=domains,
                     variables=variables,
                     parameters=rule_state.parameters,
-                    parameter_computation_impl=None,
                     batch_list=batch_list,
                     batch_request=batch_request,
                     runtime_configuration=runtime_configuration,
                 )
 
-            expectation_configuration_builders: List[ExpectationConfigurationBuilder] = (
-                self.expectation_configuration_builders or []
-            )
-
-            expectation_configuration_builder: ExpectationConfigurationBuilder
-
-            for expectation_configuration_builder in expectation_configuration_builders:
-                expectation_configuration_builder.resolve_validation_dependencies(
-                    domain=domain,
-                    variables=variables,
-                    parameters=rule_state.parameters,
-                    batch_list=batch_list,
-                    batch_request=batch_request,
-                    runtime_configuration=runtime_configuration,
+            pbar_method: Callable = determine_progress_bar_method_by_environment()
+
+            domain: Domain
+            for domain in pbar_method(
+                domains,
+                desc="Profiling Dataset:",
+                position=1,
+                leave=False,
+                bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
+            ):
+                rule_state.initialize_parameter_container_for_domain(domain=domain)
+
+                parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
+                parameter_builder: ParameterBuilder
+                for parameter_builder in parameter_builders:
+                    parameter_builder.build_parameters(
+                        domain=domain,
+                        variables=variables,
+                        parameters=rule_state.parameters,
+                        parameter_computation_impl=None,
+                        batch_list=batch_list,
+                        batch_request=batch_request,
+                        runtime_configuration=runtime_configuration,
+                    )
+
+                expectation_configuration_builders: List[ExpectationConfigurationBuilder] = (
+                    self.expectation_configuration_builders or []
                 )
 
+                expectation_configuration_builder: ExpectationConfigurationBuilder
+
+                for expectation_configuration_builder in expectation_configuration_builders:
+                    expectation_configuration_builder.resolve_validation_dependencies(
+                        domain=domain,
+                        variables=variables,
+                        parameters=rule_state.parameters,
+                        batch_list=batch_list,
+                        batch_request=batch_request,
+                        runtime_configuration=runtime_configuration,
+                    )
+        finally:
+            # Resolved metrics are only valid for this run (even if it fails part way through).
+            for parameter_builder in parameter_builders_with_resolved_metrics:
+                parameter_builder.resolved_metrics = {}
+
         return rule_state
 
     @property
@@ -317,6 +341,110 @@ class Rule(SerializableDictDot):
             for expectation_configuration_builder in expectation_configuration_builders
         }
 
+    def _resolve_metrics_across_domains(  # noqa: PLR0913
+        self,
+        domains: List[Domain],
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> List[ParameterBuilder]:
+        """
+        Collects "MetricConfiguration" objects, which all "ParameterBuilder" objects (including their evaluation
+        dependencies) need for all "domains", and resolves them in one "ValidationGraph" per set of "Batch" objects.
+
+        Resolved metrics are handed to "ParameterBuilder" objects ("resolved_metrics" property), which use them, when
+        parameters are subsequently built "Domain" by "Domain" (hence, outputs are unaffected).  Metrics, which cannot
+        be determined upfront, or which fail to resolve here, are computed as part of that step.
+
+        Returns:
+            "ParameterBuilder" objects, to which resolved metrics were handed.
+        """  # noqa: E501
+        parameter_builders_by_batch_key: Dict[str, List[ParameterBuilder]] = {}
+        metric_configurations_by_batch_key: Dict[
+            str, Dict[Tuple[str, str, str], MetricConfiguration]
+        ] = {}
+
+        batch_key: str
+        parameter_builder: ParameterBuilder
+        domain: Domain
+        metric_configuration: MetricConfiguration
+        for parameter_builder in self._get_parameter_builders_with_evaluation_dependencies(
+            batch_list=batch_list,
+            batch_request=batch_request,
+        ):
+            batch_key = _get_batch_key(builder=parameter_builder)
+            parameter_builders_by_batch_key.setdefault(batch_key, []).append(parameter_builder)
+            try:
+                for domain in domains:
+                    for metric_configuration in parameter_builder.get_metric_configurations(
+                        domain=domain,
+                        variables=variables,
+                        parameters=parameters,
+                    ):
+                        metric_configurations_by_batch_key.setdefault(batch_key, {})[
+                            metric_configuration.id
+                        ] = metric_configuration
+            except Exception as e:
+                logger.info(
+                    f"""Metrics of {parameter_builder.__class__.__name__} "{parameter_builder.name}" will be \
+resolved one Domain at a time ({e!s})."""  # noqa: E501
+                )
+
+        parameter_builders_with_resolved_metrics: List[ParameterBuilder] = []
+
+        metric_configurations: Dict[Tuple[str, str, str], MetricConfiguration]
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
+        for batch_key, metric_configurations in metric_configurations_by_batch_key.items():
+            # All "ParameterBuilder" objects, sharing "batch_key", share "ExecutionEngine" as well.
+            parameter_builder = parameter_builders_by_batch_key[batch_key][0]
+            try:
+                validator: Validator = parameter_builder.get_validator(
+                    variables=variables,
+                    parameters=parameters,
+                )
+                resolved_metrics, _ = validator.metrics_calculator.compute_metrics(
+                    metric_configurations=list(metric_configurations.values()),
+                    runtime_configuration=runtime_configuration,
+                    min_graph_edges_pbar_enable=0,
+                )
+            except Exception as e:
+                logger.info(f"Metrics will be resolved one Domain at a time ({e!s}).")
+                continue
+
+            for parameter_builder in parameter_builders_by_batch_key[batch_key]:
+                parameter_builder.resolved_metrics = resolved_metrics
+                parameter_builders_with_resolved_metrics.append(parameter_builder)
+
+        return parameter_builders_with_resolved_metrics
+
+    def _get_parameter_builders_with_evaluation_dependencies(
+        self,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+    ) -> Iterator[ParameterBuilder]:
+        """
+        Yields "ParameterBuilder" objects of this "Rule" and of its "ExpectationConfigurationBuilder" objects, each
+        followed by its evaluation dependencies (recursively), with "Batch" data set the same way as "Rule.run()" does.
+        """  # noqa: E501
+        expectation_configuration_builder: ExpectationConfigurationBuilder
+        parameter_builders: List[ParameterBuilder] = list(self.parameter_builders or [])
+        for expectation_configuration_builder in self.expectation_configuration_builders or []:
+            parameter_builders.extend(
+                expectation_configuration_builder.validation_parameter_builders or []
+            )
+
+        parameter_builder: ParameterBuilder
+        for parameter_builder in parameter_builders:
+            parameter_builder.set_batch_list_if_null_batch_request(
+                batch_list=batch_list,
+                batch_request=batch_request,
+            )
+            yield from _iterate_parameter_builder_with_evaluation_dependencies(
+                parameter_builder=parameter_builder
+            )
+
     # noinspection PyUnusedLocal
     @measure_execution_time(
         execution_time_holder_object_reference_name="rule_state",
@@ -343,3 +471,27 @@ class Rule(SerializableDictDot):
             )
         )
         return domains
+
+
+def _iterate_parameter_builder_with_evaluation_dependencies(
+    parameter_builder: ParameterBuilder,
+) -> Iterator[ParameterBuilder]:
+    yield parameter_builder
+
+    suite_parameter_builder: ParameterBuilder
+    for suite_parameter_builder in parameter_builder.suite_parameter_builders or []:
+        suite_parameter_builder.set_batch_list_if_null_batch_request(
+            batch_list=parameter_builder.batch_list,
+            batch_request=parameter_builder.batch_request,
+        )
+        yield from _iterate_parameter_builder_with_evaluation_dependencies(
+            parameter_builder=suite_parameter_builder
+        )
+
+
+def _get_batch_key(builder: ParameterBuilder) -> str:
+    """Identifies "Batch" objects, on which "builder" operates (builders sharing them share "ExecutionEngine")."""  # noqa: E501
+    if builder.batch_list is not None:
+        return json.dumps([batch.id for batch in builder.batch_list])
+
+    return json.dumps(convert_to_json_serializable(data=builder.batch_request), sort_keys=True)
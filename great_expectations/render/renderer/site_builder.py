@@ -17,6 +17,12 @@ from great_expectations.data_context.store.html_site_store import (
     SiteSectionIdentifier,
 )
 from great_expectations.data_context.store.json_site_store import JsonSiteStore
+from great_expectations.data_context.store.validation_results_index_manifest import (
+    ValidationResultsIndexManifest,
+)
+from great_expectations.data_context.store.validation_results_store import (
+    ValidationResultsStore,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     GXCloudIdentifier,
@@ -846,17 +852,19 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     validation_result_key, profiling_run_name_filter
                 )
             ]
+            source_store = self._get_validation_results_source_store(section_name="profiling")
+            index_manifest_entries = self._get_index_manifest_entries(source_store=source_store)
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.name,
-                        run_id=profiling_result_key.run_id,
-                        validation_results_store_name=self.source_stores.get("profiling"),
+                    index_entry = self._get_validation_result_index_entry(
+                        validation_result_key=profiling_result_key,
+                        section_name="profiling",
+                        source_store=source_store,
+                        index_manifest_entries=index_manifest_entries,
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    batch_kwargs = index_entry.get("batch_kwargs") or {}
+                    batch_spec = index_entry.get("batch_spec") or {}
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -901,18 +909,20 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 validation_result_site_keys = validation_result_site_keys[
                     : self.validation_results_limit
                 ]
+            source_store = self._get_validation_results_source_store(section_name="validations")
+            index_manifest_entries = self._get_index_manifest_entries(source_store=source_store)
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
-                        run_id=validation_result_key.run_id,
-                        validation_results_store_name=self.source_stores.get("validations"),
+                    index_entry = self._get_validation_result_index_entry(
+                        validation_result_key=validation_result_key,
+                        section_name="validations",
+                        source_store=source_store,
+                        index_manifest_entries=index_manifest_entries,
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    validation_success = index_entry.get("success")
+                    batch_kwargs = index_entry.get("batch_kwargs") or {}
+                    batch_spec = index_entry.get("batch_spec") or {}
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -932,6 +942,61 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     error_msg = f"Validation result not found: {validation_result_key.to_tuple()!s:s} - skipping"  # noqa: E501
                     logger.warning(error_msg)
 
+    def _get_validation_results_source_store(
+        self, section_name: str
+    ) -> Optional[ValidationResultsStore]:
+        store_name: Optional[str] = (
+            self.source_stores.get(section_name) or self.data_context.validation_results_store_name
+        )
+        store = self.data_context.stores.get(store_name)
+        if isinstance(store, ValidationResultsStore) and not store.cloud_mode:
+            return store
+
+        return None
+
+    @staticmethod
+    def _get_index_manifest_entries(
+        source_store: Optional[ValidationResultsStore],
+    ) -> dict:
+        if source_store is None:
+            return {}
+
+        try:
+            return source_store.index_manifest.entries()
+        except OSError as e:
+            logger.warning(f"Unable to read Validation Results index manifest: {e}")
+            return {}
+
+    def _get_validation_result_index_entry(
+        self,
+        validation_result_key: ValidationResultIdentifier,
+        section_name: str,
+        source_store: Optional[ValidationResultsStore],
+        index_manifest_entries: dict,
+    ) -> dict:
+        """Returns "success", "batch_kwargs", and "batch_spec" of Validation Result, rendered on index page.
+
+        These fields are read from index manifest of source store; Validation Result itself is only loaded if it is
+        missing from manifest, in which case it is recorded there, so that subsequent index builds do not load it again.
+        """  # noqa: E501
+        index_entry: Optional[dict] = index_manifest_entries.get(validation_result_key.to_tuple())
+        if index_entry is not None:
+            return index_entry
+
+        validation = self.data_context.get_validation_result(
+            batch_identifier=validation_result_key.batch_identifier,
+            expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
+            run_id=validation_result_key.run_id,
+            validation_results_store_name=self.source_stores.get(section_name),
+        )
+        index_entry = ValidationResultsIndexManifest.build_entry(validation_result=validation)
+        if source_store is not None:
+            source_store.add_to_index_manifest(
+                key=validation_result_key, validation_result=validation
+            )
+
+        return index_entry
+
 
 class CallToActionButton:
     def __init__(self, title, link) -> None:
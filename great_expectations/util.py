@@ -1183,7 +1183,7 @@ def convert_to_json_serializable(
 
 
 @public_api  # - complexity 32
-def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
+def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912, PLR0915
     data: JSONConvertable,
 ) -> JSONValues:
     """Converts an object to one that is JSON-serializable.
@@ -1241,6 +1241,11 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
         return new_list
 
     if isinstance(data, (np.ndarray, pd.Index)):
+        # Arrays of numeric, boolean, and (most) datetime dtypes are converted in bulk.
+        converted_array: Optional[list] = _convert_array_to_json_serializable(data=data)
+        if converted_array is not None:
+            return converted_array
+
         # test_obj[key] = test_obj[key].tolist()
         # If we have an array or index, convert it first to a list--causing coercion to float--and then round  # noqa: E501
         # to the number of digits for which the string representation will equal the float representation  # noqa: E501
@@ -1309,13 +1314,22 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
         value_name = data.name or "value"
         return [
             {
-                index_name: convert_to_json_serializable(idx),  # type: ignore[call-overload]
-                value_name: convert_to_json_serializable(val),  # type: ignore[dict-item]
+                index_name: idx,
+                value_name: val,
             }
-            for idx, val in data.items()
+            for idx, val in zip(
+                _convert_pandas_values_to_json_serializable(values=data.index),
+                _convert_pandas_values_to_json_serializable(values=data),
+            )
         ]
 
     if isinstance(data, pd.DataFrame):
+        converted_records: Optional[List[dict]] = _convert_dataframe_to_json_serializable_records(
+            df=data
+        )
+        if converted_records is not None:
+            return converted_records
+
         return convert_to_json_serializable(data.to_dict(orient="records"))
 
     if pyspark.DataFrame and isinstance(data, pyspark.DataFrame):  # type: ignore[truthy-function]
@@ -1360,6 +1374,109 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
     raise TypeError(f"{data!s} is of type {type(data).__name__} which cannot be serialized.")  # noqa: TRY003
 
 
+# Range of "datetime64" values, which "np.ndarray.tolist()" converts to "datetime.date" or "datetime.datetime" objects.  # noqa: E501
+_MIN_PYTHON_DATETIME64 = np.datetime64("0001-01-01T00:00:00", "us")
+_MAX_PYTHON_DATETIME64 = np.datetime64("9999-12-31T23:59:59.999999", "us")
+
+
+def _convert_array_to_json_serializable(
+    data: Union[npt.NDArray, pd.Index],
+) -> Optional[list]:
+    """Converts array of numeric, boolean, or "datetime64" dtype in bulk (None is returned for other arrays).
+
+    Results are identical to converting every element of "data.tolist()" by "convert_to_json_serializable()": NaN
+    values become None, and "datetime64" values become strings, which "isoformat()" would have produced.
+    """  # noqa: E501
+    if not isinstance(data.dtype, np.dtype) or data.ndim == 0:
+        return None
+
+    if isinstance(data, pd.Index):
+        data = data.to_numpy()
+
+    kind: str = data.dtype.kind
+    if kind in "biu":
+        return data.tolist()
+
+    if kind == "f" and data.dtype.itemsize <= 8:  # noqa: PLR2004
+        # Extended-precision floats are not converted to Python "float" by "tolist()".
+        is_nan: npt.NDArray[np.bool_] = np.isnan(data)
+        if not is_nan.any():
+            return data.tolist()
+
+        values: npt.NDArray = data.astype(object)
+        values[is_nan] = None
+        return values.tolist()
+
+    if kind == "M":
+        return _convert_datetime64_array_to_json_serializable(data=data)
+
+    return None
+
+
+def _convert_datetime64_array_to_json_serializable(data: npt.NDArray) -> Optional[list]:
+    unit: str = np.datetime_data(data.dtype)[0]
+    is_nat: npt.NDArray[np.bool_] = np.isnat(data)
+    valid_values: npt.NDArray = data[~is_nat]
+    if valid_values.size and (
+        valid_values.min() < _MIN_PYTHON_DATETIME64 or valid_values.max() > _MAX_PYTHON_DATETIME64
+    ):
+        # Values outside of range of "datetime" are converted to integers by "tolist()".
+        return None
+
+    strings: npt.NDArray
+    if unit in ("Y", "M", "W", "D"):
+        # Formatted as by "datetime.date.isoformat()".
+        strings = np.datetime_as_string(data, unit="D")
+    elif unit in ("h", "m", "s"):
+        # Formatted as by "datetime.datetime.isoformat()".
+        strings = np.datetime_as_string(data, unit="s")
+    elif unit in ("ms", "us"):
+        # "datetime.datetime.isoformat()" includes microseconds only when they are not zero.
+        has_fraction: npt.NDArray[np.bool_] = data != data.astype("datetime64[s]")
+        strings = np.where(
+            has_fraction,
+            np.datetime_as_string(data, unit="us"),
+            np.datetime_as_string(data, unit="s"),
+        )
+    else:
+        # Finer units are converted to integers by "tolist()".
+        return None
+
+    values: npt.NDArray = strings.astype(object)
+    values[is_nat] = None
+    return values.tolist()
+
+
+def _convert_pandas_values_to_json_serializable(values: Union[pd.Index, pd.Series]) -> list:
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biuf":
+        # Iterating over numeric Pandas objects yields Python scalars, just as "tolist()" of their arrays does.  # noqa: E501
+        converted_values: Optional[list] = _convert_array_to_json_serializable(
+            data=values.to_numpy()
+        )
+        if converted_values is not None:
+            return converted_values
+
+    return [convert_to_json_serializable(value) for value in values]
+
+
+def _convert_dataframe_to_json_serializable_records(df: pd.DataFrame) -> Optional[List[dict]]:
+    if (
+        len(df.columns) == 0
+        or not df.columns.is_unique
+        or not all(
+            isinstance(dtype, np.dtype) and dtype.kind in "biuf" for dtype in df.dtypes.tolist()
+        )
+    ):
+        return None
+
+    columns: List[str] = [str(column) for column in df.columns]
+    column_values: List[list] = [
+        _convert_pandas_values_to_json_serializable(values=df.iloc[:, idx])
+        for idx in range(len(columns))
+    ]
+    return [dict(zip(columns, row)) for row in zip(*column_values)]
+
+
 def ensure_json_serializable(data: Any) -> None:  # noqa: C901, PLR0911, PLR0912
     """
     Helper function to convert an object to one that is json serializable
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import ast
+import logging
+import re
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
@@ -20,6 +23,20 @@ if TYPE_CHECKING:
         ExpectationConfiguration,
     )
 
+logger = logging.getLogger(__name__)
+
+# Table expectations, which only use table metadata or row count (rather than values of any column).
+_COLUMN_AGNOSTIC_TABLE_EXPECTATION_TYPES = {
+    "expect_column_to_exist",
+    "expect_table_column_count_to_be_between",
+    "expect_table_column_count_to_equal",
+    "expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set",
+    "expect_table_row_count_to_be_between",
+    "expect_table_row_count_to_equal",
+    "expect_table_row_count_to_equal_other_table",
+}
+
 
 class Validator:
     """Validator.
@@ -32,10 +49,21 @@ class Validator:
         batch_definition: BatchDefinition,
         result_format: ResultFormat | dict = ResultFormat.SUMMARY,
         batch_parameters: Optional[BatchParameters] = None,
+        project_columns: bool = False,
     ) -> None:
+        """
+        Args:
+            batch_definition: BatchDefinition of data to validate.
+            result_format: ResultFormat (or dict) applied to all validated expectations.
+            batch_parameters: BatchParameters used to obtain the batch.
+            project_columns: If True, then only columns referenced by validated expectations (including their row
+                conditions and "unexpected_index_column_names") are loaded, where the Data Asset supports it.
+        """  # noqa: E501
         self._batch_definition = batch_definition
         self._batch_parameters = batch_parameters
         self.result_format = result_format
+        self._project_columns = project_columns
+        self._loaded_columns: Optional[List[str]] = None
 
         from great_expectations import project_manager
 
@@ -93,14 +121,31 @@ class Validator:
         batch_request = self._batch_definition.build_batch_request(
             batch_parameters=self._batch_parameters
         )
+        if self._loaded_columns is not None:
+            batch_request.columns = self._loaded_columns
+
         return self._get_validator(batch_request=batch_request)
 
+    def _project_columns_for(self, expectation_configs: list[ExpectationConfiguration]) -> None:
+        """Determine columns to load for "expectation_configs" (reloading batch if they change)."""
+        columns: Optional[List[str]] = _get_columns_referenced_by_expectation_configurations(
+            expectation_configs=expectation_configs, result_format=self.result_format
+        )
+        if columns == self._loaded_columns:
+            return
+
+        self._loaded_columns = columns
+        self.__dict__.pop("_wrapped_validator", None)
+
     def _validate_expectation_configs(
         self,
         expectation_configs: list[ExpectationConfiguration],
         suite_parameters: Optional[dict[str, Any]] = None,
     ) -> list[ExpectationValidationResult]:
         """Run a list of expectation configurations against the batch definition"""
+        if self._project_columns:
+            self._project_columns_for(expectation_configs)
+
         processed_expectation_configs = self._wrapped_validator.process_expectations_for_validation(
             expectation_configs, suite_parameters
         )
@@ -121,3 +166,80 @@ class Validator:
                 result.render()
 
         return results
+
+
+def _get_columns_referenced_by_expectation_configurations(
+    expectation_configs: list[ExpectationConfiguration],
+    result_format: ResultFormat | dict,
+) -> Optional[List[str]]:
+    """Names of all columns, whose values validating "expectation_configs" reads.
+
+    Returns None, if these cannot be determined (e.g., for table expectations, which may read any column, or for row
+    conditions that cannot be parsed); in this case, all columns must be loaded.
+    """  # noqa: E501
+    # Dictionary keys are used as insertion-ordered set of column names.
+    columns: Dict[str, None] = dict.fromkeys(_get_unexpected_index_column_names(result_format))
+    for expectation_config in expectation_configs:
+        domain_kwargs: dict = expectation_config.get_domain_kwargs()
+        domain_columns: List[str] = [
+            domain_kwargs[key]
+            for key in ("column", "column_A", "column_B")
+            if domain_kwargs.get(key) is not None
+        ] + list(domain_kwargs.get("column_list") or [])
+        if not domain_columns and (
+            expectation_config.type not in _COLUMN_AGNOSTIC_TABLE_EXPECTATION_TYPES
+        ):
+            return None
+
+        row_condition: Optional[str] = expectation_config.kwargs.get("row_condition")
+        if row_condition:
+            condition_columns: Optional[List[str]] = _get_row_condition_columns(
+                row_condition=row_condition,
+                condition_parser=expectation_config.kwargs.get("condition_parser"),
+            )
+            if condition_columns is None:
+                return None
+
+            domain_columns.extend(condition_columns)
+
+        domain_columns.extend(
+            _get_unexpected_index_column_names(expectation_config.kwargs.get("result_format"))
+        )
+        columns.update(dict.fromkeys(domain_columns))
+
+    return list(columns) or None
+
+
+def _get_unexpected_index_column_names(result_format: Any) -> List[str]:
+    if isinstance(result_format, dict):
+        return list(result_format.get("unexpected_index_column_names") or [])
+
+    return []
+
+
+def _get_row_condition_columns(
+    row_condition: str, condition_parser: Optional[str]
+) -> Optional[List[str]]:
+    """Names of columns referenced by "row_condition" (None, if these cannot be determined).
+
+    Names, which are not columns (e.g., functions in "pandas" queries), may be included; projections ignore them.
+    """  # noqa: E501
+    if condition_parser == "great_expectations__experimental__":
+        return re.findall(r'col\("([^"]+)"\)', row_condition) or None
+
+    if condition_parser in ("pandas", "python"):
+        # Backtick-quoted names (possibly not identifiers) are collected; "@name" locals dropped.
+        quoted_names: List[str] = re.findall(r"`([^`]+)`", row_condition)
+        expression: str = re.sub(r"`[^`]+`", "_", row_condition)
+        expression = re.sub(r"@\w+", "_", expression)
+        try:
+            tree: ast.AST = ast.parse(expression.strip(), mode="eval")
+        except SyntaxError:
+            logger.debug(f'Unable to determine columns of row condition "{row_condition}".')
+            return None
+
+        return quoted_names + [
+            node.id for node in ast.walk(tree) if isinstance(node, ast.Name) and node.id != "_"
+        ]
+
+    return None
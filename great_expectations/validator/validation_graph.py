@@ -6,6 +6,7 @@ from typing import (
     TYPE_CHECKING,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -87,7 +88,18 @@ class ValidationGraph:
         else:
             self._edges = []
 
-        self._edge_ids = {edge.id for edge in self._edges}
+        # Dependency index (adjacency lists keyed by metric id), maintained as edges are added.
+        self._metric_configurations: Dict[_MetricKey, MetricConfiguration] = {}
+        self._metric_dependencies: Dict[_MetricKey, Set[_MetricKey]] = {}
+        self._metric_dependents: Dict[_MetricKey, Set[_MetricKey]] = {}
+
+        self._edge_ids = set()
+        edge: MetricEdge
+        for edge in self._edges:
+            edge_id = edge.id
+            if edge_id not in self._edge_ids:
+                self._edge_ids.add(edge_id)
+                self._index_edge(edge=edge, edge_id=edge_id)
 
     @override
     def __eq__(self, other) -> bool:
@@ -106,9 +118,24 @@ class ValidationGraph:
 
     def add(self, edge: MetricEdge) -> None:
         """Adds supplied "MetricEdge" object to this "ValidationGraph" object (if not already present)."""  # noqa: E501
-        if edge.id not in self._edge_ids:
+        edge_id = edge.id
+        if edge_id not in self._edge_ids:
             self._edges.append(edge)
-            self._edge_ids.add(edge.id)
+            self._edge_ids.add(edge_id)
+            self._index_edge(edge=edge, edge_id=edge_id)
+
+    def _index_edge(
+        self, edge: MetricEdge, edge_id: Tuple[_MetricKey, Optional[_MetricKey]]
+    ) -> None:
+        """Records "MetricEdge" in adjacency lists, keyed by metric id, used for incremental graph resolution."""  # noqa: E501
+        left_id, right_id = edge_id
+        if left_id not in self._metric_configurations:
+            self._metric_configurations[left_id] = edge.left
+            self._metric_dependencies[left_id] = set()
+
+        if right_id is not None:
+            self._metric_dependencies[left_id].add(right_id)
+            self._metric_dependents.setdefault(right_id, set()).add(left_id)
 
     def build_metric_dependency_graph(
         self,
@@ -154,16 +181,18 @@ class ValidationGraph:
                         f"Metric {metric_configuration.id!s} has created a circular dependency"
                     )
                     continue
+                # Dependency sub-graph is built first, so that default kwargs of "metric_dependency"
+                # are set (and its id is final) by the time the edge is indexed.
+                self.build_metric_dependency_graph(
+                    metric_configuration=metric_dependency,
+                    runtime_configuration=runtime_configuration,
+                )
                 self.add(
                     MetricEdge(
                         left=metric_configuration,
                         right=metric_dependency,
                     )
                 )
-                self.build_metric_dependency_graph(
-                    metric_configuration=metric_dependency,
-                    runtime_configuration=runtime_configuration,
-                )
 
     def set_metric_configuration_default_kwargs_if_absent(
         self, metric_configuration: MetricConfiguration
@@ -209,6 +238,25 @@ class ValidationGraph:
             show_progress_bars=show_progress_bars,
         )
 
+        # Values of metrics, which no other metric of this graph consumes, are returned to caller; hence, ExecutionEngine  # noqa: E501
+        # must not defer them to consuming metrics.
+        materialize_deferred_metrics = getattr(
+            self._execution_engine, "materialize_deferred_metrics", None
+        )
+        if materialize_deferred_metrics is not None:
+            resolved_metrics.update(
+                materialize_deferred_metrics(
+                    metrics_to_materialize=[
+                        metric_configuration
+                        for metric_id, metric_configuration in self._metric_configurations.items()
+                        if metric_id in resolved_metrics
+                        and not self._metric_dependents.get(metric_id)
+                    ],
+                    metrics=resolved_metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
         return resolved_metrics, aborted_metrics_info
 
     def _resolve(  # noqa: C901, PLR0912, PLR0915
@@ -239,9 +287,12 @@ class ValidationGraph:
 
         progress_bar: Optional[tqdm] = None
 
+        scheduler = _MetricResolutionScheduler(graph=self, metrics=metrics)
+
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
+            ready_metrics = scheduler.ready_metrics
+            needed_metrics = scheduler.needed_metrics
 
             # Check to see if the user has disabled progress bars
             disable = not show_progress_bars
@@ -272,13 +323,16 @@ class ValidationGraph:
 
             try:
                 # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.  # noqa: E501
-                metrics.update(
-                    self._execution_engine.resolve_metrics(
-                        metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        runtime_configuration=runtime_configuration,
-                    )
+                new_metrics: Dict[_MetricKey, MetricValue] = self._execution_engine.resolve_metrics(
+                    metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+                    metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+                    runtime_configuration=runtime_configuration,
                 )
+                newly_resolved_metric_ids: List[_MetricKey] = [
+                    metric_id for metric_id in new_metrics if metric_id not in metrics
+                ]
+                metrics.update(new_metrics)
+                scheduler.mark_resolved(metric_ids=newly_resolved_metric_ids, metrics=metrics)
                 progress_bar.update(len(computable_metrics))
                 progress_bar.refresh()
             except gx_exceptions.MetricResolutionError as err:
@@ -327,23 +381,8 @@ class ValidationGraph:
     ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
         validation graph (a graph structure of metric ids) edges"""  # noqa: E501
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in self.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:  # noqa: PLR5501
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+        scheduler = _MetricResolutionScheduler(graph=self, metrics=metrics)
+        return scheduler.ready_metrics, scheduler.needed_metrics
 
     @staticmethod
     def _set_default_metric_kwargs_if_absent(
@@ -365,6 +404,88 @@ class ValidationGraph:
         return ", ".join([edge.__repr__() for edge in self._edges])
 
 
+class _MetricResolutionScheduler:
+    """Tracks unresolved metrics of "ValidationGraph" using per-metric counters of pending dependencies.
+
+    Counters are initialized once from dependency index of "ValidationGraph"; afterwards, each resolved metric only
+    decrements counters of its dependents, so that next set of ready metrics is obtained in O(changed edges).
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        graph: ValidationGraph,
+        metrics: Dict[_MetricKey, MetricValue],
+    ) -> None:
+        self._metric_configurations = graph._metric_configurations
+        self._metric_dependents = graph._metric_dependents
+
+        self._pending_dependency_counts: Dict[_MetricKey, int] = {}
+        self._ready: Dict[_MetricKey, MetricConfiguration] = {}
+        self._needed: Dict[_MetricKey, MetricConfiguration] = {}
+
+        metric_id: _MetricKey
+        metric_configuration: MetricConfiguration
+        for metric_id, metric_configuration in self._metric_configurations.items():
+            if metric_id in metrics:
+                continue
+
+            pending_dependency_count: int = sum(
+                1
+                for dependency_id in graph._metric_dependencies[metric_id]
+                if dependency_id not in metrics
+            )
+            self._pending_dependency_counts[metric_id] = pending_dependency_count
+            if pending_dependency_count == 0:
+                self._ready[metric_id] = metric_configuration
+            else:
+                self._needed[metric_id] = metric_configuration
+
+    @property
+    def ready_metrics(self) -> Set[MetricConfiguration]:
+        """Returns unresolved metrics, all of whose dependencies have been resolved."""
+        return set(self._ready.values())
+
+    @property
+    def needed_metrics(self) -> Set[MetricConfiguration]:
+        """Returns unresolved metrics, which have at least one unresolved dependency."""
+        return set(self._needed.values())
+
+    def mark_resolved(
+        self,
+        metric_ids: Iterable[_MetricKey],
+        metrics: Dict[_MetricKey, MetricValue],
+    ) -> None:
+        """Removes newly resolved metrics and promotes dependents, whose dependencies are all resolved, to "ready"."""  # noqa: E501
+        resolved_metric_ids: Set[_MetricKey] = set(metric_ids)
+
+        # Domain kwargs can be normalized in place while metric is being resolved (e.g., column names are quoted to  # noqa: E501
+        # match "Batch" columns), which changes its "id"; hence, "ready" metrics are also looked up by current "id".  # noqa: E501
+        metric_id: _MetricKey
+        metric_configuration: MetricConfiguration
+        resolved_metric_ids.update(
+            metric_id
+            for metric_id, metric_configuration in self._ready.items()
+            if metric_id not in resolved_metric_ids and metric_configuration.id in metrics
+        )
+
+        dependent_id: _MetricKey
+        for metric_id in resolved_metric_ids:
+            self._ready.pop(metric_id, None)
+            self._needed.pop(metric_id, None)
+            self._pending_dependency_counts.pop(metric_id, None)
+
+            for dependent_id in self._metric_dependents.get(metric_id, ()):
+                if dependent_id not in self._pending_dependency_counts:
+                    continue
+
+                self._pending_dependency_counts[dependent_id] -= 1
+                if (
+                    self._pending_dependency_counts[dependent_id] == 0
+                    and dependent_id in self._needed
+                ):
+                    self._ready[dependent_id] = self._needed.pop(dependent_id)
+
+
 class ExpectationValidationGraph:
     def __init__(
         self,
@@ -3,12 +3,13 @@ from __future__ import annotations
 import json
 import pathlib
 import uuid
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, List
 from unittest import mock
 
 import pytest
 
 import great_expectations as gx
+import great_expectations.exceptions as gx_exceptions
 from great_expectations import expectations as gxe
 from great_expectations import set_context
 from great_expectations.checkpoint.actions import (
@@ -23,6 +24,7 @@ from great_expectations.checkpoint.checkpoint import (
     Checkpoint,
     CheckpointAction,
     CheckpointResult,
+    _close_execution_engines,
 )
 from great_expectations.compatibility.pydantic import ValidationError
 from great_expectations.core.batch_definition import BatchDefinition
@@ -566,6 +568,163 @@ class TestCheckpointResult:
             run_id=mock.ANY,
         )
 
+    @pytest.mark.unit
+    def test_checkpoint_run_with_max_workers_preserves_order_of_validation_definitions(
+        self, mocker: MockerFixture
+    ):
+        suite_names = [f"{self.suite_name}_{i}" for i in range(4)]
+        validation_definitions = []
+        for suite_name in suite_names:
+            suite = mocker.Mock(spec=ExpectationSuite)
+            suite.name = suite_name
+            validation_definitions.append(
+                ValidationDefinition(
+                    name=f"{self.validation_definition_name}_{suite_name}",
+                    data=mocker.Mock(spec=BatchDefinition),
+                    suite=suite,
+                    id=str(uuid.uuid4()),
+                )
+            )
+
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name,
+            validation_definitions=validation_definitions,
+            id=str(uuid.uuid4()),
+        )
+
+        def run(self: ValidationDefinition, **kwargs) -> ExpectationSuiteValidationResult:
+            return ExpectationSuiteValidationResult(
+                success=True,
+                results=[],
+                suite_name=self.suite.name,
+                meta={"validation_id": self.id},
+            )
+
+        with mock.patch.object(ValidationDefinition, "run", autospec=True, side_effect=run):
+            result = checkpoint.run(max_workers=3)
+
+        assert [key.expectation_suite_identifier.name for key in result.run_results] == suite_names
+        assert [
+            validation_result.suite_name for validation_result in result.run_results.values()
+        ] == suite_names
+
+    @pytest.mark.unit
+    def test_checkpoint_run_with_max_workers_raises_error_of_first_failed_validation_definition(
+        self, mocker: MockerFixture
+    ):
+        validation_definitions = [
+            ValidationDefinition(
+                name=f"{self.validation_definition_name}_{i}",
+                data=mocker.Mock(spec=BatchDefinition),
+                suite=mocker.Mock(spec=ExpectationSuite),
+                id=str(uuid.uuid4()),
+            )
+            for i in range(3)
+        ]
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name,
+            validation_definitions=validation_definitions,
+            id=str(uuid.uuid4()),
+        )
+
+        def run(self: ValidationDefinition, **kwargs) -> ExpectationSuiteValidationResult:
+            raise ValueError(self.name)
+
+        with mock.patch.object(
+            ValidationDefinition, "run", autospec=True, side_effect=run
+        ), pytest.raises(ValueError, match=f"^{validation_definitions[0].name}$"):
+            checkpoint.run(max_workers=3)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("fails", [False, True])
+    def test_checkpoint_run_with_max_workers_closes_execution_engines_of_datasource_copies(
+        self, mocker: MockerFixture, fails: bool
+    ):
+        validation_definitions = []
+        for i in range(4):
+            suite = mocker.Mock(spec=ExpectationSuite)
+            suite.name = f"{self.suite_name}_{i}"
+            validation_definitions.append(
+                ValidationDefinition(
+                    name=f"{self.validation_definition_name}_{i}",
+                    data=mocker.Mock(spec=BatchDefinition),
+                    suite=suite,
+                    id=str(uuid.uuid4()),
+                )
+            )
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name,
+            validation_definitions=validation_definitions,
+            id=str(uuid.uuid4()),
+        )
+
+        created_execution_engines: List[Any] = []
+
+        def isolate_validation_definition(
+            validation_definition: ValidationDefinition, datasource_copies: dict
+        ) -> ValidationDefinition:
+            if not datasource_copies:
+                datasource_copies[0] = mocker.Mock(_execution_engine=mocker.Mock())
+                created_execution_engines.append(datasource_copies[0]._execution_engine)
+            return validation_definition
+
+        def run(self: ValidationDefinition, **kwargs) -> ExpectationSuiteValidationResult:
+            if fails:
+                raise ValueError(self.name)
+            return ExpectationSuiteValidationResult(
+                success=True,
+                results=[],
+                suite_name=self.suite.name,
+                meta={"validation_id": self.id},
+            )
+
+        with mock.patch(
+            "great_expectations.checkpoint.checkpoint._isolate_validation_definition",
+            side_effect=isolate_validation_definition,
+        ), mock.patch.object(ValidationDefinition, "run", autospec=True, side_effect=run):
+            if fails:
+                with pytest.raises(ValueError):
+                    checkpoint.run(max_workers=2)
+            else:
+                checkpoint.run(max_workers=2)
+
+        # One Datasource copy is created by every worker thread.
+        assert 1 <= len(created_execution_engines) <= 2
+        for execution_engine in created_execution_engines:
+            execution_engine.close.assert_called_once_with()
+
+    @pytest.mark.unit
+    def test_close_execution_engines_releases_created_execution_engines(
+        self, mocker: MockerFixture
+    ):
+        execution_engine = mocker.Mock()
+        failing_execution_engine = mocker.Mock()
+        failing_execution_engine.close.side_effect = RuntimeError("cannot close")
+        datasources = [mocker.Mock(_execution_engine=None)] + [
+            mocker.Mock(_execution_engine=engine)
+            for engine in (execution_engine, failing_execution_engine)
+        ]
+
+        _close_execution_engines(datasources=datasources)
+
+        execution_engine.close.assert_called_once_with()
+        failing_execution_engine.close.assert_called_once_with()
+        assert all(datasource._execution_engine is None for datasource in datasources)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("max_workers", [0, -1])
+    def test_checkpoint_run_with_invalid_max_workers_raises_error(
+        self, validation_definition: ValidationDefinition, max_workers: int
+    ):
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name, validation_definitions=[validation_definition]
+        )
+
+        with pytest.raises(gx_exceptions.CheckpointError, match="max_workers"):
+            checkpoint.run(max_workers=max_workers)
+
+        validation_definition.run.assert_not_called()  # type: ignore[attr-defined]
+
     @pytest.mark.unit
     def test_result_init_no_run_results_raises_error(self, mocker: MockerFixture):
         with pytest.raises(ValueError) as e:
@@ -741,6 +900,38 @@ class TestCheckpointResult:
             ],
         }
 
+    @pytest.mark.filesystem
+    def test_checkpoint_run_with_max_workers_matches_sequential_run(self, tmp_path: pathlib.Path):
+        checkpoint = self._build_file_backed_checkpoint(tmp_path)
+        batch_definition = checkpoint.validation_definitions[0].batch_definition
+        checkpoint.validation_definitions.extend(
+            ValidationDefinition(
+                name=f"{self.validation_definition_name}_{max_value}",
+                data=batch_definition,
+                suite=ExpectationSuite(
+                    name=f"{self.suite_name}_{max_value}",
+                    expectations=[
+                        gxe.ExpectColumnMaxToBeBetween(
+                            column=self.column_name, min_value=0, max_value=max_value
+                        ),
+                    ],
+                ),
+            )
+            for max_value in (1, 6)
+        )
+
+        sequential_result = checkpoint.run()
+        concurrent_result = checkpoint.run(max_workers=3)
+
+        assert concurrent_result.describe_dict() == sequential_result.describe_dict()
+        assert [key.expectation_suite_identifier.name for key in concurrent_result.run_results] == [
+            self.suite_name,
+            f"{self.suite_name}_1",
+            f"{self.suite_name}_6",
+        ]
+        # Validation definitions are run with copies of their Datasource (and its ExecutionEngine).
+        assert batch_definition.data_asset.datasource._execution_engine is not None
+
     @pytest.mark.filesystem
     def test_checkpoint_run_adds_requisite_ids(self, tmp_path: pathlib.Path):
         checkpoint = self._build_file_backed_checkpoint(tmp_path)
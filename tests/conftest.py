@@ -267,6 +267,12 @@ def pytest_addoption(parser):
         action="store_true",
         help="If set, run performance tests (which might also require additional arguments like --bigquery)",  # noqa: E501
     )
+    parser.addoption(
+        "--performance-scales",
+        action="store",
+        default="small",
+        help="Comma-separated dataset scales for offline performance benchmarks (small, medium, large, wide, xlarge, or all)",  # noqa: E501
+    )
 
 
 def build_test_backends_list_v2_api(metafunc):
@@ -410,6 +416,11 @@ def pytest_collection_modifyitems(config, items):
             reason="need --docs-tests option to run",
         ),
         Category(mark="cloud", flag="--cloud", reason="need --cloud option to run"),
+        Category(
+            mark="performance",
+            flag="--performance-tests",
+            reason="need --performance-tests option to run",
+        ),
     )
 
     for category in categories:
@@ -1,3 +1,5 @@
+import json
+
 import pandas as pd
 import pytest
 
@@ -94,6 +96,43 @@ def test_iddict_is_hashable():
         assert False, "IDDict.__hash__() failed."
 
 
+@pytest.mark.unit
+def test_iddict_id_is_memoized_until_mutated(mocker):
+    id_dict = IDDict(
+        {
+            "column": "a",
+            "row_condition": 'col("b")>1',
+            "condition_parser": "great_expectations__experimental__",
+        }
+    )
+    json_dumps = mocker.spy(json, "dumps")
+
+    original_id = id_dict.to_id()
+    assert id_dict.to_id() == original_id
+    assert hash(id_dict) == hash(original_id)
+    assert json_dumps.call_count == 1
+
+    mutations = [
+        lambda d: d.__setitem__("column", '"a"'),
+        lambda d: d.update({"column": "b"}),
+        lambda d: d.setdefault("batch_id", "1234"),
+        lambda d: d.pop("batch_id"),
+        lambda d: d.__delitem__("condition_parser"),
+        lambda d: d.popitem(),
+        lambda d: d.clear(),
+    ]
+    for mutate in mutations:
+        previous_id = id_dict.to_id()
+        mutate(id_dict)
+        assert id_dict.to_id() == IDDict(dict(id_dict)).to_id()
+        assert id_dict.to_id() != previous_id
+
+    # Explicit "id_keys" / "id_ignore_keys" are never served from memoized "id".
+    id_dict = IDDict({"a": 1, "b": 2})
+    assert id_dict.to_id(id_ignore_keys=["b"]) == "a=1"
+    assert id_dict.to_id(id_keys=["b"]) == "b=2"
+
+
 @pytest.mark.unit
 def test_batch_definition_id():
     # noinspection PyUnusedLocal,PyPep8Naming
@@ -0,0 +1,196 @@
+import datetime
+import decimal
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.sketches import (
+    DistinctCountSketch,
+    FrequentValuesSketch,
+    QuantilesSketch,
+    merge_sketches,
+    sketch_from_json_dict,
+)
+from great_expectations.data_context.store.metric_store import MetricStore
+
+
+@pytest.fixture
+def values() -> np.ndarray:
+    return np.random.default_rng(seed=42).normal(size=100_000)
+
+
+@pytest.mark.unit
+def test_quantiles_sketch_is_exact_while_values_fit():
+    sketch = QuantilesSketch(k=10)
+    sketch.update([5, 1, 4, 2, 3])
+
+    assert sketch.rank_error == 0.0
+    assert sketch.quantiles([0.0, 0.2, 0.5, 1.0]) == [1.0, 1.0, 3.0, 5.0]
+
+
+@pytest.mark.unit
+def test_quantiles_sketch_rank_error_within_bound(values: np.ndarray):
+    sketch = QuantilesSketch(k=100)
+    for batch in np.array_split(values, 10):
+        sketch.update(batch)
+
+    quantiles = [0.01, 0.1, 0.5, 0.9, 0.99]
+    estimates = sketch.quantiles(quantiles)
+
+    assert 0.0 < sketch.rank_error < 0.2
+    ranks = [np.mean(values <= estimate) for estimate in estimates]
+    assert np.allclose(ranks, quantiles, atol=sketch.rank_error)
+    assert sketch.n == len(values)
+    assert sketch.min == values.min()
+    assert sketch.max == values.max()
+
+
+@pytest.mark.unit
+def test_quantiles_sketch_weighted_update_matches_repeated_values():
+    value_counts = pd.Series([3, 1, 6], index=[10.0, 20.0, 30.0])
+
+    weighted = QuantilesSketch.from_value_counts(value_counts)
+    repeated = QuantilesSketch()
+    repeated.update(np.repeat(value_counts.index, value_counts.to_numpy()))
+
+    quantiles = [0.1, 0.3, 0.4, 0.5, 0.9]
+    assert weighted.n == repeated.n == 10
+    assert weighted.quantiles(quantiles) == repeated.quantiles(quantiles) == [10, 10, 20, 30, 30]
+
+
+@pytest.mark.unit
+def test_quantiles_sketch_merge_does_not_modify_merged_sketches(values: np.ndarray):
+    first = QuantilesSketch(k=50)
+    first.update(values[:50_000])
+    second = QuantilesSketch(k=50)
+    second.update(values[50_000:])
+    second_json_dict = second.to_json_dict()
+
+    merged = merge_sketches([first, second])
+
+    assert second.to_json_dict() == second_json_dict
+    assert merged.n == len(values)
+    assert abs(merged.quantiles([0.5])[0] - np.median(values)) < 0.1
+
+
+@pytest.mark.unit
+def test_sketches_with_different_configuration_cannot_be_merged():
+    with pytest.raises(ValueError, match='different "k"'):
+        QuantilesSketch(k=10).merge(QuantilesSketch(k=20))
+
+    with pytest.raises(TypeError):
+        QuantilesSketch().merge(DistinctCountSketch())
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("distinct_count", [10, 1_000, 100_000])
+def test_distinct_count_sketch_estimate_within_error(distinct_count: int):
+    sketch = DistinctCountSketch()
+    sketch.update(np.arange(distinct_count))
+
+    relative_error = abs(sketch.estimate() - distinct_count) / distinct_count
+    assert relative_error < 4 * sketch.relative_standard_error
+
+
+@pytest.mark.unit
+def test_distinct_count_sketch_merge_counts_union_once():
+    integers = DistinctCountSketch()
+    integers.update(np.arange(0, 60_000))
+    floats = DistinctCountSketch()
+    # Numbers are hashed by value, so that overlapping integers and floats are counted once.
+    floats.update(np.arange(40_000, 100_000, dtype=np.float64))
+
+    integers.merge(floats)
+
+    assert abs(integers.estimate() - 100_000) / 100_000 < 4 * integers.relative_standard_error
+
+
+@pytest.mark.unit
+def test_distinct_count_sketch_hashes_strings():
+    sketch = DistinctCountSketch()
+    sketch.update(["a", "b", "a", "c"])
+
+    assert sketch.estimate() == 3
+
+
+@pytest.mark.unit
+def test_distinct_count_sketch_hashes_decimals_as_numbers():
+    decimals = DistinctCountSketch()
+    decimals.update([decimal.Decimal("1.50"), decimal.Decimal("2"), "a"])
+    floats = DistinctCountSketch()
+    floats.update([1.5, 2.0, "a"])
+
+    assert decimals == floats
+    assert decimals.estimate() == 3
+
+
+@pytest.mark.unit
+def test_frequent_values_sketch_tracks_heavy_hitters():
+    values = np.random.default_rng(seed=42).zipf(2.0, size=100_000)
+    capacity = 20
+    sketch = FrequentValuesSketch(capacity=capacity)
+    for batch in np.array_split(values, 4):
+        sketch.update(batch)
+
+    true_counts = pd.Series(values).value_counts()
+    assert sketch.n == len(values)
+    assert sketch.count_error <= len(values) / (capacity + 1)
+    for value, true_count in true_counts[true_counts > sketch.count_error].items():
+        estimate = sketch.estimate(value)
+        assert estimate <= true_count <= estimate + sketch.count_error
+
+    assert [value for value, _ in sketch.most_frequent(3)] == [1, 2, 3]
+
+
+@pytest.mark.unit
+def test_frequent_values_sketch_merge():
+    first = FrequentValuesSketch(capacity=2)
+    first.update(["a", "a", "a", "b"])
+    second = FrequentValuesSketch(capacity=2)
+    second.update(["a", "c", "c"])
+
+    first.merge(second)
+
+    assert first.n == 7
+    assert first.most_frequent() == [("a", 3), ("c", 1)]
+    assert first.count_error == 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "sketch_class,values",
+    [
+        pytest.param(QuantilesSketch, np.arange(1_000), id="quantiles"),
+        pytest.param(DistinctCountSketch, np.arange(1_000), id="distinct_count"),
+        pytest.param(FrequentValuesSketch, ["a", "b", "b"], id="frequent_values"),
+    ],
+)
+def test_sketch_round_trips_through_metric_store(sketch_class, values):
+    sketch = sketch_class()
+    sketch.update(values)
+    store = MetricStore()
+
+    restored = store.deserialize(store.serialize(sketch))
+
+    assert isinstance(restored, sketch_class)
+    assert restored == sketch == sketch_from_json_dict(sketch.to_json_dict())
+
+
+@pytest.mark.unit
+def test_frequent_values_sketch_round_trip_preserves_value_types():
+    values = [
+        pd.Timestamp("2024-01-02 03:04:05", tz="UTC"),
+        datetime.date(2024, 1, 2),
+        decimal.Decimal("1.50"),
+        "a",
+        1,
+    ]
+    sketch = FrequentValuesSketch()
+    sketch.update(values)
+
+    restored = sketch_from_json_dict(json.loads(json.dumps(sketch.to_json_dict())))
+
+    assert restored == sketch
+    assert sorted(map(repr, dict(restored.most_frequent()))) == sorted(map(repr, values))
@@ -0,0 +1,131 @@
+import logging
+
+import pytest
+
+from great_expectations.data_context.store import DatabaseStoreBackend
+from great_expectations.exceptions import StoreBackendError, StoreError
+
+# module level markers
+pytestmark = [
+    pytest.mark.sqlite,
+    pytest.mark.sqlalchemy_version_compatibility,
+]
+
+
+@pytest.fixture
+def store_backend(tmp_path) -> DatabaseStoreBackend:
+    return DatabaseStoreBackend(
+        url=f"sqlite:///{tmp_path / 'store.db'}",
+        table_name="test_database_store_backend",
+        key_columns=["k1", "k2"],
+    )
+
+
+@pytest.fixture
+def statements(store_backend: DatabaseStoreBackend, sa) -> list:
+    executed_statements: list = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany):
+        executed_statements.append(statement)
+
+    sa.event.listen(store_backend.engine, "before_cursor_execute", _record_statement)
+    yield executed_statements
+    sa.event.remove(store_backend.engine, "before_cursor_execute", _record_statement)
+
+
+def test_set_updates_only_given_key(store_backend: DatabaseStoreBackend):
+    store_backend.set(("a", "1"), "a1")
+    store_backend.set(("a", "2"), "a2")
+
+    store_backend.set(("a", "1"), "a1_updated")
+
+    assert store_backend.get(("a", "1")) == "a1_updated"
+    assert store_backend.get(("a", "2")) == "a2"
+    assert sorted(store_backend.list_keys()) == [("a", "1"), ("a", "2")]
+
+
+def test_set_upserts_in_single_statement(store_backend: DatabaseStoreBackend, statements: list):
+    store_backend.set(("a", "1"), "a1")
+    store_backend.set(("a", "1"), "a1_updated")
+
+    assert len(statements) == 2
+    assert all("ON CONFLICT" in statement for statement in statements)
+    assert store_backend.get(("a", "1")) == "a1_updated"
+
+
+def test_set_without_update_raises_on_different_value(store_backend: DatabaseStoreBackend):
+    store_backend.set(("a", "1"), "a1")
+
+    # same value is tolerated
+    store_backend.set(("a", "1"), "a1", allow_update=False)
+
+    with pytest.raises(StoreBackendError):
+        store_backend.set(("a", "1"), "other", allow_update=False)
+
+
+def test_set_many_and_get_many(store_backend: DatabaseStoreBackend, statements: list):
+    items = [((f"k{idx % 3}", str(idx)), f"value_{idx}") for idx in range(1000)]
+
+    store_backend.set_many(items)
+    store_backend.set_many([(("k0", "0"), "value_0_updated")])
+
+    keys = [key for key, _ in reversed(items)]
+    expected_values = [value for _, value in reversed(items)]
+    expected_values[-1] = "value_0_updated"
+
+    statements.clear()
+    assert store_backend.get_many(keys) == expected_values
+    # keys are fetched in chunks, each with single query
+    assert len(statements) == 3
+
+
+def test_set_many_without_update_tolerates_keys_holding_same_values(
+    store_backend: DatabaseStoreBackend, caplog
+):
+    store_backend.set(("a", "1"), "a1")
+
+    with caplog.at_level(logging.WARNING):
+        store_backend.set_many([(("a", "1"), "a1"), (("a", "2"), "a2")], allow_update=False)
+
+    assert store_backend.get_many([("a", "1"), ("a", "2")]) == ["a1", "a2"]
+    assert "storing them one by one" in caplog.text
+
+
+def test_get_many_raises_on_missing_key(store_backend: DatabaseStoreBackend):
+    store_backend.set(("a", "1"), "a1")
+
+    with pytest.raises(StoreError, match="Unable to fetch value for key"):
+        store_backend.get_many([("a", "1"), ("b", "1")])
+
+
+def test_get_all(store_backend: DatabaseStoreBackend, statements: list):
+    store_backend.set_many([(("a", "1"), "a1"), (("a", "2"), "a2"), (("b", "1"), "b1")])
+    statements.clear()
+
+    assert sorted(store_backend.get_all()) == ["a1", "a2", "b1"]
+    assert sorted(store_backend.get_all(prefix=("a",))) == ["a1", "a2"]
+    assert len(statements) == 2
+
+
+def test_get_all_raises_store_error_on_database_error(store_backend: DatabaseStoreBackend, sa):
+    with store_backend.engine.begin() as connection:
+        connection.execute(sa.text("DROP TABLE test_database_store_backend"))
+
+    with pytest.raises(StoreError, match="Unable to fetch values"):
+        store_backend.get_all()
+
+
+def test_set_without_primary_key_falls_back_to_update_and_insert(tmp_path, sa):
+    url = f"sqlite:///{tmp_path / 'store.db'}"
+    engine = sa.create_engine(url)
+    with engine.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE no_primary_key (k1 VARCHAR, value VARCHAR)"))
+
+    store_backend = DatabaseStoreBackend(url=url, table_name="no_primary_key", key_columns=["k1"])
+    assert store_backend._upsert_dialect is None
+
+    store_backend.set_many([(("a",), "a"), (("b",), "b")])
+    store_backend.set(("a",), "a_updated")
+
+    assert store_backend.get_many([("a",), ("b",)]) == ["a_updated", "b"]
+    assert len(store_backend.list_keys()) == 2
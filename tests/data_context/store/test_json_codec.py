@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import json
+import math
+from typing import TYPE_CHECKING, Type
+
+import numpy as np
+import pytest
+
+from great_expectations.core.data_context_key import StringKey
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResult,
+)
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.core.validation_definition import ValidationDefinition
+from great_expectations.data_context.store import (
+    ExpectationsStore,
+    ValidationDefinitionStore,
+    ValidationResultsStore,
+)
+from great_expectations.data_context.store.json_codec import (
+    CompactJsonCodec,
+    JsonCodec,
+    OrjsonCodec,
+    PrettyJsonCodec,
+    get_json_codec,
+)
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
+from great_expectations.exceptions import StoreConfigurationError
+from great_expectations.expectations.core import ExpectColumnValuesToNotBeNull
+
+if TYPE_CHECKING:
+    from great_expectations.data_context.data_context.ephemeral_data_context import (
+        EphemeralDataContext,
+    )
+
+JSON_CODEC_NAMES = ["json", "compact", "orjson"]
+
+_DATA = {"b": [1, 2.5, None, True], "a": {"nested": "value"}, "c": "ü"}
+
+
+@pytest.fixture
+def expectation_suite(in_memory_runtime_context: EphemeralDataContext) -> ExpectationSuite:
+    return ExpectationSuite(
+        name="my_suite",
+        expectations=[ExpectColumnValuesToNotBeNull(column="passenger_count", mostly=0.95)],
+        meta={"notes": "ü"},
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "name,codec_class",
+    [
+        pytest.param(None, PrettyJsonCodec, id="default"),
+        pytest.param("json", PrettyJsonCodec, id="json"),
+        pytest.param("compact", CompactJsonCodec, id="compact"),
+        pytest.param("ORJSON", OrjsonCodec, id="orjson_case_insensitive"),
+    ],
+)
+def test_get_json_codec(name: str | None, codec_class: Type[JsonCodec]):
+    assert isinstance(get_json_codec(name=name), codec_class)
+
+
+@pytest.mark.unit
+def test_get_json_codec_unknown_name_raises():
+    with pytest.raises(StoreConfigurationError, match='Unknown JSON codec "yaml"'):
+        get_json_codec(name="yaml")
+
+
+@pytest.mark.unit
+def test_pretty_json_codec_matches_legacy_serialization():
+    assert PrettyJsonCodec().dumps(_DATA) == json.dumps(_DATA, indent=2, sort_keys=True)
+
+
+@pytest.mark.unit
+def test_compact_json_codec_writes_sorted_keys_without_whitespace():
+    assert CompactJsonCodec().dumps(_DATA) == json.dumps(
+        _DATA, separators=(",", ":"), sort_keys=True
+    )
+
+
+@pytest.mark.unit
+def test_orjson_codec_writes_sorted_keys_without_whitespace():
+    # Unlike standard library "json", "orjson" does not escape non-ASCII characters.
+    assert OrjsonCodec().dumps(_DATA) == json.dumps(
+        _DATA, separators=(",", ":"), sort_keys=True, ensure_ascii=False
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("name", JSON_CODEC_NAMES)
+def test_json_codecs_read_pretty_printed_json(name: str):
+    assert get_json_codec(name=name).loads(json.dumps(_DATA, indent=2, sort_keys=True)) == _DATA
+
+
+@pytest.mark.unit
+def test_orjson_codec_serializes_numpy_values():
+    codec = OrjsonCodec()
+    assert codec.loads(codec.dumps({"values": np.array([1, 2, 3])})) == {"values": [1, 2, 3]}
+
+
+@pytest.mark.unit
+def test_orjson_codec_reads_non_finite_floats_written_by_standard_library():
+    data = OrjsonCodec().loads(json.dumps({"value": float("nan")}, indent=2))
+    assert math.isnan(data["value"])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("name", JSON_CODEC_NAMES)
+def test_expectations_store_round_trip(name: str, expectation_suite: ExpectationSuite):
+    store = ExpectationsStore(json_codec=name)
+    key = ExpectationSuiteIdentifier(name=expectation_suite.name)
+
+    store.set(key=key, value=expectation_suite)
+
+    assert isinstance(store.json_codec, type(get_json_codec(name=name)))
+    assert store.get(key=key) == ExpectationsStore().deserialize(
+        ExpectationsStore().serialize(expectation_suite)
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("name", JSON_CODEC_NAMES)
+def test_expectations_store_reads_values_written_by_default_codec(
+    name: str, expectation_suite: ExpectationSuite
+):
+    pretty_serialized_suite: str = ExpectationsStore().serialize(expectation_suite)
+    assert "\n  " in pretty_serialized_suite
+
+    store = ExpectationsStore(json_codec=name)
+
+    assert store.deserialize(pretty_serialized_suite) == ExpectationsStore().deserialize(
+        pretty_serialized_suite
+    )
+
+
+@pytest.mark.filesystem
+@pytest.mark.parametrize("name", JSON_CODEC_NAMES)
+def test_validation_results_store_round_trip(name: str, tmp_path):
+    store = ValidationResultsStore(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": str(tmp_path),
+        },
+        json_codec=name,
+    )
+    key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(name="my_suite"),
+        run_id=RunIdentifier(run_name="my_run", run_time="20240101T000000.000000Z"),
+        batch_identifier="my_batch",
+    )
+    value = ExpectationSuiteValidationResult(
+        success=True,
+        suite_name="my_suite",
+        results=[],
+        statistics={"evaluated_expectations": 0, "success_percent": None},
+    )
+
+    store.set(key=key, value=value)
+
+    stored_files = list(tmp_path.rglob("*.json"))
+    assert len(stored_files) == 1
+    assert ("\n" in stored_files[0].read_text()) is (name == "json")
+    assert store.get(key=key) == value
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("name", JSON_CODEC_NAMES)
+def test_validation_definition_store_round_trip(
+    name: str, in_memory_runtime_context: EphemeralDataContext
+):
+    batch_definition = (
+        in_memory_runtime_context.data_sources.add_pandas("my_datasource")
+        .add_csv_asset("my_asset", "data.csv")  # type: ignore[arg-type]
+        .add_batch_definition("my_batch_definition")
+    )
+    suite = in_memory_runtime_context.suites.add(ExpectationSuite(name="my_suite"))
+    validation_definition = ValidationDefinition(
+        name="my_validation", data=batch_definition, suite=suite
+    )
+    store = ValidationDefinitionStore(json_codec=name)
+    key = StringKey(key="my_validation")
+
+    store.add(key=key, value=validation_definition)
+
+    assert store.serialize(store.get(key=key)) == store.serialize(validation_definition)
@@ -2,7 +2,7 @@ import datetime
 import json
 import os
 import uuid
-from typing import Optional
+from typing import Iterator, Optional
 from unittest import mock
 
 import boto3
@@ -13,6 +13,9 @@ from pytest_mock import MockerFixture
 
 from great_expectations.core.data_context_key import DataContextVariableKey
 from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResult,
+)
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.core.yaml_handler import YAMLHandler
 from great_expectations.data_context.data_context_variables import (
@@ -25,10 +28,12 @@ from great_expectations.data_context.store import (
     TupleFilesystemStoreBackend,
     TupleGCSStoreBackend,
     TupleS3StoreBackend,
+    ValidationResultsStore,
 )
 from great_expectations.data_context.store.inline_store_backend import (
     InlineStoreBackend,
 )
+from great_expectations.data_context.store.tuple_store_backend import _map_concurrently
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
@@ -593,6 +598,105 @@ def test_TupleS3StoreBackend_get_all(aws_credentials):
     assert sorted(result) == [val_a, val_b]
 
 
+@mock_s3
+@pytest.mark.aws_deps
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_TupleS3StoreBackend_get_all_concurrently_reuses_client(
+    aws_credentials, mocker: MockerFixture, max_concurrency: int
+):
+    bucket = "leakybucket"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}",
+        bucket=bucket,
+        prefix="my_prefix",
+        max_concurrency=max_concurrency,
+    )
+    assert my_store.config["max_concurrency"] == max_concurrency
+
+    values = [f"value_{idx}" for idx in range(25)]
+    for idx, value in enumerate(values):
+        my_store.set((f"KEY_{idx}",), value, content_type="text/html; charset=utf-8")
+
+    create_client_spy = mocker.spy(my_store, "_create_client")
+
+    assert sorted(my_store.get_all()) == sorted(values)
+    assert my_store.get(("KEY_0",)) == values[0]
+    assert create_client_spy.call_count == 0
+
+
+@mock_s3
+@pytest.mark.aws_deps
+def test_TupleS3StoreBackend_iter_keys_streams_keys(aws_credentials):
+    bucket = "leakybucket"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}", bucket=bucket, prefix="my_prefix"
+    )
+    for idx in range(3):
+        my_store.set((f"KEY_{idx}",), f"value_{idx}", content_type="text/html; charset=utf-8")
+
+    keys = my_store.iter_keys()
+
+    assert isinstance(keys, Iterator)
+    assert next(keys) in my_store.list_keys()
+    assert sorted(my_store.iter_keys()) == sorted(my_store.list_keys())
+
+
+@pytest.mark.filesystem
+def test_Store_iter_keys_matches_list_keys(tmp_path):
+    store = ValidationResultsStore(
+        store_backend={"class_name": "TupleFilesystemStoreBackend", "base_directory": "results/"},
+        runtime_environment={"root_directory": str(tmp_path)},
+    )
+    for suite_name in ("suite_a", "suite_b"):
+        store.set(
+            ValidationResultIdentifier(
+                ExpectationSuiteIdentifier(name=suite_name), "my_run_id", "my_batch_id"
+            ),
+            ExpectationSuiteValidationResult(success=True, results=[], suite_name=suite_name),
+        )
+
+    assert sorted(store.iter_keys(), key=str) == sorted(store.list_keys(), key=str)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("max_concurrency", [0, -1, 2.5])
+def test_TupleS3StoreBackend_invalid_max_concurrency(max_concurrency):
+    with pytest.raises(StoreBackendError, match="max_concurrency must be a positive integer"):
+        TupleS3StoreBackend(
+            bucket="leakybucket",
+            suppress_store_backend_id=True,
+            max_concurrency=max_concurrency,
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("max_concurrency", [1, 3, 16])
+def test_map_concurrently_preserves_order_of_streamed_items(max_concurrency: int):
+    produced = []
+
+    def _items():
+        for item in range(50):
+            produced.append(item)
+            yield item
+
+    result = _map_concurrently(
+        func=lambda item: item * 2, items=_items(), max_concurrency=max_concurrency
+    )
+
+    assert result == [item * 2 for item in range(50)]
+    assert produced == list(range(50))
+
+
 @mock_s3
 @pytest.mark.aws_deps
 def test_tuple_s3_store_backend_slash_conditions(aws_credentials):  # noqa: PLR0915
@@ -962,16 +1066,23 @@ def test_TupleGCSStoreBackend():  # noqa: PLR0915
         mock_blob = mock_bucket.get_blob.return_value
         mock_str = mock_blob.download_as_bytes.return_value
 
+        my_store = TupleGCSStoreBackend(
+            filepath_template="my_file_{0}",
+            bucket=bucket,
+            prefix=prefix,
+            project=project,
+        )
+        mock_gcs_client.assert_called_once_with("dummy-project")
+        mock_client.bucket.reset_mock()
+
         my_store.get(("BBB",))
 
+        # Client, created for store backend, is reused by subsequent requests.
         mock_gcs_client.assert_called_once_with("dummy-project")
         mock_client.bucket.assert_called_once_with("leakybucket")
-        mock_bucket.get_blob.assert_called_once_with("this_is_a_test_prefix/my_file_BBB")
-        mock_blob.download_as_bytes.assert_called_once()
-        mock_str.decode.assert_called_once_with("utf-8")
-
-    with mock.patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
-        mock_client = mock_gcs_client.return_value
+        mock_bucket.get_blob.assert_called_with("this_is_a_test_prefix/my_file_BBB")
+        mock_blob.download_as_bytes.assert_called()
+        mock_str.decode.assert_called_with("utf-8")
 
         my_store.list_keys()
 
@@ -979,6 +1090,7 @@ def test_TupleGCSStoreBackend():  # noqa: PLR0915
             "leakybucket", prefix="this_is_a_test_prefix"
         )
 
+        mock_client.bucket.reset_mock()
         my_store.remove_key("leakybucket")
 
         from google.cloud.exceptions import NotFound
@@ -988,11 +1100,12 @@ def test_TupleGCSStoreBackend():  # noqa: PLR0915
         except NotFound:
             pass
 
-    with mock.patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
-        mock_gcs_client.side_effect = InvalidKeyError("Hi I am an InvalidKeyError")
+        mock_bucket.get_blob.return_value = None
         with pytest.raises(InvalidKeyError):
             my_store.get(("non_existent_key",))
 
+        mock_gcs_client.assert_called_once_with("dummy-project")
+
     run_id = RunIdentifier("my_run_id", datetime.datetime.utcnow())
     key = ValidationResultIdentifier(
         ExpectationSuiteIdentifier(name="my_suite_name"),
@@ -1,4 +1,5 @@
 import datetime
+import os
 import uuid
 
 import boto3
@@ -6,8 +7,17 @@ import pytest
 from freezegun import freeze_time
 from moto import mock_s3
 
+import great_expectations as gx
 from great_expectations.core import ExpectationSuiteValidationResult
-from great_expectations.data_context.store import ValidationResultsStore
+from great_expectations.data_context.store import (
+    TupleFilesystemStoreBackend,
+    ValidationResultsStore,
+    validation_results_index_manifest,
+)
+from great_expectations.data_context.store.validation_results_index_manifest import (
+    VALIDATION_RESULTS_INDEX_MANIFEST_FILE_NAME,
+    ValidationResultsIndexManifest,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
@@ -230,6 +240,7 @@ def test_ValidationResultsStore_with_TupleFileSystemStoreBackend(tmp_path_factor
 {test_dir}/
     my_store/
         .ge_store_backend_id
+        .validation_results_index_manifest.jsonl
         asset/
             quarantine/
                 prod-100/
@@ -329,6 +340,151 @@ def test_ValidationResultsStore_with_DatabaseStoreBackend(sa):
     assert test_utils.validate_uuid4(my_store.store_backend_id)
 
 
+@pytest.mark.filesystem
+def test_ValidationResultsStore_maintains_index_manifest_with_TupleFileSystemStoreBackend(
+    tmp_path,
+):
+    store_config = {
+        "store_backend": {
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "my_store/",
+        },
+        "runtime_environment": {"root_directory": str(tmp_path)},
+    }
+    my_store = ValidationResultsStore(**store_config)
+
+    ns_1 = ValidationResultIdentifier.from_tuple(
+        ("asset", "quarantine", "prod-100", "20190926T134241.000000Z", "batch_id")
+    )
+    ns_2 = ValidationResultIdentifier.from_tuple(
+        ("asset", "quarantine", "prod-200", "20190926T134241.000000Z", "batch_id")
+    )
+    my_store.set(
+        ns_1,
+        ExpectationSuiteValidationResult(
+            success=True,
+            results=[],
+            suite_name="asset.quarantine",
+            meta={"batch_kwargs": {"data_asset_name": "my_asset"}},
+        ),
+    )
+    my_store.set(
+        ns_2,
+        ExpectationSuiteValidationResult(success=False, results=[], suite_name="asset.quarantine"),
+    )
+    my_store.remove_key(ns_2)
+
+    # Manifest file is not reported as key of store.
+    assert my_store.list_keys() == [ns_1]
+
+    # Another store instance reads manifest, written by first one, from disk.
+    expected_entries = {
+        ns_1.to_tuple(): {
+            "success": True,
+            "batch_kwargs": {"data_asset_name": "my_asset"},
+            "batch_spec": {},
+        }
+    }
+    assert ValidationResultsStore(**store_config).index_manifest.entries() == expected_entries
+
+    # Backfill rebuilds manifest from Validation Results, stored before manifest was maintained.
+    os.remove(my_store.index_manifest.filepath)  # noqa: PTH107
+    my_store_duplicate = ValidationResultsStore(**store_config)
+    assert my_store_duplicate.index_manifest.entries() == {}
+    assert my_store_duplicate.rebuild_index_manifest() == 1
+    assert my_store.index_manifest.entries() == expected_entries
+
+
+@pytest.mark.filesystem
+def test_ValidationResultsStore_index_manifest_tracks_add_update_and_add_or_update(tmp_path):
+    store_config = {
+        "store_backend": {
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "my_store/",
+        },
+        "runtime_environment": {"root_directory": str(tmp_path)},
+    }
+    my_store = ValidationResultsStore(**store_config)
+
+    ns_1 = ValidationResultIdentifier.from_tuple(
+        ("asset", "quarantine", "prod-100", "20190926T134241.000000Z", "batch_id")
+    )
+    ns_2 = ValidationResultIdentifier.from_tuple(
+        ("asset", "quarantine", "prod-200", "20190926T134241.000000Z", "batch_id")
+    )
+    my_store.add(
+        ns_1,
+        ExpectationSuiteValidationResult(success=True, results=[], suite_name="asset.quarantine"),
+    )
+    my_store.add_or_update(
+        ns_2,
+        ExpectationSuiteValidationResult(success=True, results=[], suite_name="asset.quarantine"),
+    )
+    assert {key: entry["success"] for key, entry in my_store.index_manifest.entries().items()} == {
+        ns_1.to_tuple(): True,
+        ns_2.to_tuple(): True,
+    }
+
+    # Overwritten Validation Results replace their (otherwise stale) entries.
+    my_store.update(
+        ns_1,
+        ExpectationSuiteValidationResult(success=False, results=[], suite_name="asset.quarantine"),
+    )
+    my_store.add_or_update(
+        ns_2,
+        ExpectationSuiteValidationResult(success=False, results=[], suite_name="asset.quarantine"),
+    )
+
+    expected_successes = {ns_1.to_tuple(): False, ns_2.to_tuple(): False}
+    assert {
+        key: entry["success"] for key, entry in my_store.index_manifest.entries().items()
+    } == expected_successes
+    assert {
+        key: entry["success"]
+        for key, entry in ValidationResultsStore(**store_config).index_manifest.entries().items()
+    } == expected_successes
+
+
+@pytest.mark.filesystem
+def test_validation_results_index_manifest_backfill_command(tmp_path, capsys):
+    context = gx.get_context(mode="file", project_root_dir=tmp_path)
+    key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(name="asset.quarantine"),
+        run_id="20191007T151224.1234Z_prod_100",
+        batch_identifier="batch_id",
+    )
+    context.validation_results_store.set(
+        key,
+        ExpectationSuiteValidationResult(success=True, results=[], suite_name="asset.quarantine"),
+    )
+    os.remove(context.validation_results_store.index_manifest.filepath)  # noqa: PTH107
+
+    assert (
+        validation_results_index_manifest.main(["--context-root-dir", context.root_directory]) == 0
+    )
+    assert "Recorded 1 Validation Results" in capsys.readouterr().out
+    assert ValidationResultsIndexManifest(
+        filepath=context.validation_results_store.index_manifest.filepath
+    ).entries() == {key.to_tuple(): {"success": True, "batch_kwargs": {}, "batch_spec": {}}}
+
+    assert validation_results_index_manifest.main(["--context-root-dir", str(tmp_path)]) == 1
+
+
+@pytest.mark.unit
+def test_index_manifest_is_ignored_only_by_backend_of_ValidationResultsStore(tmp_path):
+    validation_results_store = ValidationResultsStore(
+        store_backend={"class_name": "TupleFilesystemStoreBackend", "base_directory": "results/"},
+        runtime_environment={"root_directory": str(tmp_path)},
+    )
+    other_backend = TupleFilesystemStoreBackend(
+        base_directory="other/", root_directory=str(tmp_path)
+    )
+
+    manifest_key = (VALIDATION_RESULTS_INDEX_MANIFEST_FILE_NAME,)
+    assert validation_results_store.store_backend.is_ignored_key(manifest_key)
+    assert not other_backend.is_ignored_key(manifest_key)
+
+
 @pytest.mark.cloud
 def test_gx_cloud_response_json_to_object_dict() -> None:
     validation_id = "c1e8f964-ba44-4a13-a9b6-7331a358f12d"
@@ -1,6 +1,7 @@
 import logging
 import os
 import re
+import sys
 from typing import TYPE_CHECKING, List
 
 import pandas as pd
@@ -21,6 +22,7 @@ from great_expectations.datasource.fluent.data_connector.azure_blob_storage_data
 from great_expectations.datasource.fluent.data_connector.file_path_data_connector import (
     sanitize_prefix_for_gcs_and_s3,
 )
+from great_expectations.datasource.fluent.data_connector.s3_data_connector import list_s3_keys
 
 if TYPE_CHECKING:
     from botocore.client import BaseClient
@@ -685,3 +687,32 @@ def test_sanitize_prefix_behaves_the_same_as_local_files():
     check_sameness("a.x/b/c", "a.x/b/c/")
     check_sameness("path/to/folder.something/", "path/to/folder.something/")
     check_sameness("path/to/folder.something", "path/to/folder.something")
+
+
+@pytest.mark.unit
+def test_list_s3_keys_follows_continuation_tokens_iteratively(mocker):
+    page_count = 2 * sys.getrecursionlimit()
+
+    def _list_objects_v2(**query_options):
+        page = int(query_options.get("ContinuationToken", 0))
+        response = {
+            "Contents": [{"Key": f"prefix/file_{page}.csv", "Size": 1}],
+            "IsTruncated": page < page_count - 1,
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(page + 1)
+        return response
+
+    s3 = mocker.Mock(list_objects_v2=mocker.Mock(side_effect=_list_objects_v2))
+    iterator_dict: dict = {}
+
+    keys = list(
+        list_s3_keys(
+            s3=s3,
+            query_options={"Bucket": "my_bucket", "Prefix": "prefix/"},
+            iterator_dict=iterator_dict,
+        )
+    )
+
+    assert keys == [f"prefix/file_{page}.csv" for page in range(page_count)]
+    assert iterator_dict == {}
@@ -212,3 +212,22 @@ def test_batch_request_config_partitioner_json_round_trip_serialization(
 
     batch_request_json = batch_request.json()
     assert BatchRequest.parse_raw(batch_request_json) == batch_request
+
+
+@pytest.mark.unit
+def test_batch_request_columns_are_not_serialized() -> None:
+    batch_request = BatchRequest(
+        datasource_name="test-datasource", data_asset_name="test-asset", columns=["a", "b"]
+    )
+    assert batch_request.columns == ["a", "b"]
+
+    batch_request.columns = ["c"]
+    assert batch_request.columns == ["c"]
+    assert "columns" not in batch_request.dict()
+    assert BatchRequest.parse_raw(batch_request.json()).columns is None
+
+
+@pytest.mark.unit
+def test_batch_request_columns_must_be_list_of_names() -> None:
+    with pytest.raises(TypeError):
+        BatchRequest(datasource_name="test-datasource", data_asset_name="test-asset", columns="a")
@@ -8,6 +8,7 @@ import re
 from dataclasses import dataclass
 from pprint import pformat as pf
 from typing import TYPE_CHECKING, Any, Optional, Type
+from unittest import mock
 
 import pytest
 from pytest import MonkeyPatch, param
@@ -529,6 +530,42 @@ def test_pandas_slice_batch_count(
     assert len(batches) == expected_batch_count
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "sort_ascending,expected_month",
+    [
+        param(True, "12", id="ascending"),
+        param(False, "01", id="descending"),
+    ],
+)
+def test_pandas_slice_is_applied_to_sorted_batches_before_loading_data(
+    mocker,
+    pandas_filesystem_datasource: PandasFilesystemDatasource,
+    sort_ascending: bool,
+    expected_month: str,
+) -> None:
+    asset = pandas_filesystem_datasource.add_csv_asset(
+        name="csv_asset",
+    )
+    get_batch_data_and_markers = mocker.spy(
+        great_expectations.execution_engine.pandas_execution_engine.PandasExecutionEngine,
+        "get_batch_data_and_markers",
+    )
+    batch_request = asset.build_batch_request(
+        options={"year": "2019"},
+        batch_slice="-1",
+        partitioner=FileNamePartitionerMonthly(
+            regex=re.compile(r"yellow_tripdata_sample_(?P<year>\d{4})-(?P<month>\d{2})\.csv"),
+            sort_ascending=sort_ascending,
+        ),
+    )
+    batches = asset.get_batch_list_from_batch_request(batch_request=batch_request)
+
+    assert len(batches) == 1
+    assert batches[0].metadata["month"] == expected_month
+    assert get_batch_data_and_markers.call_count == 1
+
+
 def bad_batching_regex_config(
     csv_path: pathlib.Path,
 ) -> tuple[re.Pattern, TestConnectionError]:
@@ -615,3 +652,32 @@ def test_csv_asset_batch_metadata(
         actual_metadata.pop("path")
         actual_metadata.pop("year")
         assert actual_metadata == substituted_batch_metadata
+
+
+@pytest.mark.unit
+def test_get_batch_list_loads_batches_together(
+    pandas_filesystem_datasource: PandasFilesystemDatasource,
+):
+    asset = pandas_filesystem_datasource.add_csv_asset(name="csv_asset")
+    request = asset.build_batch_request(
+        {"year": "2018"},
+        partitioner=FileNamePartitionerMonthly(
+            regex=re.compile(r"yellow_tripdata_sample_(?P<year>\d{4})-(?P<month>\d{2})\.csv")
+        ),
+    )
+    execution_engine = pandas_filesystem_datasource.get_execution_engine()
+
+    with mock.patch.object(
+        type(execution_engine),
+        "get_batch_data_and_markers_list",
+        autospec=True,
+        side_effect=type(execution_engine).get_batch_data_and_markers_list,
+    ) as mock_get_batch_data_and_markers_list:
+        batches = asset.get_batch_list_from_batch_request(request)
+
+    assert mock_get_batch_data_and_markers_list.call_count == 1
+    assert len(batches) == 12
+    assert [batch.batch_spec["path"] for batch in batches] == [
+        batch_spec["path"]
+        for batch_spec in mock_get_batch_data_and_markers_list.call_args.kwargs["batch_specs"]
+    ]
@@ -645,6 +645,53 @@ def test_postgres_slice_batch_count(
         assert len(batches) == expected_batch_count
 
 
+@pytest.mark.postgresql
+@pytest.mark.parametrize(
+    "sort_ascending,expected_month",
+    [
+        pytest.param(True, 12, id="ascending"),
+        pytest.param(False, 1, id="descending"),
+    ],
+)
+def test_postgres_slice_only_loads_returned_batches(
+    empty_data_context,
+    create_source: CreateSourceFixture,
+    sort_ascending: bool,
+    expected_month: int,
+) -> None:
+    batch_specs = []
+    year = 2021
+
+    def collect_batch_spec(spec: SqlAlchemyDatasourceBatchSpec) -> None:
+        batch_specs.append(spec)
+
+    with create_source(
+        validate_batch_spec=collect_batch_spec,
+        dialect="postgresql",
+        data_context=empty_data_context,
+        # Partitions are deliberately returned out of order.
+        partitioner_query_response=[{"year": year, "month": month} for month in [3, 12, 1, 7]],
+    ) as source:
+        (
+            source,  # noqa: PLW2901
+            asset,
+        ) = create_and_add_table_asset_without_testing_connection(
+            source=source, name="my_asset", table_name="my_table"
+        )
+        partitioner = ColumnPartitionerMonthly(column_name="my_col", sort_ascending=sort_ascending)
+        batch_request = asset.build_batch_request(
+            options={"year": year}, batch_slice="-1", partitioner=partitioner
+        )
+        batches = asset.get_batch_list_from_batch_request(batch_request=batch_request)
+
+        assert len(batches) == 1
+        assert batches[0].metadata == {"year": year, "month": expected_month}
+        assert len(batch_specs) == 1
+        assert batch_specs[0]["batch_identifiers"] == {
+            "my_col": {"year": year, "month": expected_month}
+        }
+
+
 @pytest.mark.postgresql
 def test_data_source_json_has_properties(create_source: CreateSourceFixture):
     with create_source(validate_batch_spec=lambda _: None, dialect="postgresql") as source:
@@ -99,6 +99,21 @@ def create_engine_fake(monkeypatch: pytest.MonkeyPatch) -> None:
             ),
             id="create_temp_table=False",
         ),
+        param(
+            dict(
+                connection_string="sqlite:///",
+                max_concurrent_queries=4,
+            ),
+            id="max_concurrent_queries=4",
+        ),
+        param(
+            dict(
+                connection_string="sqlite:///",
+                schema_cache_ttl=3600,
+                schema_cache_path="schemas.pickle",
+            ),
+            id="schema_cache_ttl=3600",
+        ),
     ],
 )
 class TestConfigPasstrough:
@@ -154,6 +169,9 @@ class TestConfigPasstrough:
             **ds.dict(include={"connection_string"}, config_provider=ds._config_provider),
         }
         assert "create_temp_table" in expected_args
+        assert "max_concurrent_queries" in expected_args
+        assert "schema_cache_ttl" in expected_args
+        assert "schema_cache_path" in expected_args
 
         print(f"\nExpected SqlAlchemyExecutionEngine arguments:\n{pf(expected_args)}")
         gx_sqlalchemy_execution_engine_spy.assert_called_once_with(**expected_args)
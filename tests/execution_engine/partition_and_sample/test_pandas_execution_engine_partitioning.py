@@ -1,8 +1,10 @@
 import datetime
+import hashlib
 import os
 from typing import List
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pandas.api.types as ptypes
 import pytest
@@ -482,3 +484,190 @@ def test_get_batch_with_partition_on_hashed_column(test_df):
         )
     )
     assert partitioned_df.dataframe.shape == (8, 10)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "partitioner_method_name,partitioner_kwargs",
+    [
+        pytest.param("partition_on_year_and_month_and_day", {"column_name": "timestamp"}),
+        pytest.param(
+            "partition_on_date_parts",
+            {"column_name": "timestamp", "date_parts": ["month", "day"]},
+        ),
+        pytest.param("partition_on_column_value", {"column_name": "date"}),
+        pytest.param("partition_on_converted_datetime", {"column_name": "timestamp"}),
+        pytest.param("partition_on_converted_datetime", {"column_name": "date"}),
+        pytest.param("partition_on_divided_integer", {"column_name": "id", "divisor": 7}),
+        pytest.param("partition_on_mod_integer", {"column_name": "id", "mod": 7}),
+        pytest.param("partition_on_multi_column_values", {"column_names": ["m", "d"]}),
+        pytest.param(
+            "partition_on_hashed_column",
+            {"column_name": "favorite_color", "hash_digits": 1},
+        ),
+    ],
+)
+def test_get_partitions_matches_partitioner_methods(
+    test_df: pd.DataFrame, partitioner_method_name: str, partitioner_kwargs: dict
+):
+    data_partitioner: PandasDataPartitioner = PandasDataPartitioner()
+    partitioner_method = data_partitioner.get_partitioner_method(partitioner_method_name)
+
+    partitions = list(
+        data_partitioner.get_partitions(
+            df=test_df,
+            partitioner_method_name=partitioner_method_name,
+            partitioner_kwargs=partitioner_kwargs,
+        )
+    )
+
+    assert len(partitions) > 1
+    assert sum(len(partition_df.index) for _, partition_df in partitions) == len(test_df.index)
+    for batch_identifiers, partition_df in partitions:
+        pd.testing.assert_frame_equal(
+            partition_df,
+            partitioner_method(test_df, batch_identifiers=batch_identifiers, **partitioner_kwargs),
+        )
+
+
+@pytest.mark.unit
+def test_partition_on_hashed_column_matches_hashing_of_every_value(test_df: pd.DataFrame):
+    hash_values = PandasDataPartitioner._hash_values(
+        series=test_df["favorite_color"], hash_method=hashlib.md5, hash_digits=2
+    )
+
+    assert hash_values.tolist() == [
+        hashlib.md5(str(value).encode()).hexdigest()[-2:] for value in test_df["favorite_color"]
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "values",
+    [
+        pytest.param(
+            pd.to_datetime(["2020-01-01", "2020-01-02", None, "2020-01-01"]), id="datetime64"
+        ),
+        pytest.param(
+            [datetime.date(2020, 1, 1), datetime.date(2020, 1, 2), None, datetime.date(2020, 1, 1)],
+            id="date",
+        ),
+        pytest.param(["a", None, np.nan, "a"], id="missing_values"),
+    ],
+)
+def test_partition_on_hashed_column_hashes_string_form_of_every_value(values: list):
+    df = pd.DataFrame({"value": values})
+    expected_hash_values = [
+        hashlib.md5(str(value).encode()).hexdigest()[-2:] for value in df["value"]
+    ]
+
+    hash_values = PandasDataPartitioner._hash_values(
+        series=df["value"], hash_method=hashlib.md5, hash_digits=2
+    )
+
+    assert hash_values.tolist() == expected_hash_values
+    partitioned_df = PandasDataPartitioner.partition_on_hashed_column(
+        df=df,
+        column_name="value",
+        hash_digits=2,
+        batch_identifiers={"hash_value": expected_hash_values[0]},
+    )
+    assert partitioned_df.index.tolist() == [0, 3]
+
+
+@pytest.mark.unit
+def test_partition_on_divided_integer_truncates_towards_zero():
+    df = pd.DataFrame({"id": [-15, -5, 0, 5, 15]})
+
+    partitioned_df = PandasDataPartitioner.partition_on_divided_integer(
+        df=df, column_name="id", divisor=10, batch_identifiers={"id": 0}
+    )
+
+    assert partitioned_df["id"].tolist() == [-5, 0, 5]
+
+
+@pytest.mark.unit
+def test_get_partitioned_batch_data_and_markers(test_df: pd.DataFrame):
+    execution_engine = PandasExecutionEngine()
+
+    partitions = list(
+        execution_engine.get_partitioned_batch_data_and_markers(
+            RuntimeDataBatchSpec(
+                batch_data=test_df,
+                partitioner_method="_partition_on_mod_integer",
+                partitioner_kwargs={"column_name": "id", "mod": 10},
+                sampling_method="_sample_using_limit",
+                sampling_kwargs={"n": 5},
+            )
+        )
+    )
+
+    assert [batch_identifiers for batch_identifiers, _, _ in partitions] == [
+        {"id": mod_value} for mod_value in range(10)
+    ]
+    for batch_identifiers, batch_data, batch_markers in partitions:
+        assert batch_data.dataframe.shape == (5, 10)
+        assert (batch_data.dataframe.id % 10 == batch_identifiers["id"]).all()
+        assert "pandas_data_fingerprint" in batch_markers
+
+
+@pytest.mark.unit
+def test_get_partitioned_batch_data_and_markers_reads_source_once(test_df: pd.DataFrame):
+    execution_engine = PandasExecutionEngine()
+
+    with mock.patch.object(
+        execution_engine,
+        "_get_dataframe_from_batch_spec",
+        return_value=(test_df, None),
+    ) as mock_get_dataframe:
+        partitions = list(
+            execution_engine.get_partitioned_batch_data_and_markers(
+                PathBatchSpec(
+                    path="my_file.csv",
+                    reader_method="read_csv",
+                    partitioner_method="partition_on_column_value",
+                    partitioner_kwargs={"column_name": "batch_id"},
+                )
+            )
+        )
+
+    assert mock_get_dataframe.call_count == 1
+    assert len(partitions) == test_df["batch_id"].nunique()
+
+
+@pytest.mark.filesystem
+def test_get_batch_data_and_markers_list_reads_shared_source_once(tmp_path, test_df: pd.DataFrame):
+    path = str(tmp_path / "data.csv")
+    test_df.to_csv(path, index=False)
+    execution_engine = PandasExecutionEngine()
+    batch_ids = sorted(test_df["batch_id"].unique().tolist())
+    # Batch, which has no rows, is filtered from the same (single) read.
+    requested_batch_ids = [*batch_ids, max(batch_ids) + 1]
+    batch_specs = [
+        PathBatchSpec(
+            path=path,
+            reader_method="read_csv",
+            partitioner_method="partition_on_column_value",
+            partitioner_kwargs={
+                "column_name": "batch_id",
+                "batch_identifiers": {"batch_id": batch_id},
+            },
+        )
+        for batch_id in requested_batch_ids
+    ]
+
+    with mock.patch.object(pd, "read_csv", wraps=pd.read_csv) as mock_read_csv:
+        batch_data_and_markers = execution_engine.get_batch_data_and_markers_list(
+            batch_specs=batch_specs
+        )
+
+    assert mock_read_csv.call_count == 1
+    assert len(batch_data_and_markers) == len(requested_batch_ids)
+    for batch_id, (batch_data, batch_markers) in zip(requested_batch_ids, batch_data_and_markers):
+        expected_df = PandasDataPartitioner.partition_on_column_value(
+            df=pd.read_csv(path),
+            column_name="batch_id",
+            batch_identifiers={"batch_id": batch_id},
+        )
+        pd.testing.assert_frame_equal(batch_data.dataframe, expected_df)
+        assert "ge_load_time" in batch_markers
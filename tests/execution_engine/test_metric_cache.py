@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import PandasExecutionEngine, SqlAlchemyExecutionEngine
+from great_expectations.execution_engine.metric_cache import (
+    LRUMetricCache,
+    MetricCacheStatistics,
+    NoOpMetricCache,
+    get_approximate_size,
+)
+from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+
+@pytest.mark.unit
+def test_lru_metric_cache_records_hits_and_misses():
+    cache = LRUMetricCache()
+    cache.put(key=("table.row_count", "d", "v"), value=10, batch_id="batch_1")
+
+    assert cache.lookup(("table.row_count", "d", "v")) == (True, 10)
+    assert cache.lookup(("table.columns", "d", "v")) == (False, None)
+
+    statistics: MetricCacheStatistics = cache.statistics
+    assert statistics.hits == 1
+    assert statistics.misses == 1
+    assert statistics.entries == 1
+    assert statistics.hit_rate == 0.5
+
+    cache.reset_statistics()
+    assert cache.statistics.hits == 0
+    assert cache.statistics.misses == 0
+
+
+@pytest.mark.unit
+def test_lru_metric_cache_evicts_least_recently_used_values_by_size():
+    value = np.zeros(100, dtype=np.int8)
+    cache = LRUMetricCache(max_bytes=250)
+
+    cache.put(key=("m", "1", ""), value=value)
+    cache.put(key=("m", "2", ""), value=value)
+    # Touch first entry, so that second one becomes least recently used.
+    assert cache.lookup(("m", "1", ""))[0]
+    cache.put(key=("m", "3", ""), value=value)
+
+    assert ("m", "1", "") in cache
+    assert ("m", "2", "") not in cache
+    assert ("m", "3", "") in cache
+    assert cache.current_bytes == 200
+    assert cache.statistics.evictions == 1
+
+    # Values larger than entire budget are not cached.
+    cache.put(key=("m", "4", ""), value=np.zeros(300, dtype=np.int8))
+    assert ("m", "4", "") not in cache
+    assert len(cache) == 2
+
+
+@pytest.mark.unit
+def test_lru_metric_cache_evicts_by_entry_count():
+    cache = LRUMetricCache(max_bytes=None, max_entries=2)
+    for idx in range(3):
+        cache.put(key=("m", str(idx), ""), value=idx)
+
+    assert len(cache) == 2
+    assert ("m", "0", "") not in cache
+
+
+@pytest.mark.unit
+def test_lru_metric_cache_invalidates_batch():
+    cache = LRUMetricCache()
+    cache.update(
+        metrics={("m", "1", ""): 1, ("m", "2", ""): 2, ("m", "3", ""): 3},
+        batch_ids={("m", "1", ""): "batch_1", ("m", "2", ""): "batch_2"},
+    )
+
+    cache.invalidate_batch(batch_id="batch_1")
+    assert ("m", "1", "") not in cache
+    assert ("m", "2", "") in cache
+    assert ("m", "3", "") in cache
+    assert cache.statistics.invalidations == 1
+
+    cache.invalidate_batch(batch_id=None)
+    assert ("m", "3", "") not in cache
+    assert len(cache) == 1
+
+
+@pytest.mark.unit
+def test_no_op_metric_cache_stores_nothing():
+    cache = NoOpMetricCache()
+    cache.put(key=("m", "1", ""), value=1)
+
+    assert ("m", "1", "") not in cache
+    assert cache.lookup(("m", "1", "")) == (False, None)
+    assert cache.statistics.misses == 1
+
+
+@pytest.mark.unit
+def test_get_approximate_size_accounts_for_large_payloads():
+    unexpected_index_list = [{"pk": idx, "a": "x" * 10} for idx in range(10000)]
+    value_counts = pd.Series(np.arange(10000), index=np.arange(10000))
+
+    assert get_approximate_size(unexpected_index_list) > 10000 * 100
+    assert get_approximate_size(value_counts) >= 2 * value_counts.to_numpy().nbytes
+    assert get_approximate_size(pd.Series(["abc"] * 1000)) > get_approximate_size(
+        pd.Series(["abc"] * 10)
+    )
+
+
+@pytest.mark.unit
+def test_execution_engine_metric_cache_is_invalidated_when_batch_is_reloaded_or_removed():
+    engine = PandasExecutionEngine(metric_cache_max_bytes=1024 * 1024)
+    engine.load_batch_data(batch_id="batch_1", batch_data=pd.DataFrame({"a": [1, 2, 3]}))
+    engine.load_batch_data(batch_id="batch_2", batch_data=pd.DataFrame({"a": [1, 2]}))
+
+    metrics = {}
+    for batch_id in ["batch_1", "batch_2"]:
+        metric = MetricConfiguration(
+            metric_name="table.row_count",
+            metric_domain_kwargs={"batch_id": batch_id},
+            metric_value_kwargs=None,
+        )
+        metrics.update(engine.resolve_metrics(metrics_to_resolve=(metric,)))
+
+    assert engine.metric_cache_statistics.entries == 2
+    assert engine.metric_cache.lookup(next(iter(metrics)))[0]
+
+    engine.load_batch_data(batch_id="batch_1", batch_data=pd.DataFrame({"a": [4, 5, 6]}))
+    assert engine.metric_cache_statistics.entries == 1
+
+    engine.batch_manager.remove_batch(batch_id="batch_2")
+    assert "batch_2" not in engine.batch_manager.batch_data_cache
+    assert engine.metric_cache_statistics.entries == 0
+    assert engine.metric_cache_statistics.invalidations == 2
+
+
+@pytest.mark.unit
+def test_execution_engine_metric_cache_invalidation_is_scoped_to_replaced_batch():
+    engine = PandasExecutionEngine(metric_cache_max_bytes=1024 * 1024)
+    batch_data = PandasBatchData(execution_engine=engine, dataframe=pd.DataFrame({"a": [1, 2, 3]}))
+    engine.load_batch_data(batch_id="batch_1", batch_data=batch_data)
+
+    batch_metric = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={"batch_id": "batch_1"},
+        metric_value_kwargs=None,
+    )
+    active_batch_metric = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={},
+        metric_value_kwargs=None,
+    )
+    engine.resolve_metrics(metrics_to_resolve=(batch_metric, active_batch_metric))
+    assert engine.metric_cache_statistics.entries == 2
+
+    # Loading same data again (e.g., by new Validator) keeps metrics computed on it.
+    engine.load_batch_data(batch_id="batch_1", batch_data=batch_data)
+    assert engine.metric_cache_statistics.entries == 2
+
+    # Another active Batch only invalidates metrics of Domains without "batch_id".
+    engine.load_batch_data(batch_id="batch_2", batch_data=pd.DataFrame({"a": [1, 2]}))
+    assert engine.metric_cache.lookup(batch_metric.id)[0]
+    assert not engine.metric_cache.lookup(active_batch_metric.id)[0]
+    assert engine.metric_cache_statistics.invalidations == 1
+
+
+@pytest.mark.unit
+def test_execution_engine_without_caching_uses_no_op_metric_cache():
+    engine = PandasExecutionEngine(caching=False)
+
+    assert isinstance(engine.metric_cache, NoOpMetricCache)
+
+
+@pytest.mark.sqlite
+def test_sqlalchemy_execution_engine_accepts_metric_cache_configuration():
+    engine = SqlAlchemyExecutionEngine(
+        connection_string="sqlite://", metric_cache_max_bytes=1024 * 1024
+    )
+
+    assert engine.metric_cache_statistics.max_bytes == 1024 * 1024
+    assert engine.config["metric_cache_max_bytes"] == 1024 * 1024
+
+    metric_cache = LRUMetricCache(max_bytes=1024)
+    engine = SqlAlchemyExecutionEngine(connection_string="sqlite://", metric_cache=metric_cache)
+
+    assert engine.metric_cache is metric_cache
@@ -7,16 +7,27 @@ import pytest
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import aws, azure, google
-from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import PathBatchSpec, RuntimeDataBatchSpec, S3BatchSpec
 
 # noinspection PyBroadException
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine.pandas_batch_data import ChunkedPandasBatchData
+from great_expectations.execution_engine.pandas_chunk_aggregators import (
+    ChunkAggregator,
+    ChunkLocalMetricValue,
+)
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
 )
+from great_expectations.expectations.metrics import (
+    ColumnMapMetricProvider,
+    column_condition_partial,
+)
 from great_expectations.util import is_library_loadable
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -56,6 +67,226 @@ def test_reader_fn():
     assert "<function" in str(fn_new)
 
 
+@pytest.mark.unit
+def test_get_batch_data_with_projected_columns_reads_subset_of_csv(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1, 2], "b": ["x", "y"], "c": [1.5, 2.5]}).to_csv(path, index=False)
+
+    engine = PandasExecutionEngine()
+    batch_data, _ = engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=str(path), reader_method="read_csv", columns=["c", "z"])
+    )
+
+    # first column is always kept (so that number of rows is preserved); missing columns ignored
+    assert list(batch_data.dataframe.columns) == ["a", "c"]
+    assert batch_data.source_columns == ["a", "b", "c"]
+
+    engine.load_batch_data(batch_id="projected", batch_data=batch_data)
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    assert results[table_columns_metric.id] == ["a", "b", "c"]
+
+
+@pytest.mark.unit
+def test_get_batch_data_without_projected_columns_reads_all_columns(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}).to_csv(path, index=False)
+
+    batch_data, _ = PandasExecutionEngine().get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=str(path), reader_method="read_csv")
+    )
+
+    assert list(batch_data.dataframe.columns) == ["a", "b"]
+    assert batch_data.source_columns is None
+
+
+@pytest.fixture
+def streamed_batch_files(tmp_path) -> Dict[str, str]:
+    df = pd.DataFrame(
+        {
+            "a": [0.5, None, 2.0, -1.5, 3.25, None, 7.0, 1.0, 0.0, 4.5, -2.0],
+            "b": ["x", "y", None, "x", "z", "y", None, "x", "x", "y", "z"],
+            "c": [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5],
+        }
+    )
+    csv_path = tmp_path / "data.csv"
+    df.to_csv(csv_path, index=False)
+    paths = {"read_csv": str(csv_path)}
+    if is_library_loadable(library_name="pyarrow"):
+        parquet_path = tmp_path / "data.parquet"
+        df.to_parquet(parquet_path, index=False)
+        paths["read_parquet"] = str(parquet_path)
+
+    return paths
+
+
+def _get_streamed_metrics(
+    path: str, metric_configurations: list, **engine_kwargs
+) -> Dict[Tuple[str, str, str], MetricValue]:
+    engine = PandasExecutionEngine(**engine_kwargs)
+    batch_data, batch_markers = engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=path)
+    )
+    validator = Validator(
+        execution_engine=engine, batches=[Batch(data=batch_data, batch_markers=batch_markers)]
+    )
+    return validator.compute_metrics(
+        metric_configurations=metric_configurations,
+        runtime_configuration={"catch_exceptions": False},
+    )[0]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("reader_method", ["read_csv", "read_parquet"])
+def test_streamed_batch_metrics_match_entire_batch_metrics(
+    in_memory_runtime_context, streamed_batch_files, reader_method
+):
+    if reader_method not in streamed_batch_files:
+        pytest.skip("pyarrow is not installed")
+
+    result_format = {"result_format": "COMPLETE"}
+    metric_configurations = [
+        MetricConfiguration("table.row_count", {}),
+        MetricConfiguration("column.min", {"column": "a"}),
+        MetricConfiguration("column.max", {"column": "c"}),
+        MetricConfiguration("column.mean", {"column": "a"}),
+        MetricConfiguration("column.standard_deviation", {"column": "a"}),
+        MetricConfiguration("column.value_counts", {"column": "b"}, {"sort": "value"}),
+        MetricConfiguration("column.value_counts", {"column": "c"}, {"sort": "count"}),
+        MetricConfiguration("column.value_counts", {"column": "c"}, {"sort": None}),
+        MetricConfiguration("column_values.nonnull.unexpected_count", {"column": "b"}),
+        MetricConfiguration(
+            "column_values.in_set.unexpected_index_list",
+            {"column": "b"},
+            {"value_set": ["x", "y"], "result_format": result_format},
+        ),
+        MetricConfiguration(
+            "column_values.between.unexpected_values",
+            {"column": "c"},
+            {"min_value": 2, "max_value": 5, "result_format": result_format},
+        ),
+    ]
+    path = streamed_batch_files[reader_method]
+    expected = _get_streamed_metrics(path=path, metric_configurations=metric_configurations)
+    # Decomposable metrics never load entire batch.
+    actual = _get_streamed_metrics(
+        path=path,
+        metric_configurations=metric_configurations,
+        chunk_size=3,
+        allow_full_batch_load=False,
+    )
+
+    for metric_configuration in metric_configurations:
+        expected_value = expected[metric_configuration.id]
+        actual_value = actual[metric_configuration.id]
+        if metric_configuration.metric_value_kwargs.get("sort") == "count":
+            # Order of values with equal counts is unspecified.
+            assert actual_value.is_monotonic_decreasing
+            pd.testing.assert_series_equal(actual_value.sort_index(), expected_value.sort_index())
+        elif isinstance(expected_value, pd.Series):
+            pd.testing.assert_series_equal(actual_value, expected_value)
+        elif isinstance(expected_value, float):
+            assert actual_value == pytest.approx(expected_value)
+        else:
+            assert actual_value == expected_value
+
+
+@pytest.mark.unit
+def test_streamed_batch_falls_back_to_entire_batch_for_non_decomposable_metric(
+    in_memory_runtime_context, streamed_batch_files
+):
+    median = MetricConfiguration("column.median", {"column": "c"})
+    unique_count = MetricConfiguration("column_values.unique.unexpected_count", {"column": "c"})
+    path = streamed_batch_files["read_csv"]
+
+    metrics = _get_streamed_metrics(
+        path=path, metric_configurations=[median, unique_count], chunk_size=3
+    )
+
+    assert metrics[median.id] == 4
+    assert metrics[unique_count.id] == 7
+
+    with pytest.raises(gx_exceptions.MetricResolutionError):
+        _get_streamed_metrics(
+            path=path,
+            metric_configurations=[median],
+            chunk_size=3,
+            allow_full_batch_load=False,
+        )
+
+
+class ColumnValuesEqualToMinimum(ColumnMapMetricProvider):
+    """Custom map metric, whose rows depend on other rows (hence, not known to be row-local)."""
+
+    condition_metric_name = "column_values.test_equal_to_minimum"
+
+    @column_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, column, **kwargs):
+        return column == column.min()
+
+
+@pytest.mark.unit
+def test_streamed_batch_falls_back_to_entire_batch_for_custom_map_metric(
+    in_memory_runtime_context, streamed_batch_files
+):
+    unexpected_count = MetricConfiguration(
+        "column_values.test_equal_to_minimum.unexpected_count", {"column": "c"}
+    )
+    path = streamed_batch_files["read_csv"]
+
+    expected = _get_streamed_metrics(path=path, metric_configurations=[unexpected_count])
+    actual = _get_streamed_metrics(
+        path=path, metric_configurations=[unexpected_count], chunk_size=3
+    )
+
+    # Evaluated on chunks of 3 rows, it would count 7 values (unequal to minimum of their chunk).
+    assert actual[unexpected_count.id] == expected[unexpected_count.id] == 9
+
+
+@pytest.mark.unit
+def test_streamed_batch_materializes_requested_map_condition(
+    in_memory_runtime_context, streamed_batch_files
+):
+    condition = MetricConfiguration(
+        "column_values.in_set.condition", {"column": "b"}, {"value_set": ["x", "y"]}
+    )
+    path = streamed_batch_files["read_csv"]
+
+    expected = _get_streamed_metrics(path=path, metric_configurations=[condition])
+    actual = _get_streamed_metrics(path=path, metric_configurations=[condition], chunk_size=3)
+
+    assert not isinstance(actual[condition.id], ChunkLocalMetricValue)
+    pd.testing.assert_series_equal(actual[condition.id][0], expected[condition.id][0])
+
+
+@pytest.mark.unit
+def test_chunk_aggregator_requires_merge():
+    class _IncompleteAggregator(ChunkAggregator):
+        pass
+
+    with pytest.raises(TypeError):
+        _IncompleteAggregator()
+
+
+@pytest.mark.unit
+def test_streamed_batch_is_not_used_for_sampled_batch(streamed_batch_files):
+    batch_data, _ = PandasExecutionEngine(chunk_size=3).get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(
+            path=streamed_batch_files["read_csv"],
+            sampling_method="sample_using_limit",
+            sampling_kwargs={"n": 4},
+        )
+    )
+
+    assert not isinstance(batch_data, ChunkedPandasBatchData)
+    assert len(batch_data.dataframe) == 4
+
+
+@pytest.mark.unit
+def test_constructor_with_invalid_chunk_size():
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        PandasExecutionEngine(chunk_size=0)
+
+
 @pytest.mark.unit
 def test_get_domain_records_with_column_domain():
     engine = PandasExecutionEngine()
@@ -236,6 +467,82 @@ def test_get_domain_records_with_multicolumn_domain():
     ), "Data does not match after getting full access compute domain"
 
 
+@pytest.mark.unit
+def test_get_domain_records_memoizes_row_filtering_masks():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4, None, 5],
+            "b": [2, 3, 4, 5, 6, 7],
+            "c": [1, None, 3, 4, None, 6],
+        }
+    )
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    domain_kwargs = {
+        "column_A": "a",
+        "column_B": "c",
+        "row_condition": "b>2",
+        "condition_parser": "pandas",
+        "ignore_row_if": "either_value_is_missing",
+    }
+    expected_df = df.query("b>2", parser="pandas").dropna(axis=0, how="any", subset=["a", "c"])
+
+    with mock.patch.object(
+        pd.DataFrame, "eval", autospec=True, side_effect=pd.DataFrame.eval
+    ) as mock_eval:
+        first = engine.get_domain_records(domain_kwargs=domain_kwargs)
+        second = engine.get_domain_records(domain_kwargs=domain_kwargs)
+
+    assert mock_eval.call_count == 1
+    assert first.equals(expected_df)
+    assert second.equals(expected_df)
+    assert len(engine._domain_records_mask_cache) == 1
+
+    # Reloading Batch invalidates its memoized masks.
+    reloaded_df = df.assign(b=[7, 6, 5, 4, 3, 2])
+    engine.load_batch_data(batch_data=reloaded_df, batch_id="1234")
+    assert len(engine._domain_records_mask_cache) == 0
+
+    data = engine.get_domain_records(domain_kwargs=domain_kwargs)
+    assert data.equals(
+        reloaded_df.query("b>2", parser="pandas").dropna(axis=0, how="any", subset=["a", "c"])
+    )
+
+
+@pytest.mark.unit
+def test_get_domain_records_mask_cache_evicts_least_recently_used_masks():
+    df = pd.DataFrame({"a": list(range(100))})
+    # Budget for exactly two masks (one byte per row).
+    engine = PandasExecutionEngine(domain_records_cache_max_bytes=200)
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    for row_condition in ["a>10", "a>20", "a>30"]:
+        data = engine.get_domain_records(
+            domain_kwargs={"row_condition": row_condition, "condition_parser": "pandas"}
+        )
+        assert data.equals(df.query(row_condition))
+
+    cache = engine._domain_records_mask_cache
+    assert len(cache) == 2
+    assert cache.current_bytes == 200
+    assert cache.get(("1234", "a>10", "pandas", None, None)) is None
+
+
+@pytest.mark.unit
+def test_get_domain_records_with_non_boolean_row_condition_falls_back_to_query():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [True, False, True]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    data = engine.get_domain_records(
+        domain_kwargs={"row_condition": "b.index", "condition_parser": "python"}
+    )
+
+    assert data.equals(df.query("b.index", parser="python"))
+    assert len(engine._domain_records_mask_cache) == 0
+
+
 @pytest.mark.unit
 def test_get_compute_domain_with_no_domain_kwargs():
     engine = PandasExecutionEngine()
@@ -29,6 +29,9 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
     _dialect_requires_persisted_connection,
 )
+from great_expectations.execution_engine.sqlalchemy_schema_cache import (
+    SchemaReflectionCache,
+)
 
 # Function to test for spark dataframe equality
 from great_expectations.expectations.row_conditions import (
@@ -402,6 +405,43 @@ def test_get_domain_records_with_column_domain(sa):
     ), "Data does not match after getting full access compute domain"
 
 
+@pytest.mark.sqlite
+def test_get_batch_data_with_projected_columns_selects_subset_of_table(sa):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [2, 3, 4], "c": ["x", "y", "z"]})
+    execution_engine = build_sa_execution_engine(df, sa)
+
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=SqlAlchemyDatasourceBatchSpec(table_name="test", columns=["c", "missing"])
+    )
+    execution_engine.load_batch_data(batch_id="projected", batch_data=batch_data)
+    result = execution_engine.execute_query(
+        sa.select(sa.text("*")).select_from(batch_data.selectable)
+    )
+
+    assert list(result.keys()) == ["c"]
+    assert result.fetchall() == [("x",), ("y",), ("z",)]
+
+    # schema metadata is still reported for all columns of source table
+    table_columns_metric, results = get_table_columns_metric(execution_engine=execution_engine)
+    assert results[table_columns_metric.id] == ["a", "b", "c"]
+
+
+@pytest.mark.sqlite
+def test_get_batch_data_with_no_matching_projected_columns_selects_first_column(sa):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [2, 3, 4]})
+    execution_engine = build_sa_execution_engine(df, sa)
+
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=SqlAlchemyDatasourceBatchSpec(table_name="test", columns=["missing"])
+    )
+    result = execution_engine.execute_query(
+        sa.select(sa.text("*")).select_from(batch_data.selectable)
+    )
+
+    assert list(result.keys()) == ["a"]
+    assert len(result.fetchall()) == 3
+
+
 @pytest.mark.sqlite
 def test_get_domain_records_with_column_domain_and_filter_conditions(sa):
     df = pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None], "c": [1, 2, 3, 4, None]})
@@ -900,6 +940,222 @@ def test_get_compute_domain_with_nonexistent_condition_parser(sa):
         )
 
 
+def _build_file_backed_sa_execution_engine_with_two_domain_bundle(
+    sa, tmp_path, max_concurrent_queries
+) -> Tuple[
+    SqlAlchemyExecutionEngine,
+    Tuple[MetricConfiguration, ...],
+    Dict[Tuple[str, str, str], MetricValue],
+]:
+    sqlalchemy_engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    add_dataframe_to_db(
+        df=pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 5, 4, 4, 6, 4]}),
+        name="test",
+        con=sqlalchemy_engine,
+        index=False,
+    )
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        max_concurrent_queries=max_concurrent_queries,
+    )
+    batch_data = SqlAlchemyBatchData(execution_engine=execution_engine, table_name="test")
+    execution_engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=execution_engine)
+    metrics.update(results)
+
+    aggregate_fn_metrics = []
+    desired_metrics = []
+    domain_kwargs: dict
+    for domain_kwargs in (
+        {
+            "column": "a",
+            "row_condition": 'col("b")>4',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        {"column": "b"},
+    ):
+        for metric_name in ("column.max", "column.min"):
+            aggregate_fn_metric = MetricConfiguration(
+                metric_name=f"{metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+                metric_domain_kwargs=domain_kwargs,
+                metric_value_kwargs=None,
+            )
+            aggregate_fn_metric.metric_dependencies = {
+                "table.columns": table_columns_metric,
+            }
+            aggregate_fn_metrics.append(aggregate_fn_metric)
+
+            desired_metric = MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=domain_kwargs,
+                metric_value_kwargs=None,
+            )
+            desired_metric.metric_dependencies = {
+                "metric_partial_fn": aggregate_fn_metric,
+                "table.columns": table_columns_metric,
+            }
+            desired_metrics.append(desired_metric)
+
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=aggregate_fn_metrics,
+        metrics=metrics,
+    )
+    metrics.update(results)
+
+    return execution_engine, tuple(desired_metrics), metrics
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_concurrently_matches_serial_execution(sa, tmp_path, mocker):
+    (tmp_path / "serial").mkdir()
+    serial_execution_engine, serial_metrics_to_resolve, serial_metrics = (
+        _build_file_backed_sa_execution_engine_with_two_domain_bundle(
+            sa=sa, tmp_path=tmp_path / "serial", max_concurrent_queries=None
+        )
+    )
+    serial_results = serial_execution_engine.resolve_metrics(
+        metrics_to_resolve=serial_metrics_to_resolve,
+        metrics=serial_metrics,
+    )
+
+    execution_engine, metrics_to_resolve, metrics = (
+        _build_file_backed_sa_execution_engine_with_two_domain_bundle(
+            sa=sa, tmp_path=tmp_path, max_concurrent_queries=2
+        )
+    )
+    # sqlite is never run concurrently; pretend the dialect tolerates multiple connections.
+    assert not execution_engine._supports_concurrent_queries()
+    mocker.patch.object(execution_engine, "_supports_concurrent_queries", return_value=True)
+    spy = mocker.spy(execution_engine, "_execute_metric_bundle_queries_concurrently")
+
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=metrics_to_resolve,
+        metrics=metrics,
+    )
+
+    assert spy.call_count == 1
+    assert results == serial_results
+    assert list(results.values()) == [3, 2, 6, 4]
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_concurrently_attributes_failure_to_domain(sa, tmp_path, mocker):
+    execution_engine, metrics_to_resolve, metrics = (
+        _build_file_backed_sa_execution_engine_with_two_domain_bundle(
+            sa=sa, tmp_path=tmp_path, max_concurrent_queries=2
+        )
+    )
+    mocker.patch.object(execution_engine, "_supports_concurrent_queries", return_value=True)
+
+    original_execute_metric_bundle_query = execution_engine._execute_metric_bundle_query
+
+    def _fail_on_row_condition_domain(sa_query_object, query):
+        if "row_condition" in query["domain_kwargs"]:
+            raise gx_exceptions.ExecutionEngineError(message="An SQL execution Exception occurred.")
+        return original_execute_metric_bundle_query(sa_query_object=sa_query_object, query=query)
+
+    mocker.patch.object(
+        execution_engine,
+        "_execute_metric_bundle_query",
+        side_effect=_fail_on_row_condition_domain,
+    )
+
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        execution_engine.resolve_metrics(
+            metrics_to_resolve=metrics_to_resolve,
+            metrics=metrics,
+        )
+
+    assert {metric.id for metric in e.value.failed_metrics} == {
+        metric.id for metric in metrics_to_resolve[:2]
+    }
+
+
+@pytest.mark.unit
+def test_max_concurrent_queries_must_be_positive(sa):
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        SqlAlchemyExecutionEngine(connection_string="sqlite://", max_concurrent_queries=0)
+
+
+def _get_reflected_column_names(execution_engine: SqlAlchemyExecutionEngine) -> list:
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=SqlAlchemyDatasourceBatchSpec(table_name="test")
+    )
+    execution_engine.load_batch_data(batch_id="test", batch_data=batch_data)
+    table_columns_metric, results = get_table_columns_metric(execution_engine=execution_engine)
+    return results[table_columns_metric.id]
+
+
+@pytest.mark.sqlite
+def test_schema_cache_is_shared_by_engines_until_invalidated(sa, tmp_path):
+    connection_string = f"sqlite:///{tmp_path / 'test.db'}"
+    with sa.create_engine(connection_string).begin() as connection:
+        connection.execute(sa.text("CREATE TABLE test (a INTEGER, b TEXT)"))
+
+    execution_engine = SqlAlchemyExecutionEngine(
+        connection_string=connection_string, schema_cache_ttl=3600
+    )
+    assert _get_reflected_column_names(execution_engine) == ["a", "b"]
+
+    with execution_engine.get_connection() as connection:
+        connection.execute(sa.text("ALTER TABLE test ADD COLUMN c REAL"))
+        connection.commit()
+
+    # newly built engine is served cached (stale) schema
+    other_execution_engine = SqlAlchemyExecutionEngine(
+        connection_string=connection_string, schema_cache_ttl=3600
+    )
+    assert _get_reflected_column_names(other_execution_engine) == ["a", "b"]
+    # engines without schema cache always reflect
+    assert _get_reflected_column_names(
+        SqlAlchemyExecutionEngine(connection_string=connection_string)
+    ) == ["a", "b", "c"]
+
+    assert other_execution_engine.invalidate_schema_cache(table_name="test") == 1
+    assert _get_reflected_column_names(other_execution_engine) == ["a", "b", "c"]
+
+
+@pytest.mark.sqlite
+def test_schema_cache_is_persisted_on_close(sa, tmp_path):
+    connection_string = f"sqlite:///{tmp_path / 'test.db'}"
+    schema_cache_path = tmp_path / "schemas.pickle"
+    with sa.create_engine(connection_string).begin() as connection:
+        connection.execute(sa.text("CREATE TABLE test (a INTEGER, b TEXT)"))
+
+    execution_engine = SqlAlchemyExecutionEngine(
+        connection_string=connection_string,
+        schema_cache_ttl=3600,
+        schema_cache_path=str(schema_cache_path),
+    )
+    assert _get_reflected_column_names(execution_engine) == ["a", "b"]
+    execution_engine.close()
+
+    cache = SchemaReflectionCache(persist_path=schema_cache_path)
+    cached_columns = cache.get(
+        key=(execution_engine._get_connection_fingerprint(), None, "test"), ttl=3600
+    )
+    assert [column["name"] for column in cached_columns] == ["a", "b"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "schema_cache_kwargs",
+    [
+        pytest.param({"schema_cache_ttl": -1}, id="negative_ttl"),
+        pytest.param({"schema_cache_path": "schemas.pickle"}, id="path_without_ttl"),
+    ],
+)
+def test_schema_cache_config_is_validated(sa, schema_cache_kwargs):
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        SqlAlchemyExecutionEngine(connection_string="sqlite://", **schema_cache_kwargs)
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error  # noqa: E501
 @pytest.mark.sqlite
 def test_resolve_metric_bundle_with_nonexistent_metric(sa):
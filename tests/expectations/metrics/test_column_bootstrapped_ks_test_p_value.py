@@ -0,0 +1,88 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from great_expectations.expectations.metrics.column_aggregate_metrics import (
+    column_bootstrapped_ks_test_p_value,
+)
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_bootstrapped_ks_test_p_value import (  # noqa: E501
+    get_bootstrapped_ks_test_p_values,
+)
+
+BINS = [0.0, 1.0, 2.0, 3.0, 4.0]
+WEIGHTS = [0.1, 0.4, 0.4, 0.1]
+TEST_CDF = np.append(np.array([0]), np.cumsum(WEIGHTS))
+
+
+@pytest.fixture
+def column_values() -> np.ndarray:
+    return np.random.default_rng(42).normal(loc=2.0, scale=1.0, size=500)
+
+
+@pytest.mark.unit
+def test_p_values_match_per_sample_kstest(column_values: np.ndarray):
+    random_seed = 7
+    bootstrap_samples = 50
+    bootstrap_sample_size = 8
+
+    p_values = get_bootstrapped_ks_test_p_values(
+        column_values=column_values,
+        bins=BINS,
+        test_cdf=TEST_CDF,
+        bootstrap_samples=bootstrap_samples,
+        bootstrap_sample_size=bootstrap_sample_size,
+        random_seed=random_seed,
+    )
+
+    # single chunk: all resamples are drawn from generator seeded with first spawned seed sequence
+    generator = np.random.default_rng(np.random.SeedSequence(random_seed).spawn(1)[0])
+    resamples = generator.choice(column_values, size=(bootstrap_samples, bootstrap_sample_size))
+    expected_p_values = [
+        stats.kstest(resample, lambda x: np.interp(x, BINS, TEST_CDF))[1] for resample in resamples
+    ]
+
+    np.testing.assert_allclose(p_values, expected_p_values, rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.unit
+def test_p_values_are_reproducible_with_random_seed(column_values: np.ndarray):
+    kwargs = {
+        "column_values": column_values,
+        "bins": BINS,
+        "test_cdf": TEST_CDF,
+        "bootstrap_samples": 100,
+        "bootstrap_sample_size": 8,
+    }
+
+    assert np.array_equal(
+        get_bootstrapped_ks_test_p_values(random_seed=1, **kwargs),
+        get_bootstrapped_ks_test_p_values(random_seed=1, **kwargs),
+    )
+    assert not np.array_equal(
+        get_bootstrapped_ks_test_p_values(random_seed=1, **kwargs),
+        get_bootstrapped_ks_test_p_values(random_seed=2, **kwargs),
+    )
+
+
+@pytest.mark.unit
+def test_p_values_do_not_depend_on_max_workers(column_values: np.ndarray):
+    kwargs = {
+        "column_values": column_values,
+        "bins": BINS,
+        "test_cdf": TEST_CDF,
+        "bootstrap_samples": 25,
+        "bootstrap_sample_size": 8,
+        "random_seed": 3,
+    }
+
+    # force multiple chunks (of 2 resamples each)
+    with mock.patch.object(
+        column_bootstrapped_ks_test_p_value, "MAX_BOOTSTRAP_VALUES_PER_CHUNK", 16
+    ):
+        serial_p_values = get_bootstrapped_ks_test_p_values(**kwargs)
+        pooled_p_values = get_bootstrapped_ks_test_p_values(max_workers=2, **kwargs)
+
+    assert serial_p_values.shape == (25,)
+    assert np.array_equal(serial_p_values, pooled_p_values)
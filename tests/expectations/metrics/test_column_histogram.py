@@ -0,0 +1,235 @@
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_histogram import (
+    _get_bin_index,
+    _get_bin_index_by_binary_search,
+)
+from great_expectations.self_check.util import (
+    build_in_memory_runtime_context,
+    build_sa_execution_engine,
+    get_test_validator_with_data,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+
+
+def _get_histogram_sa(engine, bins: list) -> List[int]:
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+    desired_metric = MetricConfiguration(
+        metric_name="column.histogram",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"bins": bins},
+    )
+    desired_metric.metric_dependencies = {"table.columns": table_columns_metric}
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+    return results[desired_metric.id]
+
+
+@pytest.fixture
+def values() -> np.ndarray:
+    rng = np.random.default_rng(seed=42)
+    # Rounded values include (many) values equal to bin edges.
+    return np.round(rng.normal(loc=5.0, scale=3.0, size=2_000), 1)
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "bins",
+    [
+        pytest.param(np.linspace(0.0, 10.0, 11), id="uniform"),
+        pytest.param(np.linspace(-20.0, 20.0, 101), id="uniform_100_bins"),
+        pytest.param([-3.0, 0.5, 1.0, 4.2, 4.3, 9.9], id="non_uniform"),
+        pytest.param([2.0, 3.0], id="single_bin"),
+    ],
+)
+def test_column_histogram_matches_numpy(sa, values: np.ndarray, bins):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": np.append(values, np.nan)}), sa)
+
+    expected, _ = np.histogram(values, bins=bins)
+
+    assert _get_histogram_sa(engine, bins=list(bins)) == expected.tolist()
+
+
+@pytest.mark.sqlite
+def test_column_histogram_with_infinite_edges(sa, values: np.ndarray):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": values}), sa)
+
+    bins = [-np.inf, 0.0, 5.0, np.inf]
+
+    assert _get_histogram_sa(engine, bins=bins) == [
+        int(np.sum(values < 0.0)),
+        int(np.sum((values >= 0.0) & (values < 5.0))),
+        int(np.sum(values >= 5.0)),
+    ]
+
+
+@pytest.mark.sqlite
+def test_column_histogram_is_computed_by_single_grouped_query(sa, values: np.ndarray):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": values}), sa)
+    statements: list = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(engine.engine, "before_cursor_execute", _record_statement)
+    try:
+        _get_histogram_sa(engine, bins=list(np.linspace(-20.0, 20.0, 101)))
+    finally:
+        sa.event.remove(engine.engine, "before_cursor_execute", _record_statement)
+
+    histogram_statements = [statement for statement in statements if "GROUP BY" in statement]
+    assert len(histogram_statements) == 1
+    assert "sum(" not in histogram_statements[0].lower()
+
+
+@pytest.mark.sqlite
+def test_column_histograms_of_one_domain_are_computed_by_single_query(sa, values: np.ndarray):
+    df = pd.DataFrame({"a": values, "b": values * 2.0, "c": values - 1.0, "d": values})
+    df.loc[::3, "b"] = np.nan
+    engine = build_sa_execution_engine(df, sa)
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+    bins_by_column = {
+        "a": list(np.linspace(0.0, 10.0, 11)),
+        "b": [-np.inf, 0.0, 5.0, np.inf],
+        "c": list(np.linspace(-20.0, 20.0, 101)),
+        "d": [2.0, 3.0],
+    }
+    domain_kwargs_by_column = {column: {"column": column} for column in bins_by_column}
+    # Histogram of other compute Domain is computed by its own query.
+    domain_kwargs_by_column["d"].update(
+        row_condition='col("a")>0', condition_parser="great_expectations__experimental__"
+    )
+    desired_metrics = {
+        column: MetricConfiguration(
+            metric_name="column.histogram",
+            metric_domain_kwargs=domain_kwargs_by_column[column],
+            metric_value_kwargs={"bins": bins},
+        )
+        for column, bins in bins_by_column.items()
+    }
+    for desired_metric in desired_metrics.values():
+        desired_metric.metric_dependencies = {"table.columns": table_columns_metric}
+
+    statements: list = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(engine.engine, "before_cursor_execute", _record_statement)
+    try:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=tuple(desired_metrics.values()), metrics=metrics
+        )
+    finally:
+        sa.event.remove(engine.engine, "before_cursor_execute", _record_statement)
+
+    histogram_statements = [statement for statement in statements if "GROUP BY" in statement]
+    assert len(histogram_statements) == 2
+    assert "UNION ALL" in histogram_statements[0]
+    assert "UNION ALL" not in histogram_statements[1]
+    for column in ("a", "b", "c"):
+        column_values = df[column].dropna()
+        bins = bins_by_column[column]
+        expected = [
+            int(np.sum((column_values >= bins[i]) & (column_values < bins[i + 1])))
+            for i in range(len(bins) - 2)
+        ] + [int(np.sum((column_values >= bins[-2]) & (column_values <= bins[-1])))]
+        assert results[desired_metrics[column].id] == expected
+
+    expected, _ = np.histogram(values[values > 0], bins=bins_by_column["d"])
+    assert results[desired_metrics["d"].id] == expected.tolist()
+
+
+@pytest.mark.unit
+def test_bin_index_uses_width_bucket_on_postgresql(sa):
+    dialect = sa.dialects.postgresql.dialect()
+    dialect.server_version_info = (16, 2)
+
+    bin_index = _get_bin_index(column=sa.column("a"), thresholds=[1.0, 2.5], dialect=dialect)
+
+    assert str(bin_index.compile(dialect=dialect)) == (
+        "width_bucket(CAST(a AS FLOAT), "
+        "CAST(ARRAY[1.00000000000000000e+00, 2.50000000000000000e+00] AS FLOAT[]))"
+    )
+
+
+@pytest.mark.postgresql
+def test_column_histogram_by_width_bucket_on_postgresql(values: np.ndarray, test_backends):
+    if "postgresql" not in test_backends:
+        pytest.skip("test_column_histogram_by_width_bucket_on_postgresql requires postgresql")
+
+    validator = get_test_validator_with_data(
+        execution_engine="postgresql",
+        table_name="column_histogram_by_width_bucket",
+        data=pd.DataFrame({"a": values}),
+        context=build_in_memory_runtime_context(),
+    )
+    bins = list(np.linspace(-20.0, 20.0, 101))
+
+    histogram = validator.get_metric(
+        MetricConfiguration(
+            metric_name="column.histogram",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"bins": tuple(bins)},
+        )
+    )
+
+    assert list(histogram) == np.histogram(values, bins=bins)[0].tolist()
+
+
+@pytest.mark.unit
+def test_bin_index_case_nesting_is_limited_on_mssql(sa):
+    dialect = sa.dialects.mssql.dialect()
+
+    bin_index = _get_bin_index(
+        column=sa.column("a"), thresholds=[float(value) for value in range(2_000)], dialect=dialect
+    )
+
+    sql = str(bin_index.compile(dialect=dialect))
+    depth = max_depth = 0
+    for token in sql.split():
+        if token == "CASE":
+            depth += 1
+            max_depth = max(max_depth, depth)
+        elif token == "END":
+            depth -= 1
+
+    assert max_depth == 10
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize("max_depth", [1, 2, 3])
+def test_bin_index_by_depth_limited_binary_search_is_exact(sa, max_depth: int):
+    thresholds = [float(threshold) for threshold in range(1, 20)]
+    values = np.arange(-1.0, 21.0, 0.5)
+    engine = build_sa_execution_engine(pd.DataFrame({"a": values}), sa)
+
+    bin_index = _get_bin_index_by_binary_search(
+        column=sa.column("a"),
+        thresholds=thresholds,
+        low=0,
+        high=len(thresholds),
+        max_depth=max_depth,
+    )
+    query = sa.select(sa.column("a"), bin_index).select_from(sa.table("test")).order_by("a")
+    indices = [row[1] for row in engine.execute_query(query).fetchall()]
+
+    assert indices == np.searchsorted(thresholds, values, side="right").tolist()
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize("bins_count", [1, 2, 7, 100])
+def test_bin_index_by_binary_search_is_exact(sa, bins_count: int):
+    thresholds = [float(threshold) for threshold in range(1, bins_count)]
+    values = np.arange(-1.0, bins_count + 1.0, 0.5)
+    engine = build_sa_execution_engine(pd.DataFrame({"a": values}), sa)
+
+    bin_index = _get_bin_index(column=sa.column("a"), thresholds=thresholds, dialect=engine.dialect)
+    query = sa.select(sa.column("a"), bin_index).select_from(sa.table("test")).order_by("a")
+    indices = [row[1] for row in engine.execute_query(query).fetchall()]
+
+    assert indices == np.searchsorted(thresholds, values, side="right").tolist()
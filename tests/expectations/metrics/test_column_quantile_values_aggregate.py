@@ -0,0 +1,222 @@
+from types import SimpleNamespace
+from typing import Any, List, Optional, Tuple
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+import great_expectations.expectations as gxe
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.expectations.metrics.column_aggregate_metrics import (
+    ColumnMedian,
+    ColumnQuantileValues,
+)
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values import (  # noqa: E501
+    COLUMN_QUANTILES_AGGREGATE_METRIC_NAME,
+    column_quantiles_aggregate_is_supported,
+    get_column_quantiles_aggregate,
+    parse_column_quantiles_aggregate_result,
+)
+from great_expectations.self_check.util import build_sa_execution_engine
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+
+def _dialect(name: str, server_version_info: Optional[Tuple[int, ...]] = None) -> SimpleNamespace:
+    return SimpleNamespace(name=name, server_version_info=server_version_info)
+
+
+@pytest.fixture
+def postgresql_dialect(sa):
+    dialect = sa.dialects.postgresql.dialect()
+    dialect.server_version_info = (16, 2)
+    return dialect
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dialect,quantiles,allow_relative_error,continuous,supported",
+    [
+        pytest.param(_dialect("postgresql", (16, 2)), [0.25, 0.5], False, False, True),
+        pytest.param(_dialect("postgresql", (16, 2)), [0.5], False, True, True),
+        pytest.param(_dialect("postgresql", (8, 0, 2)), [0.5], False, False, False, id="redshift"),
+        pytest.param(_dialect("postgresql"), [0.5], False, False, False, id="not_connected"),
+        pytest.param(_dialect("postgresql", (16, 2)), [], False, False, False, id="no_quantiles"),
+        pytest.param(_dialect("snowflake"), [0.5], False, True, True),
+        pytest.param(_dialect("snowflake"), [0.25, 0.5], False, False, False),
+        pytest.param(_dialect("clickhouse"), [0.25, 0.5], False, False, True),
+        pytest.param(_dialect("clickhouse"), [0.5], False, True, False),
+        pytest.param(_dialect("trino"), [0.25, 0.5], False, False, False),
+        pytest.param(_dialect("trino"), [0.25, 0.5], True, False, True),
+        pytest.param(_dialect("bigquery"), [0.25, 0.5], False, False, False),
+        pytest.param(_dialect("bigquery"), [0.25, 0.5], 0.01, False, True),
+        pytest.param(_dialect("sqlite"), [0.5], True, False, False),
+        pytest.param(_dialect("mssql"), [0.5], True, False, False),
+        pytest.param(_dialect("mysql"), [0.5], True, False, False),
+    ],
+)
+def test_column_quantiles_aggregate_is_supported(
+    dialect: SimpleNamespace,
+    quantiles: List[float],
+    allow_relative_error: Any,
+    continuous: bool,
+    supported: bool,
+):
+    assert (
+        column_quantiles_aggregate_is_supported(
+            dialect=dialect,
+            quantiles=quantiles,
+            allow_relative_error=allow_relative_error,
+            continuous=continuous,
+        )
+        is supported
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "continuous,expected_sql",
+    [
+        pytest.param(
+            False,
+            "percentile_disc(ARRAY[0.25, 0.5]) WITHIN GROUP (ORDER BY a ASC)",
+            id="discrete",
+        ),
+        pytest.param(
+            True,
+            "percentile_cont(ARRAY[0.25, 0.5]) WITHIN GROUP (ORDER BY a ASC)",
+            id="continuous",
+        ),
+    ],
+)
+def test_get_column_quantiles_aggregate_postgresql(
+    sa, postgresql_dialect, continuous: bool, expected_sql: str
+):
+    aggregate = get_column_quantiles_aggregate(
+        column=sa.column("a"),
+        quantiles=[0.25, 0.5],
+        dialect=postgresql_dialect,
+        continuous=continuous,
+    )
+
+    assert str(aggregate.compile(dialect=postgresql_dialect)) == expected_sql
+
+
+@pytest.mark.unit
+def test_get_column_quantiles_aggregate_clickhouse_quotes_column(sa, postgresql_dialect):
+    clickhouse_dialect = SimpleNamespace(
+        name="clickhouse", identifier_preparer=postgresql_dialect.identifier_preparer
+    )
+
+    aggregate = get_column_quantiles_aggregate(
+        column=sa.column("My Column"), quantiles=[0.25, 0.5], dialect=clickhouse_dialect
+    )
+
+    assert str(aggregate) == 'quantilesExact(0.25, 0.5)("My Column")'
+
+
+@pytest.mark.unit
+def test_get_column_quantiles_aggregate_unsupported_dialect_raises(sa):
+    with pytest.raises(ValueError):
+        get_column_quantiles_aggregate(
+            column=sa.column("a"), quantiles=[0.5], dialect=_dialect("sqlite")
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "result,dialect_name,expected",
+    [
+        pytest.param([1, 2], "postgresql", [1, 2], id="array"),
+        pytest.param((1, 2), "clickhouse", [1, 2], id="tuple"),
+        pytest.param(1.5, "snowflake", [1.5], id="scalar"),
+        pytest.param(None, "postgresql", [None, None], id="no_values"),
+        pytest.param(list(range(1001)), "bigquery", [250, 500], id="bigquery_buckets"),
+        pytest.param([], "bigquery", [None, None], id="bigquery_no_values"),
+    ],
+)
+def test_parse_column_quantiles_aggregate_result(result: Any, dialect_name: str, expected: list):
+    assert (
+        parse_column_quantiles_aggregate_result(
+            result=result, quantiles=[0.25, 0.5], dialect_name=dialect_name
+        )
+        == expected
+    )
+
+
+@pytest.mark.sqlite
+def test_column_median_dependencies_without_aggregate_support(sa):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 3]}), sa)
+    metric = MetricConfiguration(metric_name="column.median", metric_domain_kwargs={"column": "a"})
+
+    dependencies = ColumnMedian._get_evaluation_dependencies(metric=metric, execution_engine=engine)
+
+    assert "column_values.nonnull.count" in dependencies
+    assert COLUMN_QUANTILES_AGGREGATE_METRIC_NAME not in dependencies
+
+
+@pytest.mark.sqlite
+def test_column_median_and_quantiles_depend_on_aggregate_if_supported(sa, postgresql_dialect):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 3]}), sa)
+    median_metric = MetricConfiguration(
+        metric_name="column.median", metric_domain_kwargs={"column": "a"}
+    )
+    quantiles_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"quantiles": [0.25, 0.75], "allow_relative_error": False},
+    )
+
+    with mock.patch.object(
+        SqlAlchemyExecutionEngine,
+        "dialect",
+        new_callable=mock.PropertyMock,
+        return_value=postgresql_dialect,
+    ):
+        median_dependencies = ColumnMedian._get_evaluation_dependencies(
+            metric=median_metric, execution_engine=engine
+        )
+        quantiles_dependencies = ColumnQuantileValues._get_evaluation_dependencies(
+            metric=quantiles_metric, execution_engine=engine
+        )
+
+    assert "column_values.nonnull.count" not in median_dependencies
+    assert median_dependencies[COLUMN_QUANTILES_AGGREGATE_METRIC_NAME].metric_value_kwargs == {
+        "quantiles": [0.5],
+        "allow_relative_error": False,
+        "continuous": True,
+    }
+    assert quantiles_dependencies[COLUMN_QUANTILES_AGGREGATE_METRIC_NAME].metric_value_kwargs == {
+        "quantiles": [0.25, 0.75],
+        "allow_relative_error": False,
+        "continuous": False,
+    }
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize("allow_relative_error", [False, True])
+def test_expect_column_median_to_be_between_passes_allow_relative_error_to_median(
+    sa, allow_relative_error: bool
+):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 3]}), sa)
+    expectation = gxe.ExpectColumnMedianToBeBetween(
+        column="a", min_value=1, max_value=3, allow_relative_error=allow_relative_error
+    )
+
+    median_metric = expectation.get_validation_dependencies(
+        execution_engine=engine
+    ).get_metric_configuration(metric_name="column.median")
+    with mock.patch.object(
+        SqlAlchemyExecutionEngine,
+        "dialect",
+        new_callable=mock.PropertyMock,
+        return_value=_dialect("trino"),
+    ):
+        median_dependencies = ColumnMedian._get_evaluation_dependencies(
+            metric=median_metric, execution_engine=engine
+        )
+
+    assert median_metric.metric_value_kwargs == {"allow_relative_error": allow_relative_error}
+    # Trino computes median only approximately; hence, only if relative error is allowed.
+    assert (COLUMN_QUANTILES_AGGREGATE_METRIC_NAME in median_dependencies) is allow_relative_error
@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+
+from great_expectations.core.sketches import (
+    DistinctCountSketch,
+    FrequentValuesSketch,
+    QuantilesSketch,
+    merge_sketches,
+)
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_sketches import (
+    ColumnSketchMetricProvider,
+)
+from great_expectations.self_check.util import build_pandas_engine, build_sa_execution_engine
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+
+def _get_sketch(execution_engine, metric_name: str, metric_value_kwargs=None):
+    validator = Validator(execution_engine=execution_engine)
+    return validator.get_metric(
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=metric_value_kwargs or {},
+        )
+    )
+
+
+@pytest.fixture(params=["pandas", "sqlite"])
+def build_engine(request, sa, in_memory_runtime_context):
+    if request.param == "sqlite":
+        return lambda df: build_sa_execution_engine(df, sa)
+
+    return build_pandas_engine
+
+
+@pytest.mark.sqlite
+def test_column_sketches(build_engine):
+    engine = build_engine(pd.DataFrame({"a": [1, 2, 2, 3, None, 4]}))
+
+    quantiles_sketch = _get_sketch(engine, "column.quantiles_sketch", {"k": 50})
+    distinct_count_sketch = _get_sketch(engine, "column.distinct_count_sketch")
+    frequent_values_sketch = _get_sketch(engine, "column.frequent_values_sketch", {"capacity": 2})
+
+    assert isinstance(quantiles_sketch, QuantilesSketch)
+    assert quantiles_sketch.k == 50
+    assert quantiles_sketch.n == 5
+    assert quantiles_sketch.quantiles([0.0, 0.5, 1.0]) == [1.0, 2.0, 4.0]
+
+    assert isinstance(distinct_count_sketch, DistinctCountSketch)
+    assert distinct_count_sketch.estimate() == 4
+
+    assert isinstance(frequent_values_sketch, FrequentValuesSketch)
+    assert frequent_values_sketch.most_frequent(1) == [(2.0, 1)]
+    assert frequent_values_sketch.count_error == 1
+
+
+@pytest.mark.sqlite
+def test_column_sketches_of_batches_merge(build_engine):
+    first = _get_sketch(build_engine(pd.DataFrame({"a": [1, 2, 3]})), "column.quantiles_sketch")
+    second = _get_sketch(build_engine(pd.DataFrame({"a": [4, 5]})), "column.quantiles_sketch")
+
+    merged = merge_sketches([first, second])
+
+    assert merged.quantiles([0.5]) == [3.0]
+    assert merged.n == 5
+
+
+@pytest.mark.sqlite
+def test_column_sketches_stream_value_counts_in_chunks(build_engine, monkeypatch):
+    monkeypatch.setattr(ColumnSketchMetricProvider, "VALUE_COUNTS_CHUNK_SIZE", 3)
+    engine = build_engine(pd.DataFrame({"a": [1, 2, 2, 3, 4, 5, 6, 7, None]}))
+
+    distinct_count_sketch = _get_sketch(engine, "column.distinct_count_sketch")
+    frequent_values_sketch = _get_sketch(engine, "column.frequent_values_sketch")
+
+    assert distinct_count_sketch.estimate() == 7
+    assert frequent_values_sketch.n == 8
+    assert frequent_values_sketch.most_frequent(1) == [(2.0, 2)]
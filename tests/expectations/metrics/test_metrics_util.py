@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import datetime
 import random
 from typing import TYPE_CHECKING, Final, List, Union
 
+import numpy as np
+import pandas as pd
 import pytest
 from _pytest import monkeypatch
 
@@ -14,11 +17,17 @@ from great_expectations.compatibility.sqlalchemy import (
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.exceptions import MetricResolutionError
 from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+from great_expectations.expectations.metrics import util as metrics_util
 from great_expectations.expectations.metrics.util import (
     CaseInsensitiveString,
     get_dbms_compatible_metric_domain_kwargs,
+    get_pandas_column_values_instance_of_mask,
+    get_pandas_unexpected_records,
     get_unexpected_indices_for_multiple_pandas_named_indices,
     get_unexpected_indices_for_single_pandas_named_index,
+    get_unexpected_records_limit,
+    map_pandas_column_datetime_strings,
+    map_pandas_column_distinct_string_values,
     sql_statement_with_post_compile_to_string,
 )
 from tests.test_utils import (
@@ -621,5 +630,179 @@ class TestCaseInsensitiveString:
             assert input_case_insensitive != other
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "result_format,expected_limit",
+    [
+        pytest.param({"result_format": "COMPLETE", "partial_unexpected_count": 20}, None),
+        pytest.param({"result_format": "SUMMARY", "partial_unexpected_count": 20}, 20),
+        pytest.param({"result_format": "BASIC", "partial_unexpected_count": 0}, 0),
+    ],
+)
+def test_get_unexpected_records_limit(result_format: dict, expected_limit: int | None):
+    assert get_unexpected_records_limit(result_format=result_format) == expected_limit
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("limit", [None, 0, 3, 200000])
+def test_get_pandas_unexpected_records_returns_first_unexpected_records(
+    monkeypatch, limit: int | None
+):
+    # Small scan chunks exercise collection of unexpected records spanning several chunks.
+    monkeypatch.setattr(metrics_util, "_UNEXPECTED_RECORDS_SCAN_CHUNK_SIZE", 4)
+    df = pd.DataFrame({"a": np.arange(50)}, index=np.arange(50) * 10)
+    mask = df["a"] % 7 == 0
+
+    unexpected_records = get_pandas_unexpected_records(
+        domain_records=df, boolean_mapped_unexpected_values=mask, limit=limit
+    )
+
+    expected = df[mask] if limit is None else df[mask].iloc[:limit]
+    pd.testing.assert_frame_equal(unexpected_records, expected)
+
+
+@pytest.mark.unit
+def test_get_pandas_unexpected_records_with_unaligned_mask_uses_label_indexing():
+    series = pd.Series([1, 2, 3, 4], index=[3, 2, 1, 0])
+    mask = pd.Series([True, False, True, True], index=[0, 1, 2, 3])
+
+    unexpected_records = get_pandas_unexpected_records(
+        domain_records=series, boolean_mapped_unexpected_values=mask, limit=2
+    )
+
+    pd.testing.assert_series_equal(unexpected_records, series[mask].iloc[:2])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "column",
+    [
+        pd.Series([1, 2, 3], dtype="int32"),
+        pd.Series([1.5, np.nan, 3.0]),
+        pd.Series([True, False]),
+        pd.Series(["a", 1, 2.5, None, True, [1], "b"], dtype=object),
+        pd.Series(["a", "b", "a"], dtype="category"),
+        pd.Series(pd.to_datetime(["2020-01-01", None])),
+        pd.Series([], dtype=object),
+    ],
+)
+@pytest.mark.parametrize(
+    "types", [(np.int64, int), (float,), (str, np.str_), (bool, np.bool_), (pd.Timestamp,)]
+)
+def test_get_pandas_column_values_instance_of_mask_matches_per_value_isinstance(
+    column: pd.Series, types: tuple
+):
+    mask = get_pandas_column_values_instance_of_mask(column=column, types=types)
+
+    pd.testing.assert_series_equal(mask, column.map(lambda x: isinstance(x, types)))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "column",
+    [
+        pd.Series(["1", "x", "1", None, "2", "x"], dtype=object),
+        pd.Series(["1", 2, "1"], dtype=object),
+        pd.Series(["1", ["x"], "1"], dtype=object),
+        pd.Series(["1", "x", "1"], dtype="category"),
+        pd.Series([], dtype=object),
+    ],
+)
+def test_map_pandas_column_distinct_string_values_matches_per_value_map(column: pd.Series):
+    evaluated_values: list = []
+
+    def is_digit(val) -> bool:
+        evaluated_values.append(val)
+        return isinstance(val, str) and val.isdigit()
+
+    mask = map_pandas_column_distinct_string_values(column=column, condition=is_digit)
+    expected = column.map(lambda val: isinstance(val, str) and val.isdigit())
+
+    pd.testing.assert_series_equal(mask, expected)
+    if column.dtype == object and column.map(type).eq(str).all():
+        assert evaluated_values == list(column.unique())
+
+
+@pytest.mark.unit
+def test_map_pandas_column_distinct_string_values_raises_for_same_value_as_map():
+    def parse(val: str) -> bool:
+        return int(val) > 0
+
+    column = pd.Series(["1", "a", "1", "b"], dtype=object)
+
+    with pytest.raises(ValueError, match="'a'"):
+        map_pandas_column_distinct_string_values(column=column, condition=parse)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "strftime_format,values,vectorized_values",
+    [
+        pytest.param(
+            "%Y-%m-%d",
+            ["2020-01-01", "2020-1-2", "2020-02-30", "now", "today", "x", "2020-01-01"],
+            ["2020-01-01", "2020-1-2"],
+            id="date",
+        ),
+        pytest.param(
+            "%Y-%m-%d %H:%M:%S.%f",
+            ["2020-01-01 00:00:00.1", "2020-01-01 00:00:00.123456789", "2020-01-01"],
+            ["2020-01-01 00:00:00.1"],
+            id="fraction_of_second",
+        ),
+        pytest.param("%D", ["01/02/20", "x"], [], id="format_unsupported_by_pandas"),
+    ],
+)
+def test_map_pandas_column_datetime_strings_matches_per_value_map(
+    strftime_format: str, values: List[str], vectorized_values: List[str]
+):
+    evaluated_values: list = []
+
+    def is_parseable_by_format(val: str) -> bool:
+        evaluated_values.append(val)
+        try:
+            datetime.datetime.strptime(val, strftime_format)
+            return True
+        except ValueError:
+            return False
+
+    column = pd.Series(values, dtype=object)
+    expected = column.map(is_parseable_by_format)
+    evaluated_values.clear()
+
+    mask = map_pandas_column_datetime_strings(
+        column=column,
+        condition=is_parseable_by_format,
+        parse_format=strftime_format,
+        verify_pattern=r"\d{7}" if "%f" in strftime_format else None,
+    )
+
+    pd.testing.assert_series_equal(mask, expected)
+    # Values, which pandas parses, are not evaluated one by one.
+    assert evaluated_values == [
+        value for value in column.unique() if value not in vectorized_values
+    ]
+
+
+@pytest.mark.unit
+def test_map_pandas_column_datetime_strings_evaluates_only_unparsed_values():
+    column = pd.Series(
+        [f"2020-01-01T00:00:{second:02d}" for second in range(60)] + ["Jan 1 2020", "x"],
+        dtype=object,
+    )
+    evaluated_values: list = []
+
+    def is_parseable(val: str) -> bool:
+        evaluated_values.append(val)
+        return val != "x"
+
+    mask = map_pandas_column_datetime_strings(
+        column=column, condition=is_parseable, parse_format="ISO8601"
+    )
+
+    assert mask.tolist() == [True] * 61 + [False]
+    assert evaluated_values == ["Jan 1 2020", "x"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from great_expectations.compatibility import numpy
+from great_expectations.experimental.rule_based_profiler.helpers.util import (
+    compute_bootstrap_quantiles_bias_corrected_point_estimates,
+    compute_bootstrap_quantiles_point_estimate,
+)
+
+
+@pytest.fixture
+def metric_values() -> np.ndarray:
+    return np.random.default_rng(0).lognormal(size=50)
+
+
+def _reference_point_estimate(
+    bootstraps: np.ndarray,
+    sample_quantile: np.float64,
+    quantile_pct: float,
+    quantile_bias_correction: bool,
+    quantile_bias_std_error_ratio_threshold: float,
+) -> np.float64:
+    bootstrap_quantiles = numpy.numpy_quantile(bootstraps, q=quantile_pct, axis=1, method="linear")
+    point_estimate = np.mean(bootstrap_quantiles)
+    standard_error = np.std(bootstrap_quantiles)
+    bias = point_estimate - sample_quantile
+    if (
+        not quantile_bias_correction
+        and standard_error > 0.0
+        and bias / standard_error <= quantile_bias_std_error_ratio_threshold
+    ):
+        return point_estimate
+
+    return point_estimate - bias
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("quantile_bias_correction", [True, False])
+@pytest.mark.parametrize("quantile_bias_std_error_ratio_threshold", [-1.0, 0.25])
+def test_point_estimates_match_per_quantile_computation(
+    metric_values: np.ndarray,
+    quantile_bias_correction: bool,
+    quantile_bias_std_error_ratio_threshold: float,
+):
+    quantile_pcts = [0.05, 0.5, 0.95]
+    random_seed = 11
+    n_resamples = 200
+
+    point_estimates = compute_bootstrap_quantiles_bias_corrected_point_estimates(
+        metric_values=metric_values,
+        quantile_pcts=quantile_pcts,
+        n_resamples=n_resamples,
+        quantile_statistic_interpolation_method="linear",
+        quantile_bias_correction=quantile_bias_correction,
+        quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
+        random_seed=random_seed,
+    )
+
+    bootstraps = np.random.Generator(np.random.PCG64(random_seed)).choice(
+        metric_values, size=(n_resamples, metric_values.size)
+    )
+    expected_point_estimates = [
+        _reference_point_estimate(
+            bootstraps=bootstraps,
+            sample_quantile=numpy.numpy_quantile(metric_values, q=quantile_pct, method="linear"),
+            quantile_pct=quantile_pct,
+            quantile_bias_correction=quantile_bias_correction,
+            quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
+        )
+        for quantile_pct in quantile_pcts
+    ]
+
+    np.testing.assert_allclose(point_estimates, expected_point_estimates, rtol=1e-12)
+
+
+@pytest.mark.unit
+def test_point_estimates_do_not_depend_on_chunk_size(metric_values: np.ndarray):
+    kwargs = {
+        "metric_values": metric_values,
+        "quantile_pcts": [0.1, 0.9],
+        "n_resamples": 99,
+        "quantile_statistic_interpolation_method": "nearest",
+        "quantile_bias_correction": False,
+        "quantile_bias_std_error_ratio_threshold": 0.25,
+        "random_seed": 5,
+    }
+
+    # chunks of 3 resamples each
+    chunked_point_estimates = compute_bootstrap_quantiles_bias_corrected_point_estimates(
+        max_values_per_chunk=3 * metric_values.size, **kwargs
+    )
+
+    np.testing.assert_allclose(
+        chunked_point_estimates,
+        compute_bootstrap_quantiles_bias_corrected_point_estimates(**kwargs),
+        rtol=1e-12,
+    )
+
+
+@pytest.mark.unit
+def test_constant_metric_values_are_not_bias_corrected():
+    metric_values = np.full(10, 3.0)
+
+    result = compute_bootstrap_quantiles_point_estimate(
+        metric_values=metric_values,
+        false_positive_rate=np.float64(0.05),
+        n_resamples=20,
+        quantile_statistic_interpolation_method="linear",
+        quantile_bias_correction=False,
+        quantile_bias_std_error_ratio_threshold=0.25,
+        random_seed=1,
+    )
+
+    assert result.value_range.tolist() == [3.0, 3.0]
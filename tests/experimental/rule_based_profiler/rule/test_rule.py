@@ -0,0 +1,198 @@
+import pathlib
+from typing import Tuple
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.compatibility.sqlalchemy_compatibility_wrappers import (
+    add_dataframe_to_db,
+)
+from great_expectations.data_context import AbstractDataContext
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+from great_expectations.experimental.rule_based_profiler.domain_builder import (
+    ColumnDomainBuilder,
+)
+from great_expectations.experimental.rule_based_profiler.helpers.util import (
+    get_parameter_value_by_fully_qualified_parameter_name,
+)
+from great_expectations.experimental.rule_based_profiler.parameter_builder import (
+    MetricMultiBatchParameterBuilder,
+    NumericMetricRangeMultiBatchParameterBuilder,
+)
+from great_expectations.experimental.rule_based_profiler.rule import Rule
+from great_expectations.util import convert_to_json_serializable
+
+PARAMETER_NAMES = ("mean", "max", "min_range")
+
+
+@pytest.fixture
+def sqlite_path(sa, tmp_path: pathlib.Path) -> pathlib.Path:
+    path = tmp_path / "data.db"
+    engine = sa.create_engine(f"sqlite:///{path}")
+    add_dataframe_to_db(
+        df=pd.DataFrame(
+            np.random.default_rng(0).normal(size=(50, 8)),
+            columns=[f"col_{idx}" for idx in range(8)],
+        ),
+        name="my_table",
+        con=engine,
+        index=False,
+    )
+    engine.dispose()
+    return path
+
+
+def _run_rule(
+    context: AbstractDataContext, sqlite_path: pathlib.Path, resolve_metrics_across_domains: bool
+) -> Tuple[dict, int]:
+    batch = (
+        context.data_sources.add_or_update_sqlite(
+            name=f"my_datasource_{resolve_metrics_across_domains}",
+            connection_string=f"sqlite:///{sqlite_path}",
+        )
+        .add_table_asset(name="my_asset", table_name="my_table")
+        .add_batch_definition_whole_table(name="my_batch_definition")
+        .get_batch()
+    )
+    rule = Rule(
+        name="my_rule",
+        domain_builder=ColumnDomainBuilder(data_context=context),
+        parameter_builders=[
+            MetricMultiBatchParameterBuilder(
+                name="mean",
+                metric_name="column.mean",
+                metric_domain_kwargs="$domain.domain_kwargs",
+                data_context=context,
+            ),
+            MetricMultiBatchParameterBuilder(
+                name="max",
+                metric_name="column.max",
+                metric_domain_kwargs="$domain.domain_kwargs",
+                data_context=context,
+            ),
+            NumericMetricRangeMultiBatchParameterBuilder(
+                name="min_range",
+                metric_name="column.min",
+                metric_domain_kwargs="$domain.domain_kwargs",
+                estimator="exact",
+                data_context=context,
+            ),
+        ],
+    )
+
+    with mock.patch.object(
+        SqlAlchemyExecutionEngine,
+        "resolve_metric_bundle",
+        autospec=True,
+        side_effect=SqlAlchemyExecutionEngine.resolve_metric_bundle,
+    ) as mock_resolve_metric_bundle:
+        rule_state = rule.run(
+            batch_list=[batch],
+            runtime_configuration={
+                "resolve_metrics_across_domains": resolve_metrics_across_domains
+            },
+        )
+
+    parameter_values = {
+        domain.domain_kwargs["column"]: {
+            parameter_name: convert_to_json_serializable(
+                get_parameter_value_by_fully_qualified_parameter_name(
+                    fully_qualified_parameter_name=f"$parameter.{parameter_name}.value",
+                    domain=domain,
+                    parameters=rule_state.parameters,
+                )
+            )
+            for parameter_name in PARAMETER_NAMES
+        }
+        for domain in rule_state.domains
+    }
+    return parameter_values, mock_resolve_metric_bundle.call_count
+
+
+@pytest.mark.sqlite
+def test_rule_run_resolves_metrics_across_domains(
+    ephemeral_context_with_defaults: AbstractDataContext, sqlite_path: pathlib.Path
+):
+    per_domain_values, per_domain_bundle_calls = _run_rule(
+        context=ephemeral_context_with_defaults,
+        sqlite_path=sqlite_path,
+        resolve_metrics_across_domains=False,
+    )
+    across_domains_values, across_domains_bundle_calls = _run_rule(
+        context=ephemeral_context_with_defaults,
+        sqlite_path=sqlite_path,
+        resolve_metrics_across_domains=True,
+    )
+
+    assert len(across_domains_values) == 8
+    assert across_domains_values == per_domain_values
+    assert across_domains_bundle_calls < per_domain_bundle_calls
+
+
+@pytest.mark.sqlite
+def test_rule_run_resets_resolved_metrics(
+    ephemeral_context_with_defaults: AbstractDataContext, sqlite_path: pathlib.Path
+):
+    batch = (
+        ephemeral_context_with_defaults.data_sources.add_sqlite(
+            name="my_datasource", connection_string=f"sqlite:///{sqlite_path}"
+        )
+        .add_table_asset(name="my_asset", table_name="my_table")
+        .add_batch_definition_whole_table(name="my_batch_definition")
+        .get_batch()
+    )
+    parameter_builder = MetricMultiBatchParameterBuilder(
+        name="mean",
+        metric_name="column.mean",
+        metric_domain_kwargs="$domain.domain_kwargs",
+        data_context=ephemeral_context_with_defaults,
+    )
+    rule = Rule(
+        name="my_rule",
+        domain_builder=ColumnDomainBuilder(data_context=ephemeral_context_with_defaults),
+        parameter_builders=[parameter_builder],
+    )
+
+    rule.run(batch_list=[batch])
+
+    assert parameter_builder.resolved_metrics == {}
+
+
+@pytest.mark.sqlite
+def test_rule_run_resets_resolved_metrics_when_building_parameters_fails(
+    ephemeral_context_with_defaults: AbstractDataContext, sqlite_path: pathlib.Path
+):
+    batch = (
+        ephemeral_context_with_defaults.data_sources.add_sqlite(
+            name="my_datasource", connection_string=f"sqlite:///{sqlite_path}"
+        )
+        .add_table_asset(name="my_asset", table_name="my_table")
+        .add_batch_definition_whole_table(name="my_batch_definition")
+        .get_batch()
+    )
+    parameter_builder = MetricMultiBatchParameterBuilder(
+        name="mean",
+        metric_name="column.mean",
+        metric_domain_kwargs="$domain.domain_kwargs",
+        data_context=ephemeral_context_with_defaults,
+    )
+    rule = Rule(
+        name="my_rule",
+        domain_builder=ColumnDomainBuilder(data_context=ephemeral_context_with_defaults),
+        parameter_builders=[parameter_builder],
+    )
+    resolved_metrics_while_building: list = []
+
+    def _fail_build_parameters(*args, **kwargs):
+        resolved_metrics_while_building.append(dict(parameter_builder.resolved_metrics))
+        raise ValueError("Building parameters failed.")
+
+    with mock.patch.object(
+        parameter_builder, "build_parameters", side_effect=_fail_build_parameters
+    ), pytest.raises(ValueError):
+        rule.run(batch_list=[batch])
+
+    assert resolved_metrics_while_building[0]
+    assert parameter_builder.resolved_metrics == {}
@@ -0,0 +1,96 @@
+"""Benchmarks comparing element-by-element conversion of arrays, Series, and DataFrames by "convert_to_json_serializable()" with bulk conversion.
+
+Run with:
+
+    pytest tests/performance/test_convert_to_json_serializable_benchmarks.py --performance-tests --benchmark-group-by=param:case
+
+Every "legacy" benchmark replicates implementation, which called "convert_to_json_serializable()" for every element;
+every "current" benchmark calls "convert_to_json_serializable()" on entire object.  Both must produce identical results.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.util import convert_to_json_serializable
+
+pytestmark = pytest.mark.performance
+
+_ELEMENT_COUNT = 1_000_000
+
+
+def _legacy_convert_array(data: np.ndarray | pd.Index) -> list:
+    return [convert_to_json_serializable(value) for value in data.tolist()]
+
+
+def _legacy_convert_series(data: pd.Series) -> list:
+    index_name = data.index.name or "index"
+    value_name = data.name or "value"
+    return [
+        {
+            index_name: convert_to_json_serializable(idx),
+            value_name: convert_to_json_serializable(val),
+        }
+        for idx, val in data.items()
+    ]
+
+
+def _legacy_convert_dataframe(data: pd.DataFrame) -> list:
+    return convert_to_json_serializable(data.to_dict(orient="records"))
+
+
+def _build_benchmark_data() -> Dict[str, Any]:
+    rng = np.random.default_rng(seed=42)
+    floats: np.ndarray = rng.normal(size=_ELEMENT_COUNT)
+    floats[::100] = np.nan
+    value_counts: pd.Series = pd.Series(
+        rng.integers(0, _ELEMENT_COUNT // 10, size=_ELEMENT_COUNT)
+    ).value_counts()
+
+    return {
+        "int_array": rng.integers(0, 1_000, size=_ELEMENT_COUNT),
+        "float_array_with_nan": floats,
+        "datetime64_array": np.datetime64("2020-01-01T00:00:00", "us")
+        + rng.integers(0, 10**12, size=_ELEMENT_COUNT).astype("timedelta64[us]"),
+        "float_index": pd.Index(floats),
+        "value_counts_series": value_counts,
+        "numeric_dataframe": pd.DataFrame(
+            {"a": floats[: _ELEMENT_COUNT // 10], "b": np.arange(_ELEMENT_COUNT // 10)}
+        ),
+    }
+
+
+_LEGACY_CONVERTERS: Dict[str, Callable[[Any], list]] = {
+    "int_array": _legacy_convert_array,
+    "float_array_with_nan": _legacy_convert_array,
+    "datetime64_array": _legacy_convert_array,
+    "float_index": _legacy_convert_array,
+    "value_counts_series": _legacy_convert_series,
+    "numeric_dataframe": _legacy_convert_dataframe,
+}
+
+
+@pytest.fixture(scope="module")
+def benchmark_data() -> Dict[str, Any]:
+    return _build_benchmark_data()
+
+
+@pytest.mark.parametrize("implementation", ["legacy", "current"])
+@pytest.mark.parametrize("case", list(_LEGACY_CONVERTERS))
+def test_convert_to_json_serializable(
+    benchmark, benchmark_data: Dict[str, Any], case: str, implementation: str
+):
+    data: Any = benchmark_data[case]
+    legacy_converter: Callable[[Any], list] = _LEGACY_CONVERTERS[case]
+
+    if implementation == "legacy":
+        benchmark(legacy_converter, data)
+        return
+
+    result: list = benchmark(convert_to_json_serializable, data)
+
+    assert result == legacy_converter(data)
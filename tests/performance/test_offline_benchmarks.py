@@ -0,0 +1,413 @@
+"""Offline benchmarks of validation hot paths, run against synthetic Pandas and SQLite datasets.
+
+Unlike BigQuery benchmarks, these need no external services.  Run with:
+
+    pytest tests/performance/test_offline_benchmarks.py --performance-tests \
+        --performance-scales=small,medium --benchmark-json=tests/performance/results/<name>.json
+
+Dataset scales are listed in "BENCHMARK_SCALES" ("--performance-scales=all" selects every scale).  Every benchmark
+records its backend, scale, row count, column count, and number of Expectations in "extra_info" of JSON report, so
+that reports of different releases can be compared (e.g., "pytest-benchmark compare <first>.json <second>.json").
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import pathlib
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import great_expectations as gx
+import great_expectations.expectations as gxe
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.core import ExpectationSuite
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResult,
+)
+from great_expectations.data_context.store import (
+    ExpectationsStore,
+    ValidationResultsStore,
+)
+from great_expectations.data_context.types.base import (
+    DataContextConfig,
+    InMemoryStoreBackendDefaults,
+    ProgressBarsConfig,
+)
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
+from great_expectations.render.renderer import ValidationResultsPageRenderer
+from great_expectations.render.view import DefaultJinjaPageView
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+if TYPE_CHECKING:
+    from great_expectations.data_context import AbstractDataContext
+    from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+    from great_expectations.validator.validation_graph import ValidationGraph
+    from great_expectations.validator.validator import Validator
+
+pytestmark = pytest.mark.performance
+
+
+class BenchmarkScale(NamedTuple):
+    rows: int
+    columns: int
+
+
+BENCHMARK_SCALES: Dict[str, BenchmarkScale] = {
+    "small": BenchmarkScale(rows=10_000, columns=10),
+    "medium": BenchmarkScale(rows=100_000, columns=50),
+    "large": BenchmarkScale(rows=1_000_000, columns=100),
+    "wide": BenchmarkScale(rows=10_000, columns=500),
+    "xlarge": BenchmarkScale(rows=10_000_000, columns=10),
+}
+
+BENCHMARK_BACKENDS: Tuple[str, ...] = ("pandas", "sqlite")
+
+_TABLE_NAME = "benchmark_data"
+_CATEGORIES = np.array([f"category_{idx}" for idx in range(50)], dtype=object)
+_NULL_FRACTION = 0.01
+_SQLITE_CHUNK_SIZE = 100_000
+
+
+class BenchmarkDataset(NamedTuple):
+    backend: str
+    scale_name: str
+    scale: BenchmarkScale
+    context: AbstractDataContext
+    validator: Validator
+    expectation_suite: ExpectationSuite
+    validation_result: ExpectationSuiteValidationResult
+
+    @property
+    def execution_engine(self) -> ExecutionEngine:
+        return self.validator.execution_engine
+
+    @property
+    def extra_info(self) -> dict:
+        return {
+            "backend": self.backend,
+            "scale": self.scale_name,
+            "rows": self.scale.rows,
+            "columns": self.scale.columns,
+            "expectations": len(self.expectation_suite.expectations),
+            "great_expectations_version": gx.__version__,
+        }
+
+
+def pytest_generate_tests(metafunc):
+    if "benchmark_scale_name" not in metafunc.fixturenames:
+        return
+
+    scale_names: List[str] = [
+        scale_name.strip()
+        for scale_name in metafunc.config.getoption("--performance-scales").split(",")
+        if scale_name.strip()
+    ]
+    if "all" in scale_names:
+        scale_names = list(BENCHMARK_SCALES)
+
+    unknown_scale_names: List[str] = sorted(set(scale_names) - set(BENCHMARK_SCALES))
+    if unknown_scale_names:
+        raise pytest.UsageError(
+            f"Unknown performance scales {unknown_scale_names}; choose from {list(BENCHMARK_SCALES)} or 'all'."  # noqa: E501
+        )
+
+    metafunc.parametrize("benchmark_scale_name", scale_names, scope="module")
+
+
+def _is_numeric_column(column_index: int) -> bool:
+    # Two of every three columns are numeric; remaining ones hold low-cardinality strings.
+    return column_index % 3 != 2
+
+
+def _column_name(column_index: int) -> str:
+    kind: str = "number" if _is_numeric_column(column_index=column_index) else "category"
+    return f"{kind}_{column_index}"
+
+
+def build_benchmark_dataframe(scale: BenchmarkScale, seed: int = 42) -> pd.DataFrame:
+    """Generates reproducible synthetic data: integer, float (with nulls), and string columns."""
+    rng = np.random.default_rng(seed=seed)
+    columns: Dict[str, np.ndarray] = {}
+
+    column_index: int
+    values: np.ndarray
+    for column_index in range(scale.columns):
+        if not _is_numeric_column(column_index=column_index):
+            values = _CATEGORIES[rng.integers(0, len(_CATEGORIES), size=scale.rows)]
+        elif column_index % 2 == 0:
+            values = rng.integers(0, 1_000, size=scale.rows)
+        else:
+            values = rng.normal(loc=500.0, scale=100.0, size=scale.rows)
+            values[rng.random(size=scale.rows) < _NULL_FRACTION] = np.nan
+
+        columns[_column_name(column_index=column_index)] = values
+
+    return pd.DataFrame(columns)
+
+
+def build_benchmark_expectation_suite(scale: BenchmarkScale, name: str) -> ExpectationSuite:
+    """Builds suite of several Column Map and Column Aggregate Expectations per column."""
+    suite = ExpectationSuite(name=name)
+
+    column_index: int
+    column: str
+    for column_index in range(scale.columns):
+        column = _column_name(column_index=column_index)
+        suite.add_expectation(gxe.ExpectColumnValuesToNotBeNull(column=column, mostly=0.95))
+        if _is_numeric_column(column_index=column_index):
+            suite.add_expectation(
+                gxe.ExpectColumnValuesToBeBetween(column=column, min_value=0, max_value=900)
+            )
+            suite.add_expectation(
+                gxe.ExpectColumnMeanToBeBetween(column=column, min_value=400, max_value=600)
+            )
+        else:
+            suite.add_expectation(
+                gxe.ExpectColumnValuesToBeInSet(column=column, value_set=list(_CATEGORIES[:45]))
+            )
+
+    return suite
+
+
+def _build_metric_configurations(dataset: BenchmarkDataset) -> List[MetricConfiguration]:
+    metric_configurations: List[MetricConfiguration] = []
+
+    column_index: int
+    domain_kwargs: dict
+    for column_index in range(dataset.scale.columns):
+        domain_kwargs = {
+            "batch_id": dataset.validator.active_batch_id,
+            "column": _column_name(column_index=column_index),
+        }
+        metric_configurations.append(
+            MetricConfiguration(
+                metric_name="column_values.nonnull.unexpected_count",
+                metric_domain_kwargs=domain_kwargs,
+            )
+        )
+        if _is_numeric_column(column_index=column_index):
+            metric_configurations.extend(
+                MetricConfiguration(metric_name=metric_name, metric_domain_kwargs=domain_kwargs)
+                for metric_name in ("column.min", "column.max", "column.mean")
+            )
+
+    return metric_configurations
+
+
+def _build_validation_graph(dataset: BenchmarkDataset) -> ValidationGraph:
+    return dataset.validator.metrics_calculator.build_metric_dependency_graph(
+        metric_configurations=_build_metric_configurations(dataset=dataset)
+    )
+
+
+def _clear_metric_cache(dataset: BenchmarkDataset) -> None:
+    # Every round must compute metrics anew, rather than read them from cache of previous round.
+    dataset.execution_engine.metric_cache.clear()
+
+
+def _get_batch_definition(
+    context: AbstractDataContext, backend: str, df: pd.DataFrame, tmp_path: pathlib.Path
+):
+    if backend == "pandas":
+        return (
+            context.data_sources.add_pandas(name="benchmark_pandas")
+            .add_dataframe_asset(name=_TABLE_NAME, dataframe=df)
+            .add_batch_definition_whole_dataframe(name="whole_dataframe")
+        )
+
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'benchmark.db'}")
+    df.to_sql(name=_TABLE_NAME, con=engine, index=False, chunksize=_SQLITE_CHUNK_SIZE)
+    engine.dispose()
+
+    return (
+        context.data_sources.add_sqlite(
+            name="benchmark_sqlite", connection_string=f"sqlite:///{tmp_path / 'benchmark.db'}"
+        )
+        .add_table_asset(name=_TABLE_NAME, table_name=_TABLE_NAME)
+        .add_batch_definition_whole_table(name="whole_table")
+    )
+
+
+@pytest.fixture(scope="module", params=BENCHMARK_BACKENDS)
+def benchmark_dataset(
+    request, tmp_path_factory: pytest.TempPathFactory, benchmark_scale_name: str
+) -> BenchmarkDataset:
+    backend: str = request.param
+    scale: BenchmarkScale = BENCHMARK_SCALES[benchmark_scale_name]
+    tmp_path: pathlib.Path = tmp_path_factory.mktemp(f"{backend}_{benchmark_scale_name}")
+
+    context = gx.get_context(
+        project_config=DataContextConfig(
+            store_backend_defaults=InMemoryStoreBackendDefaults(),
+            analytics_enabled=False,
+            progress_bars=ProgressBarsConfig(globally=False),
+        ),
+        mode="ephemeral",
+    )
+    batch_definition = _get_batch_definition(
+        context=context,
+        backend=backend,
+        df=build_benchmark_dataframe(scale=scale),
+        tmp_path=tmp_path,
+    )
+    validator: Validator = context.get_validator(batch=batch_definition.get_batch())
+
+    expectation_suite: ExpectationSuite = build_benchmark_expectation_suite(
+        scale=scale, name=f"benchmark_{backend}_{benchmark_scale_name}"
+    )
+    validation_result = validator.validate(expectation_suite=expectation_suite)
+    assert isinstance(validation_result, ExpectationSuiteValidationResult)
+
+    return BenchmarkDataset(
+        backend=backend,
+        scale_name=benchmark_scale_name,
+        scale=scale,
+        context=context,
+        validator=validator,
+        expectation_suite=expectation_suite,
+        validation_result=validation_result,
+    )
+
+
+def test_validator_graph_validate(benchmark, benchmark_dataset: BenchmarkDataset):
+    benchmark.extra_info.update(benchmark_dataset.extra_info)
+    configurations: List[ExpectationConfiguration] = [
+        expectation.configuration
+        for expectation in benchmark_dataset.expectation_suite.expectations
+    ]
+
+    results = benchmark.pedantic(
+        benchmark_dataset.validator.graph_validate,
+        kwargs={"configurations": configurations},
+        setup=lambda: _clear_metric_cache(dataset=benchmark_dataset),
+        rounds=3,
+    )
+
+    assert len(results) == len(configurations)
+    assert all(result.exception_info["raised_exception"] is False for result in results)
+
+
+def test_validation_graph_resolve(benchmark, benchmark_dataset: BenchmarkDataset):
+    benchmark.extra_info.update(benchmark_dataset.extra_info)
+
+    def setup() -> Tuple[tuple, dict]:
+        _clear_metric_cache(dataset=benchmark_dataset)
+        graph: ValidationGraph = _build_validation_graph(dataset=benchmark_dataset)
+        return (graph,), {}
+
+    def resolve(graph: ValidationGraph):
+        return graph.resolve(show_progress_bars=False)
+
+    resolved_metrics, aborted_metrics_info = benchmark.pedantic(resolve, setup=setup, rounds=3)
+
+    assert resolved_metrics
+    assert not aborted_metrics_info
+
+
+def test_execution_engine_resolve_metric_bundle(benchmark, benchmark_dataset: BenchmarkDataset):
+    if benchmark_dataset.backend == "pandas":
+        pytest.skip("PandasExecutionEngine computes aggregate metrics directly, without bundling.")
+
+    benchmark.extra_info.update(benchmark_dataset.extra_info)
+    execution_engine: ExecutionEngine = benchmark_dataset.execution_engine
+
+    # Resolve all dependencies first, so that only single bundled computation of aggregate metrics is timed.  # noqa: E501
+    _clear_metric_cache(dataset=benchmark_dataset)
+    metric_configurations: List[MetricConfiguration] = _build_metric_configurations(
+        dataset=benchmark_dataset
+    )
+    graph: ValidationGraph = (
+        benchmark_dataset.validator.metrics_calculator.build_metric_dependency_graph(
+            metric_configurations=metric_configurations
+        )
+    )
+    resolved_metrics, _ = graph.resolve(show_progress_bars=False)
+    dependencies = {
+        metric_id: metric_value
+        for metric_id, metric_value in resolved_metrics.items()
+        if metric_id
+        not in {metric_configuration.id for metric_configuration in metric_configurations}
+    }
+    (
+        _,
+        metric_fn_bundle_configurations,
+    ) = execution_engine._build_direct_and_bundled_metric_computation_configurations(
+        metrics_to_resolve=metric_configurations, metrics=dependencies
+    )
+    benchmark.extra_info["bundled_metrics"] = len(metric_fn_bundle_configurations)
+
+    bundle_results = benchmark(
+        execution_engine.resolve_metric_bundle, metric_fn_bundle=metric_fn_bundle_configurations
+    )
+
+    assert len(bundle_results) == len(metric_fn_bundle_configurations) > 0
+
+
+def test_expectation_suite_building(benchmark, benchmark_dataset: BenchmarkDataset):
+    benchmark.extra_info.update(benchmark_dataset.extra_info)
+
+    suite: ExpectationSuite = benchmark(
+        build_benchmark_expectation_suite,
+        scale=benchmark_dataset.scale,
+        name="benchmark_suite_building",
+    )
+
+    assert len(suite.expectations) == len(benchmark_dataset.expectation_suite.expectations)
+
+
+@pytest.mark.parametrize("store_backend", ["InMemoryStoreBackend", "TupleFilesystemStoreBackend"])
+@pytest.mark.parametrize("store_name", ["expectations_store", "validation_results_store"])
+def test_store_round_trip(
+    benchmark,
+    benchmark_dataset: BenchmarkDataset,
+    tmp_path: pathlib.Path,
+    store_name: str,
+    store_backend: str,
+):
+    benchmark.extra_info.update(benchmark_dataset.extra_info)
+    store_backend_config: dict = {"class_name": store_backend}
+    if store_backend == "TupleFilesystemStoreBackend":
+        store_backend_config["base_directory"] = str(tmp_path)
+
+    if store_name == "expectations_store":
+        store = ExpectationsStore(store_backend=store_backend_config)
+        key = ExpectationSuiteIdentifier(name=benchmark_dataset.expectation_suite.name)
+        value = benchmark_dataset.expectation_suite
+    else:
+        store = ValidationResultsStore(store_backend=store_backend_config)
+        key = ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(
+                name=benchmark_dataset.expectation_suite.name
+            ),
+            run_id="benchmark_run",
+            batch_identifier=benchmark_dataset.validator.active_batch_id,
+        )
+        value = benchmark_dataset.validation_result
+
+    def round_trip():
+        store.set(key, value)
+        return store.get(key)
+
+    assert benchmark(round_trip)
+
+
+def test_data_docs_validation_results_page_rendering(
+    benchmark, benchmark_dataset: BenchmarkDataset
+):
+    benchmark.extra_info.update(benchmark_dataset.extra_info)
+
+    def render() -> str:
+        document = ValidationResultsPageRenderer().render(benchmark_dataset.validation_result)
+        return DefaultJinjaPageView().render(document)
+
+    rendered_page: str = benchmark(render)
+
+    assert rendered_page.startswith("<!DOCTYPE html>")
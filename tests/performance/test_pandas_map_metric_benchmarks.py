@@ -0,0 +1,247 @@
+"""Benchmarks comparing per-row "Series.map()" implementations of Pandas map metric conditions with current ones.
+
+Run with:
+
+    pytest tests/performance/test_pandas_map_metric_benchmarks.py --performance-tests --benchmark-group-by=param:case
+
+Every "legacy" benchmark replicates implementation, which evaluated condition by calling Python function for each row;
+every "current" benchmark resolves condition metric through PandasExecutionEngine.  Both must produce identical results.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import datetime
+import json
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import jsonschema
+import numpy as np
+import pandas as pd
+import pytest
+from dateutil.parser import parse
+
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+)
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.self_check.util import build_pandas_engine
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+
+pytestmark = pytest.mark.performance
+
+_ROW_COUNT = 20_000
+_DISTINCT_VALUE_COUNT = 1_000
+
+_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {"id": {"type": "integer", "minimum": 0}, "name": {"type": "string"}},
+    "required": ["id"],
+}
+
+
+def _legacy_is_of_type(types: tuple) -> Callable[[pd.Series], pd.Series]:
+    return lambda column: column.map(lambda x: isinstance(x, types))
+
+
+def _legacy_is_between(min_value: Any, max_value: Any) -> Callable[[pd.Series], pd.Series]:
+    return lambda column: column.map(lambda val: (val >= min_value) and (val <= max_value))
+
+
+def _legacy_is_json(column: pd.Series) -> pd.Series:
+    def is_json(val):
+        try:
+            json.loads(val)
+            return True
+        except Exception:
+            return False
+
+    return column.map(is_json)
+
+
+def _legacy_matches_json_schema(column: pd.Series) -> pd.Series:
+    def matches_json_schema(val):
+        try:
+            jsonschema.validate(json.loads(val), _JSON_SCHEMA)
+            return True
+        except jsonschema.ValidationError:
+            return False
+
+    return column.map(matches_json_schema)
+
+
+def _legacy_matches_strftime_format(strftime_format: str) -> Callable[[pd.Series], pd.Series]:
+    def is_parseable_by_format(val):
+        try:
+            datetime.datetime.strptime(val, strftime_format)
+            return True
+        except ValueError:
+            return False
+
+    return lambda column: column.map(is_parseable_by_format)
+
+
+def _legacy_is_dateutil_parseable(column: pd.Series) -> pd.Series:
+    def is_parseable(val):
+        try:
+            parse(val)
+            return True
+        except (ValueError, OverflowError):
+            return False
+
+    return column.map(is_parseable)
+
+
+class _BenchmarkCase(NamedTuple):
+    column: str
+    metric_name: str
+    metric_value_kwargs: Optional[Dict[str, Any]]
+    legacy_condition: Callable[[pd.Series], pd.Series]
+
+
+_BENCHMARK_CASES: Dict[str, _BenchmarkCase] = {
+    "of_type_int32": _BenchmarkCase(
+        column="int32_values",
+        metric_name="column_values.of_type",
+        metric_value_kwargs={"type_": "int"},
+        legacy_condition=_legacy_is_of_type(types=(np.int64, int)),
+    ),
+    "in_type_list_object": _BenchmarkCase(
+        column="mixed_values",
+        metric_name="column_values.in_type_list",
+        metric_value_kwargs={"type_list": ["str", "float"]},
+        legacy_condition=_legacy_is_of_type(types=(np.str_, str, np.float64, float)),
+    ),
+    "between_int32": _BenchmarkCase(
+        column="int32_values",
+        metric_name="column_values.between",
+        metric_value_kwargs={"min_value": 10, "max_value": 500},
+        legacy_condition=_legacy_is_between(min_value=10, max_value=500),
+    ),
+    "between_strings": _BenchmarkCase(
+        column="date_strings",
+        metric_name="column_values.between",
+        metric_value_kwargs={"min_value": "2021-01-01", "max_value": "2022-01-01"},
+        legacy_condition=_legacy_is_between(min_value="2021-01-01", max_value="2022-01-01"),
+    ),
+    "json_parseable": _BenchmarkCase(
+        column="json_strings",
+        metric_name="column_values.json_parseable",
+        metric_value_kwargs=None,
+        legacy_condition=_legacy_is_json,
+    ),
+    "match_json_schema": _BenchmarkCase(
+        column="valid_json_strings",
+        metric_name="column_values.match_json_schema",
+        metric_value_kwargs={"json_schema": _JSON_SCHEMA},
+        legacy_condition=_legacy_matches_json_schema,
+    ),
+    "match_strftime_format": _BenchmarkCase(
+        column="date_strings",
+        metric_name="column_values.match_strftime_format",
+        metric_value_kwargs={"strftime_format": "%Y-%m-%d"},
+        legacy_condition=_legacy_matches_strftime_format(strftime_format="%Y-%m-%d"),
+    ),
+    "match_strftime_format_distinct_timestamps": _BenchmarkCase(
+        column="timestamp_strings",
+        metric_name="column_values.match_strftime_format",
+        metric_value_kwargs={"strftime_format": "%Y-%m-%d %H:%M:%S"},
+        legacy_condition=_legacy_matches_strftime_format(strftime_format="%Y-%m-%d %H:%M:%S"),
+    ),
+    "dateutil_parseable": _BenchmarkCase(
+        column="date_strings",
+        metric_name="column_values.dateutil_parseable",
+        metric_value_kwargs=None,
+        legacy_condition=_legacy_is_dateutil_parseable,
+    ),
+    "dateutil_parseable_distinct_timestamps": _BenchmarkCase(
+        column="timestamp_strings",
+        metric_name="column_values.dateutil_parseable",
+        metric_value_kwargs=None,
+        legacy_condition=_legacy_is_dateutil_parseable,
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def benchmark_df() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=42)
+    codes = rng.integers(0, _DISTINCT_VALUE_COUNT, size=_ROW_COUNT)
+
+    dates = pd.date_range("2020-01-01", periods=_DISTINCT_VALUE_COUNT, freq="D").strftime(
+        "%Y-%m-%d"
+    )
+    date_strings = np.array(dates, dtype=object)
+    # Sprinkle in values, which do not parse.
+    date_strings[::97] = "not a date"
+
+    # Every value is distinct (as with event timestamps), so deduplication alone does not help.
+    timestamp_strings = np.array(
+        pd.date_range("2020-01-01", periods=_ROW_COUNT, freq="s").strftime("%Y-%m-%d %H:%M:%S"),
+        dtype=object,
+    )
+    timestamp_strings[::97] = "not a timestamp"
+
+    json_strings = np.array(
+        [
+            json.dumps({"id": idx - 10, "name": f"name_{idx}"})
+            for idx in range(_DISTINCT_VALUE_COUNT)
+        ],
+        dtype=object,
+    )
+    valid_json_strings = json_strings.copy()
+    json_strings[::89] = "{not json"
+
+    mixed_values = np.array(
+        [f"value_{idx}" if idx % 3 else float(idx) for idx in range(_DISTINCT_VALUE_COUNT)],
+        dtype=object,
+    )
+    mixed_values[::7] = 1
+
+    return pd.DataFrame(
+        {
+            "int32_values": codes.astype(np.int32),
+            "date_strings": date_strings[codes],
+            "json_strings": json_strings[codes],
+            "valid_json_strings": valid_json_strings[codes],
+            "mixed_values": mixed_values[codes],
+            "timestamp_strings": timestamp_strings,
+        }
+    )
+
+
+def _resolve_condition(
+    execution_engine: PandasExecutionEngine, benchmark_case: _BenchmarkCase
+) -> pd.Series:
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=execution_engine)
+    condition_metric = MetricConfiguration(
+        metric_name=f"{benchmark_case.metric_name}.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+        metric_domain_kwargs={"column": benchmark_case.column},
+        metric_value_kwargs=benchmark_case.metric_value_kwargs,
+    )
+    condition_metric.metric_dependencies = {"table.columns": table_columns_metric}
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=(condition_metric,), metrics=metrics
+    )
+    return results[condition_metric.id][0]
+
+
+@pytest.mark.parametrize("implementation", ["legacy", "current"])
+@pytest.mark.parametrize("case", list(_BENCHMARK_CASES))
+def test_pandas_map_metric_condition(
+    benchmark, benchmark_df: pd.DataFrame, case: str, implementation: str
+):
+    benchmark_case: _BenchmarkCase = _BENCHMARK_CASES[case]
+    column: pd.Series = benchmark_df[benchmark_case.column]
+
+    if implementation == "legacy":
+        benchmark(benchmark_case.legacy_condition, column)
+        return
+
+    execution_engine = build_pandas_engine(df=benchmark_df)
+    result: pd.Series = benchmark(_resolve_condition, execution_engine, benchmark_case)
+
+    # Condition metrics flag unexpected values (inverse of what legacy callbacks return).
+    pd.testing.assert_series_equal(
+        ~result, benchmark_case.legacy_condition(column), check_names=False
+    )
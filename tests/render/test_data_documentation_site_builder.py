@@ -1,14 +1,21 @@
 import os
 import shutil
+from collections import OrderedDict
 from typing import Dict
 
 import pytest
 
+from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context import get_context
 from great_expectations.data_context.data_context.file_data_context import (
     FileDataContext,
 )
 from great_expectations.data_context.store import ExpectationsStore, ValidationResultsStore
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
 from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
@@ -125,3 +132,54 @@ def test_site_builder_with_custom_site_section_builders_config(tmp_path_factory)
     profiling_site_section_builder = site_section_builders["profiling"]
     assert isinstance(validations_site_section_builder.source_store, ExpectationsStore)
     assert profiling_site_section_builder.run_name_filter == {"equals": "custom_profiling_filter"}
+
+
+def test_site_index_builder_reads_validation_results_from_index_manifest(tmp_path, mocker):
+    context = get_context(mode="file", project_root_dir=str(tmp_path))
+    validation_results_store = context.validation_results_store
+
+    validation_result_key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(name="my_suite"),
+        run_id=RunIdentifier(run_name="my_run", run_time="20240101T000000.000000Z"),
+        batch_identifier="my_batch",
+    )
+    validation_results_store.set(
+        validation_result_key,
+        ExpectationSuiteValidationResult(
+            success=False,
+            results=[],
+            suite_name="my_suite",
+            meta={"batch_spec": {"data_asset_name": "my_asset"}},
+        ),
+    )
+
+    site_index_builder = instantiate_class_from_config(
+        config=context.variables.data_docs_sites["local_site"],
+        runtime_environment={
+            "data_context": context,
+            "root_directory": context.root_directory,
+            "site_name": "local_site",
+        },
+        config_defaults={"module_name": "great_expectations.render.renderer.site_builder"},
+    ).site_index_builder
+    get_validation_result_spy = mocker.spy(context, "get_validation_result")
+
+    index_links_dict = OrderedDict()
+    site_index_builder._add_validations_to_index_links(index_links_dict, [validation_result_key])
+
+    get_validation_result_spy.assert_not_called()
+    (validation_link,) = index_links_dict["validations_links"]
+    assert validation_link["validation_success"] is False
+    assert validation_link["asset_name"] == "my_asset"
+
+    # Validation Results missing from manifest are loaded once and recorded in it.
+    validation_results_store.index_manifest.rewrite(entries=[])
+    for _ in range(2):
+        site_index_builder._add_validations_to_index_links(OrderedDict(), [validation_result_key])
+
+    assert get_validation_result_spy.call_count == 1
+    assert validation_results_store.index_manifest.get(validation_result_key.to_tuple()) == {
+        "success": False,
+        "batch_kwargs": {},
+        "batch_spec": {"data_asset_name": "my_asset"},
+    }
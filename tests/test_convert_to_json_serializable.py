@@ -1,6 +1,8 @@
+import datetime
 import re
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from great_expectations.util import convert_to_json_serializable
@@ -63,3 +65,76 @@ def test_serialization_of_pattern():
     pattern_to_test = r"data_(?P<year>\d{4})-(?P<month>\d{2}).csv"
     data = re.compile(pattern_to_test)
     assert convert_to_json_serializable(data) == pattern_to_test
+
+
+def _convert_elementwise(data):
+    # Conversion of every element on its own; bulk conversion of arrays must produce same results.
+    if isinstance(data, pd.Series):
+        return [
+            {
+                data.index.name or "index": convert_to_json_serializable(idx),
+                data.name or "value": convert_to_json_serializable(val),
+            }
+            for idx, val in data.items()
+        ]
+
+    if isinstance(data, pd.DataFrame):
+        return convert_to_json_serializable(data.to_dict(orient="records"))
+
+    return [convert_to_json_serializable(value) for value in data.tolist()]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(np.array([1, 2, 3], dtype=np.int32), id="int32"),
+        pytest.param(np.array([2**63], dtype=np.uint64), id="uint64"),
+        pytest.param(np.array([True, False]), id="bool"),
+        pytest.param(np.array([1.5, np.nan, np.inf]), id="float64_with_nan"),
+        pytest.param(np.array([0.1, np.nan], dtype=np.float32), id="float32_with_nan"),
+        pytest.param(np.array([[1.0, np.nan], [3.0, 4.0]]), id="two_dimensional"),
+        pytest.param(np.array(["2020-01-01", "NaT"], dtype="datetime64[D]"), id="datetime64_D"),
+        pytest.param(np.array(["2020-01-01T01:02:03"], dtype="datetime64[s]"), id="datetime64_s"),
+        pytest.param(
+            np.array(
+                ["2020-01-01T01:02:03.000001", "NaT", "2020-01-01T01:02:03"],
+                dtype="datetime64[us]",
+            ),
+            id="datetime64_us",
+        ),
+        pytest.param(np.array(["2020-01-01T01"], dtype="datetime64[ns]"), id="datetime64_ns"),
+        pytest.param(np.array(["12000-01-01"], dtype="datetime64[D]"), id="datetime64_far"),
+        pytest.param(pd.Index([1.0, np.nan]), id="float_index"),
+        pytest.param(pd.date_range("2020-01-01", periods=2), id="datetime_index"),
+        pytest.param(pd.Series([1.0, np.nan], index=["a", "b"], name="v"), id="float_series"),
+        pytest.param(pd.Series([3, 1], index=pd.Index([0.5, np.nan], name="k")), id="float_keys"),
+        pytest.param(pd.Series(["a", None]), id="object_series"),
+        pytest.param(pd.Series([1, None], dtype="Int64"), id="nullable_series"),
+        pytest.param(pd.DataFrame({"a": [1, 2], "b": [1.5, np.nan], 3: [True, False]}), id="df"),
+        pytest.param(pd.DataFrame({"a": [1, 2], "b": ["x", None]}), id="mixed_df"),
+    ],
+)
+def test_bulk_conversion_matches_elementwise_conversion(data):
+    assert convert_to_json_serializable(data) == _convert_elementwise(data)
+
+
+@pytest.mark.unit
+def test_serialization_of_numeric_arrays_masks_nan():
+    assert convert_to_json_serializable(np.array([1.5, np.nan])) == [1.5, None]
+    assert convert_to_json_serializable(
+        pd.Series([2, 1], index=pd.Index([np.nan, 1.0], name="value_counts"))
+    ) == [{"value_counts": None, "value": 2}, {"value_counts": 1.0, "value": 1}]
+
+
+@pytest.mark.unit
+def test_serialization_of_datetime64_arrays_matches_isoformat():
+    data = np.array(
+        ["2020-01-01T01:02:03.120", "2020-01-01T01:02:03", "NaT"], dtype="datetime64[ms]"
+    )
+
+    assert convert_to_json_serializable(data) == [
+        datetime.datetime(2020, 1, 1, 1, 2, 3, 120000).isoformat(),
+        datetime.datetime(2020, 1, 1, 1, 2, 3).isoformat(),
+        None,
+    ]
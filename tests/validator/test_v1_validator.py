@@ -13,8 +13,14 @@ from great_expectations.data_context.data_context.abstract_data_context import (
     AbstractDataContext,
 )
 from great_expectations.datasource.fluent.interfaces import DataAsset, Datasource
-from great_expectations.expectations.expectation import Expectation
-from great_expectations.validator.v1_validator import Validator
+from great_expectations.expectations.expectation import (
+    Expectation,
+    UnexpectedRowsExpectation,
+)
+from great_expectations.validator.v1_validator import (
+    Validator,
+    _get_columns_referenced_by_expectation_configurations,
+)
 
 
 @pytest.fixture
@@ -211,3 +217,110 @@ def test_validate_expectation_suite_suite_parameters(
     result = validator.validate_expectation_suite(suite, {"my_parameter": parameter})
 
     assert result.success == expected
+
+
+@pytest.mark.unit
+def test_validate_expectation_suite_with_projected_columns(
+    fds_data_context: AbstractDataContext,
+    batch_definition: BatchDefinition,
+    expectation_suite: ExpectationSuite,
+):
+    validator = Validator(
+        batch_definition=batch_definition,
+        result_format=ResultFormat.SUMMARY,
+        project_columns=True,
+    )
+    result = validator.validate_expectation_suite(expectation_suite)
+
+    assert validator._loaded_columns == ["event_type", "id"]
+    assert result.statistics == {
+        "evaluated_expectations": 2,
+        "successful_expectations": 1,
+        "unsuccessful_expectations": 1,
+        "success_percent": 50.0,
+    }
+
+
+class ExpectNoRowsReturnedByQuery(UnexpectedRowsExpectation):
+    pass
+
+
+@pytest.mark.parametrize(
+    ["expectations", "result_format", "expected"],
+    [
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(column="a"),
+                gxe.ExpectColumnPairValuesToBeEqual(column_A="b", column_B="a"),
+                gxe.ExpectCompoundColumnsToBeUnique(column_list=["c", "d"]),
+            ],
+            ResultFormat.SUMMARY,
+            ["a", "b", "c", "d"],
+            id="domain_columns",
+        ),
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(
+                    column="a",
+                    row_condition='b > @threshold and `c d`.isna() or e == "x"',
+                    condition_parser="pandas",
+                ),
+                gxe.ExpectColumnValuesToNotBeNull(
+                    column="f",
+                    row_condition='col("g")>5',
+                    condition_parser="great_expectations__experimental__",
+                ),
+            ],
+            ResultFormat.SUMMARY,
+            ["a", "c d", "e", "b", "f", "g"],
+            id="row_conditions",
+        ),
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(column="a"),
+                gxe.ExpectTableRowCountToEqual(value=3),
+            ],
+            {"result_format": "COMPLETE", "unexpected_index_column_names": ["pk"]},
+            ["pk", "a"],
+            id="unexpected_index_column_names",
+        ),
+        pytest.param(
+            [gxe.ExpectTableRowCountToEqual(value=3)],
+            ResultFormat.SUMMARY,
+            None,
+            id="no_columns",
+        ),
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(column="a"),
+                gxe.ExpectTableColumnsToMatchSet(column_set=["a"]),
+                ExpectNoRowsReturnedByQuery(unexpected_rows_query="SELECT * FROM {batch}"),
+            ],
+            ResultFormat.SUMMARY,
+            None,
+            id="table_expectation_reading_any_column",
+        ),
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(
+                    column="a", row_condition="b > (", condition_parser="pandas"
+                ),
+            ],
+            ResultFormat.SUMMARY,
+            None,
+            id="unparsable_row_condition",
+        ),
+    ],
+)
+@pytest.mark.unit
+def test_get_columns_referenced_by_expectation_configurations(
+    expectations: list[Expectation],
+    result_format: ResultFormat | dict,
+    expected: list[str] | None,
+):
+    columns = _get_columns_referenced_by_expectation_configurations(
+        expectation_configs=[expectation.configuration for expectation in expectations],
+        result_format=result_format,
+    )
+
+    assert columns == expected
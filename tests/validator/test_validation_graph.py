@@ -317,6 +317,62 @@ def test_parse_validation_graph(
     assert len(ready_metrics) == 2 and len(needed_metrics) == 9
 
 
+@pytest.mark.unit
+def test_validation_graph_dependency_index_matches_edges(
+    expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
+):
+    graph = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+
+    edge: MetricEdge
+    assert set(graph._metric_configurations.keys()) == {edge.left.id for edge in graph.edges}
+    for edge in graph.edges:
+        if edge.right is not None:
+            assert edge.right.id in graph._metric_dependencies[edge.left.id]
+            assert edge.left.id in graph._metric_dependents[edge.right.id]
+
+    # Index is preserved when sub-graph edges are merged into new graph (e.g., suite-level graph).
+    merged_graph = ValidationGraph(
+        execution_engine=graph._execution_engine, edges=graph.edges + graph.edges
+    )
+    assert merged_graph._metric_dependencies == graph._metric_dependencies
+    assert merged_graph._metric_dependents == graph._metric_dependents
+
+
+@pytest.mark.unit
+def test_resolve_validation_graph_resolves_metrics_in_dependency_order(
+    expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
+):
+    graph = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+
+    resolution_batches = []
+
+    class ExecutionEngineRecorder:
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def resolve_metrics(
+            metrics_to_resolve: Iterable[MetricConfiguration],
+            metrics: Optional[Dict[Tuple[str, str, str], MetricConfiguration]] = None,
+            runtime_configuration: Optional[dict] = None,
+        ) -> Dict[Tuple[str, str, str], MetricValue]:
+            metric_configuration: MetricConfiguration
+            metric_ids = {metric_configuration.id for metric_configuration in metrics_to_resolve}
+            resolution_batches.append(metric_ids)
+            return {metric_id: "my_value" for metric_id in metric_ids}
+
+    graph._execution_engine = cast(ExecutionEngine, ExecutionEngineRecorder())
+
+    resolved_metrics, aborted_metrics_info = graph.resolve(show_progress_bars=False)
+
+    assert aborted_metrics_info == {}
+    assert set(resolved_metrics.keys()) == set(graph._metric_configurations.keys())
+
+    resolved_so_far: Set[Tuple[str, str, str]] = set()
+    for batch in resolution_batches:
+        for metric_id in batch:
+            assert graph._metric_dependencies[metric_id] <= resolved_so_far
+        resolved_so_far |= batch
+
+
 @pytest.mark.unit
 def test_populate_dependencies(
     expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,